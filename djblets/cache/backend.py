@@ -11,18 +11,32 @@ from __future__ import annotations
 import hashlib
 import hmac
 import io
+import itertools
 import logging
+import math
 import pickle
+import random
 import re
-import zlib
-from typing import TYPE_CHECKING, TypeVar
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
 from django.conf import settings
 from django.core.cache import cache
 from django.contrib.sites.models import Site
+from django.db import connections
 from django.utils.encoding import force_bytes
 
+from djblets.cache.codecs import (BaseCacheCompressor,
+                                  BaseCacheSerializer,
+                                  PickleCacheSerializer,
+                                  ZlibCacheCompressor,
+                                  cache_compressors,
+                                  cache_serializers)
 from djblets.cache.errors import MissingChunkError
+from djblets.cache.forwarding_backend import bypass_request_cache_memo
+from djblets.cache.stats import is_cache_stats_enabled, record_cache_stats
 from djblets.deprecation import RemovedInDjblets80Warning
 from djblets.secrets.crypto import (aes_decrypt,
                                     aes_decrypt_iter,
@@ -33,15 +47,18 @@ from djblets.util.symbols import UNSET
 from housekeeping import deprecate_non_keyword_only_args
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Iterator, Sequence
-    from typing import Annotated, Any, TypeAlias
+    from collections.abc import (Callable, Hashable, Iterable, Iterator,
+                                 Mapping, Sequence)
+    from typing import Annotated, TypeAlias
 
     from django.core.cache.backends.base import BaseCache
 
+    from djblets.cache.local import LocalCache
     from djblets.protect.locks import CacheLock
     from djblets.util.symbols import Unsettable
 
     _T = TypeVar('_T')
+    _KeyT = TypeVar('_KeyT', bound=Hashable)
 
     # NOTE: We use Annotated here in order to allow the type alias to support
     #       a TypeVar parameter. This is a known workaround for making this
@@ -63,6 +80,12 @@ logger = logging.getLogger(__name__)
 DEFAULT_EXPIRATION_TIME = 60 * 60 * 24 * 30  # 1 month
 CACHE_CHUNK_SIZE = 2 ** 20 - 1024  # almost 1M (memcached's slab limit)
 
+#: The default number of chunks fetched per request when streaming large data.
+#:
+#: Version Added:
+#:     7.0
+DEFAULT_CHUNK_BATCH_SIZE = 4
+
 # memcached key size constraint (typically 250, but leave a few bytes for the
 # large data handling)
 MAX_KEY_SIZE = 240
@@ -72,6 +95,18 @@ _INVALID_KEY_CHARS_RE = re.compile(r'[\x00-\x20\x7f]')
 _default_expiration = getattr(settings, 'CACHE_EXPIRATION_TIME',
                               DEFAULT_EXPIRATION_TIME)
 
+# The serializer and compressor used for data stored without explicit codecs.
+#
+# Note that we want to use pickle protocol 0 in order to be compatible with
+# data cached by older versions.
+_legacy_serializer = PickleCacheSerializer(protocol=0)
+_legacy_compressor = ZlibCacheCompressor()
+
+# The prefix for encoded values stored with explicit codecs.
+#
+# This can't appear at the start of a legacy pickled value.
+_CODEC_HEADER_PREFIX = b'\x00'
+
 
 class _CacheContext:
     """State and functions for performing a cache-related operation.
@@ -94,12 +129,26 @@ class _CacheContext:
     #: This may now be a string or sequence of strings.
     base_cache_key: str | Sequence[str]
 
+    #: The number of chunks to fetch per request when streaming large data.
+    #:
+    #: Version Added:
+    #:     7.0
+    chunk_batch_size: int
+
     #: The The Django cache connection that all operations will work on.
     cache: BaseCache
 
     #: Whether large data will be compressed.
     compress_large_data: bool
 
+    #: The compressor used when storing data.
+    #:
+    #: If ``None``, data will be stored in the legacy format.
+    #:
+    #: Version Added:
+    #:     7.0
+    compressor: BaseCacheCompressor | None
+
     #: Whether to use encryption when storing or reading data.
     encryption_key: bytes | None
 
@@ -115,6 +164,35 @@ class _CacheContext:
     #:     6.0
     lock: CacheLock | None
 
+    #: The serializer used when storing data.
+    #:
+    #: If ``None``, data will be stored in the legacy format.
+    #:
+    #: Version Added:
+    #:     7.0
+    serializer: BaseCacheSerializer | None
+
+    #: The size of the data serialized by the last call to prepare_value().
+    #:
+    #: This is the size before any compression or encryption. It's ``None``
+    #: if the data was handed to the cache backend to serialize.
+    #:
+    #: Version Added:
+    #:     7.0
+    serialized_bytes: int | None
+
+    #: Whether cache statistics will be recorded for operations.
+    #:
+    #: Version Added:
+    #:     7.0
+    stats_enabled: bool
+
+    #: Whether large data will be read from cache in a streaming fashion.
+    #:
+    #: Version Added:
+    #:     7.0
+    stream_large_data: bool
+
     #: Whether to use encryption when storing or reading data.
     use_encryption: bool
 
@@ -128,9 +206,18 @@ class _CacheContext:
         use_encryption: bool | None,
         encryption_key: bytes | None,
         lock: CacheLock | None,
+        stream_large_data: bool | None = None,
+        chunk_batch_size: int = DEFAULT_CHUNK_BATCH_SIZE,
+        serializer: (str | BaseCacheSerializer | None) = None,
+        compressor: (str | BaseCacheCompressor | None) = None,
     ) -> None:
         """Initialize the context.
 
+        Version Changed:
+            7.0:
+            Added the ``stream_large_data``, ``chunk_batch_size``,
+            ``serializer``, and ``compressor`` arguments.
+
         Version Changed:
             6.0:
             * ``base_cache_key`` may now be a sequence of string components of
@@ -183,10 +270,57 @@ class _CacheContext:
 
                 Version Added:
                     6.0
+
+            stream_large_data (bool, optional):
+                Whether large data will be read from cache in a streaming
+                fashion.
+
+                This defaults to the value in
+                ``settings.DJBLETS_CACHE_STREAM_LARGE_DATA``, or ``False``
+                if not set.
+
+                Version Added:
+                    7.0
+
+            chunk_batch_size (int, optional):
+                The number of chunks to fetch per request when streaming
+                large data.
+
+                Version Added:
+                    7.0
+
+            serializer (str or djblets.cache.codecs.BaseCacheSerializer,
+                        optional):
+                The serializer, or registered serializer ID, used when
+                storing data.
+
+                Version Added:
+                    7.0
+
+            compressor (str or djblets.cache.codecs.BaseCacheCompressor,
+                        optional):
+                The compressor, or registered compressor ID, used when
+                storing data.
+
+                Version Added:
+                    7.0
+
+        Raises:
+            djblets.registries.errors.ItemLookupError:
+                The serializer or compressor ID was not registered.
         """
         if use_encryption is None:
             use_encryption = _get_default_use_encryption()
 
+        if stream_large_data is None:
+            stream_large_data = _get_default_stream_large_data()
+
+        if isinstance(serializer, str):
+            serializer = cache_serializers.get_serializer(serializer)
+
+        if isinstance(compressor, str):
+            compressor = cache_compressors.get_compressor(compressor)
+
         if use_encryption:
             if encryption_key:
                 assert isinstance(encryption_key, bytes)
@@ -202,20 +336,19 @@ class _CacheContext:
         self.use_encryption = use_encryption
         self.encryption_key = encryption_key
         self.compress_large_data = compress_large_data
+        self.stream_large_data = stream_large_data
+        self.chunk_batch_size = max(chunk_batch_size, 1)
+        self.serializer = serializer
+        self.compressor = compressor
+        self.stats_enabled = is_cache_stats_enabled()
+        self.serialized_bytes = None
 
         self.full_cache_key = self.make_key(base_cache_key)
 
         # Set a default cache key for the lock, if an explicit key is not
         # provided.
         if lock and not lock.full_cache_key:
-            lock_key: str | Sequence[str]
-
-            if isinstance(base_cache_key, str):
-                lock_key = f'_lock_:{base_cache_key}'
-            else:
-                lock_key = ['_lock_', *base_cache_key]
-
-            lock.full_cache_key = self.make_key(lock_key)
+            lock.full_cache_key = self.make_lock_key()
 
         self.lock = lock
 
@@ -248,6 +381,26 @@ class _CacheContext:
                               use_encryption=self.use_encryption,
                               encryption_key=self.encryption_key)
 
+    def make_lock_key(self) -> str:
+        """Return a full cache key for a lock guarding the main key.
+
+        Version Added:
+            7.0
+
+        Returns:
+            str:
+            The full cache key for the lock.
+        """
+        lock_key: str | Sequence[str]
+        base_cache_key = self.base_cache_key
+
+        if isinstance(base_cache_key, str):
+            lock_key = f'_lock_:{base_cache_key}'
+        else:
+            lock_key = ['_lock_', *base_cache_key]
+
+        return self.make_key(lock_key)
+
     def make_subkey(
         self,
         suffix: int | str,
@@ -277,19 +430,195 @@ class _CacheContext:
 
         return self.make_key(key)
 
+    def record_stats(
+        self,
+        **kwargs,
+    ) -> None:
+        """Record cache statistics for this context's key.
+
+        This does nothing if statistics are disabled.
+
+        Version Added:
+            7.0
+
+        Args:
+            **kwargs (dict):
+                Values to add to the statistics. See
+                :py:class:`djblets.cache.stats.CacheKeyStats`.
+        """
+        if self.stats_enabled:
+            record_cache_stats(self.base_cache_key, **kwargs)
+
+    @property
+    def uses_codecs(self) -> bool:
+        """Whether data will be stored using explicit codecs.
+
+        If ``False``, data will be stored in the legacy format.
+
+        Version Added:
+            7.0
+
+        Type:
+            bool
+        """
+        return self.serializer is not None or self.compressor is not None
+
+    def get_write_codecs(
+        self,
+        *,
+        compress: bool,
+    ) -> tuple[BaseCacheSerializer, BaseCacheCompressor | None]:
+        """Return the serializer and compressor used to store data.
+
+        Version Added:
+            7.0
+
+        Args:
+            compress (bool):
+                Whether to compress the data.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            Tuple:
+                0 (djblets.cache.codecs.BaseCacheSerializer):
+                    The serializer to use.
+
+                1 (djblets.cache.codecs.BaseCacheCompressor):
+                    The compressor to use, or ``None`` if data should not
+                    be compressed.
+        """
+        compressor: BaseCacheCompressor | None
+
+        if self.uses_codecs:
+            serializer = (self.serializer or
+                          cache_serializers.get_serializer('pickle'))
+            compressor = self.compressor
+        else:
+            serializer = _legacy_serializer
+            compressor = None
+
+        if compress:
+            compressor = compressor or _legacy_compressor
+        else:
+            compressor = None
+
+        return serializer, compressor
+
+    def make_large_data_header(
+        self,
+        chunk_count: int,
+    ) -> str:
+        """Return the value to store in the main key for large data.
+
+        In the legacy format, this is just the number of chunks. When using
+        explicit codecs, this will also contain the IDs of the serializer and
+        compressor, in the form of
+        :samp:`{chunk_count};{serializer_id};{compressor_id}`.
+
+        Version Added:
+            7.0
+
+        Args:
+            chunk_count (int):
+                The number of chunks stored.
+
+        Returns:
+            str:
+            The value to store.
+        """
+        if not self.uses_codecs:
+            return '%d' % chunk_count
+
+        serializer, compressor = self.get_write_codecs(
+            compress=self.compress_large_data)
+
+        return '%d;%s;%s' % (chunk_count,
+                             serializer.serializer_id,
+                             compressor.compressor_id if compressor else '')
+
+    def parse_large_data_header(
+        self,
+        value: Any,
+    ) -> tuple[int, BaseCacheSerializer, BaseCacheCompressor | None]:
+        """Parse the value stored in the main key for large data.
+
+        This is the inverse of :py:meth:`make_large_data_header`. Legacy
+        values are assumed to be pickled, and compressed if
+        :py:attr:`compress_large_data` is set.
+
+        Version Added:
+            7.0
+
+        Args:
+            value (object):
+                The value loaded from the main key.
+
+        Returns:
+            tuple:
+            A 3-tuple of:
+
+            Tuple:
+                0 (int):
+                    The number of chunks.
+
+                1 (djblets.cache.codecs.BaseCacheSerializer):
+                    The serializer for the data.
+
+                2 (djblets.cache.codecs.BaseCacheCompressor):
+                    The compressor for the data, or ``None`` if the data is
+                    not compressed.
+
+        Raises:
+            ValueError:
+                The value was not in a valid format.
+
+            djblets.registries.errors.ItemLookupError:
+                The serializer or compressor is not registered.
+        """
+        if isinstance(value, str) and ';' in value:
+            chunk_count, serializer_id, compressor_id = value.split(';')
+
+            return (
+                int(chunk_count),
+                cache_serializers.get_serializer(serializer_id),
+                (cache_compressors.get_compressor(compressor_id)
+                 if compressor_id
+                 else None),
+            )
+
+        return (
+            int(value),
+            _legacy_serializer,
+            _legacy_compressor if self.compress_large_data else None,
+        )
+
     def prepare_value(
         self,
         full_cache_key: str,
         value: bytes,
+        *,
+        use_codecs: bool = True,
     ) -> bytes:
         """Prepare a value for storage in cache.
 
         If using encryption, this will serialize and encrypt the value.
+
+        If using explicit codecs, this will serialize and compress the value
+        with a header identifying the codecs. If not using encryption, this
+        will be wrapped in an object for storage.
+
         Otherwise this returns the value as-is.
 
         Any errors will be logged and raised. It's up to callers to catch
         and handle the errors gracefully.
 
+        Version Changed:
+            7.0:
+            Added support for explicit codecs, and the ``use_codecs``
+            argument.
+
         Args:
             full_cache_key (str):
                 The full cache key where this value will be stored.
@@ -297,6 +626,11 @@ class _CacheContext:
             value (object):
                 The value to cache.
 
+            use_codecs (bool, optional):
+                Whether to encode the value using explicit codecs, if set.
+
+                If ``False``, the value will be stored in the legacy format.
+
         Returns:
             object:
             The prepared value.
@@ -306,6 +640,33 @@ class _CacheContext:
                 An error occurred pickling or encrypting the value. The
                 The exception is logged and then raised as-is.
         """
+        use_codecs = use_codecs and self.uses_codecs
+        self.serialized_bytes = None
+
+        if use_codecs:
+            serializer, compressor = self.get_write_codecs(
+                compress=self.compressor is not None)
+
+            try:
+                data = serializer.dumps(value)
+                self.serialized_bytes = len(data)
+
+                if compressor is not None:
+                    data = compressor.compress(data)
+            except Exception as e:
+                logger.error('Failed to serialize data for cache key "%s": %s',
+                             full_cache_key, e)
+                raise
+
+            value = b'%s%s;%s\n%s' % (
+                _CODEC_HEADER_PREFIX,
+                serializer.serializer_id.encode(),
+                compressor.compressor_id.encode() if compressor else b'',
+                data)
+
+            if not self.use_encryption:
+                return _EncodedCacheValue(value)
+
         if self.use_encryption:
             encryption_key = self.encryption_key
             assert encryption_key
@@ -318,12 +679,18 @@ class _CacheContext:
             #
             # So we instead pickle the data before encrypting it, and then we
             # unpickle after we decrypt it later.
-            try:
-                value = pickle.dumps(value, protocol=0)
-            except Exception as e:
-                logger.error('Failed to serialize data for cache key "%s": %s',
-                             full_cache_key, e)
-                raise
+            #
+            # If we've already encoded the data using codecs, it can be
+            # encrypted as-is.
+            if not use_codecs:
+                try:
+                    value = pickle.dumps(value, protocol=0)
+                    self.serialized_bytes = len(value)
+                except Exception as e:
+                    logger.error('Failed to serialize data for cache key '
+                                 '"%s": %s',
+                                 full_cache_key, e)
+                    raise
 
             try:
                 value = aes_encrypt(value, key=encryption_key)
@@ -373,24 +740,86 @@ class _CacheContext:
                              key, e)
             raise
 
-        if value is not UNSET and self.use_encryption:
+        if value is not UNSET:
+            value = self.decode_value(key, value)
+
+        return value
+
+    def decode_value(
+        self,
+        full_cache_key: str,
+        value: Any,
+    ) -> Any:
+        """Decode a value that was fetched from cache.
+
+        This is the inverse of :py:meth:`prepare_value`. If using
+        encryption, this will decrypt and deserialize the value. Values
+        stored with explicit codecs will be decoded using the codecs
+        identified in the stored header, regardless of the codecs set for
+        this context. Otherwise this returns the value as-is.
+
+        Any errors will be logged and raised. It's up to callers to catch
+        and handle the errors gracefully.
+
+        Version Added:
+            7.0
+
+        Args:
+            full_cache_key (str):
+                The full cache key where this value was stored.
+
+            value (object):
+                The value fetched from cache.
+
+        Returns:
+            object:
+            The decoded value.
+
+        Raises:
+            Exception:
+                An error occurred decrypting or unpickling the value. The
+                exception is logged and then raised as-is.
+        """
+        if self.use_encryption:
             try:
                 value = aes_decrypt(value, key=self.encryption_key)
             except Exception as e:
                 logger.error('Failed to decrypt data from cache for '
                              'key %s: %s.',
-                             key, e)
+                             full_cache_key, e)
                 raise
 
-            try:
-                value = pickle.loads(value)
-            except Exception as e:
-                logger.warning('Failed to deserialize data from cache for '
-                               'key %s: %s.',
-                               key, e)
-                raise
+            if not value.startswith(_CODEC_HEADER_PREFIX):
+                try:
+                    value = pickle.loads(value)
+                except Exception as e:
+                    logger.warning('Failed to deserialize data from cache for '
+                                   'key %s: %s.',
+                                   full_cache_key, e)
+                    raise
 
-        return value
+                return value
+        elif isinstance(value, _EncodedCacheValue):
+            value = value.data
+        else:
+            return value
+
+        try:
+            header, data = value[len(_CODEC_HEADER_PREFIX):].split(b'\n', 1)
+            serializer_id, compressor_id = header.decode().split(';')
+            serializer = cache_serializers.get_serializer(serializer_id)
+
+            if compressor_id:
+                data = (
+                    cache_compressors.get_compressor(compressor_id)
+                    .decompress(data)
+                )
+
+            return serializer.loads(data)
+        except Exception as e:
+            logger.warning('Failed to decode data from cache for key %s: %s.',
+                           full_cache_key, e)
+            raise
 
     def load_value_or_lock_for_write(
         self,
@@ -432,6 +861,8 @@ class _CacheContext:
             lock = self.lock
 
             if lock is not None:
+                start_time = time.monotonic()
+
                 try:
                     lock.acquire()
                 except TimeoutError:
@@ -439,10 +870,15 @@ class _CacheContext:
                                  '%r',
                                  lock)
 
+                self.record_stats(
+                    lock_waits=1,
+                    lock_wait_secs=time.monotonic() - start_time)
+
                 # We've either acquired a lock or timed out waiting for one.
                 # Check if there's a new value in the cache and return that
-                # result.
-                value = self.load_value(key)
+                # result. This must not be served from a request memo.
+                with bypass_request_cache_memo():
+                    value = self.load_value(key)
 
         return value
 
@@ -452,6 +888,7 @@ class _CacheContext:
         *,
         key: (str | None) = None,
         raw: bool = False,
+        use_codecs: bool = True,
     ) -> None:
         """Store a value in cache.
 
@@ -460,6 +897,10 @@ class _CacheContext:
         Any errors will be logged and raised. It's up to callers to catch
         and handle the errors gracefully.
 
+        Version Changed:
+            7.0:
+            Added the ``use_codecs`` argument.
+
         Args:
             value (object):
                 The value to store in cache.
@@ -472,6 +913,12 @@ class _CacheContext:
             raw (bool, optional):
                 Whether to store the value directly without modifications.
 
+            use_codecs (bool, optional):
+                Whether to encode the value using explicit codecs, if set.
+
+                Version Added:
+                    7.0
+
         Raises:
             Exception:
                 An error occurred preparing the value or writing to cache.
@@ -481,7 +928,8 @@ class _CacheContext:
             key = self.full_cache_key
 
         if not raw:
-            value = self.prepare_value(key, value)
+            value = self.prepare_value(key, value,
+                                       use_codecs=use_codecs)
 
         try:
             self.cache.set(key, value,
@@ -521,6 +969,47 @@ class _CacheContext:
             raise
 
 
+class _EncodedCacheValue(NamedTuple):
+    """An unencrypted value stored in cache using explicit codecs.
+
+    Version Added:
+        7.0
+    """
+
+    #: The encoded data, including the codec header.
+    data: bytes
+
+
+def _get_stored_value_size(
+    value: Any,
+) -> int:
+    """Return the approximate size of a value stored in cache.
+
+    Values that aren't already encoded are pickled to determine their size,
+    as most cache backends do. This is only used for cache statistics.
+
+    Version Added:
+        7.0
+
+    Args:
+        value (object):
+            The prepared value being stored.
+
+    Returns:
+        int:
+        The size in bytes, or 0 if it could not be determined.
+    """
+    if isinstance(value, bytes):
+        return len(value)
+    elif isinstance(value, _EncodedCacheValue):
+        return len(value.data)
+
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
 def _get_default_use_encryption() -> bool:
     """Return whether encryption should be enabled by default.
 
@@ -535,6 +1024,23 @@ def _get_default_use_encryption() -> bool:
     return getattr(settings, 'DJBLETS_CACHE_FORCE_ENCRYPTION', False)
 
 
+def _get_default_stream_large_data() -> bool:
+    """Return whether large data should be streamed from cache by default.
+
+    This will dynamically check whether streaming should be enabled, based
+    on the ``settings.DJBLETS_CACHE_STREAM_LARGE_DATA`` setting. If not set,
+    this defaults to ``False``.
+
+    Version Added:
+        7.0
+
+    Returns:
+        bool:
+        Whether large data should be streamed by default.
+    """
+    return getattr(settings, 'DJBLETS_CACHE_STREAM_LARGE_DATA', False)
+
+
 def _get_default_encryption_key() -> bytes:
     """Return the default AES encryption key for caching.
 
@@ -563,6 +1069,7 @@ def _cache_fetch_large_data(
     *,
     cache_context: _CacheContext,
     chunk_count: int,
+    compressor: (BaseCacheCompressor | None) = None,
 ) -> bytes:
     """Fetch large data from the cache.
 
@@ -575,6 +1082,10 @@ def _cache_fetch_large_data(
     the caller. The caller should iterate through the results using
     :py:func:`_cache_iter_large_data`.
 
+    Version Changed:
+        7.0:
+        Added the ``compressor`` argument.
+
     Version Changed:
         3.0:
         * Updated to take ``cache_context`` instead of additional arguments,
@@ -588,6 +1099,9 @@ def _cache_fetch_large_data(
         chunk_count (int):
             The number of chunks to fetch.
 
+        compressor (djblets.cache.codecs.BaseCacheCompressor, optional):
+            The compressor used for the data, if compressed.
+
     Returns:
         bytes:
         The complete fetched data, ready for deserializing.
@@ -606,52 +1120,294 @@ def _cache_fetch_large_data(
         cache_context.make_subkey(i)
         for i in range(chunk_count)
     ]
-    chunks = cache_context.cache.get_many(chunk_keys)
 
-    # Check that we have all the keys we expect, before we begin generating
-    # values. We don't want to waste effort loading anything, and we want to
-    # pass an error about missing keys to the caller up-front before we
-    # generate anything.
-    if len(chunks) != chunk_count:
-        missing_keys = sorted(set(chunk_keys) - set(chunks.keys()))
-        missing_keys_str = ', '.join(missing_keys)
-        logger.debug('Cache miss for key(s): %s.',
-                     missing_keys_str)
+    # Chunks are too large to keep in a request memo.
+    with bypass_request_cache_memo():
+        chunks = cache_context.cache.get_many(chunk_keys)
 
-        raise MissingChunkError
+    return _cache_combine_large_data(
+        cache_context=cache_context,
+        chunk_keys=chunk_keys,
+        chunks=chunks,
+        compressor=compressor)
 
-    # Process all the chunks.
-    chunked_data: Iterator[bytes] = (
-        chunks[chunk_key][0]
-        for chunk_key in chunk_keys
-    )
 
-    if cache_context.use_encryption:
-        # We can iteratively decrypt these and build the results into a
-        # single string below for optional decompression.
-        chunked_data = aes_decrypt_iter(chunked_data,
-                                        key=cache_context.encryption_key)
+def _cache_combine_large_data(
+    *,
+    cache_context: _CacheContext,
+    chunk_keys: Sequence[str],
+    chunks: Mapping[str, Any],
+    compressor: (BaseCacheCompressor | None) = None,
+) -> bytes:
+    """Combine chunks of large data fetched from the cache.
 
-    data = b''.join(chunked_data)
+    If any chunks are missing, a
+    :py:class:`~djblets.cache.errors.MissingChunkError` will be immediately
+    raised.
+
+    The data is then combined, optionally decrypted and uncompressed, and
+    returned to the caller.
+
+    Version Added:
+        7.0
+
+    Args:
+        cache_context (_CacheContext):
+            The caching operation context.
+
+        chunk_keys (list of str):
+            The full cache keys of each chunk, in order.
+
+        chunks (dict):
+            The chunks fetched from cache. This may contain additional keys.
+
+        compressor (djblets.cache.codecs.BaseCacheCompressor, optional):
+            The compressor used for the data, if compressed.
+
+    Returns:
+        bytes:
+        The complete data, ready for deserializing.
+
+    Raises:
+        djblets.cache.errors.MissingChunkError:
+            A chunk of data was missing. All cached data for the key is
+            invalid.
+
+        Exception:
+            An error occurred processing data. The exception is raised as-is.
+    """
+    # Check that we have all the keys we expect, before we begin generating
+    # values. We don't want to waste effort loading anything, and we want to
+    # pass an error about missing keys to the caller up-front before we
+    # generate anything.
+    missing_keys = [
+        chunk_key
+        for chunk_key in chunk_keys
+        if chunk_key not in chunks
+    ]
+
+    if missing_keys:
+        missing_keys.sort()
+        missing_keys_str = ', '.join(missing_keys)
+        logger.debug('Cache miss for key(s): %s.',
+                     missing_keys_str)
+
+        raise MissingChunkError
+
+    # Process all the chunks.
+    chunked_data: Iterator[bytes] = (
+        chunks[chunk_key][0]
+        for chunk_key in chunk_keys
+    )
+
+    if cache_context.use_encryption:
+        # We can iteratively decrypt these and build the results into a
+        # single string below for optional decompression.
+        chunked_data = aes_decrypt_iter(chunked_data,
+                                        key=cache_context.encryption_key)
+
+    data = b''.join(chunked_data)
 
     # Decompress them all at once, instead of streaming the results. It's
     # faster for any reasonably-sized data in cache. We'll stream depickles
     # instead.
-    if cache_context.compress_large_data:
-        data = zlib.decompress(data)
+    if compressor is not None:
+        data = compressor.decompress(data)
 
     return data
 
 
+class _ChunkedDataReader(io.RawIOBase):
+    """A read-only file-like object reading from an iterable of bytes.
+
+    This allows data streamed from cache to be unpickled without first
+    combining all the data into a single byte string.
+
+    Version Added:
+        7.0
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+    ) -> None:
+        """Initialize the reader.
+
+        Args:
+            chunks (iterable of bytes):
+                The iterable of byte strings to read from.
+        """
+        self._chunks = iter(chunks)
+        self._buf = memoryview(b'')
+        self._pos = 0
+
+    def readable(self) -> bool:
+        """Return whether the stream is readable.
+
+        Returns:
+            bool:
+            This is always ``True``.
+        """
+        return True
+
+    def readinto(
+        self,
+        b: Any,
+    ) -> int:
+        """Read data into a pre-allocated buffer.
+
+        Args:
+            b (bytearray or memoryview):
+                The buffer to read into.
+
+        Returns:
+            int:
+            The number of bytes read, or 0 if the end of the data has been
+            reached.
+        """
+        buf = self._buf
+        pos = self._pos
+
+        while pos >= len(buf):
+            try:
+                buf = memoryview(next(self._chunks))
+            except StopIteration:
+                self._buf = memoryview(b'')
+                self._pos = 0
+
+                return 0
+
+            pos = 0
+
+        n = min(len(b), len(buf) - pos)
+        b[:n] = buf[pos:pos + n]
+
+        self._buf = buf
+        self._pos = pos + n
+
+        return n
+
+
+def _cache_fetch_large_data_iter(
+    *,
+    cache_context: _CacheContext,
+    chunk_count: int,
+    compressor: (BaseCacheCompressor | None) = None,
+) -> Iterator[bytes]:
+    """Fetch large data from the cache in batches.
+
+    This is the streaming equivalent of :py:func:`_cache_fetch_large_data`.
+    Chunks will be fetched in batches of
+    :py:attr:`_CacheContext.chunk_batch_size`, and then decrypted and
+    decompressed as they're read, keeping only a few chunks in memory at
+    a time.
+
+    The first batch of chunks is fetched immediately, before this function
+    returns. If any chunks in it are missing, a
+    :py:class:`~djblets.cache.errors.MissingChunkError` will be raised
+    up-front. Chunks in later batches are fetched as data is consumed, and
+    will raise :py:class:`~djblets.cache.errors.MissingChunkError` during
+    iteration if missing. Callers must treat that as invalidating all
+    cached data for the key.
+
+    Version Added:
+        7.0
+
+    Args:
+        cache_context (_CacheContext):
+            The caching operation context.
+
+        chunk_count (int):
+            The number of chunks to fetch.
+
+        compressor (djblets.cache.codecs.BaseCacheCompressor, optional):
+            The compressor used for the data, if compressed.
+
+    Returns:
+        iterator of bytes:
+        An iterator yielding data ready for deserializing.
+
+    Raises:
+        djblets.cache.errors.MissingChunkError:
+            A chunk of data was missing. All cached data for the key is
+            invalid.
+
+        Exception:
+            An error occurred reading from cache or processing data. The
+            exception is raised as-is.
+    """
+    batch_size = cache_context.chunk_batch_size
+    chunk_keys: list[str] = [
+        cache_context.make_subkey(i)
+        for i in range(chunk_count)
+    ]
+
+    def _fetch_batch(
+        batch_keys: list[str],
+    ) -> deque[bytes]:
+        # Chunks are too large to keep in a request memo.
+        with bypass_request_cache_memo():
+            chunks = cache_context.cache.get_many(batch_keys)
+
+        if len(chunks) != len(batch_keys):
+            missing_keys = sorted(set(batch_keys) - set(chunks.keys()))
+            missing_keys_str = ', '.join(missing_keys)
+            logger.debug('Cache miss for key(s): %s.',
+                         missing_keys_str)
+
+            raise MissingChunkError
+
+        return deque(
+            chunks[chunk_key][0]
+            for chunk_key in batch_keys
+        )
+
+    # Fetch the first batch now, so that a missing entry can be reported
+    # before the caller begins consuming any results.
+    first_batch = _fetch_batch(chunk_keys[:batch_size])
+
+    def _iter_chunks() -> Iterator[bytes]:
+        batch = first_batch
+
+        for i in range(batch_size, chunk_count + batch_size, batch_size):
+            # Pop each chunk off as we go, so that it can be freed once
+            # it's been processed.
+            while batch:
+                yield batch.popleft()
+
+            if i < chunk_count:
+                batch = _fetch_batch(chunk_keys[i:i + batch_size])
+
+    chunked_data: Iterator[bytes] = _iter_chunks()
+
+    if cache_context.use_encryption:
+        chunked_data = aes_decrypt_iter(chunked_data,
+                                        key=cache_context.encryption_key)
+
+    if compressor is not None:
+        chunked_data = compressor.iter_decompress(chunked_data)
+
+    return chunked_data
+
+
 def _cache_iter_large_data(
     *,
     cache_context: _CacheContext,
-    data: bytes,
+    data: bytes | Iterable[bytes],
+    serializer: BaseCacheSerializer = _legacy_serializer,
 ) -> Iterator[Any]:
     """Iterate through large data that was fetched from the cache.
 
     This will unpickle the large data previously fetched through
-    :py:func:`_cache_fetch_large_data`, and yield each object to the caller.
+    :py:func:`_cache_fetch_large_data` or
+    :py:func:`_cache_fetch_large_data_iter`, and yield each object to the
+    caller.
+
+    Version Changed:
+        7.0:
+        * ``data`` may now be an iterable of byte strings, which will be
+          unpickled as it's read.
+        * Added the ``serializer`` argument.
 
     Version Changed:
         3.0:
@@ -662,29 +1418,44 @@ def _cache_iter_large_data(
         cache_context (_CacheContext):
             The caching operation context.
 
-        data (bytes):
-            The combined data fetched from cache.
+        data (bytes or iterable of bytes):
+            The combined data fetched from cache, or an iterable of data
+            being streamed from cache.
+
+        serializer (djblets.cache.codecs.BaseCacheSerializer, optional):
+            The serializer used for the data.
 
     Yields:
         object:
         Each value from cache.
 
     Raises:
+        djblets.cache.errors.MissingChunkError:
+            A chunk of streamed data was missing. All cached data for the
+            key is invalid.
+
         Exception:
             An error occurred processing data. The exception is logged and
             then raised as-is.
     """
-    fp = io.BytesIO(data)
+    fp: io.BufferedIOBase
+
+    if isinstance(data, bytes):
+        fp = io.BytesIO(data)
+    else:
+        fp = io.BufferedReader(_ChunkedDataReader(data))
 
     try:
-        # Unpickle all the items we're expecting from the cached data.
+        # Deserialize all the items we're expecting from the cached data.
         #
         # There will only be one item in the case of old-style cache data.
         while True:
             try:
-                yield pickle.load(fp)
+                yield serializer.load(fp)
             except EOFError:
                 return
+    except MissingChunkError:
+        raise
     except Exception as e:
         logger.warning('Unpickle error for cache key "%s": %s.',
                        cache_context.full_cache_key, e)
@@ -693,13 +1464,19 @@ def _cache_iter_large_data(
 
 def _cache_compress_pickled_data(
     items: Iterable[_PreparingCacheItem[_T]],
+    *,
+    compressor: BaseCacheCompressor = _legacy_compressor,
 ) -> Iterator[_PreparingCacheItem[_T]]:
     """Compress lists of items for storage in the cache.
 
     This works with generators, and will take each item in the list or
-    generator of items, zlib-compress the data, and store it in a buffer.The
+    generator of items, compress the data, and store it in a buffer. The
     item and a blob of compressed data will be yielded to the caller.
 
+    Version Changed:
+        7.0:
+        Added the ``compressor`` argument.
+
     Args:
         items (generator of tuple):
             The generator of item tuples prepared in
@@ -712,6 +1489,9 @@ def _cache_compress_pickled_data(
                ultimately yield to the caller in :py:func:`cache_memoize_iter`
             3. Raw data to yield back to the caller
 
+        compressor (djblets.cache.codecs.BaseCacheCompressor, optional):
+            The compressor to use.
+
     Yields:
         tuple:
         An item tuple, but with the first entry containing compressed data.
@@ -723,12 +1503,12 @@ def _cache_compress_pickled_data(
            ultimately yield to the caller in :py:func:`cache_memoize_iter`
         3. Raw data to yield back to the caller
     """
-    compressor = zlib.compressobj()
+    compressobj = compressor.compressobj()
 
     for data, has_item, item in items:
-        yield compressor.compress(data), has_item, item
+        yield compressobj.compress(data), has_item, item
 
-    remaining = compressor.flush()
+    remaining = compressobj.flush()
 
     if remaining:
         yield remaining, False, None
@@ -876,6 +1656,7 @@ def _cache_store_chunks(
     can_cache: bool = True
     read_start: int = 0
     i: int = 0
+    stored_bytes: int = 0
     error: (Exception | None) = None
     lock = cache_context.lock
 
@@ -891,8 +1672,10 @@ def _cache_store_chunks(
         if not data or not can_cache:
             continue
 
+        data_len = len(data)
         chunks_data.write(data)
-        chunks_data_len += len(data)
+        chunks_data_len += data_len
+        stored_bytes += data_len
 
         if chunks_data_len > CACHE_CHUNK_SIZE:
             # We have enough data to fill a chunk now. Start processing
@@ -914,7 +1697,8 @@ def _cache_store_chunks(
 
             # Store the keys in the cache in a single request.
             try:
-                cache_context.store_many(cached_data)
+                with bypass_request_cache_memo():
+                    cache_context.store_many(cached_data)
 
                 if lock and lock.locked():
                     lock.update_expiration()
@@ -936,9 +1720,10 @@ def _cache_store_chunks(
 
         # Store the final amount of data.
         try:
-            cache_context.store_value([chunk],
-                                      key=cache_context.make_subkey(i),
-                                      raw=True)
+            with bypass_request_cache_memo():
+                cache_context.store_value([chunk],
+                                          key=cache_context.make_subkey(i),
+                                          raw=True)
 
             if lock and lock.locked():
                 lock.update_expiration()
@@ -952,7 +1737,12 @@ def _cache_store_chunks(
     if can_cache:
         # Store the final count.
         try:
-            cache_context.store_value('%d' % i)
+            # The header identifies the codecs, so it must always be stored
+            # in the legacy format.
+            cache_context.store_value(cache_context.make_large_data_header(i),
+                                      use_codecs=False)
+            cache_context.record_stats(chunks=i,
+                                       stored_bytes=stored_bytes)
         except Exception as e:
             # Store this error and skip any further cache operations (for
             # good measure).
@@ -971,8 +1761,8 @@ def _cache_store_items(
 ) -> Iterator[_T]:
     """Store items in the cache.
 
-    The items will be individually pickled and combined into a binary blob,
-    which can then optionally be compressed. The resulting data is then
+    The items will be individually serialized and combined into a binary
+    blob, which can then optionally be compressed. The resulting data is then
     cached over one or more keys, each representing a chunk about 1MB in size.
 
     A main cache key will be set that contains information on the other keys.
@@ -1004,15 +1794,47 @@ def _cache_store_items(
             The information should already be logged. Callers must catch this
             to gracefully handle the failure.
     """
-    # Note that we want to use pickle protocol 0 in order to be compatible
-    # across both Python 2 and 3. On Python 2, 0 is the default.
-    preparing_items: Iterable[_PreparingCacheItem] = (
-        (pickle.dumps(item, protocol=0), True, item)
-        for item in items
-    )
+    serializer, compressor = cache_context.get_write_codecs(
+        compress=cache_context.compress_large_data)
+
+    compute_secs: float = 0.0
+    uncompressed_bytes: int = 0
+
+    def _serialize_items_with_stats() -> Iterator[_PreparingCacheItem]:
+        nonlocal compute_secs, uncompressed_bytes
+
+        items_iter = iter(items)
+
+        while True:
+            # Time how long the caller's iterator takes to produce each
+            # item.
+            start_time = time.monotonic()
 
-    if cache_context.compress_large_data:
-        preparing_items = _cache_compress_pickled_data(preparing_items)
+            try:
+                item = next(items_iter)
+            except StopIteration:
+                break
+            finally:
+                compute_secs += time.monotonic() - start_time
+
+            data = serializer.dumps(item)
+            uncompressed_bytes += len(data)
+
+            yield data, True, item
+
+    preparing_items: Iterable[_PreparingCacheItem]
+
+    if cache_context.stats_enabled:
+        preparing_items = _serialize_items_with_stats()
+    else:
+        preparing_items = (
+            (serializer.dumps(item), True, item)
+            for item in items
+        )
+
+    if compressor is not None:
+        preparing_items = _cache_compress_pickled_data(preparing_items,
+                                                       compressor=compressor)
 
     prepared_items: Iterable[_PreparedCacheItem]
 
@@ -1034,6 +1856,157 @@ def _cache_store_items(
     yield from _cache_store_chunks(cache_context=cache_context,
                                    items=prepared_items)
 
+    cache_context.record_stats(compute_secs=compute_secs,
+                               uncompressed_bytes=uncompressed_bytes)
+
+
+class _RefreshableCacheValue(NamedTuple):
+    """A cached value that can be refreshed before it expires.
+
+    This is stored by :py:func:`cache_memoize` when using soft expiration
+    or early refresh.
+
+    Version Added:
+        7.0
+    """
+
+    #: The cached value.
+    value: Any
+
+    #: The Unix timestamp after which the value is considered stale.
+    refresh_at: float
+
+    #: The time in seconds it took to compute the value.
+    compute_secs: float
+
+    def should_refresh(
+        self,
+        *,
+        early_refresh_beta: float = 0,
+    ) -> bool:
+        """Return whether the value should be refreshed.
+
+        This implements probabilistic early refresh (also known as
+        "XFetch"). The value will always be refreshed once stale, and will
+        be refreshed early with a probability that grows as it approaches
+        the stale time, scaled by the compute time and
+        ``early_refresh_beta``.
+
+        Args:
+            early_refresh_beta (float, optional):
+                The factor controlling how eagerly to refresh early. ``0``
+                disables early refresh.
+
+        Returns:
+            bool:
+            ``True`` if the value should be refreshed.
+        """
+        now = time.time()
+
+        if early_refresh_beta > 0 and self.compute_secs > 0:
+            # Note that log() of a value in (0, 1] is <= 0, so this moves
+            # "now" forward by a random amount.
+            now -= (self.compute_secs * early_refresh_beta *
+                    math.log(1.0 - random.random()))
+
+        return now >= self.refresh_at
+
+
+def _acquire_refresh_lock(
+    cache_context: _CacheContext,
+) -> CacheLock | None:
+    """Attempt to acquire a lock for refreshing a stale value.
+
+    This will never block. If another caller is already refreshing the
+    value, or the lock can't be acquired, this will return ``None``.
+
+    Version Added:
+        7.0
+
+    Args:
+        cache_context (_CacheContext):
+            The caching operation context.
+
+    Returns:
+        djblets.protect.locks.CacheLock:
+        The acquired lock, or ``None`` if it could not be acquired.
+    """
+    from djblets.protect.locks import CacheLock
+
+    # We always use a new lock instance, even when the caller provided one,
+    # since this may be handed off to another thread. It will share the same
+    # key, though.
+    lock = cache_context.lock
+    refresh_lock = CacheLock(
+        blocking=False,
+        lock_expiration_secs=(lock.lock_expiration_secs if lock else 30))
+
+    if lock:
+        refresh_lock.full_cache_key = lock.full_cache_key
+    else:
+        refresh_lock.full_cache_key = cache_context.make_lock_key()
+
+    try:
+        if refresh_lock.acquire(blocking=False):
+            return refresh_lock
+    except Exception as e:
+        logger.error('Unable to acquire lock for refreshing cached data for '
+                     'key "%s": %s',
+                     cache_context.full_cache_key, e)
+
+    return None
+
+
+def _start_background_refresh(
+    refresh_func: Callable[[], Any],
+    *,
+    full_cache_key: str,
+    refresh_lock: CacheLock,
+) -> threading.Thread:
+    """Refresh a stale cached value in a background thread.
+
+    The thread takes ownership of the lock, and will release it once the
+    value has been refreshed.
+
+    Version Added:
+        7.0
+
+    Args:
+        refresh_func (callable):
+            The function to compute and store the new value.
+
+        full_cache_key (str):
+            The full cache key being refreshed.
+
+        refresh_lock (djblets.protect.locks.CacheLock):
+            The acquired lock guarding the refresh.
+
+    Returns:
+        threading.Thread:
+        The started thread.
+    """
+    def _refresh() -> None:
+        try:
+            refresh_func()
+        except Exception as e:
+            logger.exception('Failed to refresh cached data in the '
+                             'background for key "%s": %s',
+                             full_cache_key, e)
+        finally:
+            try:
+                refresh_lock.release()
+            finally:
+                # Any database connections opened by the refresh function
+                # are specific to this thread, and must be closed.
+                connections.close_all()
+
+    thread = threading.Thread(target=_refresh,
+                              name=f'cache-refresh:{full_cache_key}',
+                              daemon=True)
+    thread.start()
+
+    return thread
+
 
 @deprecate_non_keyword_only_args(RemovedInDjblets80Warning)
 def cache_memoize_iter(
@@ -1049,6 +2022,11 @@ def cache_memoize_iter(
     use_encryption: (bool | None) = None,
     encryption_key: (bytes | None) = None,
     lock: (CacheLock | None) = None,
+    stream_large_data: (bool | None) = None,
+    chunk_batch_size: int = DEFAULT_CHUNK_BATCH_SIZE,
+    local_cache: (LocalCache | None) = None,
+    serializer: (str | BaseCacheSerializer | None) = None,
+    compressor: (str | BaseCacheCompressor | None) = None,
 ) -> Iterator[_T]:
     """Memoize an iterable list of items inside the configured cache.
 
@@ -1076,6 +2054,27 @@ def cache_memoize_iter(
     important that the generator be allowed to continue until completion, or
     the data won't be retrievable from the cache.
 
+    By default, all cached chunks are fetched, combined, and decompressed
+    before any items are yielded. When ``stream_large_data`` is enabled,
+    chunks are instead fetched ``chunk_batch_size`` at a time and decrypted,
+    decompressed, and unpickled as items are yielded, bounding memory usage
+    to a few chunks rather than the entire payload. If a chunk turns out to
+    be missing before any items have been yielded, the items will be
+    regenerated and stored again. If items have already been yielded, the
+    cached data will be invalidated and
+    :py:class:`~djblets.cache.errors.MissingChunkError` will be raised, rather
+    than mixing cached and newly-generated items.
+
+    By default, items are pickled and zlib-compressed. A different
+    ``serializer`` and ``compressor`` can be chosen to trade CPU time
+    against cache memory. The codecs used are recorded in the cache, so
+    data stored with any codecs can be read back.
+
+    Version Changed:
+        7.0:
+        Added the ``stream_large_data``, ``chunk_batch_size``,
+        ``local_cache``, ``serializer``, and ``compressor`` arguments.
+
     Version Changed:
         6.0:
         * ``key`` may now be a sequence of string components of the key.
@@ -1149,12 +2148,69 @@ def cache_memoize_iter(
             Version Added:
                 6.0
 
+        stream_large_data (bool, optional):
+            Whether to stream cached data in batches of chunks, rather than
+            loading all chunks into memory at once.
+
+            This defaults to ``False``, but can be turned on for all cached
+            data by setting ``settings.DJBLETS_CACHE_STREAM_LARGE_DATA=True``.
+
+            Version Added:
+                7.0
+
+        chunk_batch_size (int, optional):
+            The number of chunks to fetch from cache per request when
+            streaming data.
+
+            Version Added:
+                7.0
+
+        local_cache (djblets.cache.local.LocalCache, optional):
+            An optional process-local cache to consult before the main
+            cache.
+
+            Once all items have been yielded, they will be stored in the
+            local cache as a list, if small enough.
+
+            Version Added:
+                7.0
+
+        serializer (str or djblets.cache.codecs.BaseCacheSerializer,
+                    optional):
+            The serializer, or registered serializer ID, used to store
+            data. See :py:mod:`djblets.cache.codecs`.
+
+            Data already in cache is always read using the serializer it
+            was stored with.
+
+            Version Added:
+                7.0
+
+        compressor (str or djblets.cache.codecs.BaseCacheCompressor,
+                    optional):
+            The compressor, or registered compressor ID, used to store
+            data. See :py:mod:`djblets.cache.codecs`.
+
+            Data already in cache is always read using the compressor it
+            was stored with.
+
+            Version Added:
+                7.0
+
     Yields:
         object:
         The list of items from the cache or from ``items_or_callable`` if
         uncached.
 
     Raises:
+        djblets.cache.errors.MissingChunkError:
+            When streaming large data, a chunk was found to be missing after
+            some results were already yielded. The cached data is
+            invalidated, and will be rebuilt on the next call.
+
+            Version Added:
+                7.0
+
         Exception:
             An error occurred while yielding results.
 
@@ -1170,12 +2226,83 @@ def cache_memoize_iter(
         use_encryption=use_encryption,
         encryption_key=encryption_key,
         lock=lock,
+        stream_large_data=stream_large_data,
+        chunk_batch_size=chunk_batch_size,
+        serializer=serializer,
+        compressor=compressor,
     )
     full_cache_key = cache_context.full_cache_key
 
+    if local_cache is not None and not force_overwrite:
+        local_results = local_cache.get(full_cache_key)
+
+        if local_results is not UNSET:
+            cache_context.record_stats(hits=1)
+
+            yield from local_results
+
+            return
+
     results: Unsettable[Iterable[_T]] = UNSET
     data_from_cache: bool = False
 
+    def _get_items() -> Iterable[_T]:
+        if callable(items_or_callable):
+            # NOTE: We don't want to catch exceptions here, since a
+            #       function may need to bubble exceptions up to a caller.
+            return items_or_callable()
+        else:
+            return items_or_callable
+
+    def _iter_streamed_results(
+        results: Iterable[_T],
+    ) -> Iterator[_T]:
+        nonlocal data_from_cache
+
+        num_yielded = 0
+
+        try:
+            for item in results:
+                yield item
+                num_yielded += 1
+        except MissingChunkError:
+            # A chunk past the first batch was missing, so the cached data
+            # is invalid.
+            if num_yielded == 0:
+                # Nothing has been yielded yet, so we can safely regenerate
+                # and store everything.
+                logger.warning('Chunk missing while streaming large or '
+                               'iterable data from cache for key "%s". '
+                               'Rebuilding data.',
+                               full_cache_key)
+
+                data_from_cache = False
+
+                yield from _cache_store_items(cache_context=cache_context,
+                                              items=_get_items())
+            else:
+                # The caller has already received some of the cached
+                # results, and we can't splice in newly-generated ones.
+                # Invalidate the data so the next call will rebuild it,
+                # and let the caller know.
+                logger.warning('Chunk missing while streaming large or '
+                               'iterable data from cache for key "%s" '
+                               'after %d item(s). Invalidating cached '
+                               'data.',
+                               full_cache_key, num_yielded)
+
+                cache_context.cache.delete(full_cache_key)
+
+                raise
+
+    def _iter_and_collect_results(
+        results: Iterable[_T],
+        collected: list[_T],
+    ) -> Iterator[_T]:
+        for item in results:
+            collected.append(item)
+            yield item
+
     try:
         if not force_overwrite:
             try:
@@ -1192,11 +2319,28 @@ def cache_memoize_iter(
                 data_from_cache = True
 
                 try:
+                    data: bytes | Iterable[bytes]
+
+                    chunk_count, serializer, compressor = \
+                        cache_context.parse_large_data_header(chunk_count)
+
+                    if cache_context.stream_large_data:
+                        data = _cache_fetch_large_data_iter(
+                            cache_context=cache_context,
+                            chunk_count=chunk_count,
+                            compressor=compressor)
+                    else:
+                        data = _cache_fetch_large_data(
+                            cache_context=cache_context,
+                            chunk_count=chunk_count,
+                            compressor=compressor)
+
                     results = _cache_iter_large_data(
                         cache_context=cache_context,
-                        data=_cache_fetch_large_data(
-                            cache_context=cache_context,
-                            chunk_count=int(chunk_count)))
+                        data=data,
+                        serializer=serializer)
+                    cache_context.record_stats(hits=1,
+                                               chunks=chunk_count)
                 except Exception as e:
                     logger.warning('Failed to fetch large or iterable data '
                                    'from cache for key "%s": %s',
@@ -1211,12 +2355,12 @@ def cache_memoize_iter(
         if results is UNSET:
             data_from_cache = False
 
-            if callable(items_or_callable):
-                # NOTE: We don't want to catch exceptions here, since a
-                #       function may need to bubble exceptions up to a caller.
-                items = items_or_callable()
-            else:
-                items = items_or_callable
+            start_time = time.monotonic()
+            items = _get_items()
+            cache_context.record_stats(
+                misses=0 if force_overwrite else 1,
+                computes=1,
+                compute_secs=time.monotonic() - start_time)
 
             try:
                 results = _cache_store_items(cache_context=cache_context,
@@ -1234,9 +2378,21 @@ def cache_memoize_iter(
                 # Return the results as-is without caching.
                 results = items
 
+        if data_from_cache and cache_context.stream_large_data:
+            results = _iter_streamed_results(results)
+
+        local_items: list[_T] = []
+
+        if local_cache is not None:
+            results = _iter_and_collect_results(results, local_items)
+
         # Yield the results to the caller.
         try:
             yield from results
+        except MissingChunkError:
+            # Streamed data was found to be incomplete after results were
+            # yielded. This has been logged, and must reach the caller.
+            raise
         except Exception as e:
             if data_from_cache:
                 # This really shouldn't happen, since we've already fetched it
@@ -1255,6 +2411,9 @@ def cache_memoize_iter(
                              'cache data for key "%s". Newly-generated data '
                              'will be returned but not cached. Error = %s',
                              full_cache_key, e)
+        else:
+            if local_cache is not None:
+                local_cache.set(full_cache_key, local_items)
     finally:
         # If there's an active write lock established, release it.
         if lock and lock.locked():
@@ -1274,6 +2433,14 @@ def cache_memoize(
     use_encryption: (bool | None) = None,
     encryption_key: (bytes | None) = None,
     lock: (CacheLock | None) = None,
+    stream_large_data: (bool | None) = None,
+    chunk_batch_size: int = DEFAULT_CHUNK_BATCH_SIZE,
+    local_cache: (LocalCache | None) = None,
+    soft_expiration: (int | None) = None,
+    early_refresh_beta: float = 0,
+    background_refresh: bool = False,
+    serializer: (str | BaseCacheSerializer | None) = None,
+    compressor: (str | BaseCacheCompressor | None) = None,
 ) -> _T:
     """Memoize the results of a callable inside the configured cache.
 
@@ -1287,6 +2454,29 @@ def cache_memoize(
     that impact access control, particularly in the event that the cache is
     compromised or shared between services.
 
+    Cached values can be refreshed before they expire from cache, to avoid
+    all callers blocking on regeneration at once. When ``soft_expiration``
+    is set, values older than that will be considered stale. The first
+    caller to notice will acquire a lock and recompute the value (either
+    immediately or in a background thread, if ``background_refresh`` is
+    set), while other callers continue to receive the stale value. Setting
+    ``early_refresh_beta`` will randomly refresh values a bit before they
+    become stale, based on how long they took to compute, spreading out
+    recomputation of expensive values.
+
+    A ``serializer`` and ``compressor`` can be chosen to control how data
+    is encoded in cache. See :py:mod:`djblets.cache.codecs`. These apply to
+    large data and encrypted data. For other values, passing either will
+    encode the value with those codecs rather than leaving serialization to
+    the cache backend.
+
+    Version Changed:
+        7.0:
+        Added the ``stream_large_data``, ``chunk_batch_size``,
+        ``local_cache``, ``soft_expiration``, ``early_refresh_beta``,
+        ``background_refresh``, ``serializer``, and ``compressor``
+        arguments.
+
     Version Changed:
         6.0:
         * ``key`` may now be a sequence of string components of the key.
@@ -1377,15 +2567,109 @@ def cache_memoize(
             Version Added:
                 6.0
 
+        stream_large_data (bool, optional):
+            Whether to stream cached data in batches of chunks when
+            ``large_data`` is ``True``. See :py:func:`cache_memoize_iter`
+            for details.
+
+            This defaults to ``False``, but can be turned on for all cached
+            data by setting ``settings.DJBLETS_CACHE_STREAM_LARGE_DATA=True``.
+
+            Version Added:
+                7.0
+
+        chunk_batch_size (int, optional):
+            The number of chunks to fetch from cache per request when
+            streaming data.
+
+            Version Added:
+                7.0
+
+        local_cache (djblets.cache.local.LocalCache, optional):
+            An optional process-local cache to consult before the main
+            cache.
+
+            This is best suited to small values that are fetched often and
+            rarely change.
+
+            Version Added:
+                7.0
+
+        soft_expiration (int, optional):
+            The time in seconds after which a cached value is considered
+            stale and will be refreshed, while still being returned to
+            other callers. This should be less than ``expiration``.
+
+            This is not supported along with ``large_data``.
+
+            Version Added:
+                7.0
+
+        early_refresh_beta (float, optional):
+            A factor controlling how eagerly values will be refreshed before
+            they become stale. Values will be refreshed early with a
+            probability that increases as the stale time approaches, scaled
+            by the time it took to compute the value. ``1.0`` is a good
+            starting point, and ``0`` (the default) disables early refresh.
+
+            This is not supported along with ``large_data``.
+
+            Version Added:
+                7.0
+
+        background_refresh (bool, optional):
+            Whether stale values will be recomputed in a background thread.
+            If ``False``, the caller that notices the value is stale will
+            recompute it before returning.
+
+            Version Added:
+                7.0
+
+        serializer (str or djblets.cache.codecs.BaseCacheSerializer,
+                    optional):
+            The serializer, or registered serializer ID, used to store
+            data. See :py:mod:`djblets.cache.codecs`.
+
+            Data already in cache is always read using the serializer it
+            was stored with.
+
+            Version Added:
+                7.0
+
+        compressor (str or djblets.cache.codecs.BaseCacheCompressor,
+                    optional):
+            The compressor, or registered compressor ID, used to store
+            data. See :py:mod:`djblets.cache.codecs`.
+
+            Data already in cache is always read using the compressor it
+            was stored with.
+
+            Version Added:
+                7.0
+
     Returns:
         object:
         The cached data, or the result of ``lookup_callable`` if uncached.
+
+    Raises:
+        ValueError:
+            ``soft_expiration`` or ``early_refresh_beta`` was passed along
+            with ``large_data`` or a serializer other than pickle.
+
+        djblets.registries.errors.ItemLookupError:
+            The serializer or compressor ID was not registered.
     """
     if use_generator:
         RemovedInDjblets80Warning.warn(
             'use_generator is deprecated and will be removed in Djblets 8.')
 
     if large_data:
+        if soft_expiration is not None or early_refresh_beta > 0:
+            raise ValueError(
+                'soft_expiration and early_refresh_beta are not supported '
+                'with large_data=True.'
+            )
+
         results = list(cache_memoize_iter(
             key,
             lambda: [lookup_callable()],
@@ -1394,7 +2678,12 @@ def cache_memoize(
             compress_large_data=compress_large_data,
             lock=lock,
             use_encryption=use_encryption,
-            encryption_key=encryption_key))
+            encryption_key=encryption_key,
+            stream_large_data=stream_large_data,
+            chunk_batch_size=chunk_batch_size,
+            local_cache=local_cache,
+            serializer=serializer,
+            compressor=compressor))
 
         assert len(results) == 1
 
@@ -1408,63 +2697,495 @@ def cache_memoize(
             use_encryption=use_encryption,
             encryption_key=encryption_key,
             lock=lock,
+            serializer=serializer,
+            compressor=compressor,
         )
         full_cache_key = cache_context.full_cache_key
+        use_refresh = (soft_expiration is not None or early_refresh_beta > 0)
 
-        try:
-            if not force_overwrite:
-                try:
-                    result = cache_context.load_value_or_lock_for_write(
-                        full_cache_key)
-                except Exception:
-                    # We've already logged enough information for this. Proceed
-                    # to generate new data.
-                    result = UNSET
+        if (use_refresh and
+            cache_context.serializer is not None and
+            not isinstance(cache_context.serializer, PickleCacheSerializer)):
+            # Refreshable values must be stored along with their metadata,
+            # which requires pickle.
+            raise ValueError(
+                'soft_expiration and early_refresh_beta require the pickle '
+                'serializer.'
+            )
 
-                if result is not UNSET:
-                    return result
+        if local_cache is not None and not force_overwrite:
+            result = local_cache.get(full_cache_key)
 
-                # The value was not found in cache. It will need to be
-                # recomputed.
-                logger.debug('Cache miss for key "%s"',
-                             full_cache_key)
+            if result is not UNSET:
+                cache_context.record_stats(hits=1)
 
+                return result
+
+        def _compute_and_store() -> _T:
+            start_time = time.monotonic()
             data = lookup_callable()
+            compute_secs = time.monotonic() - start_time
 
-            # Most people will be using memcached, and memcached has a limit of
-            # 1MB. Data this big should be broken up somehow, so let's warn
-            # about this. Users should hopefully be using large_data=True which
-            # will handle this appropriately.
+            # Most people will be using memcached, and memcached has a limit
+            # of 1MB. Data this big should be broken up somehow, so let's warn
+            # about this. Users should hopefully be using large_data=True
+            # which will handle this appropriately.
             #
             # If we do get here, we try to do some sanity checking.
-            # python-memcached will return a result in the case where the data
-            # exceeds the value size, which Django will then silently use to
-            # clear out the key. We won't know at all whether we had success
-            # unless we come back and try to verify the value.
+            # python-memcached will return a result in the case where the
+            # data exceeds the value size, which Django will then silently
+            # use to clear out the key. We won't know at all whether we had
+            # success unless we come back and try to verify the value.
             #
             # This check handles the common case of large string data being
             # stored in cache. It's still possible to attempt to store large
-            # data structures (where len(data) might be something like '6' but
-            # the serialized value is huge), where this can still fail.
+            # data structures (where len(data) might be something like '6'
+            # but the serialized value is huge), where this can still fail.
             if (isinstance(data, str) and
                 len(data) >= CACHE_CHUNK_SIZE):
                 logger.warning('Cache data for key "%s" (length %s) may be '
                                'too big for the cache.',
                                full_cache_key, len(data))
 
+            value: Any
+
+            if use_refresh:
+                if soft_expiration is None:
+                    refresh_after = expiration
+                else:
+                    refresh_after = soft_expiration
+
+                value = _RefreshableCacheValue(
+                    value=data,
+                    refresh_at=time.time() + refresh_after,
+                    compute_secs=compute_secs)
+            else:
+                value = data
+
+            stored_bytes: int = 0
+            uncompressed_bytes: int = 0
+
             try:
-                cache_context.store_value(data, key=full_cache_key)
+                value = cache_context.prepare_value(full_cache_key, value)
+
+                if cache_context.stats_enabled:
+                    stored_bytes = _get_stored_value_size(value)
+
+                    # If the cache backend is serializing the value, it
+                    # won't be compressed.
+                    uncompressed_bytes = (cache_context.serialized_bytes or
+                                          stored_bytes)
+
+                cache_context.store_value(value,
+                                          key=full_cache_key,
+                                          raw=True)
             except Exception:
                 # We've already caught and logged this error.
                 pass
+
+            cache_context.record_stats(computes=1,
+                                       compute_secs=compute_secs,
+                                       stored_bytes=stored_bytes,
+                                       uncompressed_bytes=uncompressed_bytes)
+
+            if local_cache is not None:
+                local_cache.set(full_cache_key, data)
+
+            return data
+
+        refresh_lock: CacheLock | None = None
+
+        try:
+            if not force_overwrite:
+                try:
+                    result = cache_context.load_value_or_lock_for_write(
+                        full_cache_key)
+                except Exception:
+                    # We've already logged enough information for this. Proceed
+                    # to generate new data.
+                    result = UNSET
+
+                if result is not UNSET:
+                    needs_refresh: bool = False
+
+                    cache_context.record_stats(hits=1)
+
+                    if isinstance(result, _RefreshableCacheValue):
+                        needs_refresh = (
+                            use_refresh and
+                            result.should_refresh(
+                                early_refresh_beta=early_refresh_beta))
+                        result = result.value
+
+                    if not needs_refresh:
+                        if local_cache is not None:
+                            local_cache.set(full_cache_key, result)
+
+                        return result
+
+                    # The value is stale. Only one caller should recompute
+                    # it. Everyone else will receive the stale value until
+                    # it's been refreshed.
+                    refresh_lock = _acquire_refresh_lock(cache_context)
+
+                    if refresh_lock is None:
+                        return result
+
+                    if background_refresh:
+                        # The background thread now owns the lock.
+                        _start_background_refresh(
+                            _compute_and_store,
+                            full_cache_key=full_cache_key,
+                            refresh_lock=refresh_lock)
+                        refresh_lock = None
+
+                        return result
+
+                    logger.debug('Refreshing stale cached data for key "%s"',
+                                 full_cache_key)
+                else:
+                    # The value was not found in cache. It will need to be
+                    # recomputed.
+                    logger.debug('Cache miss for key "%s"',
+                                 full_cache_key)
+                    cache_context.record_stats(misses=1)
+
+            data = _compute_and_store()
         finally:
             # If there's an active write lock established, release it.
             if lock and lock.locked():
                 lock.release()
 
+            if refresh_lock is not None and refresh_lock.locked():
+                refresh_lock.release()
+
         return data
 
 
+def cache_memoize_many(
+    keys: Iterable[_KeyT],
+    compute_missing_func: Callable[[list[_KeyT]], Mapping[_KeyT, _T]],
+    *,
+    expiration: int = _default_expiration,
+    force_overwrite: bool = False,
+    large_data: bool = False,
+    compress_large_data: bool = True,
+    use_encryption: (bool | None) = None,
+    encryption_key: (bytes | None) = None,
+    serializer: (str | BaseCacheSerializer | None) = None,
+    compressor: (str | BaseCacheCompressor | None) = None,
+) -> dict[_KeyT, _T]:
+    """Memoize the results for many keys inside the configured cache.
+
+    This is a batched form of :py:func:`cache_memoize`. All keys are looked
+    up in the cache with a single request, and ``compute_missing_func`` is
+    called once with only the keys that were not found. The newly-computed
+    values are then written back to cache in a single request.
+
+    This is useful when rendering lists of objects, where each object would
+    otherwise require its own round trip to the cache server.
+
+    Each key may be a string or a tuple of strings, following the same rules
+    as :py:func:`cache_memoize`.
+
+    When using ``large_data``, cached chunks for all keys are fetched with
+    one additional request. Newly-computed large values are stored one key
+    at a time.
+
+    Version Added:
+        7.0
+
+    Args:
+        keys (iterable of str or tuple of str):
+            The keys to look up in the cache.
+
+        compute_missing_func (callable):
+            A function to compute values for keys not found in cache.
+
+            This takes a list of the missing keys, and must return a
+            dictionary mapping those keys to values. Any keys not returned
+            will be left out of the results and won't be cached. Any keys
+            returned that weren't requested will be ignored.
+
+        expiration (int, optional):
+            The expiration time for the keys, in seconds.
+
+        force_overwrite (bool, optional):
+            If ``True``, the values will always be computed and stored
+            regardless of whether they exist in the cache already.
+
+        large_data (bool, optional):
+            If ``True``, each value will be pickled, optionally compressed,
+            and split up into chunks. See :py:func:`cache_memoize`.
+
+        compress_large_data (bool, optional):
+            Compresses the data with zlib compression when ``large_data``
+            is ``True``.
+
+        use_encryption (bool, optional):
+            Whether to use encryption when storing or reading data.
+
+            This defaults to ``False``, but can be forced on for all cached
+            data by setting ``settings.DJBLETS_CACHE_FORCE_ENCRYPTION=True``.
+
+        encryption_key (bytes, optional):
+            An explicit AES encryption key to use when passing
+            ``use_encryption=True``.
+
+        serializer (str or djblets.cache.codecs.BaseCacheSerializer,
+                    optional):
+            The serializer, or registered serializer ID, used to store
+            data. See :py:func:`cache_memoize`.
+
+        compressor (str or djblets.cache.codecs.BaseCacheCompressor,
+                    optional):
+            The compressor, or registered compressor ID, used to store
+            data. See :py:func:`cache_memoize`.
+
+    Returns:
+        dict:
+        A dictionary mapping each key to its cached or computed value, in
+        the order the keys were provided.
+
+    Raises:
+        djblets.registries.errors.ItemLookupError:
+            The serializer or compressor ID was not registered.
+    """
+    if isinstance(serializer, str):
+        serializer = cache_serializers.get_serializer(serializer)
+
+    if isinstance(compressor, str):
+        compressor = cache_compressors.get_compressor(compressor)
+
+    cache_contexts: dict[_KeyT, _CacheContext] = {
+        key: _CacheContext(
+            cache=cache,
+            base_cache_key=key,  # type: ignore
+            expiration=expiration,
+            compress_large_data=compress_large_data,
+            use_encryption=use_encryption,
+            encryption_key=encryption_key,
+            lock=None,
+            serializer=serializer,
+            compressor=compressor,
+        )
+        for key in keys
+    }
+
+    if not cache_contexts:
+        return {}
+
+    found: dict[_KeyT, Any] = {}
+
+    if not force_overwrite:
+        try:
+            cached = cache.get_many([
+                cache_context.full_cache_key
+                for cache_context in cache_contexts.values()
+            ])
+        except Exception as e:
+            logger.exception('Error fetching data from cache for keys %r: %s',
+                             sorted(
+                                 cache_context.full_cache_key
+                                 for cache_context in cache_contexts.values()
+                             ),
+                             e)
+            cached = {}
+
+        for key, cache_context in cache_contexts.items():
+            full_cache_key = cache_context.full_cache_key
+
+            if full_cache_key in cached:
+                try:
+                    value = cache_context.decode_value(full_cache_key,
+                                                       cached[full_cache_key])
+                except Exception:
+                    # We've already logged enough information for this.
+                    # Proceed to generate new data.
+                    continue
+
+                if isinstance(value, _RefreshableCacheValue):
+                    value = value.value
+
+                found[key] = value
+
+        if large_data and found:
+            found = _cache_load_many_large_data(
+                cache_contexts=cache_contexts,
+                chunk_counts=found)
+
+    missing_keys = [
+        key
+        for key in cache_contexts
+        if key not in found
+    ]
+
+    stats_enabled = is_cache_stats_enabled()
+
+    if stats_enabled and not force_overwrite:
+        for key, cache_context in cache_contexts.items():
+            if key in found:
+                cache_context.record_stats(hits=1)
+            else:
+                cache_context.record_stats(misses=1)
+
+    if missing_keys:
+        logger.debug('Cache miss for key(s): %s',
+                     ', '.join(
+                         cache_contexts[key].full_cache_key
+                         for key in missing_keys
+                     ))
+
+        start_time = time.monotonic()
+        computed = dict(compute_missing_func(missing_keys))
+
+        # Only values for the keys we asked for can be stored.
+        missing_keys_set = set(missing_keys)
+        unrequested_keys = [
+            key
+            for key in computed
+            if key not in missing_keys_set
+        ]
+
+        if unrequested_keys:
+            logger.warning('cache_memoize_many() compute function returned '
+                           'values for unrequested key(s), which will be '
+                           'ignored: %r',
+                           unrequested_keys)
+
+            for key in unrequested_keys:
+                del computed[key]
+
+        if stats_enabled:
+            # Spread the compute time across all the computed keys.
+            compute_secs = ((time.monotonic() - start_time) /
+                            len(missing_keys))
+
+            for key in missing_keys:
+                cache_contexts[key].record_stats(computes=1,
+                                                 compute_secs=compute_secs)
+
+        if large_data:
+            for key, value in computed.items():
+                try:
+                    # Consume the generator in order to store the data.
+                    list(_cache_store_items(cache_context=cache_contexts[key],
+                                            items=[value]))
+                except Exception as e:
+                    logger.error('Failed to store large cache data for key '
+                                 '"%s". Error = %s',
+                                 cache_contexts[key].full_cache_key, e)
+        elif computed:
+            try:
+                items: dict[str, Any] = {}
+
+                for key, value in computed.items():
+                    cache_context = cache_contexts[key]
+                    full_cache_key = cache_context.full_cache_key
+                    items[full_cache_key] = cache_context.prepare_value(
+                        full_cache_key, value)
+
+                # All contexts share the same cache and expiration, so any
+                # of them can store the items.
+                cache_context.store_many(items)
+            except Exception:
+                # We've already caught and logged this error.
+                pass
+
+        found.update(computed)
+
+    return {
+        key: found[key]
+        for key in cache_contexts
+        if key in found
+    }
+
+
+def _cache_load_many_large_data(
+    *,
+    cache_contexts: Mapping[_KeyT, _CacheContext],
+    chunk_counts: Mapping[_KeyT, Any],
+) -> dict[_KeyT, Any]:
+    """Load large data for many keys from the cache.
+
+    All chunks for all keys will be fetched in a single request. Any keys
+    with missing or invalid chunks will be left out of the results.
+
+    Version Added:
+        7.0
+
+    Args:
+        cache_contexts (dict):
+            The caching operation contexts for each key.
+
+        chunk_counts (dict):
+            The large data headers (containing chunk counts) fetched from
+            cache for each key.
+
+    Returns:
+        dict:
+        A dictionary mapping keys to values loaded from cache.
+    """
+    all_chunk_keys: dict[_KeyT, list[str]] = {}
+    all_codecs: dict[
+        _KeyT,
+        tuple[BaseCacheSerializer, BaseCacheCompressor | None]
+    ] = {}
+
+    for key, header in chunk_counts.items():
+        cache_context = cache_contexts[key]
+
+        try:
+            chunk_count, serializer, compressor = \
+                cache_context.parse_large_data_header(header)
+        except Exception as e:
+            logger.warning('Invalid large data header %r in cache for key '
+                           '"%s": %s',
+                           header, cache_context.full_cache_key, e)
+            continue
+
+        all_chunk_keys[key] = [
+            cache_context.make_subkey(i)
+            for i in range(chunk_count)
+        ]
+        all_codecs[key] = (serializer, compressor)
+
+    try:
+        # Chunks are too large to keep in a request memo.
+        with bypass_request_cache_memo():
+            chunks = cache.get_many(list(itertools.chain.from_iterable(
+                all_chunk_keys.values())))
+    except Exception as e:
+        logger.exception('Error fetching large data from cache: %s', e)
+
+        return {}
+
+    results: dict[_KeyT, Any] = {}
+
+    for key, chunk_keys in all_chunk_keys.items():
+        cache_context = cache_contexts[key]
+        serializer, compressor = all_codecs[key]
+
+        try:
+            data = _cache_combine_large_data(cache_context=cache_context,
+                                             chunk_keys=chunk_keys,
+                                             chunks=chunks,
+                                             compressor=compressor)
+            items = list(_cache_iter_large_data(cache_context=cache_context,
+                                                data=data,
+                                                serializer=serializer))
+        except Exception as e:
+            logger.warning('Failed to fetch large data from cache for key '
+                           '"%s": %s',
+                           cache_context.full_cache_key, e)
+            continue
+
+        if len(items) == 1:
+            results[key] = items[0]
+
+    return results
+
+
 @deprecate_non_keyword_only_args(RemovedInDjblets80Warning)
 def make_cache_key(
     key: str | Sequence[str],
@@ -0,0 +1,944 @@
+"""Serializers and compressors for cached data.
+
+These are used by :py:func:`~djblets.cache.backend.cache_memoize` and
+related functions to control how data is encoded in cache. Callers can
+choose a serializer and compressor for a given family of keys, trading CPU
+time against cache memory.
+
+The serializer and compressor used are recorded alongside the cached data,
+so data can be read back regardless of which codecs are currently
+configured.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import lzma
+import marshal
+import pickle
+import zlib
+from typing import TYPE_CHECKING, Protocol
+
+from djblets.registries.registry import Registry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import IO, Any
+
+
+#: The maximum amount of decompressed data returned at a time when streaming.
+MAX_DECOMPRESS_SIZE = 2 ** 20
+
+
+class CacheCompressorObject(Protocol):
+    """An object used to incrementally compress data.
+
+    This is compatible with the compressor objects returned by
+    :py:func:`zlib.compressobj`.
+
+    Version Added:
+        7.0
+    """
+
+    def compress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Compress a block of data.
+
+        Args:
+            data (bytes):
+                The data to compress.
+
+        Returns:
+            bytes:
+            Any compressed data ready to be written.
+        """
+        ...
+
+    def flush(self) -> bytes:
+        """Return any remaining compressed data.
+
+        Returns:
+            bytes:
+            The remaining compressed data.
+        """
+        ...
+
+
+class BaseCacheSerializer:
+    """Base class for a serializer for cached data.
+
+    Serializers convert individual values to and from bytes. Serialized
+    values may be concatenated together, so each must be self-delimiting
+    when read back through :py:meth:`load`.
+
+    Version Added:
+        7.0
+    """
+
+    #: The unique ID of the serializer.
+    #:
+    #: This is stored along with cached data, and must not change.
+    serializer_id: str = ''
+
+    def dumps(
+        self,
+        value: Any,
+    ) -> bytes:
+        """Serialize a value.
+
+        Args:
+            value (object):
+                The value to serialize.
+
+        Returns:
+            bytes:
+            The serialized value.
+        """
+        raise NotImplementedError
+
+    def load(
+        self,
+        fp: IO[bytes],
+    ) -> Any:
+        """Deserialize the next value from a stream.
+
+        Args:
+            fp (io.BufferedIOBase):
+                The stream to read from.
+
+        Returns:
+            object:
+            The deserialized value.
+
+        Raises:
+            EOFError:
+                There are no more values in the stream.
+        """
+        raise NotImplementedError
+
+    def loads(
+        self,
+        data: bytes,
+    ) -> Any:
+        """Deserialize a value.
+
+        Args:
+            data (bytes):
+                The serialized value.
+
+        Returns:
+            object:
+            The deserialized value.
+        """
+        raise NotImplementedError
+
+
+class PickleCacheSerializer(BaseCacheSerializer):
+    """A serializer using :py:mod:`pickle`.
+
+    This supports any picklable Python object. Any protocol can be read back,
+    regardless of the protocol used for writing.
+
+    Version Added:
+        7.0
+    """
+
+    serializer_id = 'pickle'
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The pickle protocol used when serializing.
+    protocol: int
+
+    def __init__(
+        self,
+        protocol: int = 5,
+    ) -> None:
+        """Initialize the serializer.
+
+        Args:
+            protocol (int, optional):
+                The pickle protocol used when serializing.
+        """
+        self.protocol = protocol
+
+    def dumps(
+        self,
+        value: Any,
+    ) -> bytes:
+        """Serialize a value.
+
+        Args:
+            value (object):
+                The value to serialize.
+
+        Returns:
+            bytes:
+            The serialized value.
+        """
+        return pickle.dumps(value, protocol=self.protocol)
+
+    def load(
+        self,
+        fp: IO[bytes],
+    ) -> Any:
+        """Deserialize the next value from a stream.
+
+        Args:
+            fp (io.BufferedIOBase):
+                The stream to read from.
+
+        Returns:
+            object:
+            The deserialized value.
+
+        Raises:
+            EOFError:
+                There are no more values in the stream.
+        """
+        return pickle.load(fp)
+
+    def loads(
+        self,
+        data: bytes,
+    ) -> Any:
+        """Deserialize a value.
+
+        Args:
+            data (bytes):
+                The serialized value.
+
+        Returns:
+            object:
+            The deserialized value.
+        """
+        return pickle.loads(data)
+
+
+class JSONCacheSerializer(BaseCacheSerializer):
+    """A serializer using JSON.
+
+    This only supports JSON-compatible values. Tuples will be read back as
+    lists.
+
+    Each value is written on its own line.
+
+    Version Added:
+        7.0
+    """
+
+    serializer_id = 'json'
+
+    def dumps(
+        self,
+        value: Any,
+    ) -> bytes:
+        """Serialize a value.
+
+        Args:
+            value (object):
+                The value to serialize.
+
+        Returns:
+            bytes:
+            The serialized value.
+        """
+        return b'%s\n' % json.dumps(value, separators=(',', ':')).encode()
+
+    def load(
+        self,
+        fp: IO[bytes],
+    ) -> Any:
+        """Deserialize the next value from a stream.
+
+        Args:
+            fp (io.BufferedIOBase):
+                The stream to read from.
+
+        Returns:
+            object:
+            The deserialized value.
+
+        Raises:
+            EOFError:
+                There are no more values in the stream.
+        """
+        line = fp.readline()
+
+        if not line:
+            raise EOFError
+
+        return json.loads(line)
+
+    def loads(
+        self,
+        data: bytes,
+    ) -> Any:
+        """Deserialize a value.
+
+        Args:
+            data (bytes):
+                The serialized value.
+
+        Returns:
+            object:
+            The deserialized value.
+        """
+        return json.loads(data)
+
+
+class MarshalCacheSerializer(BaseCacheSerializer):
+    """A serializer using :py:mod:`marshal`.
+
+    This is fast, but only supports built-in types, and the format may
+    change between Python versions. It should only be used for data that
+    can be safely discarded on upgrade.
+
+    Version Added:
+        7.0
+    """
+
+    serializer_id = 'marshal'
+
+    def dumps(
+        self,
+        value: Any,
+    ) -> bytes:
+        """Serialize a value.
+
+        Args:
+            value (object):
+                The value to serialize.
+
+        Returns:
+            bytes:
+            The serialized value.
+        """
+        return marshal.dumps(value)
+
+    def load(
+        self,
+        fp: IO[bytes],
+    ) -> Any:
+        """Deserialize the next value from a stream.
+
+        Args:
+            fp (io.BufferedIOBase):
+                The stream to read from.
+
+        Returns:
+            object:
+            The deserialized value.
+
+        Raises:
+            EOFError:
+                There are no more values in the stream.
+        """
+        return marshal.load(fp)
+
+    def loads(
+        self,
+        data: bytes,
+    ) -> Any:
+        """Deserialize a value.
+
+        Args:
+            data (bytes):
+                The serialized value.
+
+        Returns:
+            object:
+            The deserialized value.
+        """
+        return marshal.loads(data)
+
+
+class BaseCacheCompressor:
+    """Base class for a compressor for cached data.
+
+    Version Added:
+        7.0
+    """
+
+    #: The unique ID of the compressor.
+    #:
+    #: This is stored along with cached data, and must not change.
+    compressor_id: str = ''
+
+    def compressobj(self) -> CacheCompressorObject:
+        """Return an object for incrementally compressing data.
+
+        Returns:
+            CacheCompressorObject:
+            The compressor object.
+        """
+        raise NotImplementedError
+
+    def compress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Compress data.
+
+        Args:
+            data (bytes):
+                The data to compress.
+
+        Returns:
+            bytes:
+            The compressed data.
+        """
+        compressor = self.compressobj()
+
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Decompress data.
+
+        Args:
+            data (bytes):
+                The data to decompress.
+
+        Returns:
+            bytes:
+            The decompressed data.
+        """
+        return b''.join(self.iter_decompress([data]))
+
+    def iter_decompress(
+        self,
+        chunks: Iterable[bytes],
+    ) -> Iterator[bytes]:
+        """Iteratively decompress data.
+
+        Args:
+            chunks (iterable of bytes):
+                The compressed data to decompress.
+
+        Yields:
+            bytes:
+            Each block of decompressed data.
+        """
+        raise NotImplementedError
+
+
+class ZlibCacheCompressor(BaseCacheCompressor):
+    """A compressor using :py:mod:`zlib`.
+
+    Version Added:
+        7.0
+    """
+
+    compressor_id = 'zlib'
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The compression level, from 0-9, or -1 for the default.
+    level: int
+
+    def __init__(
+        self,
+        level: int = -1,
+    ) -> None:
+        """Initialize the compressor.
+
+        Args:
+            level (int, optional):
+                The compression level, from 0-9, or -1 for the default.
+        """
+        self.level = level
+
+    def compressobj(self) -> CacheCompressorObject:
+        """Return an object for incrementally compressing data.
+
+        Returns:
+            CacheCompressorObject:
+            The compressor object.
+        """
+        return zlib.compressobj(self.level)
+
+    def decompress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Decompress data.
+
+        Args:
+            data (bytes):
+                The data to decompress.
+
+        Returns:
+            bytes:
+            The decompressed data.
+        """
+        return zlib.decompress(data)
+
+    def iter_decompress(
+        self,
+        chunks: Iterable[bytes],
+    ) -> Iterator[bytes]:
+        """Iteratively decompress data.
+
+        No more than :py:data:`MAX_DECOMPRESS_SIZE` bytes of decompressed
+        data will be yielded at a time, regardless of the compression ratio.
+
+        Args:
+            chunks (iterable of bytes):
+                The compressed data to decompress.
+
+        Yields:
+            bytes:
+            Each block of decompressed data.
+
+        Raises:
+            zlib.error:
+                The compressed data was invalid or incomplete.
+        """
+        decompressor = zlib.decompressobj()
+
+        for data in chunks:
+            while data:
+                yield decompressor.decompress(data, MAX_DECOMPRESS_SIZE)
+                data = decompressor.unconsumed_tail
+
+        remaining = decompressor.flush()
+
+        if remaining:
+            yield remaining
+
+        if not decompressor.eof:
+            raise zlib.error('Incomplete or truncated compressed data')
+
+
+class LZMACacheCompressor(BaseCacheCompressor):
+    """A compressor using :py:mod:`lzma`.
+
+    This compresses better than zlib, at a higher CPU cost.
+
+    Version Added:
+        7.0
+    """
+
+    compressor_id = 'lzma'
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The compression preset, from 0-9, or ``None`` for the default.
+    preset: int | None
+
+    def __init__(
+        self,
+        preset: (int | None) = None,
+    ) -> None:
+        """Initialize the compressor.
+
+        Args:
+            preset (int, optional):
+                The compression preset, from 0-9.
+        """
+        self.preset = preset
+
+    def compressobj(self) -> CacheCompressorObject:
+        """Return an object for incrementally compressing data.
+
+        Returns:
+            CacheCompressorObject:
+            The compressor object.
+        """
+        return lzma.LZMACompressor(preset=self.preset)
+
+    def iter_decompress(
+        self,
+        chunks: Iterable[bytes],
+    ) -> Iterator[bytes]:
+        """Iteratively decompress data.
+
+        No more than :py:data:`MAX_DECOMPRESS_SIZE` bytes of decompressed
+        data will be yielded at a time, regardless of the compression ratio.
+
+        Args:
+            chunks (iterable of bytes):
+                The compressed data to decompress.
+
+        Yields:
+            bytes:
+            Each block of decompressed data.
+
+        Raises:
+            lzma.LZMAError:
+                The compressed data was invalid or incomplete.
+        """
+        decompressor = lzma.LZMADecompressor()
+
+        for data in chunks:
+            yield decompressor.decompress(data, MAX_DECOMPRESS_SIZE)
+
+            # Drain any buffered output before feeding more input.
+            while not decompressor.needs_input and not decompressor.eof:
+                yield decompressor.decompress(b'', MAX_DECOMPRESS_SIZE)
+
+        if not decompressor.eof:
+            raise lzma.LZMAError('Incomplete or truncated compressed data')
+
+
+class LZ4CacheCompressor(BaseCacheCompressor):
+    """A compressor using LZ4 frames.
+
+    This is very fast, with a lower compression ratio than zlib. It requires
+    the :pypi:`lz4` package.
+
+    Version Added:
+        7.0
+    """
+
+    compressor_id = 'lz4'
+
+    def compressobj(self) -> CacheCompressorObject:
+        """Return an object for incrementally compressing data.
+
+        Returns:
+            CacheCompressorObject:
+            The compressor object.
+        """
+        import lz4.frame
+
+        return _LZ4CompressorObject(lz4.frame.LZ4FrameCompressor())
+
+    def iter_decompress(
+        self,
+        chunks: Iterable[bytes],
+    ) -> Iterator[bytes]:
+        """Iteratively decompress data.
+
+        No more than :py:data:`MAX_DECOMPRESS_SIZE` bytes of decompressed
+        data will be yielded at a time, regardless of the compression ratio.
+
+        Args:
+            chunks (iterable of bytes):
+                The compressed data to decompress.
+
+        Yields:
+            bytes:
+            Each block of decompressed data.
+
+        Raises:
+            RuntimeError:
+                The compressed data was invalid or incomplete.
+        """
+        import lz4.frame
+
+        decompressor = lz4.frame.LZ4FrameDecompressor()
+
+        for data in chunks:
+            yield decompressor.decompress(data, MAX_DECOMPRESS_SIZE)
+
+            # Drain any buffered output before feeding more input.
+            while not decompressor.needs_input and not decompressor.eof:
+                yield decompressor.decompress(b'', MAX_DECOMPRESS_SIZE)
+
+        if not decompressor.eof:
+            raise RuntimeError('Incomplete or truncated compressed data')
+
+
+class _LZ4CompressorObject:
+    """Adapts an LZ4 frame compressor to the compressor object interface.
+
+    Version Added:
+        7.0
+    """
+
+    def __init__(
+        self,
+        compressor: Any,
+    ) -> None:
+        """Initialize the object.
+
+        Args:
+            compressor (lz4.frame.LZ4FrameCompressor):
+                The LZ4 frame compressor to wrap.
+        """
+        self._compressor = compressor
+        self._header = compressor.begin()
+
+    def compress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Compress a block of data.
+
+        Args:
+            data (bytes):
+                The data to compress.
+
+        Returns:
+            bytes:
+            Any compressed data ready to be written.
+        """
+        result = self._header + self._compressor.compress(data)
+        self._header = b''
+
+        return result
+
+    def flush(self) -> bytes:
+        """Return any remaining compressed data.
+
+        Returns:
+            bytes:
+            The remaining compressed data.
+        """
+        result = self._header + self._compressor.flush()
+        self._header = b''
+
+        return result
+
+
+class ZstdCacheCompressor(BaseCacheCompressor):
+    """A compressor using Zstandard.
+
+    This offers a good balance of speed and compression ratio. It requires
+    the :pypi:`zstandard` package.
+
+    Version Added:
+        7.0
+    """
+
+    compressor_id = 'zstd'
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The compression level.
+    level: int
+
+    def __init__(
+        self,
+        level: int = 3,
+    ) -> None:
+        """Initialize the compressor.
+
+        Args:
+            level (int, optional):
+                The compression level.
+        """
+        self.level = level
+
+    def compressobj(self) -> CacheCompressorObject:
+        """Return an object for incrementally compressing data.
+
+        Returns:
+            CacheCompressorObject:
+            The compressor object.
+        """
+        import zstandard
+
+        return (
+            zstandard.ZstdCompressor(level=self.level)
+            .compressobj()
+        )
+
+    def iter_decompress(
+        self,
+        chunks: Iterable[bytes],
+    ) -> Iterator[bytes]:
+        """Iteratively decompress data.
+
+        No more than :py:data:`MAX_DECOMPRESS_SIZE` bytes of decompressed
+        data will be yielded at a time, regardless of the compression ratio.
+
+        Args:
+            chunks (iterable of bytes):
+                The compressed data to decompress.
+
+        Yields:
+            bytes:
+            Each block of decompressed data.
+
+        Raises:
+            zstandard.ZstdError:
+                The compressed data was invalid.
+        """
+        import zstandard
+
+        yield from zstandard.ZstdDecompressor().read_to_iter(
+            _ChunksReader(chunks),
+            write_size=MAX_DECOMPRESS_SIZE)
+
+
+class _ChunksReader:
+    """Adapts an iterable of bytes to a file-like object for reading.
+
+    Version Added:
+        7.0
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+    ) -> None:
+        """Initialize the reader.
+
+        Args:
+            chunks (iterable of bytes):
+                The data to read.
+        """
+        self._chunks = iter(chunks)
+        self._pending = b''
+
+    def read(
+        self,
+        size: int = -1,
+    ) -> bytes:
+        """Read data.
+
+        This may return less data than requested. An empty result means
+        there's no more data to read.
+
+        Args:
+            size (int, optional):
+                The max number of bytes to read, or -1 for no limit.
+
+        Returns:
+            bytes:
+            The data read.
+        """
+        data = self._pending
+
+        while not data:
+            try:
+                data = next(self._chunks)
+            except StopIteration:
+                return b''
+
+        if 0 <= size < len(data):
+            self._pending = data[size:]
+            data = data[:size]
+        else:
+            self._pending = b''
+
+        return data
+
+
+class CacheSerializersRegistry(Registry[BaseCacheSerializer]):
+    """A registry of serializers for cached data.
+
+    Version Added:
+        7.0
+    """
+
+    lookup_attrs = ('serializer_id',)
+
+    def get_defaults(self) -> Iterable[BaseCacheSerializer]:
+        """Return the default serializers.
+
+        Returns:
+            list of BaseCacheSerializer:
+            The default serializers.
+        """
+        return [
+            PickleCacheSerializer(),
+            JSONCacheSerializer(),
+            MarshalCacheSerializer(),
+        ]
+
+    def get_serializer(
+        self,
+        serializer_id: str,
+    ) -> BaseCacheSerializer:
+        """Return a serializer with the given ID.
+
+        Args:
+            serializer_id (str):
+                The ID of the serializer.
+
+        Returns:
+            BaseCacheSerializer:
+            The serializer.
+
+        Raises:
+            djblets.registries.errors.ItemLookupError:
+                The serializer was not registered.
+        """
+        return self.get('serializer_id', serializer_id)
+
+
+class CacheCompressorsRegistry(Registry[BaseCacheCompressor]):
+    """A registry of compressors for cached data.
+
+    The LZ4 and Zstandard compressors will only be registered if their
+    packages are installed.
+
+    Version Added:
+        7.0
+    """
+
+    lookup_attrs = ('compressor_id',)
+
+    def get_defaults(self) -> Iterable[BaseCacheCompressor]:
+        """Return the default compressors.
+
+        Returns:
+            list of BaseCacheCompressor:
+            The default compressors.
+        """
+        compressors: list[BaseCacheCompressor] = [
+            ZlibCacheCompressor(),
+            LZMACacheCompressor(),
+        ]
+
+        if importlib.util.find_spec('lz4') is not None:
+            compressors.append(LZ4CacheCompressor())
+
+        if importlib.util.find_spec('zstandard') is not None:
+            compressors.append(ZstdCacheCompressor())
+
+        return compressors
+
+    def get_compressor(
+        self,
+        compressor_id: str,
+    ) -> BaseCacheCompressor:
+        """Return a compressor with the given ID.
+
+        Args:
+            compressor_id (str):
+                The ID of the compressor.
+
+        Returns:
+            BaseCacheCompressor:
+            The compressor.
+
+        Raises:
+            djblets.registries.errors.ItemLookupError:
+                The compressor was not registered, or its package is not
+                installed.
+        """
+        return self.get('compressor_id', compressor_id)
+
+
+#: The registry of serializers for cached data.
+#:
+#: Version Added:
+#:     7.0
+cache_serializers = CacheSerializersRegistry()
+
+#: The registry of compressors for cached data.
+#:
+#: Version Added:
+#:     7.0
+cache_compressors = CacheCompressorsRegistry()
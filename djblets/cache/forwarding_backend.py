@@ -1,10 +1,39 @@
-"""A cache backend that forwards to other dynamically-configured backends."""
+"""A cache backend that forwards to other dynamically-configured backends.
+
+Version Changed:
+    7.0:
+    Added :py:class:`RequestMemoCacheBackend`, for deduplicating cache
+    fetches within a request.
+"""
 
 from __future__ import annotations
 
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from djblets.util.symbols import UNSET
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from typing import Any
+
 
 DEFAULT_FORWARD_CACHE_ALIAS = 'forwarded_backend'
 
+#: The default max number of keys memoized per cache backend in a request.
+#:
+#: This can be changed with
+#: ``settings.DJBLETS_CACHE_REQUEST_MEMO_MAX_KEYS``.
+#:
+#: Version Added:
+#:     7.0
+DEFAULT_REQUEST_CACHE_MEMO_MAX_KEYS = 1000
+
 
 class ForwardingCacheBackend(object):
     """Forwards requests to another cache backend.
@@ -60,3 +89,795 @@ class ForwardingCacheBackend(object):
             return object.__getattribute__(self, name)
         except AttributeError:
             return self.backend.__getattribute__(name)
+
+
+class RequestCacheMemo:
+    """Memoized cache state for a single request.
+
+    This holds values fetched from or written to the cache by any
+    :py:class:`RequestMemoCacheBackend` during a request, along with
+    statistics on how many round trips to the cache server were avoided.
+
+    Instances are created and activated by :py:func:`request_cache_memo`.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The number of fetches that needed to contact the cache server.
+    fetches: int
+
+    #: The number of keys requested from the cache server.
+    fetched_keys: int
+
+    #: The number of keys served from the memo, keyed by cache key.
+    key_hits: Counter[str]
+
+    #: The max number of keys memoized for each cache backend.
+    #:
+    #: Once reached, the oldest keys will be discarded.
+    max_keys: int
+
+    #: The number of fetches served entirely from the memo.
+    #:
+    #: Each of these is a round trip to the cache server that was avoided.
+    round_trips_avoided: int
+
+    def __init__(
+        self,
+        *,
+        max_keys: int = DEFAULT_REQUEST_CACHE_MEMO_MAX_KEYS,
+    ) -> None:
+        """Initialize the memo.
+
+        Args:
+            max_keys (int, optional):
+                The max number of keys memoized for each cache backend.
+        """
+        self.fetches = 0
+        self.fetched_keys = 0
+        self.key_hits = Counter()
+        self.max_keys = max_keys
+        self.round_trips_avoided = 0
+
+        self._stores: dict[str, dict[tuple[str, Any], Any]] = {}
+
+    @property
+    def memo_hits(self) -> int:
+        """The total number of keys served from the memo.
+
+        Type:
+            int
+        """
+        return sum(self.key_hits.values())
+
+    def get_store(
+        self,
+        cache_name: str,
+    ) -> dict[tuple[str, Any], Any]:
+        """Return the memoized values for a cache backend.
+
+        Args:
+            cache_name (str):
+                The name of the cache backend being wrapped.
+
+        Returns:
+            dict:
+            The memoized values, keyed by a tuple of cache key and version.
+        """
+        try:
+            return self._stores[cache_name]
+        except KeyError:
+            store: dict[tuple[str, Any], Any] = {}
+            self._stores[cache_name] = store
+
+            return store
+
+    def remember(
+        self,
+        store: dict[tuple[str, Any], Any],
+        memo_key: tuple[str, Any],
+        value: Any,
+    ) -> None:
+        """Memoize a value in a store.
+
+        If the store is full, the oldest memoized value will be discarded.
+
+        Args:
+            store (dict):
+                The store returned from :py:meth:`get_store`.
+
+            memo_key (tuple):
+                The tuple of cache key and version.
+
+            value (object):
+                The value to memoize.
+        """
+        if memo_key not in store and len(store) >= self.max_keys:
+            del store[next(iter(store))]
+
+        store[memo_key] = value
+
+    def get_report(
+        self,
+        *,
+        max_keys: int = 10,
+    ) -> dict[str, Any]:
+        """Return a report of the cache usage during the request.
+
+        Args:
+            max_keys (int, optional):
+                The max number of keys to include in the list of most-hit
+                keys.
+
+        Returns:
+            dict:
+            The report, containing:
+
+            Keys:
+                fetches (int):
+                    The number of fetches that needed to contact the cache
+                    server.
+
+                fetched_keys (int):
+                    The number of keys requested from the cache server.
+
+                memo_hits (int):
+                    The number of keys served from the memo.
+
+                round_trips_avoided (int):
+                    The number of fetches served entirely from the memo.
+
+                top_keys (list of tuple):
+                    The keys most often served from the memo, as tuples of
+                    cache key and hit count.
+        """
+        return {
+            'fetches': self.fetches,
+            'fetched_keys': self.fetched_keys,
+            'memo_hits': self.memo_hits,
+            'round_trips_avoided': self.round_trips_avoided,
+            'top_keys': self.key_hits.most_common(max_keys),
+        }
+
+
+#: The memo for the active request, if any.
+_request_cache_memo: ContextVar[RequestCacheMemo | None] = \
+    ContextVar('request_cache_memo', default=None)
+
+#: Whether fetches should bypass the memo.
+_request_cache_memo_bypassed: ContextVar[bool] = \
+    ContextVar('request_cache_memo_bypassed', default=False)
+
+
+@contextmanager
+def request_cache_memo() -> Iterator[RequestCacheMemo]:
+    """Memoize cache operations for the duration of the context.
+
+    While active, any :py:class:`RequestMemoCacheBackend` will serve
+    repeated fetches of the same keys from memory.
+
+    This is normally activated for each request by
+    :py:func:`~djblets.cache.middleware.RequestCacheMemoMiddleware`, but
+    can be used directly in other units of work (such as tasks or
+    management commands).
+
+    Contexts can be nested. Only the outermost context creates a memo.
+
+    Each memo holds at most ``settings.DJBLETS_CACHE_REQUEST_MEMO_MAX_KEYS``
+    keys (1000 by default) per cache backend.
+
+    Version Added:
+        7.0
+
+    Context:
+        RequestCacheMemo:
+        The active memo.
+    """
+    memo = _request_cache_memo.get()
+
+    if memo is not None:
+        yield memo
+    else:
+        memo = RequestCacheMemo(max_keys=getattr(
+            settings,
+            'DJBLETS_CACHE_REQUEST_MEMO_MAX_KEYS',
+            DEFAULT_REQUEST_CACHE_MEMO_MAX_KEYS))
+        token = _request_cache_memo.set(memo)
+
+        try:
+            yield memo
+        finally:
+            _request_cache_memo.reset(token)
+
+
+@contextmanager
+def bypass_request_cache_memo() -> Iterator[None]:
+    """Bypass the active memo for cache operations in the context.
+
+    While active, fetches go directly to the cache backend, and any values
+    memoized for the fetched or written keys are discarded rather than
+    updated.
+
+    This should be used for keys that other processes change while a
+    request is in progress (such as locks), and for large values that
+    shouldn't be kept in memory (such as chunks of large data).
+
+    Version Added:
+        7.0
+
+    Context:
+        The memo will be bypassed.
+    """
+    token = _request_cache_memo_bypassed.set(True)
+
+    try:
+        yield
+    finally:
+        _request_cache_memo_bypassed.reset(token)
+
+
+def get_request_cache_memo() -> RequestCacheMemo | None:
+    """Return the active memo, if any.
+
+    Version Added:
+        7.0
+
+    Returns:
+        RequestCacheMemo:
+        The active memo, or ``None`` if one isn't active.
+    """
+    return _request_cache_memo.get()
+
+
+class RequestMemoCacheBackend(ForwardingCacheBackend):
+    """Forwards requests to another backend, memoizing them within a request.
+
+    When a :py:func:`request_cache_memo` context is active (normally set up
+    by :py:func:`~djblets.cache.middleware.RequestCacheMemoMiddleware`),
+    values fetched through :py:meth:`get` or :py:meth:`get_many` are kept
+    in memory for the rest of the request. Later fetches of the same keys
+    will be served from memory, avoiding round trips to the cache server.
+    Misses aren't remembered, so keys stored by other processes will be
+    seen once they exist.
+
+    Writes are passed through to the cache backend and applied to the memo,
+    so that code in the request always sees its own changes. Changes made
+    by other processes during the request will not be seen.
+
+    Memoized values are returned as-is, without copying. Callers must not
+    modify values returned from the cache without storing them again.
+
+    Keys that change while a request is in progress, or hold large values,
+    should be accessed within :py:func:`bypass_request_cache_memo`.
+
+    Outside of a memo context, all operations are forwarded directly.
+
+    This is configured like :py:class:`ForwardingCacheBackend`, with
+    ``LOCATION`` naming the cache backend to forward to. For example:
+
+    .. code-block:: python
+
+       CACHES = {
+           'default': {
+               'BACKEND': ('djblets.cache.forwarding_backend.'
+                           'RequestMemoCacheBackend'),
+               'LOCATION': 'memcached',
+           },
+           'memcached': {
+               'BACKEND': 'django.core.cache.backends.memcached.'
+                          'PyMemcacheCache',
+               'LOCATION': '127.0.0.1:11211',
+           },
+       }
+
+    Version Added:
+        7.0
+    """
+
+    def _get_memo(self) -> RequestCacheMemo | None:
+        """Return the memo to use for operations.
+
+        Returns:
+            RequestCacheMemo:
+            The active memo, or ``None`` if a memo is not active or is
+            being bypassed.
+        """
+        if _request_cache_memo_bypassed.get():
+            return None
+
+        return _request_cache_memo.get()
+
+    def _get_memo_store(self) -> dict[tuple[str, Any], Any] | None:
+        """Return the memoized values for this backend.
+
+        This is returned even if the memo is being bypassed, so that writes
+        can discard memoized values.
+
+        Returns:
+            dict:
+            The memoized values, or ``None`` if a memo is not active.
+        """
+        memo = _request_cache_memo.get()
+
+        if memo is None:
+            return None
+
+        return memo.get_store(self._cache_name)
+
+    def get(
+        self,
+        key: str,
+        default: Any = None,
+        version: Any = None,
+    ) -> Any:
+        """Return a value from the cache.
+
+        Args:
+            key (str):
+                The cache key.
+
+            default (object, optional):
+                The value to return if the key is not in cache.
+
+            version (object, optional):
+                The version of the key.
+
+        Returns:
+            object:
+            The cached value, or ``default``.
+        """
+        memo = self._get_memo()
+
+        if memo is None:
+            self._forget([key], version=version)
+
+            return self.backend.get(key, default, version=version)
+
+        store = memo.get_store(self._cache_name)
+        memo_key = (key, version)
+
+        try:
+            value = store[memo_key]
+        except KeyError:
+            memo.fetches += 1
+            memo.fetched_keys += 1
+
+            value = self.backend.get(key, UNSET, version=version)
+
+            if value is UNSET:
+                return default
+
+            memo.remember(store, memo_key, value)
+        else:
+            memo.round_trips_avoided += 1
+            memo.key_hits[key] += 1
+
+        return value
+
+    def get_many(
+        self,
+        keys: Iterable[str],
+        version: Any = None,
+    ) -> dict[str, Any]:
+        """Return several values from the cache.
+
+        Only keys not already in the memo will be fetched from the cache
+        backend.
+
+        Args:
+            keys (list of str):
+                The cache keys.
+
+            version (object, optional):
+                The version of the keys.
+
+        Returns:
+            dict:
+            The values found in cache, keyed by cache key.
+        """
+        memo = self._get_memo()
+
+        if memo is None:
+            keys = list(keys)
+            self._forget(keys, version=version)
+
+            return self.backend.get_many(keys, version=version)
+
+        store = memo.get_store(self._cache_name)
+        result: dict[str, Any] = {}
+        missing_keys: list[str] = []
+
+        for key in keys:
+            try:
+                result[key] = store[(key, version)]
+            except KeyError:
+                missing_keys.append(key)
+            else:
+                memo.key_hits[key] += 1
+
+        if missing_keys:
+            memo.fetches += 1
+            memo.fetched_keys += len(missing_keys)
+
+            fetched = self.backend.get_many(missing_keys, version=version)
+
+            for key, value in fetched.items():
+                memo.remember(store, (key, version), value)
+
+            result.update(fetched)
+        else:
+            memo.round_trips_avoided += 1
+
+        return result
+
+    def has_key(
+        self,
+        key: str,
+        version: Any = None,
+    ) -> bool:
+        """Return whether a key is in the cache.
+
+        Args:
+            key (str):
+                The cache key.
+
+            version (object, optional):
+                The version of the key.
+
+        Returns:
+            bool:
+            ``True`` if the key is in cache.
+        """
+        return self.get(key, UNSET, version=version) is not UNSET
+
+    def __contains__(
+        self,
+        key: str,
+    ) -> bool:
+        """Return whether a key is in the cache.
+
+        Args:
+            key (str):
+                The cache key.
+
+        Returns:
+            bool:
+            ``True`` if the key is in cache.
+        """
+        return self.has_key(key)
+
+    def get_or_set(
+        self,
+        key: str,
+        default: Any,
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: Any = None,
+    ) -> Any:
+        """Return a value from the cache, setting a default if not present.
+
+        Args:
+            key (str):
+                The cache key.
+
+            default (object or callable):
+                The value to set if the key is not in cache. If callable,
+                it will be called to compute the value.
+
+            timeout (int, optional):
+                The expiration time for the value.
+
+            version (object, optional):
+                The version of the key.
+
+        Returns:
+            object:
+            The cached or newly-set value.
+        """
+        value = self.get(key, UNSET, version=version)
+
+        if value is UNSET:
+            if callable(default):
+                default = default()
+
+            self.add(key, default, timeout=timeout, version=version)
+
+            # Fetch the stored value, in case another caller set it first.
+            value = self.get(key, default, version=version)
+
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: Any = None,
+    ) -> None:
+        """Set a value in the cache.
+
+        Args:
+            key (str):
+                The cache key.
+
+            value (object):
+                The value to set.
+
+            timeout (int, optional):
+                The expiration time for the value.
+
+            version (object, optional):
+                The version of the key.
+        """
+        self.backend.set(key, value, timeout=timeout, version=version)
+        self._update_memo({key: value}, timeout=timeout, version=version)
+
+    def set_many(
+        self,
+        data: Mapping[str, Any],
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: Any = None,
+    ) -> list[str]:
+        """Set several values in the cache.
+
+        Args:
+            data (dict):
+                The values to set, keyed by cache key.
+
+            timeout (int, optional):
+                The expiration time for the values.
+
+            version (object, optional):
+                The version of the keys.
+
+        Returns:
+            list of str:
+            The keys that failed to be set.
+        """
+        failed_keys = self.backend.set_many(data, timeout=timeout,
+                                            version=version)
+        self._update_memo(data, timeout=timeout, version=version)
+        self._forget(failed_keys or [], version=version)
+
+        return failed_keys
+
+    def add(
+        self,
+        key: str,
+        value: Any,
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: Any = None,
+    ) -> bool:
+        """Add a value to the cache, if not already present.
+
+        Args:
+            key (str):
+                The cache key.
+
+            value (object):
+                The value to add.
+
+            timeout (int, optional):
+                The expiration time for the value.
+
+            version (object, optional):
+                The version of the key.
+
+        Returns:
+            bool:
+            ``True`` if the value was added.
+        """
+        added = self.backend.add(key, value, timeout=timeout,
+                                 version=version)
+
+        if added:
+            self._update_memo({key: value}, timeout=timeout, version=version)
+        else:
+            # Another caller stored a value we haven't seen.
+            self._forget([key], version=version)
+
+        return added
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        version: Any = None,
+    ) -> int:
+        """Increment a value in the cache.
+
+        Args:
+            key (str):
+                The cache key.
+
+            delta (int, optional):
+                The amount to increment by.
+
+            version (object, optional):
+                The version of the key.
+
+        Returns:
+            int:
+            The new value.
+
+        Raises:
+            ValueError:
+                The key was not in cache.
+        """
+        try:
+            value = self.backend.incr(key, delta, version=version)
+        except ValueError:
+            self._forget([key], version=version)
+            raise
+
+        self._update_memo({key: value}, version=version)
+
+        return value
+
+    def decr(
+        self,
+        key: str,
+        delta: int = 1,
+        version: Any = None,
+    ) -> int:
+        """Decrement a value in the cache.
+
+        Args:
+            key (str):
+                The cache key.
+
+            delta (int, optional):
+                The amount to decrement by.
+
+            version (object, optional):
+                The version of the key.
+
+        Returns:
+            int:
+            The new value.
+
+        Raises:
+            ValueError:
+                The key was not in cache.
+        """
+        return self.incr(key, -delta, version=version)
+
+    def touch(
+        self,
+        key: str,
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: Any = None,
+    ) -> bool:
+        """Update the expiration time of a value in the cache.
+
+        Args:
+            key (str):
+                The cache key.
+
+            timeout (int, optional):
+                The new expiration time for the value.
+
+            version (object, optional):
+                The version of the key.
+
+        Returns:
+            bool:
+            ``True`` if the key was in cache.
+        """
+        touched = self.backend.touch(key, timeout=timeout, version=version)
+
+        if not touched or timeout == 0:
+            self._forget([key], version=version)
+
+        return touched
+
+    def delete(
+        self,
+        key: str,
+        version: Any = None,
+    ) -> bool:
+        """Delete a value from the cache.
+
+        Args:
+            key (str):
+                The cache key.
+
+            version (object, optional):
+                The version of the key.
+
+        Returns:
+            bool:
+            ``True`` if the key was deleted.
+        """
+        deleted = self.backend.delete(key, version=version)
+        self._forget([key], version=version)
+
+        return deleted
+
+    def delete_many(
+        self,
+        keys: Iterable[str],
+        version: Any = None,
+    ) -> None:
+        """Delete several values from the cache.
+
+        Args:
+            keys (list of str):
+                The cache keys.
+
+            version (object, optional):
+                The version of the keys.
+        """
+        keys = list(keys)
+        self.backend.delete_many(keys, version=version)
+        self._forget(keys, version=version)
+
+    def clear(self) -> None:
+        """Clear all values from the cache."""
+        self.backend.clear()
+
+        store = self._get_memo_store()
+
+        if store is not None:
+            store.clear()
+
+    def _update_memo(
+        self,
+        data: Mapping[str, Any],
+        *,
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: Any = None,
+    ) -> None:
+        """Apply written values to the memo.
+
+        If the memo is being bypassed, the keys will be discarded from the
+        memo instead.
+
+        Args:
+            data (dict):
+                The written values, keyed by cache key.
+
+            timeout (int, optional):
+                The expiration time used for the values. Values set to
+                expire immediately will be discarded from the memo.
+
+            version (object, optional):
+                The version of the keys.
+        """
+        memo = self._get_memo()
+        expired = (timeout is not DEFAULT_TIMEOUT and
+                   timeout is not None and
+                   timeout <= 0)
+
+        if memo is None or expired:
+            self._forget(data.keys(), version=version)
+        else:
+            store = memo.get_store(self._cache_name)
+
+            for key, value in data.items():
+                memo.remember(store, (key, version), value)
+
+    def _forget(
+        self,
+        keys: Iterable[str],
+        *,
+        version: Any = None,
+    ) -> None:
+        """Remove keys from the memo, so they'll be fetched again.
+
+        Args:
+            keys (list of str):
+                The cache keys to remove.
+
+            version (object, optional):
+                The version of the keys.
+        """
+        store = self._get_memo_store()
+
+        if store is not None:
+            for key in keys:
+                store.pop((key, version), None)
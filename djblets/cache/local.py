@@ -0,0 +1,352 @@
+"""A process-local cache tier for cached data.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from djblets.util.symbols import UNSET
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from djblets.cache.synchronizer import GenerationSynchronizer
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocalCache:
+    """A bounded, process-local cache for small, frequently-accessed data.
+
+    This acts as an in-process tier in front of the main cache backend. It
+    can be passed to :py:func:`~djblets.cache.backend.cache_memoize` or
+    :py:func:`~djblets.cache.backend.cache_memoize_iter` to avoid a round
+    trip to the cache server for values that are fetched often and rarely
+    change.
+
+    Entries are evicted in least-recently-used order once either the maximum
+    number of entries or the maximum total size is reached, and each entry
+    expires after a short period of time.
+
+    Values are stored in pickled form. This keeps the size of each entry
+    accurate, and ensures that callers modifying a returned value won't
+    affect what's stored.
+
+    A :py:class:`~djblets.cache.synchronizer.GenerationSynchronizer` can be
+    provided to keep entries consistent across processes. The generation
+    will be checked at most once every ``sync_check_interval_secs`` seconds,
+    and all entries will be dropped if another process has called
+    :py:meth:`invalidate`.
+
+    This is thread-safe.
+
+    Version Added:
+        7.0
+    """
+
+    #: The default expiration time for entries, in seconds.
+    DEFAULT_EXPIRATION_SECS = 60
+
+    #: The default maximum number of entries in the cache.
+    DEFAULT_MAX_ENTRIES = 1000
+
+    #: The default maximum total size of all entries, in bytes.
+    DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+    #: The default maximum size of a single entry, in bytes.
+    DEFAULT_MAX_ENTRY_BYTES = 64 * 1024
+
+    #: The default interval between generation checks, in seconds.
+    DEFAULT_SYNC_CHECK_INTERVAL_SECS = 5
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The default expiration time for entries, in seconds.
+    expiration_secs: float
+
+    #: The maximum total size of all entries, in bytes.
+    max_bytes: int
+
+    #: The maximum number of entries in the cache.
+    max_entries: int
+
+    #: The maximum size of a single entry, in bytes.
+    #:
+    #: Larger values will not be stored.
+    max_entry_bytes: int
+
+    #: The interval between generation checks, in seconds.
+    sync_check_interval_secs: float
+
+    #: The synchronizer used to invalidate entries across processes.
+    synchronizer: GenerationSynchronizer | None
+
+    #: The current total size of all entries, in bytes.
+    total_bytes: int
+
+    def __init__(
+        self,
+        *,
+        expiration_secs: float = DEFAULT_EXPIRATION_SECS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entry_bytes: int = DEFAULT_MAX_ENTRY_BYTES,
+        synchronizer: (GenerationSynchronizer | None) = None,
+        sync_check_interval_secs: float = DEFAULT_SYNC_CHECK_INTERVAL_SECS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            expiration_secs (float, optional):
+                The default expiration time for entries, in seconds.
+
+            max_entries (int, optional):
+                The maximum number of entries in the cache.
+
+            max_bytes (int, optional):
+                The maximum total size of all entries, in bytes.
+
+            max_entry_bytes (int, optional):
+                The maximum size of a single entry, in bytes. Larger values
+                will not be stored.
+
+            synchronizer (djblets.cache.synchronizer.GenerationSynchronizer,
+                          optional):
+                An optional synchronizer used to invalidate entries across
+                processes.
+
+            sync_check_interval_secs (float, optional):
+                The interval between generation checks, in seconds.
+        """
+        self.expiration_secs = expiration_secs
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.synchronizer = synchronizer
+        self.sync_check_interval_secs = sync_check_interval_secs
+        self.total_bytes = 0
+
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_sync_check = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache.
+
+        Expired entries that have not yet been evicted are included.
+
+        Returns:
+            int:
+            The number of entries.
+        """
+        return len(self._entries)
+
+    def __contains__(
+        self,
+        key: str,
+    ) -> bool:
+        """Return whether an unexpired entry exists for a key.
+
+        Args:
+            key (str):
+                The key to check.
+
+        Returns:
+            bool:
+            ``True`` if the entry exists and has not expired.
+        """
+        entry = self._entries.get(key)
+
+        return entry is not None and entry[1] > time.monotonic()
+
+    def get(
+        self,
+        key: str,
+        default: Any = UNSET,
+    ) -> Any:
+        """Return a value from the cache.
+
+        Args:
+            key (str):
+                The key to look up.
+
+            default (object, optional):
+                The value to return if the key is not in the cache.
+
+        Returns:
+            object:
+            The cached value, or ``default`` if not found or expired.
+        """
+        self._check_sync_gen()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return default
+
+            data, expires = entry
+
+            if expires <= time.monotonic():
+                self._remove_entry(key)
+
+                return default
+
+            self._entries.move_to_end(key)
+
+        try:
+            return pickle.loads(data)
+        except Exception as e:
+            logger.warning('Failed to deserialize data from local cache for '
+                           'key "%s": %s',
+                           key, e)
+            self.delete(key)
+
+            return default
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        expiration_secs: (float | None) = None,
+    ) -> bool:
+        """Store a value in the cache.
+
+        If the value is too large or can't be serialized, it will not be
+        stored.
+
+        Args:
+            key (str):
+                The key to store.
+
+            value (object):
+                The value to store.
+
+            expiration_secs (float, optional):
+                The expiration time for this entry, in seconds. This
+                defaults to :py:attr:`expiration_secs`.
+
+        Returns:
+            bool:
+            ``True`` if the value was stored. ``False`` if it was too large
+            or could not be serialized.
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug('Unable to store data in local cache for key '
+                         '"%s": %s',
+                         key, e)
+
+            return False
+
+        data_len = len(data)
+
+        if data_len > self.max_entry_bytes:
+            # Make sure we don't leave an older value behind.
+            self.delete(key)
+
+            return False
+
+        if expiration_secs is None:
+            expiration_secs = self.expiration_secs
+
+        entries = self._entries
+
+        with self._lock:
+            if key in entries:
+                self._remove_entry(key)
+
+            entries[key] = (data, time.monotonic() + expiration_secs)
+            self.total_bytes += data_len
+
+            # Evict the least-recently-used entries until we're back under
+            # budget.
+            while (len(entries) > self.max_entries or
+                   self.total_bytes > self.max_bytes):
+                self._remove_entry(next(iter(entries)))
+
+        return True
+
+    def delete(
+        self,
+        key: str,
+    ) -> None:
+        """Delete a value from the cache.
+
+        Args:
+            key (str):
+                The key to delete.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove_entry(key)
+
+    def clear(self) -> None:
+        """Clear all entries from this process's cache."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def invalidate(self) -> None:
+        """Invalidate the cache across all processes.
+
+        This will clear all local entries, and mark the synchronizer (if
+        any) as updated so that other processes will clear their entries
+        the next time they check the generation.
+        """
+        self.clear()
+
+        synchronizer = self.synchronizer
+
+        if synchronizer is not None:
+            synchronizer.mark_updated()
+
+    def _check_sync_gen(self) -> None:
+        """Clear the cache if the synchronization generation has changed.
+
+        This will only check the generation once per
+        :py:attr:`sync_check_interval_secs`.
+        """
+        synchronizer = self.synchronizer
+
+        if synchronizer is None:
+            return
+
+        now = time.monotonic()
+
+        if now < self._next_sync_check:
+            return
+
+        self._next_sync_check = now + self.sync_check_interval_secs
+
+        if synchronizer.is_expired():
+            self.clear()
+            synchronizer.refresh()
+
+    def _remove_entry(
+        self,
+        key: str,
+    ) -> None:
+        """Remove an entry and update the total size.
+
+        The lock must be held by the caller.
+
+        Args:
+            key (str):
+                The key to remove.
+        """
+        data = self._entries.pop(key)[0]
+        self.total_bytes -= len(data)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand
+from django.utils.translation import gettext as _
+
+from djblets.cache.stats import (clear_published_cache_stats,
+                                 get_published_cache_stats,
+                                 is_cache_stats_enabled)
+
+
+class Command(BaseCommand):
+    """Displays cache statistics published by all processes.
+
+    Statistics are only recorded when
+    ``settings.DJBLETS_CACHE_STATS_ENABLED`` is set. See
+    :py:mod:`djblets.cache.stats` for details.
+
+    Version Added:
+        7.0
+    """
+
+    help = _('Displays cache statistics published by all processes.')
+
+    #: The columns shown in the report.
+    COLUMNS = [
+        ('key_prefix', _('Key Prefix')),
+        ('hits', _('Hits')),
+        ('misses', _('Misses')),
+        ('hit_rate', _('Hit %')),
+        ('lock_waits', _('Lock Waits')),
+        ('lock_wait_secs', _('Lock Wait (s)')),
+        ('computes', _('Computes')),
+        ('avg_compute_secs', _('Avg Compute (s)')),
+        ('chunks', _('Chunks')),
+        ('stored_bytes', _('Stored Bytes')),
+        ('uncompressed_bytes', _('Uncompressed Bytes')),
+    ]
+
+    def add_arguments(self, parser):
+        """Add arguments to the command.
+
+        Args:
+            parser (object):
+                The argument parser to add to.
+        """
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            dest='json',
+            default=False,
+            help=_('Output the statistics as JSON'))
+
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            dest='reset',
+            default=False,
+            help=_('Clear the published statistics after displaying them'))
+
+    def handle(self, *args, **options):
+        if not is_cache_stats_enabled():
+            self.stderr.write(_(
+                'Cache statistics are not enabled for this process. Set '
+                'settings.DJBLETS_CACHE_STATS_ENABLED = True to record '
+                'statistics.'))
+
+        all_stats = get_published_cache_stats()
+
+        # Show the key prefixes with the most misses first, since these are
+        # the ones most worth looking into.
+        key_prefixes = sorted(
+            all_stats.keys(),
+            key=lambda key_prefix: (-all_stats[key_prefix].misses,
+                                    key_prefix))
+
+        if options['json']:
+            self.stdout.write(json.dumps(
+                {
+                    key_prefix: all_stats[key_prefix].to_json()
+                    for key_prefix in key_prefixes
+                },
+                indent=2))
+        else:
+            rows = [
+                [str(label) for attr, label in self.COLUMNS],
+            ]
+
+            for key_prefix in key_prefixes:
+                stats = all_stats[key_prefix]
+
+                rows.append([
+                    key_prefix,
+                    '%d' % stats.hits,
+                    '%d' % stats.misses,
+                    '%.1f' % (stats.hit_rate * 100),
+                    '%d' % stats.lock_waits,
+                    '%.3f' % stats.lock_wait_secs,
+                    '%d' % stats.computes,
+                    '%.3f' % stats.avg_compute_secs,
+                    '%d' % stats.chunks,
+                    '%d' % stats.stored_bytes,
+                    '%d' % stats.uncompressed_bytes,
+                ])
+
+            widths = [
+                max(len(row[i]) for row in rows)
+                for i in range(len(self.COLUMNS))
+            ]
+
+            for row in rows:
+                self.stdout.write('  '.join(
+                    value.ljust(width) if i == 0 else value.rjust(width)
+                    for i, (value, width) in enumerate(zip(row, widths))
+                ))
+
+        if options['reset']:
+            clear_published_cache_stats()
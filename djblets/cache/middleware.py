@@ -0,0 +1,129 @@
+"""Middleware for cache-related operations.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from djblets.cache.forwarding_backend import request_cache_memo
+from djblets.cache.synchronizer import get_default_synchronizer_group
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.http import HttpRequest, HttpResponseBase
+
+
+logger = logging.getLogger(__name__)
+
+
+def GenerationSyncMiddleware(
+    get_response: Callable[[HttpRequest], HttpResponseBase],
+) -> Callable[[HttpRequest], HttpResponseBase]:
+    """Middleware for checking synchronization generations once per request.
+
+    This wraps each request in a batch for the default
+    :py:class:`~djblets.cache.synchronizer.GenerationSynchronizerGroup`.
+    The first generation check in the request will fetch all generations
+    with a single cache request, and later checks will reuse them.
+
+    This should be placed before any middleware that checks for expired
+    state, such as
+    :py:class:`~djblets.siteconfig.middleware.SettingsMiddleware` and
+    :py:class:`~djblets.extensions.middleware.ExtensionsMiddleware`.
+
+    Version Added:
+        7.0
+
+    Args:
+        get_response (callable):
+            The function for getting a response from a request.
+
+    Returns:
+        callable:
+        The middleware callable for processing the request.
+    """
+    group = get_default_synchronizer_group()
+
+    def _middleware(
+        request: HttpRequest,
+    ) -> HttpResponseBase:
+        """Process the HTTP request.
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+        Returns:
+            django.http.HttpResponseBase:
+            The resulting HTTP response.
+        """
+        with group.batch():
+            return get_response(request)
+
+    return _middleware
+
+
+def RequestCacheMemoMiddleware(
+    get_response: Callable[[HttpRequest], HttpResponseBase],
+) -> Callable[[HttpRequest], HttpResponseBase]:
+    """Middleware for memoizing cache fetches within a request.
+
+    This activates a :py:func:`~djblets.cache.forwarding_backend.
+    request_cache_memo` context for each request, allowing any
+    :py:class:`~djblets.cache.forwarding_backend.RequestMemoCacheBackend`
+    to serve repeated fetches of the same keys from memory.
+
+    The memo is available during the request as ``request.cache_memo``.
+    When debug logging is enabled for this module, a report of the fetches
+    and avoided round trips will be logged at the end of each request.
+
+    This should be placed as early as possible in the middleware list, so
+    that cache fetches from other middleware are memoized.
+
+    Version Added:
+        7.0
+
+    Args:
+        get_response (callable):
+            The function for getting a response from a request.
+
+    Returns:
+        callable:
+        The middleware callable for processing the request.
+    """
+    def _middleware(
+        request: HttpRequest,
+    ) -> HttpResponseBase:
+        """Process the HTTP request.
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+        Returns:
+            django.http.HttpResponseBase:
+            The resulting HTTP response.
+        """
+        with request_cache_memo() as memo:
+            request.cache_memo = memo  # type: ignore
+            response = get_response(request)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            report = memo.get_report()
+
+            logger.debug('Cache memo for %s %s: %s fetches (%s keys), %s '
+                         'keys served from memo, %s round trips avoided. '
+                         'Most-hit keys: %r',
+                         request.method, request.path,
+                         report['fetches'], report['fetched_keys'],
+                         report['memo_hits'], report['round_trips_avoided'],
+                         report['top_keys'])
+
+        return response
+
+    return _middleware
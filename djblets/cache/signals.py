@@ -0,0 +1,27 @@
+"""Signals for cache operations.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+from django.dispatch import Signal
+
+
+#: Emitted when cache statistics are recorded.
+#:
+#: This is only emitted when cache statistics are enabled through
+#: ``settings.DJBLETS_CACHE_STATS_ENABLED``. It can be used to forward
+#: statistics to an external monitoring service.
+#:
+#: Version Added:
+#:     7.0
+#:
+#: Args:
+#:     key_prefix (str):
+#:         The key prefix (family of keys) the statistics apply to.
+#:
+#:     stats (djblets.cache.stats.CacheKeyStats):
+#:         The statistics being added to the totals for the key prefix.
+cache_stats_recorded = Signal()
@@ -0,0 +1,524 @@
+"""Statistics on cache usage.
+
+When ``settings.DJBLETS_CACHE_STATS_ENABLED`` is set, the functions in
+:py:mod:`djblets.cache.backend` will record hits, misses, lock waits, data
+sizes, and compute times for each family of cache keys.
+
+A key's family (or prefix) is the first component of a sequence key, or the
+part of a string key before the first ``:``. Callers wanting useful
+statistics should build keys accordingly (for example,
+``['diff-sidebar', str(review_request.pk)]``).
+
+Statistics are aggregated in-process, and can be accessed through
+:py:func:`get_cache_stats`. Each process will periodically publish its
+statistics to the cache from a background thread, where they can be
+combined using :py:func:`get_published_cache_stats` or the
+:command:`cache-stats` management command.
+
+Every recorded set of statistics is also sent through the
+:py:data:`~djblets.cache.signals.cache_stats_recorded` signal.
+
+When disabled, recording statistics has almost no overhead.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+
+from djblets.cache.signals import cache_stats_recorded
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The default interval between publishing statistics to the cache.
+DEFAULT_PUBLISH_INTERVAL_SECS = 30
+
+#: The expiration time for published statistics, in seconds.
+PUBLISHED_STATS_EXPIRATION_SECS = 60 * 60 * 24
+
+#: The base cache key used for published statistics.
+_PUBLISHED_STATS_KEY = 'djblets-cache-stats'
+
+#: The max number of new slots to try claiming when publishing statistics.
+_MAX_NEW_SLOT_ATTEMPTS = 10
+
+
+@dataclass
+class CacheKeyStats:
+    """Statistics for a family of cache keys.
+
+    Version Added:
+        7.0
+    """
+
+    #: The number of lookups that found data in cache.
+    hits: int = 0
+
+    #: The number of lookups that had to compute data.
+    misses: int = 0
+
+    #: The number of times a caller waited on a cache lock.
+    lock_waits: int = 0
+
+    #: The total time spent waiting on cache locks, in seconds.
+    lock_wait_secs: float = 0.0
+
+    #: The number of large data chunks read or written.
+    chunks: int = 0
+
+    #: The number of bytes written to cache.
+    #:
+    #: This is the size after any compression.
+    stored_bytes: int = 0
+
+    #: The number of bytes of serialized data written to cache.
+    #:
+    #: This is the size before any compression.
+    uncompressed_bytes: int = 0
+
+    #: The number of times data was computed.
+    computes: int = 0
+
+    #: The total time spent computing data, in seconds.
+    compute_secs: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that found data in cache.
+
+        Type:
+            float
+        """
+        total = self.hits + self.misses
+
+        if total == 0:
+            return 0.0
+
+        return self.hits / total
+
+    @property
+    def avg_compute_secs(self) -> float:
+        """The average time spent computing data, in seconds.
+
+        Type:
+            float
+        """
+        if self.computes == 0:
+            return 0.0
+
+        return self.compute_secs / self.computes
+
+    def add(
+        self,
+        other: CacheKeyStats,
+    ) -> None:
+        """Add the values from other statistics to these.
+
+        Args:
+            other (CacheKeyStats):
+                The statistics to add.
+        """
+        for field in fields(self):
+            name = field.name
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def to_json(self) -> dict[str, Any]:
+        """Return a JSON-serializable version of the statistics.
+
+        Returns:
+            dict:
+            The statistics.
+        """
+        return asdict(self)
+
+
+class _CacheStatsState:
+    """The in-process state for cache statistics.
+
+    Version Added:
+        7.0
+    """
+
+    def __init__(self) -> None:
+        """Initialize the state."""
+        self.lock = threading.Lock()
+        self.stats: dict[str, CacheKeyStats] = {}
+        self.next_publish_time = 0.0
+        self.publish_thread: threading.Thread | None = None
+
+        # The slot this process publishes statistics to. A forked process
+        # will find its parent's process ID in the slot, and claim a new one.
+        self.publish_slot: int | None = None
+
+
+_state = _CacheStatsState()
+
+
+def is_cache_stats_enabled() -> bool:
+    """Return whether cache statistics are enabled.
+
+    This is controlled by ``settings.DJBLETS_CACHE_STATS_ENABLED``, which
+    defaults to ``False``.
+
+    Version Added:
+        7.0
+
+    Returns:
+        bool:
+        Whether statistics will be recorded.
+    """
+    return getattr(settings, 'DJBLETS_CACHE_STATS_ENABLED', False)
+
+
+def get_cache_key_prefix(
+    key: str | Sequence[str],
+) -> str:
+    """Return the prefix (family) for a cache key.
+
+    Version Added:
+        7.0
+
+    Args:
+        key (str or Sequence[str]):
+            The base cache key.
+
+    Returns:
+        str:
+        The key prefix.
+    """
+    if isinstance(key, str):
+        return key.split(':', 1)[0]
+    elif key:
+        return key[0]
+    else:
+        return ''
+
+
+def record_cache_stats(
+    key: str | Sequence[str],
+    **kwargs,
+) -> None:
+    """Record statistics for a cache key.
+
+    This does nothing if statistics are disabled.
+
+    Version Added:
+        7.0
+
+    Args:
+        key (str or Sequence[str]):
+            The base cache key. Statistics will be recorded for the key's
+            prefix.
+
+        **kwargs (dict):
+            Values to add to the statistics. These correspond to attributes
+            on :py:class:`CacheKeyStats`.
+    """
+    if not is_cache_stats_enabled():
+        return
+
+    key_prefix = get_cache_key_prefix(key)
+    new_stats = CacheKeyStats(**kwargs)
+    state = _state
+    now = time.monotonic()
+    publish: bool = False
+
+    with state.lock:
+        try:
+            state.stats[key_prefix].add(new_stats)
+        except KeyError:
+            state.stats[key_prefix] = CacheKeyStats(**kwargs)
+
+        if now >= state.next_publish_time:
+            # The first statistics recorded in a process aren't published
+            # until an interval has passed.
+            publish = (state.next_publish_time > 0)
+            state.next_publish_time = now + getattr(
+                settings,
+                'DJBLETS_CACHE_STATS_PUBLISH_INTERVAL',
+                DEFAULT_PUBLISH_INTERVAL_SECS)
+
+    if cache_stats_recorded.has_listeners():
+        cache_stats_recorded.send(sender=None,
+                                  key_prefix=key_prefix,
+                                  stats=new_stats)
+
+    if publish:
+        # Publish from a thread, so that the cache operation recording
+        # these statistics isn't held up.
+        thread = threading.Thread(target=publish_cache_stats,
+                                  name='djblets-cache-stats-publisher',
+                                  daemon=True)
+        state.publish_thread = thread
+        thread.start()
+
+
+def get_cache_stats() -> dict[str, CacheKeyStats]:
+    """Return the statistics recorded in this process.
+
+    Version Added:
+        7.0
+
+    Returns:
+        dict:
+        A copy of the statistics, keyed by key prefix.
+    """
+    with _state.lock:
+        return {
+            key_prefix: CacheKeyStats(**asdict(stats))
+            for key_prefix, stats in _state.stats.items()
+        }
+
+
+def reset_cache_stats() -> None:
+    """Reset the statistics recorded in this process.
+
+    Version Added:
+        7.0
+    """
+    with _state.lock:
+        _state.stats.clear()
+        _state.next_publish_time = 0.0
+        _state.publish_thread = None
+
+
+def publish_cache_stats() -> None:
+    """Publish this process's statistics to the cache.
+
+    This is called automatically from a background thread while recording
+    statistics, at most once per
+    ``settings.DJBLETS_CACHE_STATS_PUBLISH_INTERVAL`` seconds (30 by
+    default).
+
+    Each process claims its own numbered slot in the cache the first time
+    it publishes. Processes never modify each other's statistics, and
+    statistics from processes that stop publishing will expire.
+
+    Slots whose statistics have expired or been cleared are reused before
+    new slots are added, so the number of slots is bounded by the number
+    of processes publishing within the expiration period, rather than
+    growing with every process ever started.
+
+    Errors will be logged and ignored.
+
+    Version Added:
+        7.0
+    """
+    state = _state
+    published_stats: dict[str, Any] = {
+        'process_id': _get_process_id(),
+        'stats': {
+            key_prefix: key_stats.to_json()
+            for key_prefix, key_stats in get_cache_stats().items()
+        },
+    }
+
+    try:
+        with state.lock:
+            slot = state.publish_slot
+
+        if (slot is None or
+            not _update_published_slot(slot, published_stats)):
+            slot = _claim_published_slot(published_stats)
+
+            with state.lock:
+                state.publish_slot = slot
+    except Exception as e:
+        logger.exception('Unable to publish cache statistics: %s', e)
+
+
+def get_published_cache_stats() -> dict[str, CacheKeyStats]:
+    """Return the combined statistics published by all processes.
+
+    Version Added:
+        7.0
+
+    Returns:
+        dict:
+        The combined statistics, keyed by key prefix.
+    """
+    published = cache.get_many(_get_published_slot_keys())
+    results: dict[str, CacheKeyStats] = {}
+
+    for published_stats in published.values():
+        for key_prefix, stats_json in published_stats['stats'].items():
+            stats = CacheKeyStats(**stats_json)
+
+            try:
+                results[key_prefix].add(stats)
+            except KeyError:
+                results[key_prefix] = stats
+
+    return results
+
+
+def clear_published_cache_stats() -> None:
+    """Clear the statistics published by all processes.
+
+    Processes will continue to publish their in-process statistics.
+
+    Version Added:
+        7.0
+    """
+    cache.delete_many(_get_published_slot_keys())
+
+
+def _update_published_slot(
+    slot: int,
+    published_stats: dict[str, Any],
+) -> bool:
+    """Update the statistics in a slot claimed by this process.
+
+    Version Added:
+        7.0
+
+    Args:
+        slot (int):
+            The slot number.
+
+        published_stats (dict):
+            The statistics to publish, along with the ID of this process.
+
+    Returns:
+        bool:
+        ``True`` if the slot was updated. ``False`` if another process has
+        claimed it.
+
+    Raises:
+        Exception:
+            There was an error communicating with the cache backend.
+    """
+    slot_key = _make_published_slot_key(slot)
+    existing_stats = cache.get(slot_key)
+
+    if existing_stats is None:
+        # The statistics expired or were cleared. Claim the slot again,
+        # unless another process has already reused it.
+        return cache.add(slot_key, published_stats,
+                         timeout=PUBLISHED_STATS_EXPIRATION_SECS)
+    elif existing_stats['process_id'] != published_stats['process_id']:
+        return False
+
+    cache.set(slot_key, published_stats,
+              timeout=PUBLISHED_STATS_EXPIRATION_SECS)
+
+    return True
+
+
+def _claim_published_slot(
+    published_stats: dict[str, Any],
+) -> int:
+    """Claim a slot for this process, and publish statistics to it.
+
+    A slot without statistics will be reused if available. Otherwise, a new
+    slot will be added.
+
+    Version Added:
+        7.0
+
+    Args:
+        published_stats (dict):
+            The statistics to publish, along with the ID of this process.
+
+    Returns:
+        int:
+        The claimed slot number.
+
+    Raises:
+        Exception:
+            There was an error communicating with the cache backend.
+    """
+    from djblets.cache.backend import make_cache_key
+
+    slot_keys = _get_published_slot_keys()
+    existing_slot_keys = cache.get_many(slot_keys).keys()
+
+    for slot, slot_key in enumerate(slot_keys, start=1):
+        if (slot_key not in existing_slot_keys and
+            cache.add(slot_key, published_stats,
+                      timeout=PUBLISHED_STATS_EXPIRATION_SECS)):
+            return slot
+
+    # The slot counter doesn't expire, so that slots stay unique for as
+    # long as the cache keeps it. Another process may reuse a new slot
+    # between the increment and claiming it, in which case we'll try the
+    # next one.
+    counter_key = make_cache_key([_PUBLISHED_STATS_KEY, 'slots'])
+    cache.add(counter_key, 0, timeout=None)
+
+    for attempt in range(_MAX_NEW_SLOT_ATTEMPTS):
+        slot = cache.incr(counter_key)
+
+        if cache.add(_make_published_slot_key(slot), published_stats,
+                     timeout=PUBLISHED_STATS_EXPIRATION_SECS):
+            return slot
+
+    raise RuntimeError('Unable to claim a slot for cache statistics.')
+
+
+def _get_published_slot_keys() -> list[str]:
+    """Return the cache keys for all slots that may hold statistics.
+
+    Version Added:
+        7.0
+
+    Returns:
+        list of str:
+        The list of cache keys.
+    """
+    from djblets.cache.backend import make_cache_key
+
+    num_slots = cache.get(make_cache_key([_PUBLISHED_STATS_KEY, 'slots']))
+
+    return [
+        _make_published_slot_key(slot)
+        for slot in range(1, (num_slots or 0) + 1)
+    ]
+
+
+def _make_published_slot_key(
+    slot: int,
+) -> str:
+    """Return the cache key for a slot holding statistics.
+
+    Version Added:
+        7.0
+
+    Args:
+        slot (int):
+            The slot number.
+
+    Returns:
+        str:
+        The cache key.
+    """
+    from djblets.cache.backend import make_cache_key
+
+    return make_cache_key([_PUBLISHED_STATS_KEY, 'slot', str(slot)])
+
+
+def _get_process_id() -> str:
+    """Return an ID for this process.
+
+    Returns:
+        str:
+        The process ID, in the form of :samp:`{hostname}:{pid}`.
+    """
+    return f'{socket.gethostname()}:{os.getpid()}'
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from django.conf import settings
 from django.core.cache import cache
 from housekeeping import deprecate_non_keyword_only_args
 
@@ -14,13 +18,302 @@ from djblets.cache.backend import make_cache_key
 from djblets.deprecation import RemovedInDjblets80Warning
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
     from typing import Final
 
 
 logger = logging.getLogger(__name__)
 
 
+class GenerationSynchronizerGroup:
+    """A group of synchronizers whose generations are checked together.
+
+    Each :py:class:`GenerationSynchronizer` normally fetches its generation
+    from cache whenever it's checked. When several are checked on every
+    request (for instance, for site configuration, extensions, and
+    integrations), this adds up to several cache round trips before a view
+    even runs.
+
+    A group reduces this in two ways:
+
+    1. Within :py:meth:`batch` (which
+       :py:class:`~djblets.cache.middleware.GenerationSyncMiddleware` wraps
+       around each request), the generations for all synchronizers in the
+       group are fetched with a single request the first time any of them
+       is checked, and reused for the rest of the batch.
+
+    2. If :py:attr:`min_check_interval_secs` is set, fetched generations
+       will be reused for that long across all batches in the process. This
+       trades a short delay in noticing changes made by other processes for
+       fewer cache requests. Changes made within this process are seen
+       immediately.
+
+    Outside of a batch, and without a minimum check interval, each
+    synchronizer will check its own generation, as before.
+
+    This is thread-safe. Batches are tracked per-thread.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: An explicit minimum interval between fetching generations.
+    #:
+    #: If ``None``, ``settings.DJBLETS_CACHE_SYNC_MIN_CHECK_INTERVAL``
+    #: will be used, defaulting to 0.
+    _min_check_interval_secs: float | None
+
+    def __init__(
+        self,
+        *,
+        min_check_interval_secs: (float | None) = None,
+    ) -> None:
+        """Initialize the group.
+
+        Args:
+            min_check_interval_secs (float, optional):
+                The minimum interval between fetching generations from
+                cache, in seconds.
+
+                If not provided,
+                ``settings.DJBLETS_CACHE_SYNC_MIN_CHECK_INTERVAL`` will be
+                used, defaulting to 0.
+        """
+        self._min_check_interval_secs = min_check_interval_secs
+        self._synchronizers: weakref.WeakSet[GenerationSynchronizer] = \
+            weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sync_gens: dict[str, int | None] = {}
+        self._sync_gens_expire = 0.0
+
+    @property
+    def min_check_interval_secs(self) -> float:
+        """The minimum interval between fetching generations, in seconds.
+
+        Type:
+            float
+        """
+        if self._min_check_interval_secs is not None:
+            return self._min_check_interval_secs
+
+        return getattr(settings, 'DJBLETS_CACHE_SYNC_MIN_CHECK_INTERVAL', 0)
+
+    def add(
+        self,
+        gen_sync: GenerationSynchronizer,
+    ) -> None:
+        """Add a synchronizer to the group.
+
+        Synchronizers are held by weak reference, and will leave the group
+        once they're no longer in use.
+
+        Args:
+            gen_sync (GenerationSynchronizer):
+                The synchronizer to add.
+        """
+        with self._lock:
+            self._synchronizers.add(gen_sync)
+
+    def remove(
+        self,
+        gen_sync: GenerationSynchronizer,
+    ) -> None:
+        """Remove a synchronizer from the group.
+
+        Args:
+            gen_sync (GenerationSynchronizer):
+                The synchronizer to remove.
+        """
+        with self._lock:
+            self._synchronizers.discard(gen_sync)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Check generations for all synchronizers together.
+
+        The first generation check within the batch will fetch generations
+        for all synchronizers in the group with a single cache request.
+        Later checks within the batch will reuse those generations.
+
+        Batches can be nested. The outermost batch controls the lifetime of
+        the fetched generations.
+
+        Context:
+            The batch will be active.
+        """
+        local = self._local
+        depth = getattr(local, 'batch_depth', 0)
+
+        local.batch_depth = depth + 1
+
+        if depth == 0:
+            local.batch_sync_gens = None
+
+        try:
+            yield
+        finally:
+            local.batch_depth = depth
+
+            if depth == 0:
+                local.batch_sync_gens = None
+
+    def get_sync_gen(
+        self,
+        cache_key: str,
+    ) -> int | None:
+        """Return the latest generation for a synchronization cache key.
+
+        This will use generations fetched for the current batch or within
+        the minimum check interval, if available.
+
+        Args:
+            cache_key (str):
+                The synchronization cache key.
+
+        Returns:
+            int:
+            The latest generation, or ``None`` if not in cache.
+
+        Raises:
+            Exception:
+                An error occurred communicating with the cache. The
+                exception is raised as-is.
+        """
+        min_check_interval_secs = self.min_check_interval_secs
+
+        if min_check_interval_secs > 0:
+            with self._lock:
+                if (cache_key in self._sync_gens and
+                    time.monotonic() < self._sync_gens_expire):
+                    return self._sync_gens[cache_key]
+
+        local = self._local
+        in_batch = getattr(local, 'batch_depth', 0) > 0
+
+        if in_batch:
+            batch_sync_gens = local.batch_sync_gens
+
+            if batch_sync_gens is not None and cache_key in batch_sync_gens:
+                return batch_sync_gens[cache_key]
+        elif min_check_interval_secs <= 0:
+            return cache.get(cache_key)
+
+        sync_gens = self.fetch(extra_cache_keys=[cache_key])
+
+        if in_batch:
+            local.batch_sync_gens = sync_gens
+
+        return sync_gens[cache_key]
+
+    def fetch(
+        self,
+        *,
+        extra_cache_keys: Sequence[str] = (),
+    ) -> dict[str, int | None]:
+        """Fetch generations for all synchronizers in the group.
+
+        This is performed with a single cache request.
+
+        Args:
+            extra_cache_keys (list of str, optional):
+                Additional synchronization cache keys to fetch.
+
+        Returns:
+            dict:
+            A mapping of synchronization cache keys to generations. Keys
+            not in cache will have a value of ``None``.
+
+        Raises:
+            Exception:
+                An error occurred communicating with the cache. The
+                exception is raised as-is.
+        """
+        with self._lock:
+            cache_keys = {
+                gen_sync.cache_key
+                for gen_sync in self._synchronizers
+            }
+
+        cache_keys.update(extra_cache_keys)
+
+        found = cache.get_many(list(cache_keys))
+        sync_gens = {
+            cache_key: found.get(cache_key)
+            for cache_key in cache_keys
+        }
+
+        min_check_interval_secs = self.min_check_interval_secs
+
+        if min_check_interval_secs > 0:
+            with self._lock:
+                self._sync_gens = sync_gens
+                self._sync_gens_expire = (time.monotonic() +
+                                          min_check_interval_secs)
+
+        return sync_gens
+
+    def set_sync_gen(
+        self,
+        cache_key: str,
+        sync_gen: int | None,
+    ) -> None:
+        """Record a generation that was changed or fetched in this process.
+
+        This ensures any generations reused by the group reflect changes
+        made in this process.
+
+        Args:
+            cache_key (str):
+                The synchronization cache key.
+
+            sync_gen (int):
+                The new generation, or ``None`` if it was cleared.
+        """
+        with self._lock:
+            if cache_key in self._sync_gens:
+                self._sync_gens[cache_key] = sync_gen
+
+        batch_sync_gens = getattr(self._local, 'batch_sync_gens', None)
+
+        if batch_sync_gens is not None and cache_key in batch_sync_gens:
+            batch_sync_gens[cache_key] = sync_gen
+
+    def reset(self) -> None:
+        """Reset all generations reused by the group.
+
+        The next check will fetch generations from cache.
+        """
+        with self._lock:
+            self._sync_gens = {}
+            self._sync_gens_expire = 0.0
+
+        self._local.batch_sync_gens = None
+
+
+_default_group = GenerationSynchronizerGroup()
+
+
+def get_default_synchronizer_group() -> GenerationSynchronizerGroup:
+    """Return the default group for generation synchronizers.
+
+    All :py:class:`GenerationSynchronizer` instances belong to this group
+    unless another group is provided.
+
+    Version Added:
+        7.0
+
+    Returns:
+        GenerationSynchronizerGroup:
+        The default group.
+    """
+    return _default_group
+
+
 class GenerationSynchronizer:
     """Manages the synchronization of generation state across processes.
 
@@ -38,6 +331,10 @@ class GenerationSynchronizer:
     :py:meth:`mark_updated`. This will bump the synchronization generation
     number, which will invalidate other processes.
 
+    Each synchronizer belongs to a :py:class:`GenerationSynchronizerGroup`,
+    which can reduce the number of cache requests needed to check
+    generations.
+
     Other callers, upon noticing that their state is expired (through
     :py:meth:`is_expired`) can re-fetch or re-compute the data needed and
     then call :py:meth:`refresh` to refresh the instance's counter from the
@@ -65,6 +362,12 @@ class GenerationSynchronizer:
     #: The synchronization cache key.
     cache_key: str
 
+    #: The group this synchronizer belongs to.
+    #:
+    #: Version Added:
+    #:     7.0
+    group: GenerationSynchronizerGroup
+
     #: The synchronization generation number last fetched/set by this instance.
     sync_gen: int | None
 
@@ -75,9 +378,14 @@ class GenerationSynchronizer:
         *,
         normalize_cache_key: bool = True,
         cache_expiration_secs: int = DEFAULT_EXPIRATION_SECS,
+        group: (GenerationSynchronizerGroup | None) = None,
     ) -> None:
         """Initialize the synchronizer.
 
+        Version Changed:
+            7.0:
+            Added the ``group`` argument.
+
         Version Changed:
             6.0:
             * ``cache_key`` may now be a sequence of string components of
@@ -115,6 +423,15 @@ class GenerationSynchronizer:
                 Version Added:
                     6.0
 
+            group (GenerationSynchronizerGroup, optional):
+                The group this synchronizer belongs to.
+
+                This defaults to the group returned by
+                :py:func:`get_default_synchronizer_group`.
+
+                Version Added:
+                    7.0
+
         Raises:
             ValueError:
                 ``cache_key`` was not a string, and ``normalize_cache_key``
@@ -128,10 +445,16 @@ class GenerationSynchronizer:
                 'normalize_cache_key=False.'
             )
 
+        if group is None:
+            group = get_default_synchronizer_group()
+
         self.cache_expiration_secs = cache_expiration_secs
         self.cache_key = cache_key
+        self.group = group
         self.sync_gen = None
 
+        group.add(self)
+
         try:
             self._fetch_or_create_sync_gen()
         except Exception as e:
@@ -184,6 +507,7 @@ class GenerationSynchronizer:
         """
         try:
             cache.delete(self.cache_key)
+            self.group.set_sync_gen(self.cache_key, None)
         except Exception as e:
             logger.exception(
                 'Unexpected error clearing cached synchronization state '
@@ -210,6 +534,7 @@ class GenerationSynchronizer:
     def _increment_sync_gen(self) -> None:
         """Increment the synchronization generation ID."""
         self.sync_gen = cache.incr(self.cache_key)
+        self.group.set_sync_gen(self.cache_key, self.sync_gen)
 
     def _fetch_or_create_sync_gen(self) -> None:
         """Return or create a new synchronization generation ID.
@@ -231,12 +556,18 @@ class GenerationSynchronizer:
         if stored:
             self.sync_gen = sync_gen
         else:
-            self.sync_gen = self._get_latest_sync_gen()
+            self.sync_gen = cache.get(self.cache_key)
 
-    def _get_latest_sync_gen(self) -> int:
+        self.group.set_sync_gen(self.cache_key, self.sync_gen)
+
+    def _get_latest_sync_gen(self) -> int | None:
         """Return the latest synchronization generation ID.
 
+        Version Changed:
+            7.0:
+            This may now return a generation fetched for the group.
+
         Returns:
             int: The latest generation ID from cache.
         """
-        return cache.get(self.cache_key)
+        return self.group.get_sync_gen(self.cache_key)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import inspect
+import lzma
 import pickle
 import re
 import sys
@@ -16,12 +17,19 @@ from django.core.cache import cache
 from django.core.cache.backends.base import memcache_key_warnings
 from django.test.utils import override_settings
 
+from djblets.cache import backend as cache_backend
 from djblets.cache.backend import (CACHE_CHUNK_SIZE,
                                    MAX_KEY_SIZE,
                                    cache_memoize,
                                    cache_memoize_iter,
+                                   cache_memoize_many,
                                    make_cache_key,
+                                   _EncodedCacheValue,
+                                   _RefreshableCacheValue,
                                    _get_default_encryption_key)
+from djblets.cache.codecs import JSONCacheSerializer
+from djblets.cache.errors import MissingChunkError
+from djblets.cache.local import LocalCache
 from djblets.protect.locks import CacheLock
 from djblets.secrets.crypto import AES_BLOCK_SIZE, aes_decrypt, aes_encrypt
 from djblets.testing.testcases import TestCase
@@ -451,6 +459,470 @@ class CacheMemoizeTests(BaseCacheTestCase):
 
         self.assertEqual(result, data)
 
+    def test_with_large_files_stream_large_data(self) -> None:
+        """Testing cache_memoize with large files and stream_large_data=True
+        """
+        cache_key = 'abc123'
+
+        # This takes into account the size of the pickle data, and will
+        # get us to exactly 2 chunks of data in cache.
+        data, pickled_data = self.build_test_chunk_data(num_chunks=2)
+
+        cache.set(make_cache_key(cache_key), '2')
+        cache.set(make_cache_key('%s-0' % cache_key),
+                  [pickled_data[:CACHE_CHUNK_SIZE]])
+        cache.set(make_cache_key('%s-1' % cache_key),
+                  [pickled_data[CACHE_CHUNK_SIZE:]])
+
+        def cache_func() -> str:
+            return ''
+
+        self.spy_on(cache_func)
+        self.spy_on(cache.get_many)
+
+        result = cache_memoize(cache_key,
+                               cache_func,
+                               large_data=True,
+                               compress_large_data=False,
+                               stream_large_data=True,
+                               chunk_batch_size=1)
+        self.assertEqual(result, data)
+        self.assertSpyNotCalled(cache_func)
+
+        self.assertSpyCallCount(cache.get_many, 2)
+        self.assertSpyCalledWith(
+            cache.get_many.calls[0],
+            [make_cache_key('%s-0' % cache_key)])
+        self.assertSpyCalledWith(
+            cache.get_many.calls[1],
+            [make_cache_key('%s-1' % cache_key)])
+
+    def test_with_large_files_stream_large_data_compressed(self) -> None:
+        """Testing cache_memoize with large files, compression, and
+        stream_large_data=True
+        """
+        cache_key = 'abc123'
+
+        data, pickled_data = self.build_test_chunk_data(num_chunks=2)
+
+        def cache_func() -> str:
+            return data
+
+        self.spy_on(cache_func)
+
+        result = cache_memoize(cache_key,
+                               cache_func,
+                               large_data=True,
+                               compress_large_data=True,
+                               stream_large_data=True)
+        self.assertEqual(result, data)
+        self.assertSpyCallCount(cache_func, 1)
+
+        # Try fetching the data we stored.
+        result = cache_memoize(cache_key,
+                               cache_func,
+                               large_data=True,
+                               compress_large_data=True,
+                               stream_large_data=True)
+        self.assertEqual(result, data)
+        self.assertSpyCallCount(cache_func, 1)
+
+    def test_with_large_files_stream_large_data_missing_chunk(self) -> None:
+        """Testing cache_memoize with large files, stream_large_data=True,
+        and missing chunks
+        """
+        cache_key = 'abc123'
+
+        # This takes into account the size of the pickle data, and will
+        # get us to exactly 2 chunks of data in cache.
+        data, pickled_data = self.build_test_chunk_data(num_chunks=2)
+
+        cache.set(make_cache_key(cache_key), '2')
+        cache.set(make_cache_key('%s-0' % cache_key),
+                  [pickled_data[:CACHE_CHUNK_SIZE]])
+
+        def cache_func() -> str:
+            return data
+
+        self.spy_on(cache_func)
+
+        result = cache_memoize(cache_key,
+                               cache_func,
+                               large_data=True,
+                               compress_large_data=False,
+                               stream_large_data=True,
+                               chunk_batch_size=1)
+        self.assertEqual(result, data)
+        self.assertSpyCallCount(cache_func, 1)
+
+        self.assertIn(make_cache_key('%s-1' % cache_key), cache)
+
+    @override_settings(DJBLETS_CACHE_STREAM_LARGE_DATA=True)
+    def test_with_use_encryption_and_large_files_stream_large_data(
+        self,
+    ) -> None:
+        """Testing cache_memoize with use_encryption=True, large files, and
+        settings.DJBLETS_CACHE_STREAM_LARGE_DATA=True
+        """
+        cache_key = 'abc123'
+
+        data, encrypted_data = self.build_test_chunk_data(
+            num_chunks=2,
+            use_encryption=True)
+
+        def cache_func() -> str:
+            return data
+
+        self.spy_on(cache_func)
+
+        result = cache_memoize(cache_key,
+                               cache_func,
+                               large_data=True,
+                               compress_large_data=False,
+                               use_encryption=True,
+                               chunk_batch_size=1)
+        self.assertEqual(result, data)
+        self.assertSpyCallCount(cache_func, 1)
+
+        self.spy_on(cache.get_many)
+
+        # Call a second time. We should only call cache_func once.
+        result = cache_memoize(cache_key,
+                               cache_func,
+                               large_data=True,
+                               compress_large_data=False,
+                               use_encryption=True,
+                               chunk_batch_size=1)
+        self.assertEqual(result, data)
+        self.assertSpyCallCount(cache_func, 1)
+        self.assertSpyCallCount(cache.get_many, 2)
+
+    def test_with_local_cache(self) -> None:
+        """Testing cache_memoize with local_cache"""
+        cache_key = 'abc123'
+        local_cache = LocalCache()
+
+        def cache_func() -> str:
+            return 'Test 123'
+
+        self.spy_on(cache_func)
+
+        result = cache_memoize(cache_key, cache_func,
+                               local_cache=local_cache)
+        self.assertEqual(result, 'Test 123')
+        self.assertSpyCallCount(cache_func, 1)
+        self.assertEqual(local_cache.get(make_cache_key(cache_key)),
+                         'Test 123')
+
+        # Call a second time. This should not hit the main cache.
+        self.spy_on(cache.get)
+
+        result = cache_memoize(cache_key, cache_func,
+                               local_cache=local_cache)
+        self.assertEqual(result, 'Test 123')
+        self.assertSpyCallCount(cache_func, 1)
+        self.assertSpyNotCalled(cache.get)
+
+    def test_with_local_cache_and_in_main_cache(self) -> None:
+        """Testing cache_memoize with local_cache and value only in the main
+        cache
+        """
+        cache_key = 'abc123'
+        local_cache = LocalCache()
+
+        cache.set(make_cache_key(cache_key), 'existing result')
+
+        def cache_func() -> str:
+            return 'new result'
+
+        self.spy_on(cache_func)
+
+        result = cache_memoize(cache_key, cache_func,
+                               local_cache=local_cache)
+        self.assertEqual(result, 'existing result')
+        self.assertSpyNotCalled(cache_func)
+        self.assertEqual(local_cache.get(make_cache_key(cache_key)),
+                         'existing result')
+
+    def test_with_local_cache_and_force_overwrite(self) -> None:
+        """Testing cache_memoize with local_cache and force_overwrite=True"""
+        cache_key = 'abc123'
+        local_cache = LocalCache()
+        local_cache.set(make_cache_key(cache_key), 'old result')
+
+        result = cache_memoize(cache_key,
+                               lambda: 'new result',
+                               local_cache=local_cache,
+                               force_overwrite=True)
+        self.assertEqual(result, 'new result')
+        self.assertEqual(local_cache.get(make_cache_key(cache_key)),
+                         'new result')
+        self.assertEqual(cache.get(make_cache_key(cache_key)),
+                         'new result')
+
+    def test_with_soft_expiration_and_fresh(self) -> None:
+        """Testing cache_memoize with soft_expiration and fresh value"""
+        cache_key = 'abc123'
+
+        def cache_func() -> str:
+            return 'Test 123'
+
+        self.spy_on(cache_func)
+
+        result = cache_memoize(cache_key, cache_func,
+                               soft_expiration=60)
+        self.assertEqual(result, 'Test 123')
+        self.assertSpyCallCount(cache_func, 1)
+
+        stored = cache.get(make_cache_key(cache_key))
+        self.assertIsInstance(stored, _RefreshableCacheValue)
+        self.assertEqual(stored.value, 'Test 123')
+        self.assertAlmostEqual(stored.refresh_at, time.time() + 60,
+                               delta=5)
+
+        result = cache_memoize(cache_key, cache_func,
+                               soft_expiration=60)
+        self.assertEqual(result, 'Test 123')
+        self.assertSpyCallCount(cache_func, 1)
+
+    def test_with_soft_expiration_and_stale(self) -> None:
+        """Testing cache_memoize with soft_expiration and stale value"""
+        cache_key = 'abc123'
+
+        cache.set(make_cache_key(cache_key),
+                  _RefreshableCacheValue(value='old result',
+                                         refresh_at=time.time() - 1,
+                                         compute_secs=0))
+
+        def cache_func() -> str:
+            return 'new result'
+
+        self.spy_on(cache_func)
+
+        result = cache_memoize(cache_key, cache_func,
+                               soft_expiration=60)
+        self.assertEqual(result, 'new result')
+        self.assertSpyCallCount(cache_func, 1)
+
+        stored = cache.get(make_cache_key(cache_key))
+        self.assertEqual(stored.value, 'new result')
+
+        # The refresh lock should have been released.
+        self.assertNotIn(make_cache_key('_lock_:%s' % cache_key), cache)
+
+    def test_with_soft_expiration_and_stale_while_locked(self) -> None:
+        """Testing cache_memoize with soft_expiration and stale value while
+        another caller is refreshing
+        """
+        cache_key = 'abc123'
+
+        cache.set(make_cache_key(cache_key),
+                  _RefreshableCacheValue(value='old result',
+                                         refresh_at=time.time() - 1,
+                                         compute_secs=0))
+
+        def cache_func() -> str:
+            return 'new result'
+
+        self.spy_on(cache_func)
+
+        with CacheLock(key='_lock_:%s' % cache_key):
+            result = cache_memoize(cache_key, cache_func,
+                                   soft_expiration=60)
+
+        self.assertEqual(result, 'old result')
+        self.assertSpyNotCalled(cache_func)
+
+    def test_with_soft_expiration_and_background_refresh(self) -> None:
+        """Testing cache_memoize with soft_expiration and
+        background_refresh=True
+        """
+        cache_key = 'abc123'
+
+        cache.set(make_cache_key(cache_key),
+                  _RefreshableCacheValue(value='old result',
+                                         refresh_at=time.time() - 1,
+                                         compute_secs=0))
+
+        def cache_func() -> str:
+            return 'new result'
+
+        self.spy_on(cache_func)
+        self.spy_on(cache_backend._start_background_refresh)
+
+        result = cache_memoize(cache_key, cache_func,
+                               soft_expiration=60,
+                               background_refresh=True)
+        self.assertEqual(result, 'old result')
+
+        self.assertSpyCalledOnce(cache_backend._start_background_refresh)
+        cache_backend._start_background_refresh.last_call.return_value.join()
+
+        self.assertSpyCallCount(cache_func, 1)
+        self.assertEqual(cache.get(make_cache_key(cache_key)).value,
+                         'new result')
+        self.assertNotIn(make_cache_key('_lock_:%s' % cache_key), cache)
+
+    def test_with_early_refresh_beta(self) -> None:
+        """Testing cache_memoize with early_refresh_beta and early refresh
+        """
+        cache_key = 'abc123'
+
+        cache.set(make_cache_key(cache_key),
+                  _RefreshableCacheValue(value='old result',
+                                         refresh_at=time.time() + 10,
+                                         compute_secs=1e9))
+
+        def cache_func() -> str:
+            return 'new result'
+
+        self.spy_on(cache_func)
+
+        # With a compute time this large compared to the time remaining,
+        # the chance of not refreshing early is roughly 1 in 100 million.
+
+        result = cache_memoize(cache_key, cache_func,
+                               early_refresh_beta=1.0)
+        self.assertEqual(result, 'new result')
+        self.assertSpyCallCount(cache_func, 1)
+
+    def test_with_early_refresh_beta_and_no_refresh(self) -> None:
+        """Testing cache_memoize with early_refresh_beta and no early refresh
+        """
+        cache_key = 'abc123'
+
+        cache.set(make_cache_key(cache_key),
+                  _RefreshableCacheValue(value='old result',
+                                         refresh_at=time.time() + 10,
+                                         compute_secs=1e-6))
+
+        def cache_func() -> str:
+            return 'new result'
+
+        self.spy_on(cache_func)
+
+        # With a compute time this small compared to the time remaining,
+        # there's effectively no chance of refreshing early.
+
+        result = cache_memoize(cache_key, cache_func,
+                               early_refresh_beta=1.0)
+        self.assertEqual(result, 'old result')
+        self.assertSpyNotCalled(cache_func)
+
+    def test_with_soft_expiration_and_large_data(self) -> None:
+        """Testing cache_memoize with soft_expiration and large_data=True"""
+        message = (
+            'soft_expiration and early_refresh_beta are not supported with '
+            'large_data=True.'
+        )
+
+        with self.assertRaisesMessage(ValueError, message):
+            cache_memoize('abc123', lambda: 'Test',
+                          large_data=True,
+                          soft_expiration=60)
+
+    def test_with_refreshable_value_without_soft_expiration(self) -> None:
+        """Testing cache_memoize without soft_expiration and a stored
+        refreshable value
+        """
+        cache_key = 'abc123'
+
+        cache.set(make_cache_key(cache_key),
+                  _RefreshableCacheValue(value='old result',
+                                         refresh_at=time.time() - 1,
+                                         compute_secs=0))
+
+        result = cache_memoize(cache_key, lambda: 'new result')
+        self.assertEqual(result, 'old result')
+
+    def test_with_serializer_and_compressor(self) -> None:
+        """Testing cache_memoize with serializer and compressor"""
+        cache_key = 'abc123'
+        test_value = {'a': [1, 2, 3]}
+
+        def cache_func() -> dict[str, list[int]]:
+            return test_value
+
+        self.spy_on(cache_func)
+
+        result = cache_memoize(cache_key, cache_func,
+                               serializer='json',
+                               compressor='lzma')
+        self.assertEqual(result, test_value)
+
+        self.assertEqual(
+            cache.get(make_cache_key(cache_key)),
+            _EncodedCacheValue(
+                b'\x00json;lzma\n' +
+                lzma.compress(b'{"a":[1,2,3]}\n')))
+
+        # Fetch it again, using different codecs. The stored codecs should
+        # be used.
+        result = cache_memoize(cache_key, cache_func)
+        self.assertEqual(result, test_value)
+        self.assertSpyCallCount(cache_func, 1)
+
+    def test_with_serializer_and_use_encryption(self) -> None:
+        """Testing cache_memoize with serializer and use_encryption=True"""
+        cache_key = 'abc123'
+        test_value = ['a', 1, None]
+
+        def cache_func() -> list[str | int | None]:
+            return test_value
+
+        self.spy_on(cache_func)
+
+        result = cache_memoize(cache_key, cache_func,
+                               use_encryption=True,
+                               serializer=JSONCacheSerializer())
+        self.assertEqual(result, test_value)
+
+        encrypted_key = make_cache_key(cache_key, use_encryption=True)
+        self.assertEqual(
+            aes_decrypt(cache.get(encrypted_key)),
+            b'\x00json;\n["a",1,null]\n')
+
+        result = cache_memoize(cache_key, cache_func,
+                               use_encryption=True)
+        self.assertEqual(result, test_value)
+        self.assertSpyCallCount(cache_func, 1)
+
+    def test_with_serializer_and_soft_expiration(self) -> None:
+        """Testing cache_memoize with non-pickle serializer and
+        soft_expiration
+        """
+        message = (
+            'soft_expiration and early_refresh_beta require the pickle '
+            'serializer.'
+        )
+
+        with self.assertRaisesMessage(ValueError, message):
+            cache_memoize('abc123', lambda: 'Test',
+                          serializer='json',
+                          soft_expiration=60)
+
+    def test_with_large_data_and_codecs(self) -> None:
+        """Testing cache_memoize with large_data=True and codecs"""
+        cache_key = 'abc123'
+
+        def cache_func() -> list[int]:
+            return [1, 2, 3]
+
+        self.spy_on(cache_func)
+
+        result = cache_memoize(cache_key, cache_func,
+                               large_data=True,
+                               serializer='marshal',
+                               compressor='lzma')
+        self.assertEqual(result, [1, 2, 3])
+        self.assertEqual(cache.get(make_cache_key(cache_key)),
+                         '1;marshal;lzma')
+
+        result = cache_memoize(cache_key, cache_func,
+                               large_data=True)
+        self.assertEqual(result, [1, 2, 3])
+        self.assertSpyCallCount(cache_func, 1)
+
     def test_with_use_encryption(self):
         """Testing cache_memoize with use_encryption=True"""
         cache_key = 'abc123'
@@ -1420,6 +1892,335 @@ class CacheMemoizeIterTests(BaseCacheTestCase):
         self.assertEqual(data_yielded, [])
         self.assertSpyCallCount(cache_func, 1)
 
+    def test_with_codecs(self) -> None:
+        """Testing cache_memoize_iter with serializer and compressor"""
+        cache_key = 'abc123'
+
+        def cache_func() -> Iterator[dict[str, int]]:
+            yield {'a': 1}
+            yield {'b': 2}
+
+        self.spy_on(cache_func)
+
+        result = list(cache_memoize_iter(cache_key, cache_func,
+                                         serializer='json',
+                                         compressor='lzma'))
+        self.assertEqual(result, [{'a': 1}, {'b': 2}])
+
+        # Verify the contents of the stored data.
+        self.assertEqual(cache.get(make_cache_key(cache_key)),
+                         '1;json;lzma')
+        self.assertEqual(
+            lzma.decompress(cache.get(make_cache_key(f'{cache_key}-0'))[0]),
+            b'{"a":1}\n{"b":2}\n')
+
+        # Try fetching the data we stored, in both modes.
+        for stream_large_data in (False, True):
+            result = list(cache_memoize_iter(
+                cache_key,
+                cache_func,
+                stream_large_data=stream_large_data))
+            self.assertEqual(result, [{'a': 1}, {'b': 2}])
+
+        self.assertSpyCallCount(cache_func, 1)
+
+    def test_with_codecs_and_use_encryption(self) -> None:
+        """Testing cache_memoize_iter with codecs and use_encryption=True"""
+        cache_key = 'abc123'
+
+        def cache_func() -> list[str]:
+            return ['a', 'b']
+
+        self.spy_on(cache_func)
+
+        for i in range(2):
+            result = list(cache_memoize_iter(cache_key, cache_func,
+                                             use_encryption=True,
+                                             serializer='json',
+                                             compressor='lzma'))
+            self.assertEqual(result, ['a', 'b'])
+
+        self.assertSpyCallCount(cache_func, 1)
+
+        encrypted_key = make_cache_key(cache_key, use_encryption=True)
+        self.assertEqual(pickle.loads(aes_decrypt(cache.get(encrypted_key))),
+                         '1;json;lzma')
+
+    def test_with_codecs_and_no_compression(self) -> None:
+        """Testing cache_memoize_iter with serializer and
+        compress_large_data=False
+        """
+        cache_key = 'abc123'
+
+        result = list(cache_memoize_iter(cache_key, lambda: [[1, 2]],
+                                         compress_large_data=False,
+                                         serializer='json'))
+        self.assertEqual(result, [[1, 2]])
+
+        self.assertEqual(cache.get(make_cache_key(cache_key)), '1;json;')
+        self.assertEqual(cache.get(make_cache_key(f'{cache_key}-0')),
+                         [b'[1,2]\n'])
+
+    def test_with_codecs_and_legacy_data(self) -> None:
+        """Testing cache_memoize_iter with codecs reading data stored
+        without codecs
+        """
+        cache_key = 'abc123'
+
+        def cache_func() -> list[str]:
+            return ['a', 'b']
+
+        self.spy_on(cache_func)
+
+        list(cache_memoize_iter(cache_key, cache_func))
+        self.assertEqual(cache.get(make_cache_key(cache_key)), '1')
+
+        result = list(cache_memoize_iter(cache_key, cache_func,
+                                         serializer='json',
+                                         compressor='lzma'))
+        self.assertEqual(result, ['a', 'b'])
+        self.assertSpyCallCount(cache_func, 1)
+
+    def test_with_unknown_codec(self) -> None:
+        """Testing cache_memoize_iter with data stored using an unknown
+        codec
+        """
+        cache_key = 'abc123'
+
+        cache.set(make_cache_key(cache_key), '1;bad-serializer;')
+        cache.set(make_cache_key(f'{cache_key}-0'), [b'junk'])
+
+        with self.assertLogs(level='WARNING'):
+            result = list(cache_memoize_iter(cache_key,
+                                             lambda: ['a', 'b'],
+                                             serializer='json'))
+
+        self.assertEqual(result, ['a', 'b'])
+        self.assertEqual(cache.get(make_cache_key(cache_key)), '1;json;zlib')
+
+    def test_with_stream_large_data(self) -> None:
+        """Testing cache_memoize_iter with stream_large_data=True"""
+        cache_key = 'abc123'
+        data_yielded = []
+
+        data1, pickled_data_1 = self.build_test_chunk_data(num_chunks=2)
+        data2, pickled_data_2 = self.build_test_chunk_data(num_chunks=2)
+
+        def cache_func() -> Iterator[str]:
+            data_yielded.append('data1')
+            yield data1
+
+            data_yielded.append('data2')
+            yield data2
+
+        self.spy_on(cache_func)
+
+        result = list(cache_memoize_iter(cache_key,
+                                         cache_func,
+                                         compress_large_data=True,
+                                         stream_large_data=True))
+        self.assertEqual(result, [data1, data2])
+        self.assertSpyCallCount(cache_func, 1)
+
+        # Try fetching the data we stored.
+        data_yielded = []
+
+        result = list(cache_memoize_iter(cache_key,
+                                         cache_func,
+                                         compress_large_data=True,
+                                         stream_large_data=True))
+        self.assertEqual(result, [data1, data2])
+        self.assertEqual(data_yielded, [])
+        self.assertSpyCallCount(cache_func, 1)
+
+    def test_with_stream_large_data_fetches_in_batches(self) -> None:
+        """Testing cache_memoize_iter with stream_large_data=True fetches
+        chunks in batches as items are consumed
+        """
+        cache_key = 'abc123'
+
+        data1, pickled_data_1 = self.build_test_chunk_data(num_chunks=2)
+        data2, pickled_data_2 = self.build_test_chunk_data(num_chunks=2)
+
+        def cache_func() -> Iterator[str]:
+            yield data1
+            yield data2
+
+        list(cache_memoize_iter(cache_key,
+                                cache_func,
+                                compress_large_data=False))
+
+        self.spy_on(cache.get_many)
+
+        result = cache_memoize_iter(cache_key,
+                                    cache_func,
+                                    compress_large_data=False,
+                                    stream_large_data=True,
+                                    chunk_batch_size=2)
+
+        self.assertEqual(next(result), data1)
+        self.assertSpyCallCount(cache.get_many, 1)
+
+        self.assertEqual(next(result), data2)
+        self.assertSpyCallCount(cache.get_many, 2)
+
+        with self.assertRaises(StopIteration):
+            next(result)
+
+        self.assertSpyCallCount(cache.get_many, 2)
+
+    def test_with_stream_large_data_and_missing_later_chunk(self) -> None:
+        """Testing cache_memoize_iter with stream_large_data=True and a
+        chunk missing after items were yielded
+        """
+        cache_key = 'abc123'
+        data_yielded = []
+
+        data1, pickled_data_1 = self.build_test_chunk_data(num_chunks=2)
+        data2, pickled_data_2 = self.build_test_chunk_data(num_chunks=2)
+
+        def cache_func() -> Iterator[str]:
+            data_yielded.append('data1')
+            yield data1
+
+            data_yielded.append('data2')
+            yield data2
+
+        self.spy_on(cache_func)
+
+        list(cache_memoize_iter(cache_key,
+                                cache_func,
+                                compress_large_data=False))
+        self.assertSpyCallCount(cache_func, 1)
+
+        cache.delete(make_cache_key('%s-3' % cache_key))
+        data_yielded = []
+        result = []
+
+        with self.assertLogs() as logs:
+            with self.assertRaises(MissingChunkError):
+                for item in cache_memoize_iter(cache_key,
+                                               cache_func,
+                                               compress_large_data=False,
+                                               stream_large_data=True,
+                                               chunk_batch_size=2):
+                    result.append(item)
+
+        # Only cached items should have been yielded.
+        self.assertEqual(result, [data1])
+        self.assertEqual(data_yielded, [])
+        self.assertSpyCallCount(cache_func, 1)
+
+        self.assertEqual(
+            logs.output,
+            [
+                'WARNING:djblets.cache.backend:Chunk missing while '
+                'streaming large or iterable data from cache for key '
+                '"example.com:abc123" after 1 item(s). Invalidating cached '
+                'data.',
+            ])
+
+        # The data should have been invalidated, and will be rebuilt on the
+        # next call.
+        self.assertNotIn(make_cache_key(cache_key), cache)
+
+        result = list(cache_memoize_iter(cache_key,
+                                         cache_func,
+                                         compress_large_data=False,
+                                         stream_large_data=True,
+                                         chunk_batch_size=2))
+
+        self.assertEqual(result, [data1, data2])
+        self.assertEqual(data_yielded, ['data1', 'data2'])
+        self.assertSpyCallCount(cache_func, 2)
+        self.assertIn(make_cache_key('%s-3' % cache_key), cache)
+
+    def test_with_stream_large_data_and_missing_chunk_before_yield(
+        self,
+    ) -> None:
+        """Testing cache_memoize_iter with stream_large_data=True and a
+        chunk missing before any items were yielded
+        """
+        cache_key = 'abc123'
+
+        data1, pickled_data_1 = self.build_test_chunk_data(num_chunks=2)
+
+        def cache_func() -> Iterator[str]:
+            yield data1
+
+        self.spy_on(cache_func)
+
+        list(cache_memoize_iter(cache_key,
+                                cache_func,
+                                compress_large_data=False))
+
+        cache.delete(make_cache_key('%s-1' % cache_key))
+
+        with self.assertLogs() as logs:
+            result = list(cache_memoize_iter(cache_key,
+                                             cache_func,
+                                             compress_large_data=False,
+                                             stream_large_data=True,
+                                             chunk_batch_size=1))
+
+        self.assertEqual(result, [data1])
+        self.assertSpyCallCount(cache_func, 2)
+        self.assertEqual(
+            logs.output,
+            [
+                'WARNING:djblets.cache.backend:Chunk missing while '
+                'streaming large or iterable data from cache for key '
+                '"example.com:abc123". Rebuilding data.',
+            ])
+        self.assertIn(make_cache_key('%s-1' % cache_key), cache)
+
+    def test_with_local_cache(self) -> None:
+        """Testing cache_memoize_iter with local_cache"""
+        cache_key = 'abc123'
+        local_cache = LocalCache()
+
+        def cache_func() -> Iterator[str]:
+            yield 'data1'
+            yield 'data2'
+
+        self.spy_on(cache_func)
+
+        result = list(cache_memoize_iter(cache_key, cache_func,
+                                         local_cache=local_cache))
+        self.assertEqual(result, ['data1', 'data2'])
+        self.assertSpyCallCount(cache_func, 1)
+        self.assertEqual(local_cache.get(make_cache_key(cache_key)),
+                         ['data1', 'data2'])
+
+        # Call a second time. This should not hit the main cache.
+        self.spy_on(cache.get)
+        self.spy_on(cache.get_many)
+
+        result = list(cache_memoize_iter(cache_key, cache_func,
+                                         local_cache=local_cache))
+        self.assertEqual(result, ['data1', 'data2'])
+        self.assertSpyCallCount(cache_func, 1)
+        self.assertSpyNotCalled(cache.get)
+        self.assertSpyNotCalled(cache.get_many)
+
+    def test_with_local_cache_and_incomplete_iteration(self) -> None:
+        """Testing cache_memoize_iter with local_cache and results not fully
+        consumed
+        """
+        cache_key = 'abc123'
+        local_cache = LocalCache()
+
+        def cache_func() -> Iterator[str]:
+            yield 'data1'
+            yield 'data2'
+
+        result = cache_memoize_iter(cache_key, cache_func,
+                                    local_cache=local_cache)
+        self.assertEqual(next(result), 'data1')
+        result.close()
+
+        self.assertNotIn(make_cache_key(cache_key), local_cache)
+
     def test_with_cache_get_error(self) -> None:
         """Testing cache_memoize_iter with cache.get() error"""
         cache_key = 'abc123'
@@ -1899,6 +2700,263 @@ class CacheMemoizeIterTests(BaseCacheTestCase):
         self.assertIsNone(cache.get(lock_key))
 
 
+class CacheMemoizeManyTests(BaseCacheTestCase):
+    """Unit tests for cache_memoize_many."""
+
+    def test_with_all_missing(self) -> None:
+        """Testing cache_memoize_many with all keys missing"""
+        def compute_missing(keys: list[str]) -> dict[str, str]:
+            return {
+                key: f'value-{key}'
+                for key in keys
+            }
+
+        self.spy_on(compute_missing)
+        self.spy_on(cache.get_many)
+        self.spy_on(cache.set_many)
+
+        results = cache_memoize_many(['a', 'b', 'c'], compute_missing)
+
+        self.assertEqual(results, {
+            'a': 'value-a',
+            'b': 'value-b',
+            'c': 'value-c',
+        })
+        self.assertSpyCalledOnceWith(compute_missing, ['a', 'b', 'c'])
+        self.assertSpyCallCount(cache.get_many, 1)
+        self.assertSpyCallCount(cache.set_many, 1)
+
+        self.assertEqual(cache.get(make_cache_key('a')), 'value-a')
+        self.assertEqual(cache.get(make_cache_key('b')), 'value-b')
+        self.assertEqual(cache.get(make_cache_key('c')), 'value-c')
+
+    def test_with_some_missing(self) -> None:
+        """Testing cache_memoize_many with some keys missing"""
+        cache.set(make_cache_key('a'), 'cached-a')
+        cache.set(make_cache_key(['b', 'c:d']), 'cached-b')
+
+        def compute_missing(keys: list[str]) -> dict[str, str]:
+            return {
+                key: f'value-{key}'
+                for key in keys
+            }
+
+        self.spy_on(compute_missing)
+
+        results = cache_memoize_many(['a', ('b', 'c:d'), 'e'],
+                                     compute_missing)
+
+        self.assertEqual(list(results.items()), [
+            ('a', 'cached-a'),
+            (('b', 'c:d'), 'cached-b'),
+            ('e', 'value-e'),
+        ])
+        self.assertSpyCalledOnceWith(compute_missing, ['e'])
+
+    def test_with_all_cached(self) -> None:
+        """Testing cache_memoize_many with all keys cached"""
+        cache.set(make_cache_key('a'), 'cached-a')
+        cache.set(make_cache_key('b'), 'cached-b')
+
+        def compute_missing(keys: list[str]) -> dict[str, str]:
+            return {}
+
+        self.spy_on(compute_missing)
+        self.spy_on(cache.set_many)
+
+        results = cache_memoize_many(['a', 'b'], compute_missing)
+
+        self.assertEqual(results, {
+            'a': 'cached-a',
+            'b': 'cached-b',
+        })
+        self.assertSpyNotCalled(compute_missing)
+        self.assertSpyNotCalled(cache.set_many)
+
+    def test_with_compute_omitting_keys(self) -> None:
+        """Testing cache_memoize_many with compute_missing_func not returning
+        all keys
+        """
+        results = cache_memoize_many(['a', 'b'],
+                                     lambda keys: {'a': 'value-a'})
+
+        self.assertEqual(results, {
+            'a': 'value-a',
+        })
+        self.assertNotIn(make_cache_key('b'), cache)
+
+    def test_with_compute_returning_unrequested_keys(self) -> None:
+        """Testing cache_memoize_many with compute_missing_func returning
+        keys that weren't requested
+        """
+        cache.set(make_cache_key('a'), 'cached-a')
+
+        with self.assertLogs() as logs:
+            results = cache_memoize_many(
+                ['a', 'b'],
+                lambda keys: {
+                    'a': 'value-a',
+                    'b': 'value-b',
+                    'c': 'value-c',
+                })
+
+        self.assertEqual(results, {
+            'a': 'cached-a',
+            'b': 'value-b',
+        })
+        self.assertEqual(
+            logs.output,
+            [
+                "WARNING:djblets.cache.backend:cache_memoize_many() compute "
+                "function returned values for unrequested key(s), which "
+                "will be ignored: ['a', 'c']",
+            ])
+        self.assertEqual(cache.get(make_cache_key('a')), 'cached-a')
+        self.assertEqual(cache.get(make_cache_key('b')), 'value-b')
+        self.assertNotIn(make_cache_key('c'), cache)
+
+    def test_with_compute_returning_unrequested_keys_and_large_data(
+        self,
+    ) -> None:
+        """Testing cache_memoize_many with compute_missing_func returning
+        keys that weren't requested and large_data=True
+        """
+        with self.assertLogs(level='WARNING'):
+            results = cache_memoize_many(
+                ['a'],
+                lambda keys: {
+                    'a': 'value-a',
+                    'c': 'value-c',
+                },
+                large_data=True)
+
+        self.assertEqual(results, {
+            'a': 'value-a',
+        })
+        self.assertIn(make_cache_key('a'), cache)
+        self.assertNotIn(make_cache_key('c'), cache)
+
+    def test_with_force_overwrite(self) -> None:
+        """Testing cache_memoize_many with force_overwrite=True"""
+        cache.set(make_cache_key('a'), 'cached-a')
+
+        results = cache_memoize_many(
+            ['a'],
+            lambda keys: {'a': 'value-a'},
+            force_overwrite=True)
+
+        self.assertEqual(results, {
+            'a': 'value-a',
+        })
+        self.assertEqual(cache.get(make_cache_key('a')), 'value-a')
+
+    def test_with_use_encryption(self) -> None:
+        """Testing cache_memoize_many with use_encryption=True"""
+        def compute_missing(keys: list[str]) -> dict[str, object]:
+            return {
+                'a': {'value': 1},
+                'b': [2],
+            }
+
+        self.spy_on(compute_missing)
+
+        results = cache_memoize_many(['a', 'b'], compute_missing,
+                                     use_encryption=True)
+        self.assertEqual(results, {
+            'a': {'value': 1},
+            'b': [2],
+        })
+
+        stored = cache.get(make_cache_key('a', use_encryption=True))
+        self.assertIsInstance(stored, bytes)
+        self.assertEqual(pickle.loads(aes_decrypt(stored)), {'value': 1})
+
+        results = cache_memoize_many(['a', 'b'], compute_missing,
+                                     use_encryption=True)
+        self.assertEqual(results, {
+            'a': {'value': 1},
+            'b': [2],
+        })
+        self.assertSpyCallCount(compute_missing, 1)
+
+    def test_with_large_data(self) -> None:
+        """Testing cache_memoize_many with large_data=True"""
+        data1 = self.build_test_chunk_data(num_chunks=2)[0]
+        data2 = self.build_test_chunk_data(data_char='y',
+                                           num_chunks=2)[0]
+
+        def compute_missing(keys: list[str]) -> dict[str, str]:
+            return {
+                'a': data1,
+                'b': data2,
+            }
+
+        self.spy_on(compute_missing)
+
+        results = cache_memoize_many(['a', 'b'], compute_missing,
+                                     large_data=True,
+                                     compress_large_data=False)
+        self.assertEqual(results, {
+            'a': data1,
+            'b': data2,
+        })
+        self.assertEqual(cache.get(make_cache_key('a')), '2')
+        self.assertEqual(cache.get(make_cache_key('b')), '2')
+
+        self.spy_on(cache.get_many)
+
+        results = cache_memoize_many(['a', 'b'], compute_missing,
+                                     large_data=True,
+                                     compress_large_data=False)
+        self.assertEqual(results, {
+            'a': data1,
+            'b': data2,
+        })
+        self.assertSpyCallCount(compute_missing, 1)
+        self.assertSpyCallCount(cache.get_many, 2)
+
+    def test_with_large_data_missing_chunk(self) -> None:
+        """Testing cache_memoize_many with large_data=True and missing
+        chunks
+        """
+        def compute_missing(keys: list[str]) -> dict[str, str]:
+            return {
+                key: f'value-{key}'
+                for key in keys
+            }
+
+        self.spy_on(compute_missing)
+
+        cache_memoize_many(['a', 'b'], compute_missing,
+                           large_data=True)
+        cache.delete(make_cache_key('b-0'))
+
+        results = cache_memoize_many(['a', 'b'], compute_missing,
+                                     large_data=True)
+        self.assertEqual(results, {
+            'a': 'value-a',
+            'b': 'value-b',
+        })
+        self.assertSpyCallCount(compute_missing, 2)
+        self.assertSpyLastCalledWith(compute_missing, ['b'])
+
+    def test_with_cache_get_many_error(self) -> None:
+        """Testing cache_memoize_many with cache.get_many() error"""
+        self.spy_on(cache.get_many, op=kgb.SpyOpRaise(Exception('Oh no')))
+
+        with self.assertLogs() as logs:
+            results = cache_memoize_many(['a'],
+                                         lambda keys: {'a': 'value-a'})
+
+        self.assertEqual(results, {
+            'a': 'value-a',
+        })
+        self.assertEqual(len(logs.output), 1)
+        self.assertTrue(logs.output[0].startswith(
+            'ERROR:djblets.cache.backend:Error fetching data from cache for '
+            'keys [\'example.com:a\']: Oh no'))
+
+
 class MakeCacheKeyTests(BaseCacheTestCase):
     """Unit tests for make_cache_key."""
 
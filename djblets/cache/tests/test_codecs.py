@@ -0,0 +1,208 @@
+"""Unit tests for djblets.cache.codecs."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import lzma
+import zlib
+from unittest import skipUnless
+
+from djblets.cache.codecs import (MAX_DECOMPRESS_SIZE,
+                                  JSONCacheSerializer,
+                                  LZ4CacheCompressor,
+                                  LZMACacheCompressor,
+                                  MarshalCacheSerializer,
+                                  PickleCacheSerializer,
+                                  ZlibCacheCompressor,
+                                  ZstdCacheCompressor,
+                                  cache_compressors,
+                                  cache_serializers)
+from djblets.registries.errors import ItemLookupError
+from djblets.testing.testcases import TestCase
+
+
+class CacheSerializerTests(TestCase):
+    """Unit tests for cache serializers."""
+
+    def test_pickle(self) -> None:
+        """Testing PickleCacheSerializer"""
+        serializer = PickleCacheSerializer()
+
+        self.assertEqual(serializer.serializer_id, 'pickle')
+        self._check_serializer(serializer, [{'a': (1, 2)}, {'b', 'c'}])
+
+    def test_pickle_with_protocol(self) -> None:
+        """Testing PickleCacheSerializer with protocol"""
+        data = PickleCacheSerializer(protocol=0).dumps('test')
+
+        self.assertFalse(data.startswith(b'\x80'))
+        self.assertEqual(PickleCacheSerializer().loads(data), 'test')
+
+    def test_json(self) -> None:
+        """Testing JSONCacheSerializer"""
+        serializer = JSONCacheSerializer()
+
+        self.assertEqual(serializer.serializer_id, 'json')
+        self.assertEqual(serializer.dumps({'a': [1, None]}),
+                         b'{"a":[1,null]}\n')
+        self._check_serializer(serializer, [{'a': [1, None]}, 'line\nbreak'])
+
+    def test_marshal(self) -> None:
+        """Testing MarshalCacheSerializer"""
+        serializer = MarshalCacheSerializer()
+
+        self.assertEqual(serializer.serializer_id, 'marshal')
+        self._check_serializer(serializer, [{'a': (1, 2)}, b'bytes'])
+
+    def _check_serializer(self, serializer, values) -> None:
+        """Check that values can be serialized and read back.
+
+        Args:
+            serializer (djblets.cache.codecs.BaseCacheSerializer):
+                The serializer to check.
+
+            values (list):
+                The values to serialize.
+
+        Raises:
+            AssertionError:
+                The values could not be read back.
+        """
+        for value in values:
+            self.assertEqual(serializer.loads(serializer.dumps(value)),
+                             value)
+
+        fp = io.BytesIO(b''.join(
+            serializer.dumps(value)
+            for value in values
+        ))
+
+        for value in values:
+            self.assertEqual(serializer.load(fp), value)
+
+        with self.assertRaises(EOFError):
+            serializer.load(fp)
+
+
+class CacheCompressorTests(TestCase):
+    """Unit tests for cache compressors."""
+
+    def test_zlib(self) -> None:
+        """Testing ZlibCacheCompressor"""
+        compressor = ZlibCacheCompressor(level=9)
+
+        self.assertEqual(compressor.compressor_id, 'zlib')
+        self.assertEqual(compressor.compress(b'x' * 1000),
+                         zlib.compress(b'x' * 1000, 9))
+        self._check_compressor(compressor)
+
+    def test_zlib_iter_decompress_truncated(self) -> None:
+        """Testing ZlibCacheCompressor.iter_decompress with truncated data"""
+        data = ZlibCacheCompressor().compress(b'x' * 1000)
+
+        with self.assertRaises(zlib.error):
+            list(ZlibCacheCompressor().iter_decompress([data[:-4]]))
+
+    def test_lzma(self) -> None:
+        """Testing LZMACacheCompressor"""
+        compressor = LZMACacheCompressor()
+
+        self.assertEqual(compressor.compressor_id, 'lzma')
+        self._check_compressor(compressor)
+
+    def test_lzma_iter_decompress_truncated(self) -> None:
+        """Testing LZMACacheCompressor.iter_decompress with truncated data"""
+        data = LZMACacheCompressor().compress(b'x' * 1000)
+
+        with self.assertRaises(lzma.LZMAError):
+            list(LZMACacheCompressor().iter_decompress([data[:-4]]))
+
+    @skipUnless(importlib.util.find_spec('lz4'), 'lz4 is not installed')
+    def test_lz4(self) -> None:
+        """Testing LZ4CacheCompressor"""
+        compressor = LZ4CacheCompressor()
+
+        self.assertEqual(compressor.compressor_id, 'lz4')
+        self._check_compressor(compressor)
+
+    @skipUnless(importlib.util.find_spec('zstandard'),
+                'zstandard is not installed')
+    def test_zstd(self) -> None:
+        """Testing ZstdCacheCompressor"""
+        compressor = ZstdCacheCompressor()
+
+        self.assertEqual(compressor.compressor_id, 'zstd')
+        self._check_compressor(compressor)
+
+    def _check_compressor(self, compressor) -> None:
+        """Check that data can be compressed and decompressed.
+
+        Args:
+            compressor (djblets.cache.codecs.BaseCacheCompressor):
+                The compressor to check.
+
+        Raises:
+            AssertionError:
+                The data could not be decompressed.
+        """
+        data = b''.join(
+            b'%d' % i
+            for i in range(100000)
+        )
+
+        compressobj = compressor.compressobj()
+        compressed = (compressobj.compress(data[:1000]) +
+                      compressobj.compress(data[1000:]) +
+                      compressobj.flush())
+
+        self.assertLess(len(compressed), len(data))
+        self.assertEqual(compressor.decompress(compressed), data)
+
+        # Feed the data in a few bytes at a time.
+        chunks = [
+            compressed[i:i + 100]
+            for i in range(0, len(compressed), 100)
+        ]
+
+        self.assertEqual(b''.join(compressor.iter_decompress(chunks)), data)
+
+        # Highly-compressible data must be decompressed in bounded blocks.
+        data = b'x' * (MAX_DECOMPRESS_SIZE * 4)
+        blocks = list(compressor.iter_decompress([compressor.compress(data)]))
+
+        self.assertEqual(b''.join(blocks), data)
+        self.assertGreaterEqual(len(blocks), 4)
+
+        for block in blocks:
+            self.assertLessEqual(len(block), MAX_DECOMPRESS_SIZE)
+
+
+class CacheCodecsRegistryTests(TestCase):
+    """Unit tests for the cache serializer and compressor registries."""
+
+    def test_get_serializer(self) -> None:
+        """Testing CacheSerializersRegistry.get_serializer"""
+        self.assertIsInstance(cache_serializers.get_serializer('pickle'),
+                              PickleCacheSerializer)
+        self.assertIsInstance(cache_serializers.get_serializer('json'),
+                              JSONCacheSerializer)
+        self.assertIsInstance(cache_serializers.get_serializer('marshal'),
+                              MarshalCacheSerializer)
+
+    def test_get_serializer_with_unknown(self) -> None:
+        """Testing CacheSerializersRegistry.get_serializer with unknown ID"""
+        with self.assertRaises(ItemLookupError):
+            cache_serializers.get_serializer('xxx')
+
+    def test_get_compressor(self) -> None:
+        """Testing CacheCompressorsRegistry.get_compressor"""
+        self.assertIsInstance(cache_compressors.get_compressor('zlib'),
+                              ZlibCacheCompressor)
+        self.assertIsInstance(cache_compressors.get_compressor('lzma'),
+                              LZMACacheCompressor)
+
+    def test_get_compressor_with_unknown(self) -> None:
+        """Testing CacheCompressorsRegistry.get_compressor with unknown ID"""
+        with self.assertRaises(ItemLookupError):
+            cache_compressors.get_compressor('xxx')
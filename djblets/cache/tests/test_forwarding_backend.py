@@ -0,0 +1,319 @@
+"""Unit tests for djblets.cache.forwarding_backend."""
+
+from __future__ import annotations
+
+import logging
+
+import kgb
+from django.core.cache import cache, caches
+from django.http import HttpRequest, HttpResponse
+from django.test.utils import override_settings
+
+from djblets.cache.backend import cache_memoize
+from djblets.cache.forwarding_backend import (RequestMemoCacheBackend,
+                                              bypass_request_cache_memo,
+                                              get_request_cache_memo,
+                                              request_cache_memo)
+from djblets.cache.middleware import RequestCacheMemoMiddleware
+from djblets.protect.locks import CacheReadLock, _make_writer_cache_key
+from djblets.testing.testcases import TestCase
+
+
+class RequestMemoCacheBackendTests(kgb.SpyAgency, TestCase):
+    """Unit tests for RequestMemoCacheBackend."""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.memo_cache = RequestMemoCacheBackend('default')
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        cache.clear()
+
+    def test_get_without_memo(self) -> None:
+        """Testing RequestMemoCacheBackend.get without an active memo"""
+        cache.set('key', 'value')
+        self.spy_on(cache.get)
+
+        self.assertEqual(self.memo_cache.get('key'), 'value')
+        self.assertEqual(self.memo_cache.get('key'), 'value')
+
+        self.assertSpyCallCount(cache.get, 2)
+
+    def test_get_with_memo(self) -> None:
+        """Testing RequestMemoCacheBackend.get with an active memo"""
+        cache.set('key', 'value')
+        self.spy_on(cache.get)
+
+        with request_cache_memo() as memo:
+            self.assertEqual(self.memo_cache.get('key'), 'value')
+            self.assertEqual(self.memo_cache.get('key'), 'value')
+            self.assertIsNone(self.memo_cache.get('missing'))
+            self.assertEqual(self.memo_cache.get('missing', 'default'),
+                             'default')
+            self.assertNotIn('missing', self.memo_cache)
+
+        # Misses aren't memoized.
+        self.assertSpyCallCount(cache.get, 4)
+        self.assertEqual(memo.get_report(), {
+            'fetches': 4,
+            'fetched_keys': 4,
+            'memo_hits': 1,
+            'round_trips_avoided': 1,
+            'top_keys': [('key', 1)],
+        })
+
+        self.assertIsNone(get_request_cache_memo())
+
+    def test_get_many_with_memo(self) -> None:
+        """Testing RequestMemoCacheBackend.get_many with an active memo"""
+        cache.set_many({
+            'key1': 1,
+            'key2': 2,
+        })
+        self.spy_on(cache.get_many)
+
+        with request_cache_memo() as memo:
+            self.assertEqual(self.memo_cache.get('key1'), 1)
+            self.assertEqual(
+                self.memo_cache.get_many(['key1', 'key2', 'key3']),
+                {
+                    'key1': 1,
+                    'key2': 2,
+                })
+            self.assertEqual(
+                self.memo_cache.get_many(['key2', 'key3']),
+                {
+                    'key2': 2,
+                })
+
+        # Misses aren't memoized.
+        self.assertSpyCallCount(cache.get_many, 2)
+        self.assertSpyCalledWith(cache.get_many.calls[0], ['key2', 'key3'])
+        self.assertSpyCalledWith(cache.get_many.calls[1], ['key3'])
+        self.assertEqual(memo.fetches, 3)
+        self.assertEqual(memo.fetched_keys, 4)
+        self.assertEqual(memo.round_trips_avoided, 0)
+
+    def test_get_with_memo_and_key_set_elsewhere(self) -> None:
+        """Testing RequestMemoCacheBackend.get with an active memo and a
+        missing key later set by another caller
+        """
+        with request_cache_memo():
+            self.assertIsNone(self.memo_cache.get('key'))
+            self.assertEqual(self.memo_cache.get_many(['key']), {})
+
+            # Simulate another process setting the key.
+            cache.set('key', 'other')
+
+            self.assertEqual(self.memo_cache.get('key'), 'other')
+
+    def test_get_with_bypass(self) -> None:
+        """Testing RequestMemoCacheBackend.get and get_many with
+        bypass_request_cache_memo
+        """
+        cache.set('key', 'value')
+
+        with request_cache_memo() as memo:
+            self.assertEqual(self.memo_cache.get('key'), 'value')
+
+            # Simulate another process changing the key.
+            cache.set('key', 'other')
+            self.assertEqual(self.memo_cache.get('key'), 'value')
+
+            with bypass_request_cache_memo():
+                self.assertEqual(self.memo_cache.get('key'), 'other')
+                self.assertEqual(self.memo_cache.get_many(['key']),
+                                 {'key': 'other'})
+
+                self.memo_cache.set('key2', 'value2')
+
+            # Neither key should be memoized.
+            self.spy_on(cache.get)
+
+            self.assertEqual(self.memo_cache.get('key'), 'other')
+            self.assertEqual(self.memo_cache.get('key2'), 'value2')
+
+            self.assertSpyCallCount(cache.get, 2)
+            self.assertEqual(memo.memo_hits, 1)
+
+    @override_settings(DJBLETS_CACHE_REQUEST_MEMO_MAX_KEYS=2)
+    def test_get_with_max_keys(self) -> None:
+        """Testing RequestMemoCacheBackend.get with max memoized keys"""
+        cache.set_many({
+            'key1': 1,
+            'key2': 2,
+            'key3': 3,
+        })
+
+        with request_cache_memo() as memo:
+            self.assertEqual(memo.max_keys, 2)
+
+            self.memo_cache.get_many(['key1', 'key2', 'key3'])
+
+            self.spy_on(cache.get_many)
+
+            self.assertEqual(
+                self.memo_cache.get_many(['key1', 'key2', 'key3']),
+                {
+                    'key1': 1,
+                    'key2': 2,
+                    'key3': 3,
+                })
+
+        # The oldest key should have been discarded.
+        self.assertSpyCalledOnceWith(cache.get_many, ['key1'])
+
+    def test_writes_with_memo(self) -> None:
+        """Testing RequestMemoCacheBackend writes keep the memo coherent"""
+        with request_cache_memo():
+            self.assertIsNone(self.memo_cache.get('key'))
+
+            self.memo_cache.set('key', 'value')
+            self.assertEqual(self.memo_cache.get('key'), 'value')
+            self.assertEqual(cache.get('key'), 'value')
+
+            self.memo_cache.delete('key')
+            self.assertIsNone(self.memo_cache.get('key'))
+            self.assertIsNone(cache.get('key'))
+
+            self.memo_cache.set_many({'key1': 1, 'key2': 2})
+            self.assertEqual(self.memo_cache.get_many(['key1', 'key2']),
+                             {'key1': 1, 'key2': 2})
+
+            self.memo_cache.delete_many(['key1'])
+            self.assertEqual(self.memo_cache.get_many(['key1', 'key2']),
+                             {'key2': 2})
+
+            self.assertEqual(self.memo_cache.incr('key2'), 3)
+            self.assertEqual(self.memo_cache.get('key2'), 3)
+            self.assertEqual(self.memo_cache.decr('key2', 2), 1)
+            self.assertEqual(self.memo_cache.get('key2'), 1)
+
+            with self.assertRaises(ValueError):
+                self.memo_cache.incr('key3')
+
+            self.memo_cache.set('key4', 'value', timeout=0)
+            self.assertIsNone(self.memo_cache.get('key4'))
+
+            self.memo_cache.clear()
+            self.assertIsNone(self.memo_cache.get('key2'))
+
+    def test_add_with_existing_key(self) -> None:
+        """Testing RequestMemoCacheBackend.add with a key set by another
+        caller
+        """
+        with request_cache_memo():
+            self.assertIsNone(self.memo_cache.get('key'))
+
+            # Simulate another process setting the key.
+            cache.set('key', 'other')
+
+            self.assertFalse(self.memo_cache.add('key', 'value'))
+            self.assertEqual(self.memo_cache.get('key'), 'other')
+
+            self.assertEqual(self.memo_cache.get_or_set('key', 'new'),
+                             'other')
+            self.assertEqual(self.memo_cache.get_or_set('key2', lambda: 'new'),
+                             'new')
+
+    @override_settings(CACHES={
+        'default': {
+            'BACKEND': ('djblets.cache.forwarding_backend.'
+                        'RequestMemoCacheBackend'),
+            'LOCATION': 'forwarded',
+        },
+        'forwarded': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'forwarded',
+        },
+    })
+    def test_with_cache_lock(self) -> None:
+        """Testing RequestMemoCacheBackend with cache locks polling for
+        changes made by other processes
+        """
+        forwarded_cache = caches['forwarded']
+
+        try:
+            with request_cache_memo():
+                lock = CacheReadLock('my-lock')
+                writer_key = _make_writer_cache_key(lock.full_cache_key)
+
+                # Simulate another process holding the write lock.
+                forwarded_cache.set(writer_key, 'other')
+                self.assertFalse(lock.acquire(blocking=False))
+
+                # Simulate the other process releasing the lock.
+                forwarded_cache.delete(writer_key)
+                self.assertTrue(lock.acquire(blocking=False))
+
+                lock.release()
+        finally:
+            forwarded_cache.clear()
+
+    @override_settings(CACHES={
+        'default': {
+            'BACKEND': ('djblets.cache.forwarding_backend.'
+                        'RequestMemoCacheBackend'),
+            'LOCATION': 'forwarded',
+        },
+        'forwarded': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'forwarded',
+        },
+    })
+    def test_with_large_data(self) -> None:
+        """Testing RequestMemoCacheBackend doesn't memoize chunks of large
+        data
+        """
+        forwarded_cache = caches['forwarded']
+
+        try:
+            with request_cache_memo() as memo:
+                cache_memoize('my-key', lambda: 'value', large_data=True)
+                cache_memoize('my-key', lambda: 'value', large_data=True)
+
+                self.assertEqual(
+                    memo.get_store('forwarded'),
+                    {
+                        ('example.com:my-key', None): '1',
+                    })
+        finally:
+            forwarded_cache.clear()
+
+    def test_middleware(self) -> None:
+        """Testing RequestCacheMemoMiddleware"""
+        cache.set('key', 'value')
+
+        def _get_response(
+            request: HttpRequest,
+        ) -> HttpResponse:
+            self.assertIs(get_request_cache_memo(), request.cache_memo)
+
+            for i in range(3):
+                self.assertEqual(self.memo_cache.get('key'), 'value')
+
+            return HttpResponse()
+
+        self.spy_on(cache.get)
+
+        middleware = RequestCacheMemoMiddleware(_get_response)
+        request = HttpRequest()
+        request.method = 'GET'
+        request.path = '/test/'
+
+        with self.assertLogs('djblets.cache.middleware',
+                             level=logging.DEBUG) as cm:
+            middleware(request)
+
+        self.assertSpyCalledOnce(cache.get)
+        self.assertEqual(
+            cm.output,
+            [
+                "DEBUG:djblets.cache.middleware:Cache memo for GET /test/: "
+                "1 fetches (1 keys), 2 keys served from memo, 2 round trips "
+                "avoided. Most-hit keys: [('key', 2)]",
+            ])
+        self.assertIsNone(get_request_cache_memo())
@@ -0,0 +1,158 @@
+"""Unit tests for djblets.cache.local."""
+
+from __future__ import annotations
+
+import time
+
+import kgb
+from django.core.cache import cache
+
+from djblets.cache.local import LocalCache
+from djblets.cache.synchronizer import GenerationSynchronizer
+from djblets.testing.testcases import TestCase
+from djblets.util.symbols import UNSET
+
+
+class LocalCacheTests(kgb.SpyAgency, TestCase):
+    """Unit tests for djblets.cache.local.LocalCache."""
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        cache.clear()
+
+    def test_get_and_set(self) -> None:
+        """Testing LocalCache.get and set"""
+        local_cache = LocalCache()
+
+        self.assertIs(local_cache.get('key'), UNSET)
+        self.assertIsNone(local_cache.get('key', None))
+
+        self.assertTrue(local_cache.set('key', {'a': [1, 2]}))
+        self.assertEqual(local_cache.get('key'), {'a': [1, 2]})
+        self.assertIn('key', local_cache)
+
+    def test_get_returns_copy(self) -> None:
+        """Testing LocalCache.get returns a copy of the stored value"""
+        local_cache = LocalCache()
+        local_cache.set('key', [1, 2])
+
+        value = local_cache.get('key')
+        value.append(3)
+
+        self.assertEqual(local_cache.get('key'), [1, 2])
+
+    def test_get_with_expired(self) -> None:
+        """Testing LocalCache.get with expired entry"""
+        local_cache = LocalCache()
+        local_cache.set('key', 'value',
+                        expiration_secs=0.01)
+
+        time.sleep(0.015)
+
+        self.assertIs(local_cache.get('key'), UNSET)
+        self.assertEqual(len(local_cache), 0)
+        self.assertEqual(local_cache.total_bytes, 0)
+
+    def test_set_with_max_entries(self) -> None:
+        """Testing LocalCache.set evicts least-recently-used entries past
+        max_entries
+        """
+        local_cache = LocalCache(max_entries=2)
+        local_cache.set('key1', 1)
+        local_cache.set('key2', 2)
+
+        # Mark key1 as recently used.
+        local_cache.get('key1')
+
+        local_cache.set('key3', 3)
+
+        self.assertEqual(len(local_cache), 2)
+        self.assertEqual(local_cache.get('key1'), 1)
+        self.assertIs(local_cache.get('key2'), UNSET)
+        self.assertEqual(local_cache.get('key3'), 3)
+
+    def test_set_with_max_bytes(self) -> None:
+        """Testing LocalCache.set evicts entries past max_bytes"""
+        local_cache = LocalCache(max_bytes=200,
+                                 max_entry_bytes=150)
+        local_cache.set('key1', 'x' * 100)
+        local_cache.set('key2', 'y' * 100)
+
+        self.assertIs(local_cache.get('key1'), UNSET)
+        self.assertEqual(local_cache.get('key2'), 'y' * 100)
+        self.assertLessEqual(local_cache.total_bytes, 200)
+
+    def test_set_with_max_entry_bytes(self) -> None:
+        """Testing LocalCache.set with value larger than max_entry_bytes"""
+        local_cache = LocalCache(max_entry_bytes=100)
+        local_cache.set('key', 'value')
+
+        self.assertFalse(local_cache.set('key', 'x' * 200))
+        self.assertIs(local_cache.get('key'), UNSET)
+        self.assertEqual(local_cache.total_bytes, 0)
+
+    def test_set_with_unpicklable(self) -> None:
+        """Testing LocalCache.set with value that can't be pickled"""
+        local_cache = LocalCache()
+
+        self.assertFalse(local_cache.set('key', lambda: None))
+        self.assertIs(local_cache.get('key'), UNSET)
+
+    def test_delete(self) -> None:
+        """Testing LocalCache.delete"""
+        local_cache = LocalCache()
+        local_cache.set('key', 'value')
+        local_cache.delete('key')
+
+        self.assertIs(local_cache.get('key'), UNSET)
+        self.assertEqual(local_cache.total_bytes, 0)
+
+    def test_with_synchronizer_expired(self) -> None:
+        """Testing LocalCache with synchronizer and generation changed by
+        another process
+        """
+        local_cache = LocalCache(
+            synchronizer=GenerationSynchronizer('test-local-cache'),
+            sync_check_interval_secs=0)
+        local_cache.set('key', 'value')
+
+        self.assertEqual(local_cache.get('key'), 'value')
+
+        # Simulate another process invalidating the cache.
+        GenerationSynchronizer('test-local-cache').mark_updated()
+
+        self.assertIs(local_cache.get('key'), UNSET)
+
+        # The new generation should now be current.
+        local_cache.set('key', 'new value')
+        self.assertEqual(local_cache.get('key'), 'new value')
+
+    def test_with_synchronizer_check_interval(self) -> None:
+        """Testing LocalCache with synchronizer only checks the generation
+        once per interval
+        """
+        synchronizer = GenerationSynchronizer('test-local-cache')
+        local_cache = LocalCache(synchronizer=synchronizer,
+                                 sync_check_interval_secs=60)
+
+        self.spy_on(synchronizer.is_expired)
+
+        local_cache.get('key')
+        local_cache.get('key')
+        local_cache.get('key')
+
+        self.assertSpyCallCount(synchronizer.is_expired, 1)
+
+    def test_invalidate(self) -> None:
+        """Testing LocalCache.invalidate"""
+        synchronizer = GenerationSynchronizer('test-local-cache')
+        local_cache = LocalCache(synchronizer=synchronizer)
+        local_cache.set('key', 'value')
+
+        self.spy_on(synchronizer.mark_updated)
+
+        local_cache.invalidate()
+
+        self.assertIs(local_cache.get('key'), UNSET)
+        self.assertSpyCalledOnce(synchronizer.mark_updated)
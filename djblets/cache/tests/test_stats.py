@@ -0,0 +1,266 @@
+"""Unit tests for djblets.cache.stats."""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+
+import kgb
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test.utils import override_settings
+
+from djblets.cache import stats as stats_module
+from djblets.cache.backend import cache_memoize, cache_memoize_iter
+from djblets.cache.signals import cache_stats_recorded
+from djblets.cache.stats import (CacheKeyStats,
+                                 clear_published_cache_stats,
+                                 get_cache_key_prefix,
+                                 get_cache_stats,
+                                 get_published_cache_stats,
+                                 publish_cache_stats,
+                                 record_cache_stats,
+                                 reset_cache_stats)
+from djblets.protect.locks import CacheLock
+from djblets.testing.testcases import TestCase
+
+
+@override_settings(DJBLETS_CACHE_STATS_ENABLED=True)
+class CacheStatsTests(kgb.SpyAgency, TestCase):
+    """Unit tests for djblets.cache.stats."""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        reset_cache_stats()
+        stats_module._state.publish_slot = None
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        reset_cache_stats()
+        cache.clear()
+
+    def test_get_cache_key_prefix(self) -> None:
+        """Testing get_cache_key_prefix"""
+        self.assertEqual(get_cache_key_prefix('my-key'), 'my-key')
+        self.assertEqual(get_cache_key_prefix('my-key:123'), 'my-key')
+        self.assertEqual(get_cache_key_prefix(['my-key', '123']), 'my-key')
+
+    def test_record_cache_stats(self) -> None:
+        """Testing record_cache_stats"""
+        record_cache_stats('key:1', hits=1)
+        record_cache_stats(['key', '2'], misses=1, compute_secs=0.5,
+                           computes=1)
+        record_cache_stats('other', hits=2)
+
+        self.assertEqual(get_cache_stats(), {
+            'key': CacheKeyStats(hits=1,
+                                 misses=1,
+                                 computes=1,
+                                 compute_secs=0.5),
+            'other': CacheKeyStats(hits=2),
+        })
+
+    @override_settings(DJBLETS_CACHE_STATS_ENABLED=False)
+    def test_record_cache_stats_with_disabled(self) -> None:
+        """Testing record_cache_stats with statistics disabled"""
+        record_cache_stats('key', hits=1)
+
+        self.assertEqual(get_cache_stats(), {})
+
+    def test_record_cache_stats_emits_signal(self) -> None:
+        """Testing record_cache_stats emits cache_stats_recorded"""
+        def _on_stats_recorded(**kwargs) -> None:
+            pass
+
+        self.spy_on(_on_stats_recorded)
+        cache_stats_recorded.connect(_on_stats_recorded)
+
+        try:
+            record_cache_stats('key', hits=1)
+        finally:
+            cache_stats_recorded.disconnect(_on_stats_recorded)
+
+        self.assertSpyCalledWith(_on_stats_recorded,
+                                 key_prefix='key',
+                                 stats=CacheKeyStats(hits=1))
+
+    def test_hit_rate(self) -> None:
+        """Testing CacheKeyStats.hit_rate"""
+        self.assertEqual(CacheKeyStats().hit_rate, 0.0)
+        self.assertEqual(CacheKeyStats(hits=3, misses=1).hit_rate, 0.75)
+
+    def test_publish_cache_stats(self) -> None:
+        """Testing publish_cache_stats and get_published_cache_stats"""
+        record_cache_stats('key', hits=1, stored_bytes=100)
+        publish_cache_stats()
+
+        self.assertEqual(get_published_cache_stats(), {
+            'key': CacheKeyStats(hits=1, stored_bytes=100),
+        })
+
+    def test_publish_cache_stats_with_multiple_processes(self) -> None:
+        """Testing publish_cache_stats with multiple processes publishing"""
+        self.spy_on(stats_module._get_process_id,
+                    op=kgb.SpyOpReturnInOrder([
+                        'host:1',
+                        'host:2',
+                    ]))
+
+        record_cache_stats('key', hits=1)
+        publish_cache_stats()
+
+        reset_cache_stats()
+        record_cache_stats('key', hits=2)
+        record_cache_stats('other', misses=1)
+        publish_cache_stats()
+
+        self.assertEqual(get_published_cache_stats(), {
+            'key': CacheKeyStats(hits=3),
+            'other': CacheKeyStats(misses=1),
+        })
+        self.assertEqual(len(stats_module._get_published_slot_keys()), 2)
+
+    def test_publish_cache_stats_reuses_expired_slots(self) -> None:
+        """Testing publish_cache_stats reuses slots with expired statistics
+        """
+        self.spy_on(stats_module._get_process_id,
+                    op=kgb.SpyOpReturnInOrder([
+                        'host:1',
+                        'host:2',
+                        'host:3',
+                    ]))
+
+        record_cache_stats('key', hits=1)
+        publish_cache_stats()
+
+        reset_cache_stats()
+        record_cache_stats('key', hits=2)
+        publish_cache_stats()
+
+        # Expire the first process's statistics, and publish from a new
+        # process.
+        cache.delete(stats_module._make_published_slot_key(1))
+        stats_module._state.publish_slot = None
+
+        reset_cache_stats()
+        record_cache_stats('key', hits=4)
+        publish_cache_stats()
+
+        self.assertEqual(stats_module._state.publish_slot, 1)
+        self.assertEqual(len(stats_module._get_published_slot_keys()), 2)
+        self.assertEqual(get_published_cache_stats(), {
+            'key': CacheKeyStats(hits=6),
+        })
+
+    def test_publish_cache_stats_after_clear(self) -> None:
+        """Testing publish_cache_stats after clearing published statistics
+        keeps the same slot
+        """
+        record_cache_stats('key', hits=1)
+        publish_cache_stats()
+
+        clear_published_cache_stats()
+
+        record_cache_stats('key', hits=1)
+        publish_cache_stats()
+
+        self.assertEqual(stats_module._state.publish_slot, 1)
+        self.assertEqual(len(stats_module._get_published_slot_keys()), 1)
+        self.assertEqual(get_published_cache_stats(), {
+            'key': CacheKeyStats(hits=2),
+        })
+
+    @override_settings(DJBLETS_CACHE_STATS_PUBLISH_INTERVAL=0)
+    def test_record_cache_stats_publishes_in_thread(self) -> None:
+        """Testing record_cache_stats publishes statistics from a background
+        thread
+        """
+        self.spy_on(publish_cache_stats)
+
+        # The first statistics recorded won't be published.
+        record_cache_stats('key', hits=1)
+        self.assertIsNone(stats_module._state.publish_thread)
+
+        record_cache_stats('key', hits=1)
+
+        thread = stats_module._state.publish_thread
+        assert thread is not None
+        self.assertIsNot(thread, threading.current_thread())
+
+        thread.join()
+
+        self.assertSpyCallCount(publish_cache_stats, 1)
+        self.assertEqual(get_published_cache_stats(), {
+            'key': CacheKeyStats(hits=2),
+        })
+
+    def test_with_cache_memoize(self) -> None:
+        """Testing cache_memoize records statistics"""
+        cache_memoize(['my-key', '1'], lambda: 'test')
+        cache_memoize(['my-key', '1'], lambda: 'test')
+        cache_memoize(['my-key', '2'], lambda: 'test')
+
+        stats = get_cache_stats()['my-key']
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 2)
+        self.assertEqual(stats.computes, 2)
+        self.assertGreater(stats.stored_bytes, 0)
+
+    def test_with_cache_memoize_and_compressor(self) -> None:
+        """Testing cache_memoize records uncompressed sizes with a
+        compressor
+        """
+        cache_memoize('my-key', lambda: 'a' * 1000,
+                      compressor='zlib')
+
+        stats = get_cache_stats()['my-key']
+        self.assertGreater(stats.stored_bytes, 0)
+        self.assertGreater(stats.uncompressed_bytes, stats.stored_bytes)
+
+    def test_with_cache_memoize_and_lock(self) -> None:
+        """Testing cache_memoize records lock waits"""
+        cache_memoize('my-key', lambda: 'test',
+                      lock=CacheLock())
+
+        stats = get_cache_stats()['my-key']
+        self.assertEqual(stats.lock_waits, 1)
+        self.assertEqual(stats.misses, 1)
+
+    def test_with_cache_memoize_iter(self) -> None:
+        """Testing cache_memoize_iter records statistics"""
+        for i in range(2):
+            list(cache_memoize_iter('my-key', lambda: ['a' * 100, 'b']))
+
+        stats = get_cache_stats()['my-key']
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.computes, 1)
+        self.assertEqual(stats.chunks, 2)
+        self.assertGreater(stats.uncompressed_bytes, stats.stored_bytes)
+
+    def test_cache_stats_command(self) -> None:
+        """Testing cache-stats management command"""
+        record_cache_stats('my-key', hits=3, misses=1)
+        publish_cache_stats()
+
+        stdout = io.StringIO()
+        call_command('cache-stats', stdout=stdout)
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith('Key Prefix'))
+        self.assertEqual(lines[1].split()[:4], ['my-key', '3', '1', '75.0'])
+
+    def test_cache_stats_command_with_json_and_reset(self) -> None:
+        """Testing cache-stats management command with --json and --reset"""
+        record_cache_stats('my-key', hits=1)
+        publish_cache_stats()
+
+        stdout = io.StringIO()
+        call_command('cache-stats', json=True, reset=True, stdout=stdout)
+
+        self.assertEqual(json.loads(stdout.getvalue())['my-key']['hits'], 1)
+        self.assertEqual(get_published_cache_stats(), {})
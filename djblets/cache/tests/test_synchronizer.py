@@ -6,8 +6,12 @@ import re
 
 import kgb
 from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
 
-from djblets.cache.synchronizer import GenerationSynchronizer
+from djblets.cache.middleware import GenerationSyncMiddleware
+from djblets.cache.synchronizer import (GenerationSynchronizer,
+                                        GenerationSynchronizerGroup,
+                                        get_default_synchronizer_group)
 from djblets.testing.testcases import TestCase
 
 
@@ -86,3 +90,126 @@ class GenerationSynchronizerTests(kgb.SpyAgency, TestCase):
         self.assertEqual(gen_sync.sync_gen, sync_gen + 1)
         self.assertEqual(cache.get(gen_sync.cache_key),
                          gen_sync.sync_gen)
+
+
+class GenerationSynchronizerGroupTests(kgb.SpyAgency, TestCase):
+    """Unit tests for djblets.cache.synchronizer.GenerationSynchronizerGroup.
+    """
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        cache.clear()
+
+    def test_is_expired_without_batch(self) -> None:
+        """Testing GenerationSynchronizerGroup without a batch checks each
+        synchronizer individually
+        """
+        group = GenerationSynchronizerGroup()
+        gen_sync1 = GenerationSynchronizer('test-sync-1', group=group)
+        gen_sync2 = GenerationSynchronizer('test-sync-2', group=group)
+
+        self.spy_on(cache.get)
+        self.spy_on(cache.get_many)
+
+        self.assertFalse(gen_sync1.is_expired())
+        self.assertFalse(gen_sync2.is_expired())
+
+        self.assertSpyCallCount(cache.get, 2)
+        self.assertSpyNotCalled(cache.get_many)
+
+    def test_is_expired_with_batch(self) -> None:
+        """Testing GenerationSynchronizerGroup.batch fetches all generations
+        with one request
+        """
+        group = GenerationSynchronizerGroup()
+        gen_sync1 = GenerationSynchronizer('test-sync-1', group=group)
+        gen_sync2 = GenerationSynchronizer('test-sync-2', group=group)
+
+        self.spy_on(cache.get_many)
+
+        with group.batch():
+            self.assertFalse(gen_sync1.is_expired())
+            self.assertFalse(gen_sync2.is_expired())
+            self.assertFalse(gen_sync1.is_expired())
+
+        self.assertSpyCalledOnce(cache.get_many)
+
+        # A new batch should fetch again, and see the new generation.
+        cache.incr(gen_sync2.cache_key)
+
+        with group.batch():
+            self.assertFalse(gen_sync1.is_expired())
+            self.assertTrue(gen_sync2.is_expired())
+
+        self.assertSpyCallCount(cache.get_many, 2)
+
+    def test_is_expired_with_batch_and_local_update(self) -> None:
+        """Testing GenerationSynchronizerGroup.batch with generation updated
+        in this process
+        """
+        group = GenerationSynchronizerGroup()
+        gen_sync1 = GenerationSynchronizer('test-sync', group=group)
+        gen_sync2 = GenerationSynchronizer('test-sync', group=group)
+
+        with group.batch():
+            self.assertFalse(gen_sync1.is_expired())
+
+            gen_sync1.mark_updated()
+
+            self.assertFalse(gen_sync1.is_expired())
+            self.assertTrue(gen_sync2.is_expired())
+
+            gen_sync2.refresh()
+
+            self.assertFalse(gen_sync2.is_expired())
+
+    def test_is_expired_with_min_check_interval(self) -> None:
+        """Testing GenerationSynchronizerGroup with min_check_interval_secs
+        """
+        group = GenerationSynchronizerGroup(min_check_interval_secs=60)
+        gen_sync1 = GenerationSynchronizer('test-sync-1', group=group)
+        gen_sync2 = GenerationSynchronizer('test-sync-2', group=group)
+
+        self.spy_on(cache.get_many)
+
+        self.assertFalse(gen_sync1.is_expired())
+        self.assertFalse(gen_sync2.is_expired())
+
+        # Changes from other processes aren't seen until the interval
+        # passes.
+        cache.incr(gen_sync1.cache_key)
+
+        self.assertFalse(gen_sync1.is_expired())
+        self.assertSpyCalledOnce(cache.get_many)
+
+        group.reset()
+
+        self.assertTrue(gen_sync1.is_expired())
+        self.assertSpyCallCount(cache.get_many, 2)
+
+    def test_default_group(self) -> None:
+        """Testing GenerationSynchronizer uses the default group"""
+        gen_sync = GenerationSynchronizer('test-sync')
+
+        self.assertIs(gen_sync.group, get_default_synchronizer_group())
+
+    def test_middleware(self) -> None:
+        """Testing GenerationSyncMiddleware"""
+        gen_sync1 = GenerationSynchronizer('test-sync-1')
+        gen_sync2 = GenerationSynchronizer('test-sync-2')
+
+        def _get_response(
+            request: HttpRequest,
+        ) -> HttpResponse:
+            self.assertFalse(gen_sync1.is_expired())
+            self.assertFalse(gen_sync2.is_expired())
+
+            return HttpResponse()
+
+        self.spy_on(cache.get_many)
+
+        middleware = GenerationSyncMiddleware(_get_response)
+        middleware(HttpRequest())
+
+        self.assertSpyCalledOnce(cache.get_many)
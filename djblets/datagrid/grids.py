@@ -25,29 +25,44 @@ All datagrids are meant to be subclassed.
 from __future__ import annotations
 
 import datetime
+import json
 import logging
 import re
 import string
 import traceback
+import uuid
 from collections.abc import Callable
 from typing import Any, TYPE_CHECKING, TypedDict
 from urllib.parse import urlencode
 
 from django.conf import settings
-from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import InvalidPage, Paginator
+from django.core.cache import cache
+from django.core.exceptions import (EmptyResultSet,
+                                    FieldDoesNotExist,
+                                    FieldError,
+                                    ObjectDoesNotExist)
+from django.core.paginator import (EmptyPage, InvalidPage, Page,
+                                   PageNotAnInteger, Paginator)
+from django.db import DatabaseError, connections
+from django.db.models import Prefetch
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.http import Http404, HttpResponse
 from django.template.defaultfilters import date
 from django.template.loader import get_template, render_to_string
 from django.utils.cache import add_never_cache_headers
 from django.utils.functional import cached_property
-from django.utils.html import escape, format_html
+from django.utils.html import conditional_escape, escape, escapejs, format_html
 from django.utils.safestring import mark_safe
 from django.utils.timesince import timesince
-from django.utils.translation import gettext_lazy as _
+from django.utils.timezone import get_current_timezone_name
+from django.utils.translation import get_language, gettext_lazy as _
 from housekeeping import deprecate_non_keyword_only_args
 from typelets.symbols import UNSET
 
+from djblets.cache.backend import make_cache_key
+from djblets.db.query import (build_keyset_q,
+                              decode_keyset_cursor,
+                              encode_keyset_cursor)
 from djblets.deprecation import RemovedInDjblets80Warning
 from djblets.template.context import get_default_template_context_processors
 from djblets.util.http import get_url_params_except
@@ -56,7 +71,6 @@ if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping, Sequence
     from typing import ClassVar, Final, TypeAlias
 
-    from django.core.paginator import Page
     from django.db.models import Model, QuerySet
     from django.http import HttpRequest
     from django.template.backends.base import _EngineTemplate
@@ -67,6 +81,8 @@ if TYPE_CHECKING:
     from typelets.django.strings import StrOrPromise
     from typelets.symbols import Unsettable
 
+    from djblets.db.query import KeysetCursor
+
     _RenderContext: TypeAlias = Context | dict[str, Any]
 
     class _DataGridRow(TypedDict):
@@ -165,6 +181,14 @@ class DataGridPaginationJSONData(TypedDict):
     #: The total number of rows across all pages.
     total_count: int
 
+    #: Whether the total number of rows is exact.
+    #:
+    #: If ``False``, ``total_count`` and ``total_pages`` are estimates.
+    #:
+    #: Version Added:
+    #:     7.0
+    total_count_is_exact: bool
+
     #: The total number of pages.
     total_pages: int
 
@@ -232,6 +256,15 @@ class DataGridPaginator(Paginator):
     # Instance variables #
     ######################
 
+    #: Whether the total number of items is exact.
+    #:
+    #: If ``False``, the count is an estimate or a lower bound, as provided
+    #: by a :py:class:`BaseDataGridCountStrategy`.
+    #:
+    #: Version Added:
+    #:     7.0
+    count_is_exact: bool
+
     #: The total number of items across all pages.
     #:
     #: Type:
@@ -242,20 +275,32 @@ class DataGridPaginator(Paginator):
         self,
         *,
         total_count: int,
+        count_is_exact: bool = True,
         **kwargs,
     ) -> None:
         """Initialize the paginator.
 
+        Version Changed:
+            7.0:
+            Added the ``count_is_exact`` argument.
+
         Args:
             total_count (int):
                 The total number of items across all pages.
 
+            count_is_exact (bool, optional):
+                Whether ``total_count`` is exact.
+
+                Version Added:
+                    7.0
+
             **kwargs (dict):
                 Additional keyword argumens for the parent class.
         """
         super().__init__(**kwargs)
 
         self._total_count = total_count
+        self.count_is_exact = count_is_exact
 
     @cached_property
     def count(self) -> int:
@@ -266,6 +311,620 @@ class DataGridPaginator(Paginator):
         """
         return self._total_count
 
+    def page(
+        self,
+        number: int | str,
+    ) -> Page:
+        """Return a page of results.
+
+        If the count isn't exact, pages past the counted total can still be
+        requested, and results won't be truncated to the count.
+
+        Version Added:
+            7.0
+
+        Args:
+            number (int or str):
+                The 1-based page number.
+
+        Returns:
+            django.core.paginator.Page:
+            The page of results.
+
+        Raises:
+            django.core.paginator.InvalidPage:
+                The page number was invalid.
+        """
+        if self.count_is_exact:
+            return super().page(number)
+
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_('That page number is not an integer'))
+
+        if number < 1:
+            raise EmptyPage(_('That page number is less than 1'))
+
+        bottom = (number - 1) * self.per_page
+
+        return self._get_page(self.object_list[bottom:bottom + self.per_page],
+                              number, self)
+
+
+class DataGridKeysetPage(Page):
+    """A page of results fetched using keyset pagination.
+
+    Rather than an offset, the next and previous pages are located using
+    cursors containing the sort values of the last or first row on this
+    page. The object list contains the IDs of the objects on the page.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The cursor for the next page, if there is one.
+    next_cursor: str | None
+
+    #: The cursor for the previous page, if there is one.
+    previous_cursor: str | None
+
+    def __init__(
+        self,
+        object_list: Sequence[Any],
+        number: int,
+        paginator: Paginator,
+        *,
+        next_cursor: (str | None) = None,
+        previous_cursor: (str | None) = None,
+    ) -> None:
+        """Initialize the page.
+
+        Args:
+            object_list (list):
+                The IDs of the objects on this page.
+
+            number (int):
+                The 1-based page number.
+
+            paginator (django.core.paginator.Paginator):
+                The paginator for the datagrid.
+
+            next_cursor (str, optional):
+                The cursor for the next page, if there is one.
+
+            previous_cursor (str, optional):
+                The cursor for the previous page, if there is one.
+        """
+        super().__init__(object_list, number, paginator)
+
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def has_next(self) -> bool:
+        """Return whether there's a next page.
+
+        Returns:
+            bool:
+            ``True`` if there's a next page.
+        """
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        """Return whether there's a previous page.
+
+        Returns:
+            bool:
+            ``True`` if there's a previous page.
+        """
+        return self.previous_cursor is not None
+
+    def next_page_number(self) -> int:
+        """Return the number of the next page.
+
+        Returns:
+            int:
+            The 1-based number of the next page.
+        """
+        return self.number + 1
+
+    def previous_page_number(self) -> int:
+        """Return the number of the previous page.
+
+        Returns:
+            int:
+            The 1-based number of the previous page.
+        """
+        return self.number - 1
+
+    def end_index(self) -> int:
+        """Return the 1-based index of the last object on this page.
+
+        Returns:
+            int:
+            The index of the last object on this page.
+        """
+        return (self.number - 1) * self.paginator.per_page + len(self)
+
+
+class BaseDataGridCountStrategy:
+    """Base class for a strategy used to count the items in a datagrid.
+
+    Strategies are set in :py:attr:`DataGrid.count_strategy`, and are used
+    to compute the total number of items for the paginator. Subclasses can
+    trade accuracy for speed on large datagrids.
+
+    Version Added:
+        7.0
+    """
+
+    def get_count(
+        self,
+        *,
+        datagrid: DataGrid,
+        queryset: QuerySet,
+        page_number: int | None,
+        **kwargs,
+    ) -> tuple[int, bool]:
+        """Return the total number of items for the datagrid.
+
+        Args:
+            datagrid (DataGrid):
+                The datagrid being rendered.
+
+            queryset (django.db.models.QuerySet):
+                The filtered, unordered queryset to count.
+
+            page_number (int):
+                The 1-based page number being rendered, or ``None`` if the
+                last page was requested.
+
+            **kwargs (dict):
+                Additional keyword arguments, for future expansion.
+
+        Returns:
+            tuple:
+            A 2-tuple containing:
+
+            Tuple:
+                0 (int):
+                    The total number of items.
+
+                1 (bool):
+                    Whether the count is exact.
+        """
+        raise NotImplementedError
+
+
+class ExactDataGridCountStrategy(BaseDataGridCountStrategy):
+    """A count strategy that counts all items in the database.
+
+    This is the default strategy.
+
+    Version Added:
+        7.0
+    """
+
+    def get_count(
+        self,
+        *,
+        datagrid: DataGrid,
+        queryset: QuerySet,
+        page_number: int | None,
+        **kwargs,
+    ) -> tuple[int, bool]:
+        """Return the total number of items for the datagrid.
+
+        Args:
+            datagrid (DataGrid):
+                The datagrid being rendered.
+
+            queryset (django.db.models.QuerySet):
+                The filtered, unordered queryset to count.
+
+            page_number (int):
+                The 1-based page number being rendered, or ``None`` if the
+                last page was requested.
+
+            **kwargs (dict):
+                Additional keyword arguments, for future expansion.
+
+        Returns:
+            tuple:
+            A 2-tuple of the total number of items and ``True``.
+        """
+        return queryset.count(), True
+
+
+class CachedDataGridCountStrategy(ExactDataGridCountStrategy):
+    """A count strategy that caches exact counts.
+
+    Counts are cached for each distinct filtered query. The cached counts
+    for a model are invalidated whenever an instance of that model (or any
+    of :py:attr:`invalidate_models`) is saved or deleted, or its
+    many-to-many relations change. Changes to any other models the query
+    depends on will be reflected once :py:attr:`expiration` is reached.
+
+    Version Added:
+        7.0
+    """
+
+    #: The expiration time in seconds for cached counts.
+    expiration: int
+
+    #: Additional models that invalidate cached counts when changed.
+    invalidate_models: Sequence[type[Model]]
+
+    #: Models that are already connected for invalidation.
+    _connected_models: set[type[Model]]
+
+    def __init__(
+        self,
+        *,
+        expiration: int = 5 * 60,
+        invalidate_models: Sequence[type[Model]] = (),
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            expiration (int, optional):
+                The expiration time in seconds for cached counts.
+
+            invalidate_models (list of type, optional):
+                Additional models that invalidate cached counts when changed.
+        """
+        self.expiration = expiration
+        self.invalidate_models = invalidate_models
+        self._connected_models = set()
+
+    def get_count(
+        self,
+        *,
+        datagrid: DataGrid,
+        queryset: QuerySet,
+        page_number: int | None,
+        **kwargs,
+    ) -> tuple[int, bool]:
+        """Return the total number of items for the datagrid.
+
+        Args:
+            datagrid (DataGrid):
+                The datagrid being rendered.
+
+            queryset (django.db.models.QuerySet):
+                The filtered, unordered queryset to count.
+
+            page_number (int):
+                The 1-based page number being rendered, or ``None`` if the
+                last page was requested.
+
+            **kwargs (dict):
+                Additional keyword arguments, for future expansion.
+
+        Returns:
+            tuple:
+            A 2-tuple of the total number of items and ``True``.
+        """
+        model = getattr(queryset, 'model', None)
+        query = getattr(queryset, 'query', None)
+
+        if model is None or query is None:
+            return super().get_count(datagrid=datagrid,
+                                     queryset=queryset,
+                                     page_number=page_number,
+                                     **kwargs)
+
+        try:
+            sql, params = query.sql_with_params()
+        except Exception:
+            # This query can't be represented as SQL (for instance, it's
+            # known to be empty), so it can't be cached.
+            return super().get_count(datagrid=datagrid,
+                                     queryset=queryset,
+                                     page_number=page_number,
+                                     **kwargs)
+
+        models = [model, *self.invalidate_models]
+
+        for invalidate_model in models:
+            if invalidate_model not in self._connected_models:
+                self._connect_model(invalidate_model)
+
+        generations = [
+            self._get_generation(invalidate_model)
+            for invalidate_model in models
+        ]
+
+        cache_key = make_cache_key([
+            'datagrid-count',
+            queryset.db,
+            sql,
+            repr(params),
+            *generations,
+        ])
+        count = cache.get(cache_key)
+
+        if count is None:
+            count = queryset.count()
+            cache.set(cache_key, count, self.expiration)
+
+        return count, True
+
+    def _get_generation(
+        self,
+        model: type[Model],
+    ) -> str:
+        """Return the current generation of cached counts for a model.
+
+        Args:
+            model (type):
+                The model class.
+
+        Returns:
+            str:
+            The generation for the model.
+        """
+        gen_key = self._get_generation_key(model)
+        generation = cache.get(gen_key)
+
+        if generation is None:
+            generation = uuid.uuid4().hex
+
+            if not cache.add(gen_key, generation, self.expiration):
+                # Another process set the generation first.
+                generation = cache.get(gen_key, generation)
+
+        return generation
+
+    def _get_generation_key(
+        self,
+        model: type[Model],
+    ) -> str:
+        """Return the cache key storing the generation for a model.
+
+        Args:
+            model (type):
+                The model class.
+
+        Returns:
+            str:
+            The cache key.
+        """
+        return make_cache_key(['datagrid-count-generation',
+                               model._meta.label])
+
+    def _connect_model(
+        self,
+        model: type[Model],
+    ) -> None:
+        """Connect signals to invalidate cached counts for a model.
+
+        Args:
+            model (type):
+                The model class.
+        """
+        gen_key = self._get_generation_key(model)
+
+        def _on_model_changed(**kwargs) -> None:
+            cache.delete(gen_key)
+
+        dispatch_uid = 'datagrid-count:%s:%s' % (id(self), model._meta.label)
+
+        post_save.connect(_on_model_changed,
+                          sender=model,
+                          weak=False,
+                          dispatch_uid=dispatch_uid)
+        post_delete.connect(_on_model_changed,
+                            sender=model,
+                            weak=False,
+                            dispatch_uid=dispatch_uid)
+
+        for m2m_field in model._meta.many_to_many:
+            m2m_changed.connect(_on_model_changed,
+                                sender=m2m_field.remote_field.through,
+                                weak=False,
+                                dispatch_uid=dispatch_uid)
+
+        self._connected_models.add(model)
+
+
+class EstimatedDataGridCountStrategy(ExactDataGridCountStrategy):
+    """A count strategy that uses the database's estimated row counts.
+
+    On PostgreSQL and MySQL, the query planner's estimate (from ``EXPLAIN``)
+    will be used if it's at least :py:attr:`threshold`. Smaller results,
+    and other databases, will be counted exactly.
+
+    Estimated counts may be higher or lower than the real count. Pages
+    past the estimated count can still be viewed.
+
+    Version Added:
+        7.0
+    """
+
+    #: The minimum estimated count needed to use the estimate.
+    threshold: int
+
+    def __init__(
+        self,
+        *,
+        threshold: int = 10000,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            threshold (int, optional):
+                The minimum estimated count needed to use the estimate.
+        """
+        self.threshold = threshold
+
+    def get_count(
+        self,
+        *,
+        datagrid: DataGrid,
+        queryset: QuerySet,
+        page_number: int | None,
+        **kwargs,
+    ) -> tuple[int, bool]:
+        """Return the total number of items for the datagrid.
+
+        Args:
+            datagrid (DataGrid):
+                The datagrid being rendered.
+
+            queryset (django.db.models.QuerySet):
+                The filtered, unordered queryset to count.
+
+            page_number (int):
+                The 1-based page number being rendered, or ``None`` if the
+                last page was requested.
+
+            **kwargs (dict):
+                Additional keyword arguments, for future expansion.
+
+        Returns:
+            tuple:
+            A 2-tuple of the total number of items and whether the count is
+            exact.
+        """
+        estimate = self.get_estimated_count(queryset)
+
+        if estimate is not None and estimate >= self.threshold:
+            return estimate, False
+
+        return super().get_count(datagrid=datagrid,
+                                 queryset=queryset,
+                                 page_number=page_number,
+                                 **kwargs)
+
+    def get_estimated_count(
+        self,
+        queryset: QuerySet,
+    ) -> int | None:
+        """Return the database's estimated count for a queryset.
+
+        Args:
+            queryset (django.db.models.QuerySet):
+                The queryset to estimate.
+
+        Returns:
+            int:
+            The estimated count, or ``None`` if it couldn't be estimated.
+        """
+        query = getattr(queryset, 'query', None)
+        db = getattr(queryset, 'db', None)
+
+        if query is None or db is None:
+            return None
+
+        connection = connections[db]
+        vendor = connection.vendor
+
+        if vendor not in ('mysql', 'postgresql'):
+            return None
+
+        try:
+            sql, params = query.sql_with_params()
+        except Exception:
+            return None
+
+        try:
+            with connection.cursor() as cursor:
+                if vendor == 'postgresql':
+                    cursor.execute('EXPLAIN (FORMAT JSON) %s' % sql, params)
+                    plan = cursor.fetchone()[0]
+
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+
+                    return int(plan[0]['Plan']['Plan Rows'])
+                else:
+                    cursor.execute('EXPLAIN %s' % sql, params)
+                    columns = [
+                        column[0].lower()
+                        for column in cursor.description
+                    ]
+                    row = cursor.fetchone()
+
+                    return int(row[columns.index('rows')])
+        except (DatabaseError, KeyError, IndexError, TypeError,
+                ValueError) as e:
+            logger.warning('Unable to estimate the datagrid count for '
+                           'query %r: %s',
+                           sql, e)
+
+            return None
+
+
+class HasNextPageDataGridCountStrategy(ExactDataGridCountStrategy):
+    """A count strategy that only checks for a next page.
+
+    Rather than counting all items, this counts only up to one item past
+    the current page, plus any :py:attr:`DataGrid.paginate_orphans`. The
+    paginator will know whether there's a next page, but not the total
+    number of pages.
+
+    If the remaining items fit on the current page (including orphans), the
+    count is exact, and the orphans will be shown on that page rather than
+    on a page of their own.
+
+    If the last page is requested, all items will be counted.
+
+    Version Added:
+        7.0
+    """
+
+    def get_count(
+        self,
+        *,
+        datagrid: DataGrid,
+        queryset: QuerySet,
+        page_number: int | None,
+        **kwargs,
+    ) -> tuple[int, bool]:
+        """Return the total number of items for the datagrid.
+
+        Args:
+            datagrid (DataGrid):
+                The datagrid being rendered.
+
+            queryset (django.db.models.QuerySet):
+                The filtered, unordered queryset to count.
+
+            page_number (int):
+                The 1-based page number being rendered, or ``None`` if the
+                last page was requested.
+
+            **kwargs (dict):
+                Additional keyword arguments, for future expansion.
+
+        Returns:
+            tuple:
+            A 2-tuple of the number of items up to one past the current page
+            and its orphans, and whether the count is exact.
+        """
+        if page_number is None or page_number < 1:
+            return super().get_count(datagrid=datagrid,
+                                     queryset=queryset,
+                                     page_number=page_number,
+                                     **kwargs)
+
+        per_page = datagrid.paginate_by
+        max_page_size = per_page + datagrid.paginate_orphans
+        offset = (page_number - 1) * per_page
+        count = queryset[offset:offset + max_page_size + 1].count()
+
+        # If this page (along with any orphans) reached the end of the
+        # results, the count is exact. The paginator will then apply the
+        # orphans, so it won't link to a page containing only orphans.
+        is_exact = (count <= max_page_size and (count > 0 or offset == 0))
+
+        return offset + count, is_exact
+
 
 class Column:
     """A column in a datagrid.
@@ -300,6 +959,26 @@ class Column:
     # Class customization/instance variables #
     ##########################################
 
+    #: Annotations to add to the page query when displaying this column.
+    #:
+    #: This maps annotation names to query expressions, which will be
+    #: available as attributes on each object. Annotations from all visible
+    #: columns are merged into the page query.
+    #:
+    #: Version Added:
+    #:     7.0
+    annotations: Mapping[str, Any] = {}
+
+    #: Whether rendered cells can be stored in the datagrid's row cache.
+    #:
+    #: This is only used if :py:attr:`DataGrid.row_cache_enabled` is set.
+    #: It should be disabled for columns whose rendered cells depend on the
+    #: user viewing the datagrid or on the current time.
+    #:
+    #: Version Added:
+    #:     7.0
+    cacheable: bool = True
+
     #: Unused option to indicate a cell is clickable.
     #:
     #: This has never been used and should not be used by any code.
@@ -324,6 +1003,21 @@ class Column:
     #: set.
     db_field: str = ''
 
+    #: Whether cells can be rendered without the template engine.
+    #:
+    #: If enabled, and the cell uses the default :file:`datagrid/cell.html`
+    #: or :file:`datagrid/cell_no_link.html` template, the cell's HTML will
+    #: be built directly instead of rendering the template. The result is
+    #: the same as the template, but is considerably faster.
+    #:
+    #: This should not be enabled if a project overrides either of the
+    #: default cell templates. Cells using any other template will always
+    #: be rendered through that template.
+    #:
+    #: Version Added:
+    #:     7.0
+    fast_cell_render: bool = False
+
     #: The default sorting direction when the user activates sorting.
     #:
     #: This must be either :py:attr:`SORT_ASCENDING` or
@@ -393,6 +1087,39 @@ class Column:
     #: This is only used if :py:attr:`link` is ``True``.
     link_func: (LinkObjectFunc | None) = None
 
+    #: The model fields needed to display this column.
+    #:
+    #: If this is set for every visible column, and
+    #: :py:attr:`DataGrid.only_fields` is set, the page query will load only
+    #: these fields (along with any needed for related lookups) using
+    #: :py:meth:`QuerySet.only() <django.db.models.query.QuerySet.only>`.
+    #:
+    #: ``None`` means the column may need any field.
+    #:
+    #: Version Added:
+    #:     7.0
+    only_fields: Sequence[str] | None = None
+
+    #: Related lookups to prefetch when displaying this column.
+    #:
+    #: These may be lookup strings or
+    #: :py:class:`~django.db.models.Prefetch` objects, and are merged for all
+    #: visible columns into the page query.
+    #:
+    #: Version Added:
+    #:     7.0
+    prefetch_related: Sequence[str | Prefetch] = ()
+
+    #: Related fields to select when displaying this column.
+    #:
+    #: These are merged for all visible columns into a single
+    #: :py:meth:`QuerySet.select_related()
+    #: <django.db.models.query.QuerySet.select_related>` on the page query.
+    #:
+    #: Version Added:
+    #:     7.0
+    select_related: Sequence[str] = ()
+
     #: Whether the column will shrink to the minimum size for the data.
     shrink: bool = False
 
@@ -776,7 +1503,7 @@ class Column:
 
             query_args = datagrid.request.GET.copy()
 
-            for key in ('datagrid-id', 'gridonly', 'columns'):
+            for key in ('datagrid-id', 'gridonly', 'columns', 'cursor'):
                 query_args.pop(key, None)
 
             sort_query_args = query_args.copy()
@@ -909,6 +1636,20 @@ class Column:
             if url:
                 css_class = '%s has-link' % css_class
 
+            if self.fast_cell_render:
+                fast_renderer = _FAST_CELL_RENDERERS.get(
+                    self.cell_template or state.datagrid.cell_template)
+
+                if fast_renderer is not None:
+                    state.cell_render_cache[key] = fast_renderer(
+                        state=state,
+                        css_class=css_class.strip(),
+                        link_css_class=link_css_class,
+                        url=url,
+                        data=rendered_data)
+
+                    return state.cell_render_cache[key]
+
             ctx: dict[str, Any] = {}
 
             if render_context:
@@ -967,6 +1708,38 @@ class Column:
         else:
             return escape(self.get_raw_object_value(state, obj) or '')
 
+    def get_cache_version(
+        self,
+        state: StatefulColumn,
+        obj: Any,
+    ) -> str | None:
+        """Return a version for an object's cached cell.
+
+        This is used when :py:attr:`DataGrid.row_cache_enabled` is set. The
+        version is included in the row's cache key, so any change to it
+        will cause the row to be rendered again.
+
+        Subclasses can override this if the rendered cell depends on data
+        not covered by :py:attr:`DataGrid.row_cache_version_field`, such as
+        data on related objects.
+
+        Version Added:
+            7.0
+
+        Args:
+            state (StatefulColumn):
+                The state for the DataGrid instance.
+
+            obj (object):
+                The object being rendered for this row.
+
+        Returns:
+            str:
+            The version for the cell, or ``None`` if the column doesn't
+            provide its own version.
+        """
+        return None
+
     def to_json(
         self,
         state: StatefulColumn,
@@ -1325,6 +2098,7 @@ class CheckboxColumn(Column):
     """
 
     # Overrides for the parent class.
+    cacheable: bool = False
     cell_template: (str | None) = 'datagrid/cell_no_link.html'
     detailed_label: (StrOrPromise | None) = _('Select Rows')
     shrink = True
@@ -1702,6 +2476,8 @@ class DateTimeSinceColumn(Column):
         subclassing.
     """
 
+    # Overrides for the parent class.
+    cacheable: bool = False
     sortable: bool = True
 
     # TODO: Remove this function in Djblets 7.
@@ -1817,18 +2593,94 @@ class DataGrid:
     #:     6.0
     allow_search_indexing: bool = True
 
+    #: The strategy used to count the items in the datagrid.
+    #:
+    #: This defaults to counting all items. Large datagrids can use
+    #: :py:class:`CachedDataGridCountStrategy`,
+    #: :py:class:`EstimatedDataGridCountStrategy`, or
+    #: :py:class:`HasNextPageDataGridCountStrategy` to avoid an expensive
+    #: count on every page view.
+    #:
+    #: Version Added:
+    #:     7.0
+    count_strategy: BaseDataGridCountStrategy = ExactDataGridCountStrategy()
+
     #: The list of default columns for this datagrid.
     #:
     #: Type:
     #:     list of str
     default_columns: ClassVar[Sequence[str]] = []
 
+    #: The model fields needed for each row, outside of columns.
+    #:
+    #: This should include any fields used by
+    #: :py:meth:`link_to_object` or the model's ``get_absolute_url()``.
+    #:
+    #: If set, and every visible column sets :py:attr:`Column.only_fields`,
+    #: the page query will only load the fields needed for the datagrid.
+    #: The primary key is always loaded.
+    #:
+    #: Version Added:
+    #:     7.0
+    only_fields: Sequence[str] | None = None
+
+    #: Whether to page through sorted results using keyset pagination.
+    #:
+    #: If enabled, the next and previous links will contain a cursor with the
+    #: sort values of the last or first row on the page, and pages will be
+    #: fetched using range conditions on those values. Unlike page offsets,
+    #: this doesn't require the database to scan all preceding rows, so deep
+    #: pages are as fast as the first.
+    #:
+    #: Keyset pagination is only used if every sort field (as returned by
+    #: :py:meth:`Column.get_sort_field`) is a non-nullable, indexed field on
+    #: the model. Otherwise, or if a ``?page=`` is requested, pages will be
+    #: fetched by offset.
+    #:
+    #: Version Added:
+    #:     7.0
+    use_keyset_pagination: bool = False
+
     #: The default sort list for columns.
     #:
     #: Type:
     #:     list of str
     default_sort: ClassVar[Sequence[str]] = []
 
+    #: Whether to cache rendered rows across requests.
+    #:
+    #: If enabled, the rendered cells for each row will be stored in the
+    #: Django cache and shared by any users viewing the same objects with
+    #: the same columns and locale. Columns with :py:attr:`Column.cacheable`
+    #: disabled will always be rendered.
+    #:
+    #: Rows are keyed by the object's primary key, the value of
+    #: :py:attr:`row_cache_version_field`, and the results of
+    #: :py:meth:`Column.get_cache_version`. Rows without a version will be
+    #: cached until :py:attr:`row_cache_expiration` is reached.
+    #:
+    #: This should only be enabled if the rendered cells don't depend on the
+    #: user viewing the datagrid.
+    #:
+    #: Version Added:
+    #:     7.0
+    row_cache_enabled: bool = False
+
+    #: The expiration time in seconds for cached rows.
+    #:
+    #: Version Added:
+    #:     7.0
+    row_cache_expiration: int = 60 * 60
+
+    #: The model field used as a version for cached rows.
+    #:
+    #: This would normally be a modification timestamp, updated whenever the
+    #: object changes.
+    #:
+    #: Version Added:
+    #:     7.0
+    row_cache_version_field: str | None = None
+
     ######################
     # Instance variables #
     ######################
@@ -1879,6 +2731,14 @@ class DataGrid:
     #:     list of object
     id_list: list[Any]
 
+    #: The template used for the paginator when using keyset pagination.
+    #:
+    #: This defaults to :file:`datagrid/keyset_paginator.html`.
+    #:
+    #: Version Added:
+    #:     7.0
+    keyset_paginator_template: str
+
     #: The template used to render the list view.
     #:
     #: The default is :file:`datagrid/listview.html`.
@@ -2243,6 +3103,7 @@ class DataGrid:
         self.column_header_template = 'datagrid/column_header.html'
         self.cell_template = 'datagrid/cell.html'
         self.paginator_template = 'datagrid/paginator.html'
+        self.keyset_paginator_template = 'datagrid/keyset_paginator.html'
 
     @cached_property
     def cell_template_obj(self) -> _EngineTemplate:
@@ -2755,29 +3616,73 @@ class DataGrid:
         if self.use_distinct and hasattr(data_queryset, 'distinct'):
             data_queryset = data_queryset.distinct()
 
+        # Figure out what page we're starting on.
+        page_num = request.GET.get('page', 1)
+        keyset_ordering: (list[str] | None) = None
+        keyset_cursor: (KeysetCursor | None) = None
+
+        if self.use_keyset_pagination and 'page' not in request.GET:
+            keyset_ordering = self._get_keyset_ordering(data_queryset,
+                                                        sort_list)
+
+            if keyset_ordering is not None:
+                keyset_cursor = decode_keyset_cursor(
+                    request.GET.get('cursor'),
+                    queryset=data_queryset,
+                    ordering=keyset_ordering,
+                    with_page_number=True)
+
+                if keyset_cursor is not None:
+                    page_num = keyset_cursor.page_number
+
+        try:
+            count_page_num = int(page_num)
+        except (TypeError, ValueError):
+            count_page_num = None
+
+        total_count, count_is_exact = self.count_strategy.get_count(
+            datagrid=self,
+            queryset=filter_queryset.order_by(),
+            page_number=count_page_num)
+
         paginator = self.build_paginator(
             queryset=data_queryset,
-            total_count=filter_queryset.order_by().count())
+            total_count=total_count,
+            count_is_exact=count_is_exact)
 
         self.paginator = paginator
 
-        # Figure out what page we're starting on.
-        page_num = request.GET.get('page', 1)
+        page: Page
 
-        # Accept either "last" or a valid page number.
-        if page_num == 'last':
-            page_num = paginator.num_pages
+        if keyset_ordering is not None:
+            page = self._get_keyset_page(paginator=paginator,
+                                         queryset=data_queryset,
+                                         ordering=keyset_ordering,
+                                         cursor=keyset_cursor)
+        else:
+            # Accept either "last" or a valid page number.
+            if page_num == 'last':
+                page_num = paginator.num_pages
 
-        try:
-            page = paginator.page(page_num)
-        except InvalidPage:
-            raise Http404
+            try:
+                page = paginator.page(page_num)
+            except InvalidPage:
+                raise Http404
 
         self.page = page
 
         id_list: list[Any] = []
 
-        if self.optimize_sorts and len(sort_list) > 0:
+        if isinstance(page, DataGridKeysetPage):
+            # The IDs for the page were fetched along with the sort values,
+            # so we can fetch the objects directly.
+            id_list = list(page.object_list)
+            self.id_list = id_list
+
+            assert self.model is not None
+            page_queryset = self.post_process_queryset(
+                self.model.objects.filter(pk__in=id_list).order_by())
+        elif self.optimize_sorts and len(sort_list) > 0:
             # This can be slow when sorting by multiple columns. If we
             # have multiple items in the sort list, we'll request just the
             # IDs and then fetch the actual details from that.
@@ -2813,11 +3718,13 @@ class DataGrid:
             page_queryset,  # type: ignore
             request=request)
 
-        if use_select_related and hasattr(page.object_list, 'select_related'):
-            page_queryset = (
-                page_queryset
-                .select_related(depth=1)  # type: ignore
-            )
+        if (use_select_related and
+            hasattr(page_queryset, 'select_related') and
+            not getattr(getattr(page_queryset, 'query', None),
+                        'select_related', False)):
+            # No columns have declared the related fields they need, so
+            # select all of them.
+            page_queryset = page_queryset.select_related()
 
         page.object_list = page_queryset
 
@@ -2842,16 +3749,45 @@ class DataGrid:
             object_list = list(page.object_list)
 
         stateful_columns = self.columns
+        row_cache_keys: list[str | None] = [None] * len(object_list)
+        cached_rows: dict[str, dict[str, str]] = {}
+        cacheable_column_ids: set[str] = set()
+
+        if self.row_cache_enabled:
+            cacheable_column_ids = {
+                stateful_column.id
+                for stateful_column in stateful_columns
+                if stateful_column.cacheable
+            }
+
+            if cacheable_column_ids:
+                row_cache_keys = self._build_row_cache_keys(object_list)
+                cached_rows = self._get_cached_rows(row_cache_keys)
+
+        if cached_rows:
+            # Cached cells don't need any related objects, so only collect
+            # them for the rows that still need to be rendered.
+            uncached_objects = [
+                obj
+                for obj, row_cache_key in zip(object_list, row_cache_keys)
+                if row_cache_key not in cached_rows
+            ]
+        else:
+            uncached_objects = object_list
 
         for stateful_column in stateful_columns:
-            stateful_column.collect_objects(object_list)
+            if stateful_column.id in cacheable_column_ids:
+                stateful_column.collect_objects(uncached_objects)
+            else:
+                stateful_column.collect_objects(object_list)
 
         if render_context is None:
             render_context = self._build_render_context()
 
         rows: list[_DataGridRow] = []
+        new_cached_rows: dict[str, dict[str, str]] = {}
 
-        for obj in object_list:
+        for obj, row_cache_key in zip(object_list, row_cache_keys):
             if obj is None:
                 continue
 
@@ -2863,8 +3799,22 @@ class DataGrid:
             render_context['_datagrid_object_url'] = obj_url
 
             cells: list[SafeString] = []
+            cached_cells: dict[str, str] | None = None
+            cells_to_cache: dict[str, str] | None = None
+
+            if row_cache_key is not None:
+                cached_cells = cached_rows.get(row_cache_key)
+
+                if cached_cells is None:
+                    cells_to_cache = {}
 
             for stateful_column in stateful_columns:
+                column_id = stateful_column.id
+
+                if cached_cells is not None and column_id in cached_cells:
+                    cells.append(mark_safe(cached_cells[column_id]))
+                    continue
+
                 try:
                     rendered_cell = stateful_column.render_cell(
                         obj, render_context)
@@ -2876,14 +3826,33 @@ class DataGrid:
                         extra={'request': request})
                     rendered_cell = mark_safe('')
 
+                    # Don't cache a row containing a failed render.
+                    cells_to_cache = None
+
+                if (cells_to_cache is not None and
+                    column_id in cacheable_column_ids):
+                    cells_to_cache[column_id] = str(rendered_cell)
+
                 cells.append(rendered_cell)
 
+            if row_cache_key is not None and cells_to_cache is not None:
+                new_cached_rows[row_cache_key] = cells_to_cache
+
             rows.append({
                 'object': obj,
                 'cells': cells,
                 'url': obj_url,
             })
 
+        if new_cached_rows:
+            try:
+                cache.set_many(new_cached_rows, self.row_cache_expiration)
+            except Exception as e:
+                logger.exception('Error storing rendered DataGrid rows in '
+                                 'cache: %s',
+                                 e,
+                                 extra={'request': request})
+
         self.rows = rows
 
     def post_process_queryset_for_filter(
@@ -2958,6 +3927,7 @@ class DataGrid:
             The resulting augmented QuerySet.
         """
         request = self.request
+        queryset = self._apply_column_data_requirements(queryset)
 
         for column in self.columns:
             try:
@@ -3127,7 +4097,7 @@ class DataGrid:
         """
         request = self.request
         extra_query = get_url_params_except(request.GET,
-                                            'page', 'gridonly',
+                                            'cursor', 'page', 'gridonly',
                                             *self.special_query_args)
 
         paginator = self.paginator
@@ -3142,7 +4112,8 @@ class DataGrid:
 
         if page_nums:
             show_first = (page_nums[0] != 1)
-            show_last = (page_nums[-1] != paginator.num_pages)
+            show_last = (paginator.count_is_exact and
+                         page_nums[-1] != paginator.num_pages)
         else:
             show_first = False
             show_last = False
@@ -3169,6 +4140,7 @@ class DataGrid:
             'has_next': page.has_next(),
             'has_previous': page.has_previous(),
             'hits': paginator.count,
+            'hits_is_exact': paginator.count_is_exact,
             'is_paginated': page.has_other_pages(),
             'page': page.number,
             'page_numbers': page_nums,
@@ -3183,25 +4155,36 @@ class DataGrid:
             'show_last': show_last,
         }
 
-        if page.has_next():
-            context['next'] = page.next_page_number()
-        else:
-            context['next'] = None
+        if isinstance(page, DataGridKeysetPage):
+            context.update({
+                'next': page.next_cursor,
+                'previous': page.previous_cursor,
+            })
 
-        if page.has_previous():
-            context['previous'] = page.previous_page_number()
+            template_name = self.keyset_paginator_template
         else:
-            context['previous'] = None
+            if page.has_next():
+                context['next'] = page.next_page_number()
+            else:
+                context['next'] = None
+
+            if page.has_previous():
+                context['previous'] = page.previous_page_number()
+            else:
+                context['previous'] = None
+
+            template_name = self.paginator_template
 
         context.update(self.extra_context)
 
-        return render_to_string(self.paginator_template, context)
+        return render_to_string(template_name, context)
 
     def build_paginator(
         self,
         queryset: QuerySet,
         *,
         total_count: int,
+        count_is_exact: bool = True,
         **kwargs,
     ) -> DataGridPaginator:
         """Build the paginator for the datagrid.
@@ -3209,6 +4192,10 @@ class DataGrid:
         This can be overridden to use a special paginator or to perform
         any kind of processing before passing on the query.
 
+        Version Changed:
+            7.0:
+            Added the ``count_is_exact`` argument.
+
         Args:
             queryset (django.db.models.QuerySet):
                 A queryset-compatible object for fetching column data.
@@ -3216,6 +4203,12 @@ class DataGrid:
             total_count (int):
                 The total number of items across all pages.
 
+            count_is_exact (bool, optional):
+                Whether ``total_count`` is exact.
+
+                Version Added:
+                    7.0
+
             **kwargs (dict):
                 Additional keyword arguments, for future expansion.
 
@@ -3223,11 +4216,19 @@ class DataGrid:
             DataGridPaginator
             A populated paginator object.
         """
+        if count_is_exact:
+            orphans = self.paginate_orphans
+        else:
+            # Orphans can't be collected without knowing where the results
+            # end.
+            orphans = 0
+
         return DataGridPaginator(
             object_list=queryset,
             total_count=total_count,
+            count_is_exact=count_is_exact,
             per_page=self.paginate_by,
-            orphans=self.paginate_orphans)
+            orphans=orphans)
 
     def to_json(self) -> DataGridJSONData:
         """Serialize the datagrid to a JSON-compatible dictionary.
@@ -3316,6 +4317,7 @@ class DataGrid:
             'per_page': self.paginate_by,
             'start_index': page.start_index(),
             'total_count': paginator.count,
+            'total_count_is_exact': paginator.count_is_exact,
             'total_pages': paginator.num_pages,
         }
 
@@ -3360,6 +4362,394 @@ class DataGrid:
 
         return render_context
 
+    def _apply_column_data_requirements(
+        self,
+        queryset: QuerySet,
+    ) -> QuerySet:
+        """Apply the data requirements declared by the visible columns.
+
+        The :py:attr:`Column.select_related`,
+        :py:attr:`Column.prefetch_related`, :py:attr:`Column.annotations`,
+        and :py:attr:`Column.only_fields` of all visible columns are merged
+        and applied to the page query in a single pass.
+
+        The resulting query is compiled up-front, so that conflicting
+        requirements (such as deferring a field that's traversed by
+        ``select_related``) can be caught here. If they conflict, an error
+        will be logged and the original queryset will be returned.
+        Prefetches can't be checked without running their queries.
+
+        Version Added:
+            7.0
+
+        Args:
+            queryset (django.db.models.QuerySet):
+                The queryset for the page of results.
+
+        Returns:
+            django.db.models.QuerySet:
+            The resulting queryset.
+        """
+        if not hasattr(queryset, 'select_related'):
+            # This is something more custom. Perhaps a Haystack
+            # SearchQuerySet.
+            return queryset
+
+        select_related: dict[str, None] = {}
+        prefetch_related: dict[str, str | Prefetch] = {}
+        annotations: dict[str, Any] = {}
+        only_fields: (set[str] | None) = None
+
+        if self.only_fields is not None:
+            only_fields = set(self.only_fields)
+
+        for stateful_column in self.columns:
+            column = stateful_column.column
+
+            select_related.update(dict.fromkeys(column.select_related))
+
+            for lookup in column.prefetch_related:
+                if isinstance(lookup, Prefetch):
+                    prefetch_related.setdefault(lookup.prefetch_to, lookup)
+                else:
+                    prefetch_related.setdefault(lookup, lookup)
+
+            for name, expression in column.annotations.items():
+                annotations.setdefault(name, expression)
+
+            if only_fields is not None:
+                if column.only_fields is None:
+                    only_fields = None
+                else:
+                    only_fields.update(column.only_fields)
+
+        new_queryset = queryset
+
+        try:
+            if select_related:
+                new_queryset = new_queryset.select_related(*select_related)
+
+            if prefetch_related:
+                new_queryset = new_queryset.prefetch_related(
+                    *prefetch_related.values())
+
+            if annotations:
+                new_queryset = new_queryset.annotate(**annotations)
+
+            if only_fields is not None:
+                # Related lookups need the fields they traverse.
+                for path in (*select_related, *prefetch_related):
+                    parts = path.split('__')
+
+                    only_fields.update(
+                        '__'.join(parts[:i])
+                        for i in range(1, len(parts) + 1)
+                    )
+
+                # Annotations aren't model fields, and are always loaded.
+                only_fields.difference_update(annotations)
+
+                new_queryset = new_queryset.only('pk', *sorted(only_fields))
+
+            if new_queryset is not queryset and hasattr(new_queryset,
+                                                        'query'):
+                # Most conflicts between these are only raised when the
+                # query is compiled, so check for them now.
+                try:
+                    new_queryset.query.get_compiler(
+                        using=new_queryset.db).as_sql()
+                except EmptyResultSet:
+                    # The query is valid, but won't match anything.
+                    pass
+        except (FieldError, TypeError, ValueError) as e:
+            logger.exception('Error applying column data requirements for '
+                             'DataGrid %r: %s',
+                             self, e,
+                             extra={'request': self.request})
+
+            return queryset
+
+        return new_queryset
+
+    def _get_keyset_ordering(
+        self,
+        queryset: QuerySet,
+        sort_list: Sequence[str],
+    ) -> list[str] | None:
+        """Return the ordering to use for keyset pagination.
+
+        Each sort field must be a non-nullable, indexed field on the model.
+        The primary key will be added if not already present, ensuring a
+        stable order.
+
+        Version Added:
+            7.0
+
+        Args:
+            queryset (django.db.models.QuerySet):
+                The queryset for the datagrid's data.
+
+            sort_list (list of str):
+                The sort fields for the datagrid. Fields prefixed with ``-``
+                are sorted in descending order.
+
+        Returns:
+            list of str:
+            The attribute names of the fields to sort by, or ``None`` if
+            keyset pagination can't be used.
+        """
+        model = getattr(queryset, 'model', None)
+
+        if model is None or not hasattr(queryset, 'query'):
+            return None
+
+        meta = model._meta
+        pk_field = meta.pk
+        assert pk_field is not None
+
+        # Fields at the start of a multi-field index can use that index.
+        indexed_names: set[str] = {
+            fields[0]
+            for fields in (
+                *(index.fields for index in meta.indexes),
+                *meta.unique_together,
+            )
+            if fields
+        }
+
+        ordering: list[str] = []
+        has_pk = False
+
+        for sort_field in sort_list:
+            prefix = '-' if sort_field.startswith('-') else ''
+            name = sort_field.lstrip('-')
+
+            if name == 'pk':
+                field = pk_field
+            else:
+                try:
+                    field = meta.get_field(name)
+                except FieldDoesNotExist:
+                    return None
+
+            if (not getattr(field, 'concrete', False) or
+                field.many_to_many or
+                field.null or
+                not (field.primary_key or
+                     field.unique or
+                     field.db_index or
+                     field.name in indexed_names)):
+                return None
+
+            if field.primary_key:
+                has_pk = True
+
+            ordering.append(prefix + field.attname)
+
+        if not has_pk:
+            ordering.append(pk_field.attname)
+
+        return ordering
+
+    def _get_keyset_page(
+        self,
+        *,
+        paginator: DataGridPaginator,
+        queryset: QuerySet,
+        ordering: Sequence[str],
+        cursor: KeysetCursor | None,
+    ) -> DataGridKeysetPage:
+        """Return a page of results using keyset pagination.
+
+        This will fetch the IDs and sort values for one more row than
+        needed, in order to determine if there's another page of results.
+
+        Version Added:
+            7.0
+
+        Args:
+            paginator (DataGridPaginator):
+                The paginator for the datagrid.
+
+            queryset (django.db.models.QuerySet):
+                The queryset for the datagrid's data.
+
+            ordering (list of str):
+                The fields used to sort results, from
+                :py:meth:`_get_keyset_ordering`.
+
+            cursor (djblets.db.query.KeysetCursor):
+                The decoded cursor for the page, if any.
+
+        Returns:
+            DataGridKeysetPage:
+            The page of results.
+        """
+        per_page = self.paginate_by
+        is_prev = False
+        number = 1
+
+        if cursor is not None:
+            assert cursor.page_number is not None
+
+            number = cursor.page_number
+            is_prev = (cursor.direction == 'prev')
+            queryset = queryset.filter(build_keyset_q(
+                ordering=ordering,
+                values=cursor.values,
+                reverse=is_prev))
+
+        if is_prev:
+            # Walk backwards from the cursor, and then flip the page.
+            queryset = queryset.order_by(*(
+                field[1:] if field.startswith('-') else f'-{field}'
+                for field in ordering
+            ))
+        else:
+            queryset = queryset.order_by(*ordering)
+
+        attnames = [
+            field.lstrip('-')
+            for field in ordering
+        ]
+        rows = list(queryset.values_list(*attnames)[:per_page + 1])
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+
+        if is_prev:
+            rows.reverse()
+            has_prev = has_more
+            has_next = True
+
+            if not has_prev:
+                number = 1
+        else:
+            has_prev = cursor is not None
+            has_next = has_more
+
+        next_cursor: (str | None) = None
+        previous_cursor: (str | None) = None
+
+        if rows:
+            if has_prev:
+                previous_cursor = encode_keyset_cursor(
+                    'prev', rows[0], page_number=number - 1)
+
+            if has_next:
+                next_cursor = encode_keyset_cursor(
+                    'next', rows[-1], page_number=number + 1)
+
+        # The primary key is always the last sort field.
+        return DataGridKeysetPage(
+            [row[-1] for row in rows],
+            number,
+            paginator,
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor)
+
+    def _build_row_cache_keys(
+        self,
+        object_list: Sequence[Any],
+    ) -> list[str | None]:
+        """Build cache keys for rendered rows.
+
+        Version Added:
+            7.0
+
+        Args:
+            object_list (list of object):
+                The list of objects being rendered on the datagrid.
+
+        Returns:
+            list of str:
+            The cache keys for each object, in order. Entries will be
+            ``None`` for any missing objects.
+        """
+        cls = type(self)
+        stateful_columns = self.columns
+        versioned_columns = [
+            stateful_column
+            for stateful_column in stateful_columns
+            if stateful_column.cacheable
+        ]
+        version_field = self.row_cache_version_field
+
+        # Cells depend on the column order (through the "last" state), the
+        # language, and the timezone used for dates.
+        base_key = [
+            'datagrid-row',
+            f'{cls.__module__}.{cls.__qualname__}',
+            ','.join(
+                stateful_column.id
+                for stateful_column in stateful_columns
+            ),
+            get_language() or '',
+            get_current_timezone_name(),
+        ]
+
+        keys: list[str | None] = []
+
+        for obj in object_list:
+            if obj is None:
+                keys.append(None)
+                continue
+
+            versions: list[str] = []
+
+            if version_field:
+                versions.append(str(getattr(obj, version_field, '')))
+
+            for stateful_column in versioned_columns:
+                version = stateful_column.get_cache_version(obj)
+
+                if version is not None:
+                    versions.append(f'{stateful_column.id}={version}')
+
+            keys.append(make_cache_key([
+                *base_key,
+                str(obj.pk),
+                ','.join(versions),
+            ]))
+
+        return keys
+
+    def _get_cached_rows(
+        self,
+        row_cache_keys: Sequence[str | None],
+    ) -> dict[str, dict[str, str]]:
+        """Return cached rendered rows.
+
+        Version Added:
+            7.0
+
+        Args:
+            row_cache_keys (list of str):
+                The cache keys for the rows.
+
+        Returns:
+            dict:
+            A mapping of cache keys to dictionaries of column IDs and
+            rendered cells. Only rows found in cache will be included.
+        """
+        keys = [
+            key
+            for key in row_cache_keys
+            if key is not None
+        ]
+
+        if not keys:
+            return {}
+
+        try:
+            return cache.get_many(keys)
+        except Exception as e:
+            logger.exception('Error fetching rendered DataGrid rows from '
+                             'cache: %s',
+                             e,
+                             extra={'request': self.request})
+
+            return {}
+
     @staticmethod
     def link_to_object(
         state: StatefulColumn,
@@ -3472,6 +4862,122 @@ class AlphanumericDataGrid(DataGrid):
         self.paginator_template = 'datagrid/alphanumeric_paginator.html'
 
 
+def _render_fast_cell(
+    *,
+    state: StatefulColumn,
+    css_class: str,
+    link_css_class: str,
+    url: str,
+    data: str,
+) -> SafeString:
+    """Render a cell equivalent to the :file:`datagrid/cell.html` template.
+
+    Version Added:
+        7.0
+
+    Args:
+        state (StatefulColumn):
+            The state for the column.
+
+        css_class (str):
+            The CSS class for the cell.
+
+        link_css_class (str):
+            The CSS class for the cell's link.
+
+        url (str):
+            The URL to link to, if any.
+
+        data (str):
+            The rendered HTML for the cell's data.
+
+    Returns:
+        django.utils.safestring.SafeString:
+        The rendered cell.
+    """
+    parts: list[str] = ['<td']
+
+    if css_class:
+        parts.append(' class="%s"' % conditional_escape(css_class))
+
+    if state.last:
+        parts.append(' colspan="2"')
+
+    if url:
+        if state.column.cell_clickable:
+            parts.append(' onclick="javascript:window.location = \'%s\'; '
+                         'return false;"'
+                         % escapejs(url))
+
+        parts.append('>\n\n<a href="%s"' % conditional_escape(url))
+
+        if link_css_class:
+            parts.append(' class="%s"' % conditional_escape(link_css_class))
+
+        parts.append('>%s</a>\n\n</td>\n' % data)
+    else:
+        parts.append('>\n\n %s\n\n</td>\n' % data)
+
+    return mark_safe(''.join(parts))
+
+
+def _render_fast_cell_no_link(
+    *,
+    state: StatefulColumn,
+    css_class: str,
+    link_css_class: str,
+    url: str,
+    data: str,
+) -> SafeString:
+    """Render a cell equivalent to the :file:`datagrid/cell_no_link.html`
+    template.
+
+    Version Added:
+        7.0
+
+    Args:
+        state (StatefulColumn):
+            The state for the column.
+
+        css_class (str):
+            The CSS class for the cell.
+
+        link_css_class (str):
+            The CSS class for the cell's link. This is unused.
+
+        url (str):
+            The URL to link to. This is unused.
+
+        data (str):
+            The rendered HTML for the cell's data.
+
+    Returns:
+        django.utils.safestring.SafeString:
+        The rendered cell.
+    """
+    parts: list[str] = ['<td']
+
+    if css_class:
+        parts.append(' class="%s"' % conditional_escape(css_class))
+
+    if state.last:
+        parts.append(' colspan="2"')
+
+    parts.append('>\n%s\n</td>\n' % data)
+
+    return mark_safe(''.join(parts))
+
+
+#: Template-free renderers for the default cell templates.
+#:
+#: Version Added:
+#:     7.0
+_FAST_CELL_RENDERERS: Mapping[str, Callable[..., SafeString]] = {
+    'datagrid/cell.html': _render_fast_cell,
+    'datagrid/cell_no_link.html': _render_fast_cell_no_link,
+}
+
+
 #: A type alias for a function that returns a URL for an object.
 #:
 #: Version Added:
@@ -2,23 +2,32 @@
 
 from __future__ import annotations
 
+import base64
+import json
 from datetime import datetime, timedelta, timezone
 
 import kgb
 from django.conf import settings
-from django.contrib.auth.models import Group, User
-from django.db.models import Count, Q
+from django.contrib.auth.models import Group, Permission, User
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Q, QuerySet
 from django.http import HttpRequest
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.utils.encoding import force_str
 from django.utils.safestring import SafeString
 from django_assert_queries import assert_queries
 
-from djblets.datagrid.grids import (CheckboxColumn,
+from djblets.datagrid.grids import (CachedDataGridCountStrategy,
+                                    CheckboxColumn,
                                     Column,
                                     DataGrid,
+                                    DataGridKeysetPage,
                                     DateTimeColumn,
                                     DateTimeSinceColumn,
+                                    EstimatedDataGridCountStrategy,
+                                    HasNextPageDataGridCountStrategy,
                                     StatefulColumn,
                                     logger)
 from djblets.testing.testcases import TestCase
@@ -56,6 +65,15 @@ class GroupDataGrid(DataGrid):
         self.default_columns = ['objid', 'name']
 
 
+class KeysetGroupDataGrid(GroupDataGrid):
+    use_keyset_pagination = True
+
+
+class CachedGroupDataGrid(GroupDataGrid):
+    row_cache_enabled = True
+    row_cache_version_field = 'name'
+
+
 class CheckboxColumnTests(TestCase):
     """Unit tests for djblets.datagrid.grids.CheckboxColumn."""
 
@@ -1362,12 +1380,1008 @@ class DataGridTests(kgb.SpyAgency, TestCase):
                     'per_page': 50,
                     'start_index': 1,
                     'total_count': 99,
+                    'total_count_is_exact': True,
                     'total_pages': 2,
                 },
                 'sort': [],
             })
 
 
+class DataGridRowCacheTests(kgb.SpyAgency, TestCase):
+    """Unit tests for DataGrid row caching.
+
+    Version Added:
+        7.0
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        cache.clear()
+
+        Group.objects.bulk_create(
+            Group(name='Group %02d' % i)
+            for i in range(1, 11)
+        )
+
+        self.request = HttpRequest()
+        self.request.user = User(username='testuser')
+
+    def tearDown(self) -> None:
+        cache.clear()
+
+        super().tearDown()
+
+    def test_precompute_objects_with_row_cache(self) -> None:
+        """Testing DataGrid.precompute_objects with row_cache_enabled reuses
+        cached rows
+        """
+        datagrid = self._render_datagrid(CachedGroupDataGrid)
+        rows = self._get_row_cells(datagrid)
+
+        self.assertEqual(len(rows), 10)
+
+        self.spy_on(Column.render_cell,
+                    owner=Column)
+        self.spy_on(Column.collect_objects,
+                    owner=Column)
+
+        datagrid = self._render_datagrid(CachedGroupDataGrid)
+
+        self.assertEqual(self._get_row_cells(datagrid), rows)
+        self.assertSpyNotCalled(Column.render_cell)
+
+        for call in Column.collect_objects.calls:
+            self.assertEqual(call.args[1], [])
+
+    def test_precompute_objects_with_row_cache_version_changed(self) -> None:
+        """Testing DataGrid.precompute_objects with row_cache_enabled and
+        changed row_cache_version_field
+        """
+        self._render_datagrid(CachedGroupDataGrid)
+
+        group = Group.objects.get(name='Group 01')
+        group.name = 'New Name'
+        group.save(update_fields=('name',))
+
+        self.spy_on(Column.render_cell,
+                    owner=Column)
+
+        datagrid = self._render_datagrid(CachedGroupDataGrid)
+
+        self.assertSpyCallCount(Column.render_cell, 2)
+        self.assertIn('New Name', str(datagrid.rows[0]['cells'][1]))
+
+    def test_precompute_objects_with_row_cache_column_version(self) -> None:
+        """Testing DataGrid.precompute_objects with row_cache_enabled and
+        Column.get_cache_version
+        """
+        versions = {
+            'Group 02': '1',
+        }
+
+        class VersionedColumn(Column):
+            def get_cache_version(self, state, obj):
+                return versions.get(obj.name)
+
+        class VersionedDataGrid(CachedGroupDataGrid):
+            versioned = VersionedColumn('Versioned',
+                                        field_name='name')
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+
+                self.default_columns = ['objid', 'versioned']
+
+        self._render_datagrid(VersionedDataGrid)
+
+        versions['Group 02'] = '2'
+
+        self.spy_on(Column.render_cell,
+                    owner=Column)
+
+        self._render_datagrid(VersionedDataGrid)
+
+        self.assertSpyCallCount(Column.render_cell, 2)
+        self.assertEqual(Column.render_cell.calls[0].args[1].name,
+                         'Group 02')
+
+    def test_precompute_objects_with_row_cache_uncacheable_column(
+        self,
+    ) -> None:
+        """Testing DataGrid.precompute_objects with row_cache_enabled always
+        renders columns with cacheable=False
+        """
+        class UncachedColumn(Column):
+            cacheable = False
+
+        class UncachedDataGrid(CachedGroupDataGrid):
+            uncached = UncachedColumn('Uncached',
+                                      field_name='name')
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+
+                self.default_columns = ['objid', 'uncached']
+
+        self._render_datagrid(UncachedDataGrid)
+
+        self.spy_on(Column.render_cell,
+                    owner=Column)
+
+        self._render_datagrid(UncachedDataGrid)
+
+        self.assertSpyCallCount(Column.render_cell, 10)
+
+        for call in Column.render_cell.calls:
+            self.assertIsInstance(call.args[0].column, UncachedColumn)
+
+    def test_precompute_objects_with_row_cache_columns_changed(self) -> None:
+        """Testing DataGrid.precompute_objects with row_cache_enabled and
+        different columns
+        """
+        self._render_datagrid(CachedGroupDataGrid)
+
+        self.spy_on(Column.render_cell,
+                    owner=Column)
+
+        self.request.GET['columns'] = 'name,objid'
+        self._render_datagrid(CachedGroupDataGrid)
+
+        self.assertSpyCallCount(Column.render_cell, 20)
+
+    def test_precompute_objects_without_row_cache(self) -> None:
+        """Testing DataGrid.precompute_objects without row_cache_enabled"""
+        self.spy_on(cache.get_many)
+        self.spy_on(cache.set_many)
+
+        self._render_datagrid(GroupDataGrid)
+
+        self.assertSpyNotCalled(cache.get_many)
+        self.assertSpyNotCalled(cache.set_many)
+
+    def _render_datagrid(
+        self,
+        datagrid_cls: type[DataGrid],
+    ) -> DataGrid:
+        """Load and pre-compute a datagrid.
+
+        Args:
+            datagrid_cls (type):
+                The datagrid class to instantiate.
+
+        Returns:
+            djblets.datagrid.grids.DataGrid:
+            The loaded datagrid.
+        """
+        datagrid = datagrid_cls(self.request)
+        datagrid.load_state()
+
+        return datagrid
+
+    def _get_row_cells(
+        self,
+        datagrid: DataGrid,
+    ) -> list[list[str]]:
+        """Return the rendered cells for each row in a datagrid.
+
+        Args:
+            datagrid (djblets.datagrid.grids.DataGrid):
+                The loaded datagrid.
+
+        Returns:
+            list of list of str:
+            The rendered cells for each row.
+        """
+        return [
+            [str(cell) for cell in row['cells']]
+            for row in datagrid.rows
+        ]
+
+
+class DataGridCountStrategyTests(kgb.SpyAgency, TestCase):
+    """Unit tests for DataGrid count strategies.
+
+    Version Added:
+        7.0
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        cache.clear()
+
+        Group.objects.bulk_create(
+            Group(name='Group %02d' % i)
+            for i in range(1, 100)
+        )
+
+        self.request = HttpRequest()
+        self.request.user = User(username='testuser')
+
+    def tearDown(self) -> None:
+        cache.clear()
+
+        super().tearDown()
+
+    def test_exact(self) -> None:
+        """Testing DataGrid with default count strategy"""
+        datagrid = self._load_datagrid()
+        paginator = datagrid.paginator
+        assert paginator is not None
+
+        self.assertEqual(paginator.count, 99)
+        self.assertTrue(paginator.count_is_exact)
+
+    def test_cached(self) -> None:
+        """Testing DataGrid with CachedDataGridCountStrategy"""
+        strategy = CachedDataGridCountStrategy()
+
+        self.spy_on(QuerySet.count,
+                    owner=QuerySet)
+
+        datagrid = self._load_datagrid(count_strategy=strategy)
+        assert datagrid.paginator is not None
+
+        self.assertEqual(datagrid.paginator.count, 99)
+        self.assertTrue(datagrid.paginator.count_is_exact)
+        self.assertSpyCallCount(QuerySet.count, 1)
+
+        datagrid = self._load_datagrid(count_strategy=strategy)
+        assert datagrid.paginator is not None
+
+        self.assertEqual(datagrid.paginator.count, 99)
+        self.assertSpyCallCount(QuerySet.count, 1)
+
+        # Different filters are cached separately.
+        datagrid = self._load_datagrid(
+            count_strategy=strategy,
+            queryset=(
+                Group.objects
+                .filter(name__startswith='Group 0')
+                .order_by('pk')
+            ))
+        assert datagrid.paginator is not None
+
+        self.assertEqual(datagrid.paginator.count, 9)
+        self.assertSpyCallCount(QuerySet.count, 2)
+
+    def test_cached_invalidated(self) -> None:
+        """Testing DataGrid with CachedDataGridCountStrategy invalidates
+        counts when objects change
+        """
+        strategy = CachedDataGridCountStrategy()
+
+        self._load_datagrid(count_strategy=strategy)
+
+        group = Group.objects.create(name='Group 100')
+        datagrid = self._load_datagrid(count_strategy=strategy)
+        assert datagrid.paginator is not None
+
+        self.assertEqual(datagrid.paginator.count, 100)
+
+        group.delete()
+        datagrid = self._load_datagrid(count_strategy=strategy)
+        assert datagrid.paginator is not None
+
+        self.assertEqual(datagrid.paginator.count, 99)
+
+    def test_estimated_below_threshold(self) -> None:
+        """Testing DataGrid with EstimatedDataGridCountStrategy and estimate
+        below threshold
+        """
+        strategy = EstimatedDataGridCountStrategy(threshold=1000)
+
+        self.spy_on(strategy.get_estimated_count,
+                    op=kgb.SpyOpReturn(100))
+
+        datagrid = self._load_datagrid(count_strategy=strategy)
+        assert datagrid.paginator is not None
+
+        self.assertEqual(datagrid.paginator.count, 99)
+        self.assertTrue(datagrid.paginator.count_is_exact)
+
+    def test_estimated_above_threshold(self) -> None:
+        """Testing DataGrid with EstimatedDataGridCountStrategy and estimate
+        above threshold
+        """
+        strategy = EstimatedDataGridCountStrategy(threshold=1000)
+
+        self.spy_on(strategy.get_estimated_count,
+                    op=kgb.SpyOpReturn(5000))
+        self.spy_on(QuerySet.count,
+                    owner=QuerySet)
+
+        datagrid = self._load_datagrid(count_strategy=strategy)
+        assert datagrid.paginator is not None
+
+        self.assertEqual(datagrid.paginator.count, 5000)
+        self.assertFalse(datagrid.paginator.count_is_exact)
+        self.assertSpyNotCalled(QuerySet.count)
+
+        self.assertHTMLEqual(
+            datagrid.render_paginator(),
+            '<div class="paginator">'
+            ' <span class="current-page">1</span>'
+            ' <a href="?page=2" title="Page 2">2</a>'
+            ' <a href="?page=3" title="Page 3">3</a>'
+            ' <a href="?page=4" title="Page 4">4</a>'
+            ' <a href="?page=2" rel="next" title="Next Page">&gt;</a>'
+            '</div>')
+
+    def test_estimated_with_unsupported_database(self) -> None:
+        """Testing EstimatedDataGridCountStrategy.get_estimated_count with
+        unsupported database
+        """
+        strategy = EstimatedDataGridCountStrategy()
+
+        self.assertIsNone(strategy.get_estimated_count(Group.objects.all()))
+
+    def test_estimated_with_page_past_estimate(self) -> None:
+        """Testing DataGrid with EstimatedDataGridCountStrategy and page past
+        the estimated count
+        """
+        strategy = EstimatedDataGridCountStrategy(threshold=10)
+
+        self.spy_on(strategy.get_estimated_count,
+                    op=kgb.SpyOpReturn(20))
+
+        self.request.GET['page'] = '2'
+        datagrid = self._load_datagrid(count_strategy=strategy)
+
+        self.assertEqual(len(datagrid.rows), 49)
+        self.assertEqual(datagrid.rows[0]['object'].name, 'Group 51')
+
+    def test_has_next_page(self) -> None:
+        """Testing DataGrid with HasNextPageDataGridCountStrategy"""
+        datagrid = self._load_datagrid(
+            count_strategy=HasNextPageDataGridCountStrategy())
+        paginator = datagrid.paginator
+        page = datagrid.page
+        assert paginator is not None
+        assert page is not None
+
+        # This counts up to one past the page and its orphans.
+        self.assertEqual(paginator.count, 54)
+        self.assertFalse(paginator.count_is_exact)
+        self.assertEqual(paginator.num_pages, 2)
+        self.assertTrue(page.has_next())
+        self.assertEqual(len(datagrid.rows), 50)
+
+        self.assertHTMLEqual(
+            datagrid.render_paginator(),
+            '<div class="paginator">'
+            ' <span class="current-page">1</span>'
+            ' <a href="?page=2" title="Page 2">2</a>'
+            ' <a href="?page=2" rel="next" title="Next Page">&gt;</a>'
+            '</div>')
+
+    def test_has_next_page_with_last_page(self) -> None:
+        """Testing DataGrid with HasNextPageDataGridCountStrategy on the last
+        page
+        """
+        self.request.GET['page'] = '2'
+        datagrid = self._load_datagrid(
+            count_strategy=HasNextPageDataGridCountStrategy())
+        paginator = datagrid.paginator
+        page = datagrid.page
+        assert paginator is not None
+        assert page is not None
+
+        self.assertEqual(paginator.count, 99)
+        self.assertTrue(paginator.count_is_exact)
+        self.assertFalse(page.has_next())
+        self.assertEqual(len(datagrid.rows), 49)
+
+    def test_has_next_page_with_orphans(self) -> None:
+        """Testing DataGrid with HasNextPageDataGridCountStrategy and fewer
+        rows on the last page than paginate_orphans
+        """
+        queryset = (
+            Group.objects
+            .filter(pk__in=Group.objects.order_by('pk').values('pk')[:52])
+            .order_by('name')
+        )
+
+        # The orphans should be shown on the first page, with no link to a
+        # second page.
+        datagrid = self._load_datagrid(
+            count_strategy=HasNextPageDataGridCountStrategy(),
+            queryset=queryset)
+        paginator = datagrid.paginator
+        page = datagrid.page
+        assert paginator is not None
+        assert page is not None
+
+        self.assertEqual(datagrid.paginate_orphans, 3)
+        self.assertEqual(paginator.count, 52)
+        self.assertTrue(paginator.count_is_exact)
+        self.assertEqual(paginator.num_pages, 1)
+        self.assertFalse(page.has_next())
+        self.assertEqual(len(datagrid.rows), 52)
+
+        # With two more rows, there's a second page, and it should load.
+        queryset = (
+            Group.objects
+            .filter(pk__in=Group.objects.order_by('pk').values('pk')[:54])
+            .order_by('name')
+        )
+
+        datagrid = self._load_datagrid(
+            count_strategy=HasNextPageDataGridCountStrategy(),
+            queryset=queryset)
+        page = datagrid.page
+        assert page is not None
+
+        self.assertTrue(page.has_next())
+        self.assertEqual(len(datagrid.rows), 50)
+
+        self.request.GET['page'] = '2'
+        datagrid = self._load_datagrid(
+            count_strategy=HasNextPageDataGridCountStrategy(),
+            queryset=queryset)
+        paginator = datagrid.paginator
+        page = datagrid.page
+        assert paginator is not None
+        assert page is not None
+
+        self.assertEqual(paginator.count, 54)
+        self.assertTrue(paginator.count_is_exact)
+        self.assertEqual(page.number, 2)
+        self.assertFalse(page.has_next())
+        self.assertEqual(len(datagrid.rows), 4)
+
+    def test_has_next_page_with_page_last(self) -> None:
+        """Testing DataGrid with HasNextPageDataGridCountStrategy and
+        ?page=last
+        """
+        self.request.GET['page'] = 'last'
+        datagrid = self._load_datagrid(
+            count_strategy=HasNextPageDataGridCountStrategy())
+        paginator = datagrid.paginator
+        page = datagrid.page
+        assert paginator is not None
+        assert page is not None
+
+        self.assertEqual(paginator.count, 99)
+        self.assertTrue(paginator.count_is_exact)
+        self.assertEqual(page.number, 2)
+
+    def _load_datagrid(
+        self,
+        *,
+        count_strategy=None,
+        queryset=None,
+    ) -> DataGrid:
+        """Load a datagrid with a count strategy.
+
+        Args:
+            count_strategy (djblets.datagrid.grids.
+                            BaseDataGridCountStrategy, optional):
+                The count strategy to use.
+
+            queryset (django.db.models.QuerySet, optional):
+                An explicit queryset for the datagrid.
+
+        Returns:
+            djblets.datagrid.grids.DataGrid:
+            The loaded datagrid.
+        """
+        datagrid = GroupDataGrid(self.request)
+
+        if count_strategy is not None:
+            datagrid.count_strategy = count_strategy
+
+        if queryset is not None:
+            datagrid.queryset = queryset
+
+        datagrid.load_state()
+
+        return datagrid
+
+
+class DataGridKeysetPaginationTests(kgb.SpyAgency, TestCase):
+    """Unit tests for DataGrid keyset pagination.
+
+    Version Added:
+        7.0
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        Group.objects.bulk_create(
+            Group(name='Group %02d' % i)
+            for i in range(1, 100)
+        )
+
+        self.request = HttpRequest()
+        self.request.user = User(username='testuser')
+
+    def test_first_page(self) -> None:
+        """Testing DataGrid with use_keyset_pagination on the first page"""
+        datagrid = self._load_datagrid(sort='name')
+        page = datagrid.page
+
+        self.assertIsInstance(page, DataGridKeysetPage)
+        assert isinstance(page, DataGridKeysetPage)
+
+        self.assertEqual(page.number, 1)
+        self.assertEqual(page.start_index(), 1)
+        self.assertEqual(page.end_index(), 50)
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+        self.assertIsNotNone(page.next_cursor)
+        self.assertEqual(self._get_names(datagrid),
+                         ['Group %02d' % i for i in range(1, 51)])
+
+    def test_next_and_previous(self) -> None:
+        """Testing DataGrid with use_keyset_pagination following next and
+        previous cursors
+        """
+        datagrid = self._load_datagrid(sort='name')
+        page = datagrid.page
+        assert isinstance(page, DataGridKeysetPage)
+
+        with CaptureQueriesContext(connection) as ctx:
+            datagrid = self._load_datagrid(sort='name',
+                                           cursor=page.next_cursor)
+
+        for query in ctx.captured_queries:
+            self.assertNotIn('OFFSET', query['sql'])
+
+        page = datagrid.page
+        assert isinstance(page, DataGridKeysetPage)
+
+        self.assertEqual(page.number, 2)
+        self.assertEqual(page.start_index(), 51)
+        self.assertEqual(page.end_index(), 99)
+        self.assertFalse(page.has_next())
+        self.assertTrue(page.has_previous())
+        self.assertEqual(self._get_names(datagrid),
+                         ['Group %02d' % i for i in range(51, 100)])
+
+        datagrid = self._load_datagrid(sort='name',
+                                       cursor=page.previous_cursor)
+        page = datagrid.page
+        assert isinstance(page, DataGridKeysetPage)
+
+        self.assertEqual(page.number, 1)
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+        self.assertEqual(self._get_names(datagrid),
+                         ['Group %02d' % i for i in range(1, 51)])
+
+    def test_descending(self) -> None:
+        """Testing DataGrid with use_keyset_pagination and descending sort"""
+        datagrid = self._load_datagrid(sort='-name')
+        page = datagrid.page
+        assert isinstance(page, DataGridKeysetPage)
+
+        datagrid = self._load_datagrid(sort='-name',
+                                       cursor=page.next_cursor)
+
+        self.assertEqual(self._get_names(datagrid),
+                         ['Group %02d' % i for i in range(49, 0, -1)])
+
+    def test_with_unindexed_sort_field(self) -> None:
+        """Testing DataGrid with use_keyset_pagination and sort field that
+        isn't indexed
+        """
+        class UserDataGrid(DataGrid):
+            use_keyset_pagination = True
+
+            username = Column(sortable=True)
+            first_name = Column(sortable=True)
+
+            def __init__(self, request) -> None:
+                super().__init__(request=request,
+                                 queryset=User.objects.all())
+
+                self.default_columns = ['username', 'first_name']
+
+        self.request.GET['sort'] = 'username'
+        datagrid = UserDataGrid(self.request)
+        datagrid.load_state()
+
+        self.assertIsInstance(datagrid.page, DataGridKeysetPage)
+
+        self.request.GET['sort'] = 'first_name'
+        datagrid = UserDataGrid(self.request)
+        datagrid.load_state()
+
+        self.assertNotIsInstance(datagrid.page, DataGridKeysetPage)
+
+    def test_with_page(self) -> None:
+        """Testing DataGrid with use_keyset_pagination and ?page="""
+        self.request.GET['page'] = '2'
+        datagrid = self._load_datagrid(sort='name')
+        page = datagrid.page
+        assert page is not None
+
+        self.assertNotIsInstance(page, DataGridKeysetPage)
+        self.assertEqual(page.number, 2)
+        self.assertEqual(self._get_names(datagrid)[0], 'Group 51')
+
+    def test_with_invalid_cursor(self) -> None:
+        """Testing DataGrid with use_keyset_pagination and invalid cursor"""
+        datagrid = self._load_datagrid(sort='name',
+                                       cursor='abc!')
+        page = datagrid.page
+        assert isinstance(page, DataGridKeysetPage)
+
+        self.assertEqual(page.number, 1)
+        self.assertEqual(self._get_names(datagrid)[0], 'Group 01')
+
+    def test_with_invalid_cursor_values(self) -> None:
+        """Testing DataGrid with use_keyset_pagination and cursor containing
+        invalid values for the sort fields
+        """
+        for data in (['next', 2, ['Group 10', 'abc']],
+                     ['next', 2, ['Group 10', None]],
+                     ['next', 2, [['Group 10'], 10]]):
+            cursor = force_str(base64.urlsafe_b64encode(
+                json.dumps(data).encode('utf-8')))
+
+            with self.subTest(data=data):
+                datagrid = self._load_datagrid(sort='name',
+                                               cursor=cursor)
+                page = datagrid.page
+                assert isinstance(page, DataGridKeysetPage)
+
+                self.assertEqual(page.number, 1)
+                self.assertEqual(self._get_names(datagrid)[0], 'Group 01')
+
+    def test_render_paginator(self) -> None:
+        """Testing DataGrid.render_paginator with use_keyset_pagination"""
+        datagrid = self._load_datagrid(sort='name')
+        page = datagrid.page
+        assert isinstance(page, DataGridKeysetPage)
+
+        datagrid = self._load_datagrid(sort='name',
+                                       cursor=page.next_cursor)
+        page = datagrid.page
+        assert isinstance(page, DataGridKeysetPage)
+
+        self.assertHTMLEqual(
+            datagrid.render_paginator(),
+            '<div class="paginator">'
+            ' <a href="?sort=name&amp;" rel="first nofollow noindex"'
+            '    title="First Page">&laquo;</a>'
+            ' <a href="?sort=name&amp;cursor=%s"'
+            '    rel="prev nofollow noindex" title="Previous Page">&lt;</a>'
+            ' <span class="current-page">2</span>'
+            ' <span class="page-count">2 pages&nbsp;</span>'
+            '</div>'
+            % page.previous_cursor)
+
+    def _load_datagrid(
+        self,
+        *,
+        sort: str,
+        cursor: (str | None) = None,
+    ) -> DataGrid:
+        """Load a datagrid using keyset pagination.
+
+        Args:
+            sort (str):
+                The sort order for the datagrid.
+
+            cursor (str, optional):
+                The cursor for the page to load.
+
+        Returns:
+            djblets.datagrid.grids.DataGrid:
+            The loaded datagrid.
+        """
+        self.request.GET['sort'] = sort
+
+        if cursor is None:
+            self.request.GET.pop('cursor', None)
+        else:
+            self.request.GET['cursor'] = cursor
+
+        datagrid = KeysetGroupDataGrid(self.request)
+        datagrid.load_state()
+
+        return datagrid
+
+    def _get_names(
+        self,
+        datagrid: DataGrid,
+    ) -> list[str]:
+        """Return the names of the groups shown in a datagrid.
+
+        Args:
+            datagrid (djblets.datagrid.grids.DataGrid):
+                The loaded datagrid.
+
+        Returns:
+            list of str:
+            The group names.
+        """
+        return [
+            row['object'].name
+            for row in datagrid.rows
+        ]
+
+
+class UserGroupsColumn(Column):
+    only_fields = []
+    prefetch_related = ['groups']
+
+    def render_data(self, state, obj):
+        return ', '.join(
+            group.name
+            for group in obj.groups.all()
+        )
+
+
+class UserGroupCountColumn(Column):
+    annotations = {
+        'group_count': Count('groups'),
+    }
+    only_fields = []
+
+    def render_data(self, state, obj):
+        return str(obj.group_count)
+
+
+class UserDataRequirementsDataGrid(DataGrid):
+    only_fields = ['username']
+
+    username = Column(
+        'Username',
+        sortable=True,
+    )
+    username.only_fields = ['username']
+
+    first_name = Column(
+        'First Name',
+    )
+
+    groups = UserGroupsColumn('Groups')
+    group_count = UserGroupCountColumn('Group Count')
+
+    def __init__(self, request, **kwargs):
+        super().__init__(
+            request=request,
+            queryset=User.objects.order_by('pk'),
+            title='All Users',
+            **kwargs,
+        )
+
+        self.default_sort = []
+        self.default_columns = ['username', 'groups', 'group_count']
+
+
+class PermissionContentTypeColumn(Column):
+    only_fields = []
+    select_related = ['content_type']
+
+    def render_data(self, state, obj):
+        return obj.content_type.model
+
+
+class PermissionDataGrid(DataGrid):
+    only_fields = []
+
+    name = Column(
+        'Name',
+    )
+    name.only_fields = ['name']
+
+    content_type = PermissionContentTypeColumn('Content Type')
+
+    def __init__(self, request, **kwargs):
+        super().__init__(
+            request=request,
+            queryset=Permission.objects.order_by('pk'),
+            title='All Permissions',
+            **kwargs,
+        )
+
+        self.default_sort = []
+        self.default_columns = ['name', 'content_type']
+
+
+class DataGridColumnDataRequirementsTests(kgb.SpyAgency, TestCase):
+    """Unit tests for column data requirements in DataGrid.
+
+    Version Added:
+        7.0
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.request = HttpRequest()
+        self.request.user = User(username='testuser')
+
+        self.group1 = Group.objects.create(name='group1')
+        self.group2 = Group.objects.create(name='group2')
+
+    def test_prefetch_related_and_annotations(self) -> None:
+        """Testing DataGrid with Column.prefetch_related and
+        Column.annotations uses a constant number of queries
+        """
+        self._create_users(5)
+
+        with CaptureQueriesContext(connection) as ctx:
+            datagrid = self._load_datagrid(UserDataRequirementsDataGrid)
+
+        num_queries = len(ctx.captured_queries)
+
+        self.assertEqual(len(datagrid.rows), 5)
+
+        for row in datagrid.rows:
+            self.assertIn('group1, group2', row['cells'][1])
+            self.assertIn('2', row['cells'][2])
+
+        self._create_users(10, start=5)
+
+        with self.assertNumQueries(num_queries):
+            datagrid = self._load_datagrid(UserDataRequirementsDataGrid)
+
+        self.assertEqual(len(datagrid.rows), 15)
+
+    def test_select_related(self) -> None:
+        """Testing DataGrid with Column.select_related uses a constant number
+        of queries
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            datagrid = self._load_datagrid(PermissionDataGrid)
+
+        rows = datagrid.rows
+        self.assertGreater(len(rows), 1)
+
+        for row in rows:
+            self.assertIn(row['object'].content_type.model, row['cells'][1])
+
+        # The permissions and their content types are fetched together.
+        self.assertEqual(
+            sum(
+                'django_content_type' in query['sql']
+                for query in ctx.captured_queries
+            ),
+            1)
+
+    def test_only_fields(self) -> None:
+        """Testing DataGrid with Column.only_fields set for all columns"""
+        self._create_users(2)
+
+        datagrid = self._load_datagrid(UserDataRequirementsDataGrid)
+        obj = datagrid.rows[0]['object']
+
+        self.assertEqual(obj.get_deferred_fields(),
+                         {
+                             field.attname
+                             for field in User._meta.concrete_fields
+                         } - {'id', 'username'})
+
+    def test_only_fields_with_undeclared(self) -> None:
+        """Testing DataGrid with Column.only_fields not set for a visible
+        column
+        """
+        self._create_users(2)
+
+        datagrid = self._load_datagrid(UserDataRequirementsDataGrid,
+                                       columns='username,first_name,groups')
+        obj = datagrid.rows[0]['object']
+
+        self.assertEqual(obj.get_deferred_fields(), set())
+
+    def test_only_fields_with_select_related(self) -> None:
+        """Testing DataGrid with Column.only_fields includes fields for
+        Column.select_related
+        """
+        datagrid = self._load_datagrid(PermissionDataGrid)
+        obj = datagrid.rows[0]['object']
+
+        self.assertEqual(obj.get_deferred_fields(), {'codename'})
+        self.assertEqual(obj.content_type.get_deferred_fields(), set())
+
+    def test_hidden_columns(self) -> None:
+        """Testing DataGrid ignores data requirements for hidden columns"""
+        self._create_users(2)
+
+        with CaptureQueriesContext(connection) as ctx:
+            datagrid = self._load_datagrid(UserDataRequirementsDataGrid,
+                                           columns='username')
+
+        self.assertEqual(len(datagrid.rows), 2)
+
+        for query in ctx.captured_queries:
+            self.assertNotIn('auth_user_groups', query['sql'])
+
+    def test_with_error(self) -> None:
+        """Testing DataGrid with invalid column data requirements"""
+        class BadColumn(Column):
+            annotations = {
+                'bad_count': Count('bad_field'),
+            }
+
+        class BadDataGrid(UserDataRequirementsDataGrid):
+            bad = BadColumn('Bad')
+
+        self._create_users(2)
+        self.spy_on(logger.exception)
+
+        datagrid = self._load_datagrid(BadDataGrid,
+                                       columns='username,bad')
+
+        self.assertEqual(len(datagrid.rows), 2)
+        self.assertSpyCalled(logger.exception)
+
+    def test_with_compile_error(self) -> None:
+        """Testing DataGrid with column data requirements that fail when
+        compiling the query
+        """
+        class BadColumn(Column):
+            only_fields = []
+            select_related = ['username']
+
+        class BadDataGrid(UserDataRequirementsDataGrid):
+            bad = BadColumn('Bad')
+
+        self._create_users(2)
+        self.spy_on(logger.exception)
+
+        datagrid = self._load_datagrid(BadDataGrid,
+                                       columns='username,bad')
+
+        self.assertEqual(len(datagrid.rows), 2)
+        self.assertSpyCalled(logger.exception)
+
+        # None of the requirements should have been applied.
+        obj = datagrid.rows[0]['object']
+        self.assertEqual(obj.get_deferred_fields(), set())
+
+    def _create_users(
+        self,
+        count: int,
+        start: int = 0,
+    ) -> None:
+        """Create users in both test groups.
+
+        Args:
+            count (int):
+                The number of users to create.
+
+            start (int, optional):
+                The starting index for the usernames.
+        """
+        for i in range(start, start + count):
+            user = User.objects.create(username='user%02d' % i)
+            user.groups.add(self.group1, self.group2)
+
+    def _load_datagrid(
+        self,
+        datagrid_cls: type[DataGrid],
+        columns: (str | None) = None,
+    ) -> DataGrid:
+        """Load a datagrid and its rows.
+
+        Args:
+            datagrid_cls (type):
+                The datagrid class to load.
+
+            columns (str, optional):
+                The comma-separated list of columns to show.
+
+        Returns:
+            djblets.datagrid.grids.DataGrid:
+            The loaded datagrid.
+        """
+        if columns is not None:
+            self.request.GET['columns'] = columns
+
+        datagrid = datagrid_cls(self.request)
+        datagrid.load_state()
+
+        return datagrid
+
+
 class ColumnTests(kgb.SpyAgency, TestCase):
     """Unit tests for djblets.datagrid.grids.Column."""
 
@@ -1514,6 +2528,95 @@ class ColumnTests(kgb.SpyAgency, TestCase):
         self.assertIn('Error when calling render_data for DataGrid Column',
                       logger.exception.last_call.args[0])
 
+    def test_render_cell_with_fast_cell_render(self) -> None:
+        """Testing Column.render_cell with fast_cell_render matches the
+        cell template
+        """
+        self._check_fast_cell_render(CheckboxColumn)
+        self._check_fast_cell_render(Column)
+
+    def test_render_cell_with_fast_cell_render_custom_template(self) -> None:
+        """Testing Column.render_cell with fast_cell_render and custom
+        cell_template uses the template
+        """
+        class MyColumn(Column):
+            cell_template = 'datagrid/column_header.html'
+            fast_cell_render = True
+
+        datagrid = DataGrid(request=RequestFactory().request(),
+                            queryset=Group.objects.all())
+        column = MyColumn(id='name')
+        state = StatefulColumn(datagrid=datagrid,
+                               column=column)
+
+        template = column.cell_template_obj
+        self.spy_on(template.render)
+
+        column.render_cell(state=state,
+                           obj=Group(name='Test'),
+                           render_context={})
+
+        self.assertSpyCalled(template.render)
+
+    def _check_fast_cell_render(
+        self,
+        base_column_cls: type[Column],
+    ) -> None:
+        """Check that fast cell renders match template renders.
+
+        Args:
+            base_column_cls (type):
+                The base column class to render with.
+        """
+        request = RequestFactory().request()
+        group = Group(pk=1, name='<Test> & "Group"')
+        options = [
+            {},
+            {
+                'link': True,
+                'link_func': lambda state, obj, value: '/a?b=1&c="d"',
+            },
+            {
+                'css_class': 'my-class<>',
+                'link': True,
+                'link_css_class': 'link&class',
+                'link_func': lambda state, obj, value: '/url/',
+            },
+            {
+                'css_class': lambda obj: 'callable-class',
+                'link': True,
+                'link_func': lambda state, obj, value: '',
+            },
+        ]
+
+        for column_options in options:
+            for last in (False, True):
+                for cell_clickable in (False, True):
+                    results = []
+
+                    for fast_cell_render in (False, True):
+                        class MyColumn(base_column_cls):
+                            pass
+
+                        MyColumn.fast_cell_render = fast_cell_render
+                        MyColumn.cell_clickable = cell_clickable
+
+                        datagrid = DataGrid(request=request,
+                                            queryset=Group.objects.all())
+                        column = MyColumn(id='name',
+                                          field_name='name',
+                                          **column_options)
+                        state = StatefulColumn(datagrid=datagrid,
+                                               column=column)
+                        state.last = last
+
+                        results.append(column.render_cell(
+                            state=state,
+                            obj=group,
+                            render_context={}))
+
+                    self.assertEqual(results[0], results[1])
+
     def test_to_json(self) -> None:
         """Testing Column.to_json"""
         group = Group.objects.create(name='Test Group')
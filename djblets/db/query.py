@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import functools
+import json
 import re
 from copy import deepcopy
+from dataclasses import dataclass, field as dataclass_field
 from typing import Any, TYPE_CHECKING
 
-from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
+from django.core.exceptions import (FieldDoesNotExist,
+                                    FieldError,
+                                    MultipleObjectsReturned,
+                                    ObjectDoesNotExist,
+                                    ValidationError)
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.manager import Manager
 from django.db.models.query_utils import Q
+from django.utils.encoding import force_str
 from djblets.util.symbols import UNSET, Unsettable
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from typing import TypeVar
 
-    from django.db.models import Model
+    from django.db.models import Field, Model, QuerySet
 
     _TModel = TypeVar('_TModel', bound=Model)
 
@@ -293,6 +304,273 @@ def get_object_cached_field(
     return UNSET
 
 
+@dataclass(frozen=True)
+class KeysetCursor:
+    """A decoded cursor for keyset pagination.
+
+    Version Added:
+        7.0
+    """
+
+    #: The direction to page (``next`` or ``prev``).
+    direction: str
+
+    #: The values of each sort field, converted to Python values.
+    values: list[Any] = dataclass_field(default_factory=list)
+
+    #: The 1-based number of the page the cursor leads to, if encoded.
+    page_number: (int | None) = None
+
+
+def build_keyset_q(
+    *,
+    ordering: Sequence[str],
+    values: Sequence[Any],
+    reverse: bool = False,
+) -> Q:
+    """Return a query for rows following a keyset pagination cursor.
+
+    For an ordering of ``(a, b)``, this matches
+    ``a > a_value OR (a = a_value AND b > b_value)``, with comparisons
+    flipped for descending fields (or when going in reverse).
+
+    Version Added:
+        7.0
+
+    Args:
+        ordering (list of str):
+            The fields used to sort results. Fields prefixed with ``-`` are
+            sorted in descending order.
+
+        values (list):
+            The values of each field from the cursor.
+
+        reverse (bool, optional):
+            Whether to match rows preceding the cursor.
+
+    Returns:
+        django.db.models.Q:
+        The resulting query.
+    """
+    q = Q()
+    equal_q = Q()
+
+    for field, value in zip(ordering, values):
+        descending = field.startswith('-')
+        name = field.lstrip('-')
+
+        if descending != reverse:
+            op = 'lt'
+        else:
+            op = 'gt'
+
+        q |= equal_q & Q(**{f'{name}__{op}': value})
+        equal_q &= Q(**{name: value})
+
+    return q
+
+
+def encode_keyset_cursor(
+    direction: str,
+    values: Sequence[Any],
+    *,
+    page_number: (int | None) = None,
+) -> str:
+    """Return an encoded cursor for keyset pagination.
+
+    Values that aren't JSON-compatible, such as datetimes, decimals, and
+    UUIDs, will be stored as strings. These will be converted back by
+    :py:func:`decode_keyset_cursor`.
+
+    Version Added:
+        7.0
+
+    Args:
+        direction (str):
+            The direction to page (``next`` or ``prev``).
+
+        values (list):
+            The values of each sort field.
+
+        page_number (int, optional):
+            The 1-based number of the page the cursor leads to, if it should
+            be included in the cursor.
+
+    Returns:
+        str:
+        The encoded cursor.
+    """
+    norm_values = [
+        value if isinstance(value, (bool, int, float, str)) else str(value)
+        for value in values
+    ]
+
+    if page_number is None:
+        data = [direction, norm_values]
+    else:
+        data = [direction, page_number, norm_values]
+
+    return force_str(
+        base64.urlsafe_b64encode(
+            json.dumps(data, separators=(',', ':')).encode('utf-8'))
+        .rstrip(b'='))
+
+
+def decode_keyset_cursor(
+    cursor: str | None,
+    *,
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    with_page_number: bool = False,
+) -> KeysetCursor | None:
+    """Return a decoded cursor for keyset pagination.
+
+    Each value in the cursor will be converted using the
+    :py:meth:`~django.db.models.Field.to_python` method of the field it
+    sorts on. Cursors may come from clients, so any cursor that's malformed
+    or contains values that aren't valid for the fields will be ignored.
+
+    Version Added:
+        7.0
+
+    Args:
+        cursor (str):
+            The encoded cursor.
+
+        queryset (django.db.models.QuerySet):
+            The queryset being paginated. This is used to look up the sort
+            fields.
+
+        ordering (list of str):
+            The fields used to sort results.
+
+        with_page_number (bool, optional):
+            Whether the cursor is expected to include a page number.
+
+    Returns:
+        KeysetCursor:
+        The decoded cursor, or ``None`` if there's no valid cursor.
+    """
+    if not cursor:
+        return None
+
+    try:
+        data = json.loads(base64.urlsafe_b64decode(
+            cursor + '=' * (-len(cursor) % 4)))
+    except (binascii.Error, TypeError, ValueError):
+        return None
+
+    page_number: (int | None) = None
+
+    if not isinstance(data, list):
+        return None
+
+    if with_page_number:
+        if len(data) != 3:
+            return None
+
+        direction, page_number, values = data
+
+        if (not isinstance(page_number, int) or
+            isinstance(page_number, bool) or
+            page_number < 1):
+            return None
+    else:
+        if len(data) != 2:
+            return None
+
+        direction, values = data
+
+    if (direction not in ('next', 'prev') or
+        not isinstance(values, list) or
+        len(values) != len(ordering)):
+        return None
+
+    norm_values: list[Any] = []
+
+    for sort_field, value in zip(ordering, values):
+        if not isinstance(value, (bool, int, float, str)):
+            # This includes None, which can't be compared against.
+            return None
+
+        model_field = _get_keyset_field(queryset, sort_field.lstrip('-'))
+
+        if model_field is not None:
+            try:
+                value = model_field.to_python(value)
+            except (TypeError, ValueError, ValidationError):
+                return None
+
+            if value is None:
+                return None
+
+        norm_values.append(value)
+
+    return KeysetCursor(direction=direction,
+                        values=norm_values,
+                        page_number=page_number)
+
+
+def _get_keyset_field(
+    queryset: QuerySet,
+    name: str,
+) -> Field | None:
+    """Return the field used for a keyset pagination sort field.
+
+    Version Added:
+        7.0
+
+    Args:
+        queryset (django.db.models.QuerySet):
+            The queryset being paginated.
+
+        name (str):
+            The name of the sort field. This may be a field name or attribute
+            name, a path across relations, or an annotation.
+
+    Returns:
+        django.db.models.Field:
+        The field, or ``None`` if it couldn't be found.
+    """
+    model = getattr(queryset, 'model', None)
+
+    if model is None:
+        return None
+
+    query = getattr(queryset, 'query', None)
+    annotations = getattr(query, 'annotations', {})
+
+    if name in annotations:
+        try:
+            return annotations[name].output_field
+        except (AttributeError, FieldError):
+            return None
+
+    field: (Field | None) = None
+
+    for part in name.split(LOOKUP_SEP):
+        if model is None:
+            return None
+
+        meta = model._meta
+
+        try:
+            if part == 'pk':
+                field = meta.pk
+            else:
+                field = meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+
+        model = getattr(field, 'related_model', None)
+
+    if not hasattr(field, 'to_python'):
+        # This is a reverse relation, which can't be used for conversion.
+        return None
+
+    return field
+
+
 def prefix_q(prefix, q, clone=True):
     """Prefix a query expression.
 
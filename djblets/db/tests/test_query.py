@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import base64
+import json
+from datetime import datetime, timezone
+
 from django.contrib.auth.models import Group, User
 from django.contrib.sites.models import Site
-from django.db.models import (ForeignKey,
+from django.db.models import (Count,
+                              ForeignKey,
                               ManyToManyField,
                               ManyToManyRel,
                               ManyToOneRel,
@@ -13,7 +18,12 @@ from django.db.models import (ForeignKey,
                               Q)
 
 from djblets.privacy.models import StoredConsentData
-from djblets.db.query import get_object_cached_field, prefix_q
+from djblets.db.query import (KeysetCursor,
+                              build_keyset_q,
+                              decode_keyset_cursor,
+                              encode_keyset_cursor,
+                              get_object_cached_field,
+                              prefix_q)
 from djblets.siteconfig.models import SiteConfiguration
 from djblets.testing.testcases import TestCase
 
@@ -232,3 +242,151 @@ class PrefixTests(TestCase):
         self.assertEqual(len(q.children), 1)
         self.assertIs(type(q.children[0]), tuple)
         self.assertIsInstance(q.children[0][0], str)
+
+
+class KeysetCursorTests(TestCase):
+    """Unit tests for the keyset pagination cursor functions.
+
+    Version Added:
+        7.0
+    """
+
+    def test_build_keyset_q(self) -> None:
+        """Testing build_keyset_q"""
+        self.assertEqual(
+            build_keyset_q(ordering=['-first_name', 'id'],
+                           values=['name1', 10]),
+            Q(first_name__lt='name1') |
+            Q(first_name='name1', id__gt=10))
+
+    def test_build_keyset_q_with_reverse(self) -> None:
+        """Testing build_keyset_q with reverse=True"""
+        self.assertEqual(
+            build_keyset_q(ordering=['-first_name', 'id'],
+                           values=['name1', 10],
+                           reverse=True),
+            Q(first_name__gt='name1') |
+            Q(first_name='name1', id__lt=10))
+
+    def test_encode_decode(self) -> None:
+        """Testing encode_keyset_cursor and decode_keyset_cursor"""
+        date_joined = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        cursor = encode_keyset_cursor('prev', ['name1', date_joined, 10])
+
+        self.assertEqual(
+            decode_keyset_cursor(
+                cursor,
+                queryset=User.objects.all(),
+                ordering=['first_name', '-date_joined', 'pk']),
+            KeysetCursor(direction='prev',
+                         values=['name1', date_joined, 10]))
+
+    def test_encode_decode_with_page_number(self) -> None:
+        """Testing encode_keyset_cursor and decode_keyset_cursor with
+        page numbers
+        """
+        cursor = encode_keyset_cursor('next', [10], page_number=3)
+
+        self.assertEqual(
+            decode_keyset_cursor(cursor,
+                                 queryset=User.objects.all(),
+                                 ordering=['id'],
+                                 with_page_number=True),
+            KeysetCursor(direction='next',
+                         values=[10],
+                         page_number=3))
+
+        # Cursors without page numbers aren't valid here.
+        self.assertIsNone(decode_keyset_cursor(
+            encode_keyset_cursor('next', [10]),
+            queryset=User.objects.all(),
+            ordering=['id'],
+            with_page_number=True))
+
+    def test_decode_with_annotation(self) -> None:
+        """Testing decode_keyset_cursor with an annotation"""
+        queryset = User.objects.annotate(num_groups=Count('groups'))
+
+        self.assertEqual(
+            decode_keyset_cursor(
+                self._encode(['next', ['2', 10]]),
+                queryset=queryset,
+                ordering=['-num_groups', 'pk']),
+            KeysetCursor(direction='next',
+                         values=[2, 10]))
+
+        self.assertIsNone(decode_keyset_cursor(
+            self._encode(['next', ['abc', 10]]),
+            queryset=queryset,
+            ordering=['-num_groups', 'pk']))
+
+    def test_decode_with_related_field(self) -> None:
+        """Testing decode_keyset_cursor with a field across a relation"""
+        queryset = StoredConsentData.objects.all()
+
+        self.assertEqual(
+            decode_keyset_cursor(
+                self._encode(['next', ['user1', '5']]),
+                queryset=queryset,
+                ordering=['user__username', 'user_id']),
+            KeysetCursor(direction='next',
+                         values=['user1', 5]))
+
+        self.assertIsNone(decode_keyset_cursor(
+            self._encode(['next', ['user1', 'abc']]),
+            queryset=queryset,
+            ordering=['user__username', 'user']))
+
+    def test_decode_with_invalid(self) -> None:
+        """Testing decode_keyset_cursor with invalid cursors"""
+        queryset = User.objects.all()
+        ordering = ['first_name', 'pk']
+
+        for cursor in ('', 'xxx', '!!!'):
+            with self.subTest(cursor=cursor):
+                self.assertIsNone(decode_keyset_cursor(cursor,
+                                                       queryset=queryset,
+                                                       ordering=ordering))
+
+        for data in ({'direction': 'next'},
+                     ['next'],
+                     ['up', ['name1', 10]],
+                     ['next', 'name1'],
+                     ['next', ['name1']],
+                     ['next', ['name1', 'zzz']],
+                     ['next', ['name1', None]],
+                     ['next', ['name1', [10]]],
+                     ['next', 2, ['name1', 10]]):
+            with self.subTest(data=data):
+                self.assertIsNone(decode_keyset_cursor(
+                    self._encode(data),
+                    queryset=queryset,
+                    ordering=ordering))
+
+        for data in (['next', 0, ['name1', 10]],
+                     ['next', True, ['name1', 10]],
+                     ['next', '2', ['name1', 10]],
+                     ['next', ['name1', 10]]):
+            with self.subTest(data=data):
+                self.assertIsNone(decode_keyset_cursor(
+                    self._encode(data),
+                    queryset=queryset,
+                    ordering=ordering,
+                    with_page_number=True))
+
+    def _encode(
+        self,
+        data: object,
+    ) -> str:
+        """Return an encoded cursor for arbitrary data.
+
+        Args:
+            data (object):
+                The data to encode.
+
+        Returns:
+            str:
+            The encoded cursor.
+        """
+        return base64.urlsafe_b64encode(
+            json.dumps(data).encode('utf-8')).decode('utf-8')
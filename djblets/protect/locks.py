@@ -1,5 +1,10 @@
 """Locking implementations.
 
+Version Changed:
+    7.0:
+    Added :py:class:`CacheSemaphore`, :py:class:`CacheReadLock`, and
+    :py:class:`CacheWriteLock`.
+
 Version Added:
     6.0
 """
@@ -8,16 +13,19 @@ from __future__ import annotations
 
 import logging
 import random
+import threading
 import time
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from django.core.cache import cache
 
 from djblets.cache.backend import make_cache_key
+from djblets.cache.forwarding_backend import bypass_request_cache_memo
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Mapping, Sequence
 
     from typing_extensions import Self
 
@@ -25,6 +33,162 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _CacheLockWaiters:
+    """State shared by all threads in a process waiting on a lock.
+
+    Only one waiting thread (the poller) will check the cache on its retry
+    schedule. Other threads wait until the poller hands off that role, or
+    until a lock is released by another thread in this process.
+
+    Version Added:
+        7.0
+    """
+
+    def __init__(self) -> None:
+        """Initialize the state."""
+        self.condition = threading.Condition()
+        self.has_poller = False
+        self.release_count = 0
+        self.refcount = 0
+
+    def wait(
+        self,
+        *,
+        is_poller: bool,
+        poll_secs: float,
+        timeout_secs: float | None,
+    ) -> bool:
+        """Wait until the caller should try acquiring the lock again.
+
+        Args:
+            is_poller (bool):
+                Whether the caller is currently the poller.
+
+            poll_secs (float):
+                The time the poller should wait before checking the cache.
+
+            timeout_secs (float):
+                The max time to wait, or ``None`` to wait for a notification
+                from another thread.
+
+        Returns:
+            bool:
+            Whether the caller is now the poller.
+        """
+        with self.condition:
+            if not is_poller and not self.has_poller:
+                self.has_poller = True
+                is_poller = True
+
+            release_count = self.release_count
+
+            if is_poller:
+                if timeout_secs is not None:
+                    poll_secs = min(poll_secs, timeout_secs)
+
+                self.condition.wait_for(
+                    lambda: self.release_count != release_count,
+                    poll_secs)
+            else:
+                self.condition.wait_for(
+                    lambda: (self.release_count != release_count or
+                             not self.has_poller),
+                    timeout_secs)
+
+        return is_poller
+
+    def stop_polling(self) -> None:
+        """Stop polling, handing the role off to another waiting thread."""
+        with self.condition:
+            self.has_poller = False
+            self.condition.notify()
+
+    def notify_released(self) -> None:
+        """Notify a waiting thread that a lock was released."""
+        with self.condition:
+            self.release_count += 1
+            self.condition.notify()
+
+
+#: Waiting state for locks in this process.
+#:
+#: This is keyed by full cache key, and then by the lock class, so that
+#: different kinds of locks on the same key (such as readers and writers)
+#: each get their own poller.
+_lock_waiters: dict[str, dict[type[CacheLock], _CacheLockWaiters]] = {}
+
+#: A lock guarding access to :py:data:`_lock_waiters`.
+_lock_waiters_lock = threading.Lock()
+
+
+@contextmanager
+def _get_lock_waiters(
+    full_cache_key: str,
+    lock_cls: type[CacheLock],
+) -> Iterator[_CacheLockWaiters]:
+    """Return the shared waiting state for a lock.
+
+    The state will be removed once there are no more waiting threads.
+
+    Version Added:
+        7.0
+
+    Args:
+        full_cache_key (str):
+            The full cache key for the lock.
+
+        lock_cls (type):
+            The class of the lock being waited on.
+
+    Context:
+        _CacheLockWaiters:
+        The shared waiting state.
+    """
+    with _lock_waiters_lock:
+        waiters_by_cls = _lock_waiters.setdefault(full_cache_key, {})
+
+        try:
+            waiters = waiters_by_cls[lock_cls]
+        except KeyError:
+            waiters = _CacheLockWaiters()
+            waiters_by_cls[lock_cls] = waiters
+
+        waiters.refcount += 1
+
+    try:
+        yield waiters
+    finally:
+        with _lock_waiters_lock:
+            waiters.refcount -= 1
+
+            if waiters.refcount == 0:
+                del waiters_by_cls[lock_cls]
+
+                if not waiters_by_cls:
+                    del _lock_waiters[full_cache_key]
+
+
+def _notify_lock_released(
+    full_cache_key: str,
+) -> None:
+    """Notify waiting threads in this process that a lock was released.
+
+    Threads waiting on any kind of lock for the key will be notified.
+
+    Version Added:
+        7.0
+
+    Args:
+        full_cache_key (str):
+            The full cache key for the lock.
+    """
+    with _lock_waiters_lock:
+        all_waiters = list(_lock_waiters.get(full_cache_key, {}).values())
+
+    for waiters in all_waiters:
+        waiters.notify_released()
+
+
 class CacheLock:
     """A distributed lock backed by a cache.
 
@@ -45,6 +209,12 @@ class CacheLock:
     with additional capabilities for updating expiration times and setting
     default blocking and timeout behavior during construction.
 
+    While waiting, the time between checks grows exponentially (starting at
+    :py:attr:`retry_secs` and capped at :py:attr:`max_retry_secs`), reducing
+    load on the cache server during a stampede. Threads in the same process
+    waiting on the same lock share a single poller, and are woken
+    immediately when another thread in the process releases the lock.
+
     Note:
         This lock is subject to the limitations of the cache system. The
         lock may be purged from cache without notice, and it's possible
@@ -59,6 +229,13 @@ class CacheLock:
         CacheLocks are also not thread-safe. Do not reuse the same lock
         across threads.
 
+    Version Changed:
+        7.0:
+        * Added exponential backoff while waiting, through the
+          ``backoff_factor`` and ``max_retry_secs`` arguments.
+        * Threads in a process waiting on the same lock now share a single
+          poller.
+
     Version Added:
         6.0
     """
@@ -70,6 +247,12 @@ class CacheLock:
     #: Whether a lock is currently acquired by this instance.
     acquired: bool
 
+    #: The factor to multiply the retry time by after each failed check.
+    #:
+    #: Version Added:
+    #:     7.0
+    backoff_factor: float
+
     #: Whether this lock will block for a period of time to be acquired.
     blocking: bool
 
@@ -82,7 +265,13 @@ class CacheLock:
     #: The max amount of time a lock can be claimed.
     lock_expiration_secs: int
 
-    #: The time to sleep between checking for a lock to be released.
+    #: The max time to sleep between checking for a lock to be released.
+    #:
+    #: Version Added:
+    #:     7.0
+    max_retry_secs: float
+
+    #: The initial time to sleep between checking for a lock to be released.
     retry_secs: float
 
     #: The max time to wait for a lock to be released.
@@ -93,6 +282,12 @@ class CacheLock:
     #: The cached token value associated with this lock instance.
     token: str
 
+    #: The cache key claimed when the lock was acquired.
+    #:
+    #: This is the same as :py:attr:`full_cache_key` for standard locks,
+    #: but may differ for subclasses.
+    _acquired_cache_key: str
+
     #: The expected timestamp for lock expiration.
     _lock_expires_time: float
 
@@ -100,13 +295,19 @@ class CacheLock:
         self,
         key: str | Sequence[str] = '',
         *,
+        backoff_factor: float = 2,
         blocking: bool = True,
         lock_expiration_secs: int = 30,
+        max_retry_secs: (float | None) = None,
         retry_secs: float = 0.25,
         timeout_secs: float = -1,
     ) -> None:
         """Initialize the lock.
 
+        Version Changed:
+            7.0:
+            Added the ``backoff_factor`` and ``max_retry_secs`` arguments.
+
         Args:
             key (str or list of str):
                 The key to use in the cache.
@@ -118,6 +319,15 @@ class CacheLock:
                 This will be passed to :py:func:`make_cache_key` to construct
                 a full cache key.
 
+            backoff_factor (float, optional):
+                The factor to multiply the retry time by after each failed
+                check for the lock.
+
+                A value of 1 will check at a fixed interval.
+
+                Version Added:
+                    7.0
+
             blocking (bool, optional):
                 Whether this lock will block for a period of time to be
                 acquired.
@@ -127,8 +337,19 @@ class CacheLock:
 
                 After this period, the lock will be automatically released.
 
+            max_retry_secs (float, optional):
+                The max time to sleep between checking for a lock to be
+                released.
+
+                This defaults to 2 seconds, or ``retry_secs`` if that's
+                higher.
+
+                Version Added:
+                    7.0
+
             retry_secs (float, optional):
-                The time to sleep between checking for a lock to be released.
+                The initial time to sleep between checking for a lock to be
+                released.
 
                 The caller should set this to be less than the timeout, but
                 note that timeouts can be extended or reduced by the lock
@@ -152,13 +373,25 @@ class CacheLock:
         if retry_secs <= 0:
             raise ValueError('retry_secs must be a positive value.')
 
+        if max_retry_secs is None:
+            max_retry_secs = max(retry_secs, 2)
+        elif max_retry_secs < retry_secs:
+            raise ValueError('max_retry_secs must be greater than or equal '
+                             'to retry_secs.')
+
+        if backoff_factor < 1:
+            raise ValueError('backoff_factor must be 1 or higher.')
+
+        self.backoff_factor = backoff_factor
         self.blocking = blocking
+        self.max_retry_secs = max_retry_secs
         self.retry_secs = retry_secs
         self.timeout_secs = timeout_secs
         self.lock_expiration_secs = lock_expiration_secs
 
         self.acquired = False
         self.token = ''
+        self._acquired_cache_key = ''
         self._lock_expires_time = 0
 
         if key:
@@ -173,7 +406,8 @@ class CacheLock:
         exception will be logged indicating an implementation problem
         with the caller's use of the lock.
         """
-        if self.acquired:
+        # This may not be set if the constructor failed.
+        if getattr(self, 'acquired', False):
             logger.error('Cache lock "%s" was garbage collected without '
                          'being released! The caller must be careful to '
                          'keep this lock around until it is released.',
@@ -203,7 +437,16 @@ class CacheLock:
         on :py:attr:`blocking`.
 
         If waiting, this will wait for a total time specified by
-        :py:attr:`timeout_secs`, checking every :py:attr:`retry_secs`.
+        :py:attr:`timeout_secs`. Checks start :py:attr:`retry_secs` apart,
+        with the time between checks multiplied by
+        :py:attr:`backoff_factor` after each failed check, up to
+        :py:attr:`max_retry_secs`.
+
+        Only one waiting thread in the process will check the cache for a
+        given lock at a time. The other threads will take over checking
+        once that thread acquires the lock or stops waiting, and will be
+        woken immediately if another thread in the process releases the
+        lock.
 
         Waiting uses the monotonic clock, so it's not affected by changes
         to the system clock.
@@ -212,6 +455,10 @@ class CacheLock:
         other Python lock objects, this method can also take arguments that
         override the values provided during construction.
 
+        Version Changed:
+            7.0:
+            Added exponential backoff and shared polling while waiting.
+
         Returns:
             bool:
             ``True`` if the lock could be acquired (even after waiting).
@@ -249,47 +496,161 @@ class CacheLock:
         if timeout is None:
             timeout = self.timeout_secs
 
+        if self._acquire_once(token):
+            return True
+
+        if not blocking:
+            # The caller doesn't want to block waiting for a request,
+            # so return immediately.
+            self._abandon_acquire(token)
+
+            return False
+
         retry_secs = self.retry_secs
+        start = time.monotonic()
+        is_poller = False
+
+        with _get_lock_waiters(full_cache_key, type(self)) as waiters:
+            try:
+                while True:
+                    # Check if we've timed out waiting for a lock.
+                    if timeout == -1:
+                        remaining_secs = None
+                    else:
+                        remaining_secs = timeout - (time.monotonic() - start)
+
+                        if remaining_secs <= 0:
+                            self._abandon_acquire(token)
+
+                            logger.warning('Timed out waiting for cache '
+                                           'lock "%s" (token "%s") for %s '
+                                           'seconds',
+                                           full_cache_key, token, timeout)
+
+                            raise TimeoutError(
+                                f'Timed out waiting for lock: '
+                                f'{full_cache_key}'
+                            )
+
+                    # Threads that aren't polling will still check at least
+                    # once per lock expiration period, in case they weren't
+                    # notified of a change.
+                    if remaining_secs is None:
+                        wait_secs = self.lock_expiration_secs
+                    else:
+                        wait_secs = min(remaining_secs,
+                                        self.lock_expiration_secs)
+
+                    # Wait before retrying, and add random jitter to the
+                    # retry time to avoid overloading the cache server with
+                    # concurrent checks during a stampede.
+                    is_poller = waiters.wait(
+                        is_poller=is_poller,
+                        poll_secs=(retry_secs +
+                                   random.uniform(0, retry_secs * 0.25)),
+                        timeout_secs=wait_secs)
+
+                    if self._acquire_once(token):
+                        return True
+
+                    if is_poller:
+                        retry_secs = min(retry_secs * self.backoff_factor,
+                                         self.max_retry_secs)
+            finally:
+                if is_poller:
+                    waiters.stop_polling()
+
+    def _acquire_once(
+        self,
+        token: str,
+    ) -> bool:
+        """Attempt to acquire the lock without waiting.
+
+        Version Added:
+            7.0
+
+        Args:
+            token (str):
+                The token to store for the lock.
+
+        Returns:
+            bool:
+            ``True`` if the lock was acquired. ``False`` if it was not.
+        """
         lock_expiration_secs = self.lock_expiration_secs
 
-        start = time.monotonic()
+        # Lock state is changed by other processes, so it must never be
+        # served from a request memo.
+        with bypass_request_cache_memo():
+            acquired_cache_key = self._try_acquire(token,
+                                                   lock_expiration_secs)
+
+        if not acquired_cache_key:
+            return False
+
+        lock_expires_time = time.monotonic() + lock_expiration_secs
+
+        logger.debug('Acquired cache lock "%s" with token "%s" for '
+                     '%s seconds (monotonic expiration = %s, '
+                     'estimated timestamp = %s)',
+                     acquired_cache_key, token, lock_expiration_secs,
+                     lock_expires_time,
+                     time.time() + lock_expiration_secs)
+
+        self.acquired = True
+        self._acquired_cache_key = acquired_cache_key
+        self._lock_expires_time = lock_expires_time
+
+        return True
+
+    def _try_acquire(
+        self,
+        token: str,
+        lock_expiration_secs: int,
+    ) -> str | None:
+        """Attempt to claim the lock in the cache.
+
+        Subclasses can override this to change how locks are claimed.
+
+        Version Added:
+            7.0
 
-        while True:
-            if cache.add(full_cache_key, token, lock_expiration_secs):
-                lock_expires_time = time.monotonic() + lock_expiration_secs
+        Args:
+            token (str):
+                The token to store for the lock.
+
+            lock_expiration_secs (int):
+                The expiration time for the claimed key.
 
-                logger.debug('Acquired cache lock "%s" with token "%s" for '
-                             '%s seconds (monotonic expiration = %s, '
-                             'estimated timestamp = %s)',
-                             full_cache_key, token, lock_expiration_secs,
-                             lock_expires_time,
-                             time.time() + lock_expiration_secs)
+        Returns:
+            str:
+            The cache key that was claimed, or ``None`` if the lock could not
+            be acquired.
+        """
+        full_cache_key = self.full_cache_key
 
-                self.acquired = True
-                self._lock_expires_time = lock_expires_time
+        if cache.add(full_cache_key, token, lock_expiration_secs):
+            return full_cache_key
 
-                return True
+        return None
 
-            if not blocking:
-                # The caller doesn't want to block waiting for a request,
-                # so return immediately.
-                return False
+    def _abandon_acquire(
+        self,
+        token: str,
+    ) -> None:
+        """Clean up after giving up on acquiring the lock.
 
-            # Check if we've timed out waiting for a lock.
-            if (timeout != -1 and
-                time.monotonic() - start >= timeout):
-                logger.warning('Timed out waiting for cache lock "%s" '
-                               '(token "%s") for %s seconds',
-                               self.full_cache_key, token, timeout)
+        Subclasses can override this to release any state claimed during a
+        partial acquisition.
 
-                raise TimeoutError(
-                    f'Timed out waiting for lock: {full_cache_key}'
-                )
+        Version Added:
+            7.0
 
-            # Wait before retrying, and add random jitter to the retry time
-            # to avoid overloading the cache server with concurrent checks
-            # during a stampede.
-            time.sleep(retry_secs + random.uniform(0, retry_secs * 0.25))
+        Args:
+            token (str):
+                The token used when attempting to acquire the lock.
+        """
+        pass
 
     def update_expiration(
         self,
@@ -319,7 +680,7 @@ class CacheLock:
         if lock_expiration_secs is None:
             lock_expiration_secs = self.lock_expiration_secs
 
-        key = self.full_cache_key
+        key = self._acquired_cache_key
         token = self.token
 
         if cache.touch(key, lock_expiration_secs):
@@ -356,7 +717,7 @@ class CacheLock:
 
         self.acquired = False
 
-        key = self.full_cache_key
+        key = self._acquired_cache_key
         token = self.token
         lock_expiration_secs = self.lock_expiration_secs
 
@@ -368,15 +729,16 @@ class CacheLock:
         expired = time.monotonic() > self._lock_expires_time
 
         if not expired:
-            # Attempt to bump the expiration for the key. If it timed out and
-            # we lost the key, then the worst that happens is the expiration
-            # for the new owner's key is bumped up. It should help avoid
-            # deleting that owner's key, in this case.
-            expired = not cache.touch(key, lock_expiration_secs)
+            with bypass_request_cache_memo():
+                # Attempt to bump the expiration for the key. If it timed out
+                # and we lost the key, then the worst that happens is the
+                # expiration for the new owner's key is bumped up. It should
+                # help avoid deleting that owner's key, in this case.
+                expired = not cache.touch(key, lock_expiration_secs)
 
-            if not expired and cache.get(key) == token:
-                # The lock is still acquired. Delete it.
-                cache.delete(key)
+                if not expired and cache.get(key) == token:
+                    # The lock is still acquired. Delete it.
+                    cache.delete(key)
 
         if expired:
             logger.debug('Released cache lock "%s" (token "%s"), which '
@@ -386,6 +748,10 @@ class CacheLock:
             logger.debug('Released cache lock "%s" (token "%s")',
                          key, token)
 
+        # Let any threads in this process waiting on the lock try again
+        # immediately.
+        _notify_lock_released(self.full_cache_key)
+
     def __enter__(self) -> Self:
         """Enter the context manager.
 
@@ -439,3 +805,428 @@ class CacheLock:
             f' full_cache_key={self.full_cache_key!r},'
             f' token={self.token!r})>'
         )
+
+
+class CacheSemaphore(CacheLock):
+    """A distributed semaphore backed by a cache.
+
+    This works like :py:class:`CacheLock`, but allows up to a set number of
+    holders at once. This can be used to bound the concurrency of expensive
+    operations (such as regenerating cached data) without fully serializing
+    them.
+
+    Each holder claims one of a fixed number of slots, stored as separate
+    keys in the cache. Slots are freed when released or when they expire.
+
+    This is subject to the same limitations as :py:class:`CacheLock`.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The max number of holders of the semaphore at once.
+    max_holders: int
+
+    def __init__(
+        self,
+        key: str | Sequence[str] = '',
+        *,
+        max_holders: int,
+        **kwargs,
+    ) -> None:
+        """Initialize the semaphore.
+
+        Args:
+            key (str or list of str):
+                The key to use in the cache.
+
+                See :py:class:`CacheLock` for details.
+
+            max_holders (int):
+                The max number of holders of the semaphore at once.
+
+            **kwargs (dict):
+                Additional keyword arguments for :py:class:`CacheLock`.
+
+        Raises:
+            ValueError:
+                A provided argument had an invalid value.
+        """
+        if max_holders < 1:
+            raise ValueError('max_holders must be a positive value.')
+
+        super().__init__(key, **kwargs)
+
+        self.max_holders = max_holders
+
+    def get_slot_cache_keys(self) -> list[str]:
+        """Return the cache keys for each slot in the semaphore.
+
+        Returns:
+            list of str:
+            The cache keys for each slot.
+        """
+        full_cache_key = self.full_cache_key
+
+        return [
+            make_cache_key([full_cache_key, str(i)])
+            for i in range(self.max_holders)
+        ]
+
+    def _try_acquire(
+        self,
+        token: str,
+        lock_expiration_secs: int,
+    ) -> str | None:
+        """Attempt to claim a free slot in the cache.
+
+        Args:
+            token (str):
+                The token to store for the slot.
+
+            lock_expiration_secs (int):
+                The expiration time for the claimed slot.
+
+        Returns:
+            str:
+            The cache key for the claimed slot, or ``None`` if all slots are
+            taken.
+        """
+        slot_keys = self.get_slot_cache_keys()
+
+        return _claim_free_slot(slot_keys=slot_keys,
+                                claimed=cache.get_many(slot_keys),
+                                token=token,
+                                lock_expiration_secs=lock_expiration_secs)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the semaphore object.
+
+        Returns:
+            str:
+            The string representation.
+        """
+        cls_name = type(self).__name__
+
+        return (
+            f'<{cls_name}(blocking={self.blocking!r},'
+            f' full_cache_key={self.full_cache_key!r},'
+            f' max_holders={self.max_holders!r},'
+            f' token={self.token!r})>'
+        )
+
+
+class CacheReadLock(CacheSemaphore):
+    """The reader side of a distributed reader/writer lock.
+
+    Any number of readers (up to ``max_readers``) can hold the lock at once,
+    so long as a writer isn't holding or waiting on a
+    :py:class:`CacheWriteLock` with the same key.
+
+    Writers are given preference. Once a writer is waiting, new readers will
+    wait until the writer has released its lock.
+
+    This is subject to the same limitations as :py:class:`CacheLock`.
+
+    Version Added:
+        7.0
+    """
+
+    def __init__(
+        self,
+        key: str | Sequence[str] = '',
+        *,
+        max_readers: int = 10,
+        **kwargs,
+    ) -> None:
+        """Initialize the lock.
+
+        Args:
+            key (str or list of str):
+                The key to use in the cache.
+
+                This must match the key used for the
+                :py:class:`CacheWriteLock`. See :py:class:`CacheLock` for
+                details.
+
+            max_readers (int, optional):
+                The max number of readers at once.
+
+                This must match the value used for the
+                :py:class:`CacheWriteLock`.
+
+            **kwargs (dict):
+                Additional keyword arguments for :py:class:`CacheLock`.
+
+        Raises:
+            ValueError:
+                A provided argument had an invalid value.
+        """
+        super().__init__(key, max_holders=max_readers, **kwargs)
+
+    def get_slot_cache_keys(self) -> list[str]:
+        """Return the cache keys for each reader slot.
+
+        Returns:
+            list of str:
+            The cache keys for each reader slot.
+        """
+        return _make_reader_cache_keys(self.full_cache_key, self.max_holders)
+
+    def _try_acquire(
+        self,
+        token: str,
+        lock_expiration_secs: int,
+    ) -> str | None:
+        """Attempt to claim a reader slot in the cache.
+
+        Args:
+            token (str):
+                The token to store for the slot.
+
+            lock_expiration_secs (int):
+                The expiration time for the claimed slot.
+
+        Returns:
+            str:
+            The cache key for the claimed slot, or ``None`` if a writer is
+            active or all slots are taken.
+        """
+        writer_key = _make_writer_cache_key(self.full_cache_key)
+        slot_keys = self.get_slot_cache_keys()
+        claimed = cache.get_many([writer_key, *slot_keys])
+
+        if writer_key in claimed:
+            return None
+
+        slot_key = _claim_free_slot(slot_keys=slot_keys,
+                                    claimed=claimed,
+                                    token=token,
+                                    lock_expiration_secs=lock_expiration_secs)
+
+        if slot_key and cache.get(writer_key) is not None:
+            # A writer showed up while we were claiming the slot. Give the
+            # slot back so the writer isn't left waiting on us.
+            cache.delete(slot_key)
+            slot_key = None
+
+        return slot_key
+
+
+class CacheWriteLock(CacheLock):
+    """The writer side of a distributed reader/writer lock.
+
+    Only one writer can hold the lock at once, and only when no
+    :py:class:`CacheReadLock` with the same key is held.
+
+    A waiting writer claims the lock first and then waits for existing
+    readers to release theirs, preventing new readers from starving it.
+
+    This is subject to the same limitations as :py:class:`CacheLock`.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The max number of readers at once.
+    max_readers: int
+
+    #: Whether the writer key is claimed while waiting for readers.
+    _writer_key_claimed: bool
+
+    def __init__(
+        self,
+        key: str | Sequence[str] = '',
+        *,
+        max_readers: int = 10,
+        **kwargs,
+    ) -> None:
+        """Initialize the lock.
+
+        Args:
+            key (str or list of str):
+                The key to use in the cache.
+
+                This must match the key used for the
+                :py:class:`CacheReadLock`. See :py:class:`CacheLock` for
+                details.
+
+            max_readers (int, optional):
+                The max number of readers at once.
+
+                This must match the value used for the
+                :py:class:`CacheReadLock`.
+
+            **kwargs (dict):
+                Additional keyword arguments for :py:class:`CacheLock`.
+
+        Raises:
+            ValueError:
+                A provided argument had an invalid value.
+        """
+        if max_readers < 1:
+            raise ValueError('max_readers must be a positive value.')
+
+        super().__init__(key, **kwargs)
+
+        self.max_readers = max_readers
+        self._writer_key_claimed = False
+
+    def _try_acquire(
+        self,
+        token: str,
+        lock_expiration_secs: int,
+    ) -> str | None:
+        """Attempt to claim the writer lock in the cache.
+
+        Args:
+            token (str):
+                The token to store for the lock.
+
+            lock_expiration_secs (int):
+                The expiration time for the claimed key.
+
+        Returns:
+            str:
+            The cache key for the writer lock, or ``None`` if another writer
+            holds the lock or readers have yet to release theirs.
+        """
+        full_cache_key = self.full_cache_key
+        writer_key = _make_writer_cache_key(full_cache_key)
+
+        if self._writer_key_claimed and cache.get(writer_key) != token:
+            # Our claim expired or was replaced while waiting on readers.
+            self._writer_key_claimed = False
+
+        if not self._writer_key_claimed:
+            if not cache.add(writer_key, token, lock_expiration_secs):
+                return None
+
+            self._writer_key_claimed = True
+
+        if cache.get_many(_make_reader_cache_keys(full_cache_key,
+                                                  self.max_readers)):
+            return None
+
+        self._writer_key_claimed = False
+
+        return writer_key
+
+    def _abandon_acquire(
+        self,
+        token: str,
+    ) -> None:
+        """Release the writer claim after giving up on the lock.
+
+        Args:
+            token (str):
+                The token used when attempting to acquire the lock.
+        """
+        if self._writer_key_claimed:
+            self._writer_key_claimed = False
+            writer_key = _make_writer_cache_key(self.full_cache_key)
+
+            with bypass_request_cache_memo():
+                if cache.get(writer_key) == token:
+                    cache.delete(writer_key)
+                    _notify_lock_released(self.full_cache_key)
+
+
+def _claim_free_slot(
+    *,
+    slot_keys: Sequence[str],
+    claimed: Mapping[str, object],
+    token: str,
+    lock_expiration_secs: int,
+) -> str | None:
+    """Claim a free slot in the cache.
+
+    Free slots are tried in random order, to reduce contention between
+    callers.
+
+    Version Added:
+        7.0
+
+    Args:
+        slot_keys (list of str):
+            The cache keys for all slots.
+
+        claimed (dict):
+            Slots known to be claimed, keyed by cache key.
+
+        token (str):
+            The token to store for the slot.
+
+        lock_expiration_secs (int):
+            The expiration time for the claimed slot.
+
+    Returns:
+        str:
+        The cache key for the claimed slot, or ``None`` if no slot could be
+        claimed.
+    """
+    free_slot_keys = [
+        slot_key
+        for slot_key in slot_keys
+        if slot_key not in claimed
+    ]
+    random.shuffle(free_slot_keys)
+
+    for slot_key in free_slot_keys:
+        if cache.add(slot_key, token, lock_expiration_secs):
+            return slot_key
+
+    return None
+
+
+def _make_writer_cache_key(
+    full_cache_key: str,
+) -> str:
+    """Return the cache key for the writer of a reader/writer lock.
+
+    Version Added:
+        7.0
+
+    Args:
+        full_cache_key (str):
+            The full cache key for the lock.
+
+    Returns:
+        str:
+        The cache key for the writer.
+    """
+    return make_cache_key([full_cache_key, 'writer'])
+
+
+def _make_reader_cache_keys(
+    full_cache_key: str,
+    max_readers: int,
+) -> list[str]:
+    """Return the cache keys for the readers of a reader/writer lock.
+
+    Version Added:
+        7.0
+
+    Args:
+        full_cache_key (str):
+            The full cache key for the lock.
+
+        max_readers (int):
+            The max number of readers at once.
+
+    Returns:
+        list of str:
+        The cache keys for each reader slot.
+    """
+    return [
+        make_cache_key([full_cache_key, 'reader', str(i)])
+        for i in range(max_readers)
+    ]
@@ -3,6 +3,11 @@
 This can be used to impose rate limits on operations or access to resources,
 locked down to a user, IP, or any other criteria.
 
+Version Changed:
+    7.0:
+    Added support for sliding window and token bucket algorithms, and for
+    checking multiple rate limits at once.
+
 Version Added:
     6.0
 """
@@ -10,9 +15,11 @@ Version Added:
 from __future__ import annotations
 
 import logging
+import math
 import re
 import time
 from dataclasses import dataclass
+from enum import Enum
 from typing import TYPE_CHECKING
 
 from django.core.cache import cache
@@ -20,14 +27,58 @@ from django.utils.translation import gettext as _
 from typing_extensions import Self
 
 from djblets.cache.backend import make_cache_key
+from djblets.cache.forwarding_backend import bypass_request_cache_memo
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from typing import Any, TypeAlias
+
+    #: A rate limit to check, and the key to check it against.
+    #:
+    #: Version Added:
+    #:     7.0
+    RateLimitCheck: TypeAlias = tuple[
+        'RateLimit | str | None',
+        'str | Sequence[str]',
+    ]
 
 
 logger = logging.getLogger(__name__)
 
 
+class RateLimitAlgorithm(Enum):
+    """Algorithms used to track usage against a rate limit.
+
+    Version Added:
+        7.0
+    """
+
+    #: Count attempts within fixed windows of time.
+    #:
+    #: This is the cheapest algorithm, but allows up to twice the limit
+    #: in a burst spanning the end of one window and the start of the next.
+    FIXED_WINDOW = 'fixed-window'
+
+    #: Count attempts within a window sliding along with the current time.
+    #:
+    #: The count is estimated from the counts of the current and previous
+    #: fixed windows, weighting the previous window by how much of it
+    #: overlaps the sliding window. This avoids bursts at window edges, at
+    #: the cost of fetching one more key.
+    SLIDING_WINDOW = 'sliding-window'
+
+    #: Allow attempts while tokens remain in a bucket.
+    #:
+    #: The bucket holds up to the total limit of tokens, and refills
+    #: continuously over the period. This smooths out usage over the
+    #: period while still allowing short bursts.
+    #:
+    #: This is tracked using the Generic Cell Rate Algorithm, storing a
+    #: single timestamp per key. Updates are not atomic, so concurrent
+    #: attempts may occasionally be under-counted.
+    TOKEN_BUCKET = 'token-bucket'
+
+
 @dataclass
 class RateLimitUsage:
     """Usage information for a rate limit key.
@@ -88,6 +139,12 @@ class RateLimit:
     # Instance variables #
     ######################
 
+    #: The algorithm used to track usage against the rate limit.
+    #:
+    #: Version Added:
+    #:     7.0
+    algorithm: RateLimitAlgorithm
+
     #: The time period in seconds for a rate limit window.
     period_secs: int
 
@@ -98,6 +155,8 @@ class RateLimit:
     def parse(
         cls,
         rate_str: str,
+        *,
+        algorithm: RateLimitAlgorithm = RateLimitAlgorithm.FIXED_WINDOW,
     ) -> Self:
         """Return a RateLimit parsed from the given rate string.
 
@@ -105,11 +164,21 @@ class RateLimit:
         the number of login attempts allowed (count) and the time period
         allotted for these attempts (seconds).
 
+        Version Changed:
+            7.0:
+            Added the ``algorithm`` argument.
+
         Args:
             rate (str):
                 The number of attempts allowed within a period
                 of time (can be seconds, minutes, hours, or days).
 
+            algorithm (RateLimitAlgorithm, optional):
+                The algorithm used to track usage against the rate limit.
+
+                Version Added:
+                    7.0
+
         Returns:
             RateLimit:
             The parsed rate limit information.
@@ -128,13 +197,15 @@ class RateLimit:
             period_secs *= int(multiplier)
 
         return cls(total_limit=int(count),
-                   period_secs=period_secs)
+                   period_secs=period_secs,
+                   algorithm=algorithm)
 
     def __init__(
         self,
         *,
         total_limit: int,
         period_secs: int,
+        algorithm: RateLimitAlgorithm = RateLimitAlgorithm.FIXED_WINDOW,
     ) -> None:
         """Initialize attributes for the Rate object.
 
@@ -142,13 +213,24 @@ class RateLimit:
         the time period for the login attempts in seconds based on the
         data returned from the :py:meth:`parse` function.
 
+        Version Changed:
+            7.0:
+            Added the ``algorithm`` argument.
+
         Args:
             total_limit (int):
                 The total number of failed attempts allowed.
 
             period_secs (int):
                 The time period in seconds for a rate limit window.
+
+            algorithm (RateLimitAlgorithm, optional):
+                The algorithm used to track usage against the rate limit.
+
+                Version Added:
+                    7.0
         """
+        self.algorithm = algorithm
         self.total_limit = total_limit
         self.period_secs = period_secs
 
@@ -189,11 +271,12 @@ class RateLimit:
 
         Returns:
             bool:
-            Return true if the count and seconds match.
+            Return true if the count, seconds, and algorithm match.
         """
         return (isinstance(other, RateLimit) and
                 self.total_limit == other.total_limit and
-                self.period_secs == other.period_secs)
+                self.period_secs == other.period_secs and
+                self.algorithm == other.algorithm)
 
     def __repr__(self) -> str:
         """Return a string representation of the instance.
@@ -203,7 +286,8 @@ class RateLimit:
             The string representation.
         """
         return (
-            f'<RateLimit(period_secs={self.period_secs!r}, '
+            f'<RateLimit(algorithm={self.algorithm.value!r}, '
+            f'period_secs={self.period_secs!r}, '
             f'total_limit={self.total_limit!r})>'
         )
 
@@ -219,6 +303,13 @@ def check_rate_limit(
     This fetches the rate limit status for a key, optionally incrementing the
     count towards the limit in the process.
 
+    To check several rate limits at once (for instance, per-user and per-IP
+    limits), use :py:func:`check_rate_limits` instead.
+
+    Version Changed:
+        7.0:
+        Added support for the algorithms in :py:class:`RateLimitAlgorithm`.
+
     Version Added:
         6.0
 
@@ -245,73 +336,299 @@ def check_rate_limit(
         RateLimitUsage:
         The resulting rate limit stats for the key.
     """
-    if rate_limit is None:
-        # If the setting is explicitly None, don't do any rate limiting.
-        return RateLimitUsage(count=1)
+    return check_rate_limits(rate_limits=[(rate_limit, key)],
+                             increment_count=increment_count)[0]
 
-    if isinstance(rate_limit, str):
-        rate_limit = RateLimit.parse(rate_limit)
 
-    limit = rate_limit.total_limit
-    period_secs = rate_limit.period_secs
+def check_rate_limits(
+    *,
+    rate_limits: Sequence[RateLimitCheck],
+    increment_count: bool = False,
+) -> list[RateLimitUsage]:
+    """Return rate limit status for several rate limits at once.
 
-    # Prepare cache key to add or update to cache and determine remaining time
-    # period left.
+    This works like :py:func:`check_rate_limit`, but batches the cache
+    operations for all rate limits together. All stored state is fetched
+    using a single :py:meth:`~django.core.cache.cache.get_many` call, and
+    token bucket state is stored using a single
+    :py:meth:`~django.core.cache.cache.set_many` call.
+
+    Counters being incremented still require one
+    :py:meth:`~django.core.cache.cache.incr` call each, since cache
+    backends don't offer a batched increment. The result of each increment
+    is used as the count, so a separate fetch is only needed when a counter
+    is first created.
+
+    Version Added:
+        7.0
+
+    Args:
+        rate_limits (list of tuple):
+            The rate limits to check.
+
+            Each item is a tuple of a rate limit and the key to check it
+            against, matching the ``rate_limit`` and ``key`` arguments for
+            :py:func:`check_rate_limit`.
+
+        increment_count (bool, optional):
+            Whether to increment the counts toward the rate limits.
+
+    Returns:
+        list of RateLimitUsage:
+        The resulting rate limit stats for each rate limit, in the same
+        order as ``rate_limits``.
+    """
     now = _get_time_int()
-    window = rate_limit.get_reset_timestamp(now)
-    time_left_secs = window - now
+    checks: list[_RateLimitCheckState | None] = []
+    fetch_keys: list[str] = []
+
+    for rate_limit, key in rate_limits:
+        if rate_limit is None:
+            # If the setting is explicitly None, don't do any rate limiting.
+            checks.append(None)
+            continue
+
+        if isinstance(rate_limit, str):
+            rate_limit = RateLimit.parse(rate_limit)
 
-    # Build a key for the cache to track usage.
-    if isinstance(key, str):
-        key = [key]
+        check = _RateLimitCheckState(rate_limit=rate_limit,
+                                     key=key,
+                                     now=now)
+        checks.append(check)
 
-    cache_key = make_cache_key([
-        '_ratelimit_',
-        *key,
-        f'{limit}/{period_secs}',
-        str(window),
-    ])
+        if check.previous_cache_key:
+            fetch_keys.append(check.previous_cache_key)
 
-    # Check and track the rate limit count.
-    count: (int | None) = None
+        if (not increment_count or
+            rate_limit.algorithm == RateLimitAlgorithm.TOKEN_BUCKET):
+            fetch_keys.append(check.cache_key)
 
-    if increment_count:
+    # Fetch all stored state in one go.
+    stored: dict[str, Any] = {}
+
+    if fetch_keys:
         try:
-            try:
-                count = cache.incr(cache_key)
-            except ValueError:
-                # Add this to the cache, and set expiration 1 minute beyond
-                # the number of seconds remaining to help avoid race
-                # conditions or clock skew.
-                cache.add(cache_key, 1, timeout=time_left_secs + 60)
+            # Rate limit state is changed by other processes, so it must
+            # never be served from a request memo.
+            with bypass_request_cache_memo():
+                stored = cache.get_many(fetch_keys)
         except Exception as e:
-            logger.exception('Failed to set rate limit cache key "%s". Rate '
-                             'limit checks are currently unreliable. Is the '
-                             'cache server down? Error = %s',
-                             cache_key, e)
-
-    if count is None:
+            logger.exception('Failed to fetch rate limit cache keys %r. '
+                             'Rate limit checks are currently unreliable. '
+                             'Is the cache server down? Error = %s',
+                             fetch_keys, e)
+
+    results: list[RateLimitUsage] = []
+    new_tats: dict[int, dict[str, float]] = {}
+
+    for check in checks:
+        if check is None:
+            results.append(RateLimitUsage(count=1))
+            continue
+
+        rate_limit = check.rate_limit
+        limit = rate_limit.total_limit
+        cache_key = check.cache_key
+        time_left_secs = check.time_left_secs
+
+        if rate_limit.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+            # The stored value is the theoretical arrival time (TAT): the
+            # time at which the bucket would be full again, given all
+            # attempts so far. Each attempt pushes it forward by the time
+            # needed to refill one token.
+            emission_secs = rate_limit.period_secs / limit
+            tat = max(stored.get(cache_key, now), now)
+            new_tat = tat + emission_secs
+
+            # Round to avoid floating point error when converting the
+            # outstanding refill time back into a count.
+            count = math.ceil(round((new_tat - now) / emission_secs, 6))
+
+            if count > limit:
+                # Report how long until a token is available.
+                time_left_secs = math.ceil(new_tat - now -
+                                           rate_limit.period_secs)
+            else:
+                time_left_secs = math.ceil(new_tat - now)
+
+                if increment_count:
+                    new_tats.setdefault(time_left_secs + 60, {})[
+                        cache_key] = new_tat
+        else:
+            if increment_count:
+                count = _increment_rate_limit_key(
+                    cache_key,
+                    timeout=check.expiration_secs)
+            else:
+                # Add one to the returned value, even if we aren't
+                # incrementing the stored value. This makes it so that
+                # we're consistent in how many tries per period regardless
+                # of whether we're incrementing now or later.
+                count = stored.get(cache_key, 0) + 1
+
+            previous_cache_key = check.previous_cache_key
+
+            if previous_cache_key:
+                # Weight the previous window's count by how much of it
+                # overlaps the sliding window.
+                count += math.floor(stored.get(previous_cache_key, 0) *
+                                    time_left_secs / rate_limit.period_secs)
+
+        results.append(RateLimitUsage(count=count,
+                                      limit=limit,
+                                      time_left_secs=time_left_secs))
+
+    for timeout, values in new_tats.items():
         try:
-            count = cache.get(cache_key, 0)
+            cache.set_many(values, timeout=timeout)
         except Exception as e:
-            logger.exception('Failed to fetch rate limit cache key "%s". Rate '
+            logger.exception('Failed to set rate limit cache keys %r. Rate '
                              'limit checks are currently unreliable. Is the '
                              'cache server down? Error = %s',
-                             cache_key, e)
-            count = 0
+                             list(values.keys()), e)
+
+    return results
+
+
+class _RateLimitCheckState:
+    """State for checking a rate limit against a key.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The cache key storing the current state for the rate limit.
+    cache_key: str
 
-    assert count is not None
+    #: The expiration for the current state, in seconds.
+    expiration_secs: int
 
-    if not increment_count:
-        # Add one to the returned value, even if we aren't incrementing the
-        # stored value. This makes it so that we're consistent in how many
-        # tries per period regardless of whether we're incrementing now or
-        # later.
-        count += 1
+    #: The cache key for the previous window, for sliding windows.
+    previous_cache_key: str | None
 
-    return RateLimitUsage(count=count,
-                          limit=limit,
-                          time_left_secs=time_left_secs)
+    #: The rate limit being checked.
+    rate_limit: RateLimit
+
+    #: The time remaining in seconds before the current window resets.
+    time_left_secs: int
+
+    def __init__(
+        self,
+        *,
+        rate_limit: RateLimit,
+        key: str | Sequence[str],
+        now: int,
+    ) -> None:
+        """Initialize the state.
+
+        Args:
+            rate_limit (RateLimit):
+                The rate limit being checked.
+
+            key (str or list of str):
+                The rate limit key associated with the rate limit.
+
+            now (int):
+                The current timestamp.
+        """
+        algorithm = rate_limit.algorithm
+        limit = rate_limit.total_limit
+        period_secs = rate_limit.period_secs
+
+        # Build a key for the cache to track usage.
+        if isinstance(key, str):
+            key = [key]
+
+        key_prefix = [
+            '_ratelimit_',
+            *key,
+            f'{limit}/{period_secs}',
+        ]
+
+        self.rate_limit = rate_limit
+        self.previous_cache_key = None
+
+        if algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+            self.cache_key = make_cache_key([*key_prefix, 'token-bucket'])
+            self.expiration_secs = period_secs + 60
+            self.time_left_secs = 0
+        else:
+            if algorithm == RateLimitAlgorithm.SLIDING_WINDOW:
+                # Windows are tracked by their end time, like fixed
+                # windows, but always span the full period.
+                window = now - (now % period_secs) + period_secs
+                key_prefix.append('sliding')
+
+                self.previous_cache_key = make_cache_key([
+                    *key_prefix,
+                    str(window - period_secs),
+                ])
+
+                # The current window's count needs to stick around long
+                # enough to become the previous window's count.
+                extra_expiration_secs = period_secs
+            else:
+                window = rate_limit.get_reset_timestamp(now)
+                extra_expiration_secs = 0
+
+            self.time_left_secs = window - now
+            self.cache_key = make_cache_key([*key_prefix, str(window)])
+
+            self.expiration_secs = \
+                self.time_left_secs + extra_expiration_secs + 60
+
+
+def _increment_rate_limit_key(
+    cache_key: str,
+    *,
+    timeout: int,
+) -> int:
+    """Increment the count for a rate limit key.
+
+    Version Added:
+        7.0
+
+    Args:
+        cache_key (str):
+            The cache key to increment.
+
+        timeout (int):
+            The expiration for the key, if it's newly added.
+
+    Returns:
+        int:
+        The new count.
+    """
+    try:
+        try:
+            return cache.incr(cache_key)
+        except ValueError:
+            # Add this to the cache, and set expiration 1 minute beyond
+            # the number of seconds remaining to help avoid race
+            # conditions or clock skew.
+            cache.add(cache_key, 1, timeout=timeout)
+    except Exception as e:
+        logger.exception('Failed to set rate limit cache key "%s". Rate '
+                         'limit checks are currently unreliable. Is the '
+                         'cache server down? Error = %s',
+                         cache_key, e)
+
+    # The key was newly added (possibly by another caller), or couldn't be
+    # set. Fetch the current count.
+    try:
+        with bypass_request_cache_memo():
+            return cache.get(cache_key, 0)
+    except Exception as e:
+        logger.exception('Failed to fetch rate limit cache key "%s". Rate '
+                         'limit checks are currently unreliable. Is the '
+                         'cache server down? Error = %s',
+                         cache_key, e)
+
+        return 0
 
 
 def _get_time_int() -> int:
@@ -8,11 +8,12 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
 
 import kgb
 from django.core.cache import cache
 
-from djblets.protect.locks import CacheLock
+from djblets.protect.locks import CacheLock, _CacheLockWaiters, _lock_waiters
 from djblets.testing.testcases import TestCase
 
 
@@ -41,6 +42,33 @@ class CacheLockTests(kgb.SpyAgency, TestCase):
 
         cache.clear()
 
+    def _spy_on_waits(self) -> threading.Semaphore:
+        """Spy on waits for a lock, signaling as threads start waiting.
+
+        Returns:
+            threading.Semaphore:
+            A semaphore released each time a thread waits on a condition.
+            Acquiring it ensures the thread is waiting, as the condition's
+            lock will be held until then.
+        """
+        semaphore = threading.Semaphore(0)
+
+        def _wait_for(
+            _self: threading.Condition,
+            *args,
+            **kwargs,
+        ) -> bool:
+            semaphore.release()
+
+            return threading.Condition.wait_for.call_original(
+                _self, *args, **kwargs)
+
+        self.spy_on(threading.Condition.wait_for,
+                    owner=threading.Condition,
+                    call_fake=_wait_for)
+
+        return semaphore
+
     def test_acquire_with_new_lock(self) -> None:
         """Testing CacheLock.acquire with new lock"""
         lock = CacheLock(key='1D5BC5F3')
@@ -177,6 +205,149 @@ class CacheLockTests(kgb.SpyAgency, TestCase):
         self.assertEqual(cache.get(new_lock.full_cache_key),
                          existing_lock.token)
 
+    def test_acquire_with_backoff(self) -> None:
+        """Testing CacheLock.acquire with exponential backoff capped at
+        max_retry_secs
+        """
+        existing_lock = CacheLock(key='5A0E2C37')
+        existing_lock.acquire()
+        self.addCleanup(existing_lock.release)
+
+        new_lock = CacheLock(key='5A0E2C37',
+                             retry_secs=0.01,
+                             max_retry_secs=0.04,
+                             timeout_secs=0.2)
+
+        self.spy_on(_CacheLockWaiters.wait,
+                    owner=_CacheLockWaiters)
+
+        with self.assertRaises(TimeoutError):
+            new_lock.acquire()
+
+        poll_secs = [
+            call.kwargs['poll_secs']
+            for call in _CacheLockWaiters.wait.calls
+        ]
+        self.assertGreaterEqual(len(poll_secs), 4)
+
+        for i, expected_secs in enumerate([0.01, 0.02, 0.04, 0.04]):
+            self.assertGreaterEqual(poll_secs[i], expected_secs)
+            self.assertLessEqual(poll_secs[i], expected_secs * 1.25)
+
+        # All waiting state should be cleaned up.
+        self.assertNotIn(new_lock.full_cache_key, _lock_waiters)
+
+    def test_acquire_with_threads_share_poller(self) -> None:
+        """Testing CacheLock.acquire with multiple waiting threads sharing
+        one poller
+        """
+        existing_lock = CacheLock(key='0BC1A4D2')
+        existing_lock.acquire()
+
+        full_cache_key = existing_lock.full_cache_key
+        results: list[bool] = []
+
+        def _acquire() -> None:
+            lock = CacheLock(key='0BC1A4D2',
+                             retry_secs=10,
+                             max_retry_secs=10)
+
+            with lock:
+                results.append(lock.acquired)
+
+        self.spy_on(CacheLock._acquire_once,
+                    owner=CacheLock)
+
+        waits = self._spy_on_waits()
+        threads = [
+            threading.Thread(target=_acquire)
+            for i in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for i in range(4):
+            self.assertTrue(waits.acquire(timeout=5))
+
+        waiters = _lock_waiters[full_cache_key][CacheLock]
+
+        with waiters.condition:
+            self.assertTrue(waiters.has_poller)
+            self.assertEqual(waiters.refcount, 4)
+
+        # Each thread has only made its initial attempt. Nothing polls the
+        # cache until the poller's retry time passes.
+        self.assertSpyCallCount(CacheLock._acquire_once, 4)
+
+        existing_lock.release()
+
+        for thread in threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+        self.assertEqual(results, [True, True, True, True])
+        self.assertNotIn(full_cache_key, _lock_waiters)
+
+    def test_acquire_with_local_release(self) -> None:
+        """Testing CacheLock.acquire waking immediately when released in the
+        same process
+        """
+        existing_lock = CacheLock(key='9F3E8B61')
+        existing_lock.acquire()
+
+        results: list[bool] = []
+
+        def _acquire() -> None:
+            # This would wait far longer than the join below if it weren't
+            # woken by the release.
+            lock = CacheLock(key='9F3E8B61',
+                             retry_secs=30,
+                             max_retry_secs=30)
+
+            with lock:
+                results.append(lock.acquired)
+
+        waits = self._spy_on_waits()
+        thread = threading.Thread(target=_acquire)
+        thread.start()
+
+        self.assertTrue(waits.acquire(timeout=5))
+
+        existing_lock.release()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [True])
+
+    def test_init_with_invalid_max_retry_secs(self) -> None:
+        """Testing CacheLock.__init__ with max_retry_secs < retry_secs"""
+        message = ('max_retry_secs must be greater than or equal to '
+                   'retry_secs.')
+
+        with self.assertRaisesMessage(ValueError, message):
+            CacheLock(key='A1', retry_secs=1, max_retry_secs=0.5)
+
+    def test_init_with_default_max_retry_secs(self) -> None:
+        """Testing CacheLock.__init__ with default max_retry_secs"""
+        lock = CacheLock(key='A1')
+        self.assertEqual(lock.max_retry_secs, 2)
+
+    def test_init_with_retry_secs_above_default_max(self) -> None:
+        """Testing CacheLock.__init__ with retry_secs greater than the
+        default max_retry_secs
+        """
+        lock = CacheLock(key='A1', retry_secs=5)
+        self.assertEqual(lock.retry_secs, 5)
+        self.assertEqual(lock.max_retry_secs, 5)
+
+    def test_init_with_invalid_backoff_factor(self) -> None:
+        """Testing CacheLock.__init__ with backoff_factor < 1"""
+        message = 'backoff_factor must be 1 or higher.'
+
+        with self.assertRaisesMessage(ValueError, message):
+            CacheLock(key='A1', backoff_factor=0.5)
+
     def test_release_with_acquired(self) -> None:
         """Testing CacheLock.release with lock acquired"""
         lock = CacheLock(key='F0E07CB8')
@@ -0,0 +1,203 @@
+"""Unit tests for djblets.protect.locks.CacheReadLock and CacheWriteLock.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import threading
+
+import kgb
+from django.core.cache import cache
+
+from djblets.protect.locks import (CacheReadLock, CacheWriteLock,
+                                   _lock_waiters)
+from djblets.testing.testcases import TestCase
+
+
+class CacheReadWriteLockTests(kgb.SpyAgency, TestCase):
+    """Unit tests for CacheReadLock and CacheWriteLock.
+
+    Version Added:
+        7.0
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        cache.clear()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        cache.clear()
+
+    def _spy_on_waits(self) -> threading.Semaphore:
+        """Spy on waits for a lock, signaling as threads start waiting.
+
+        Returns:
+            threading.Semaphore:
+            A semaphore released each time a thread waits on a condition.
+            Acquiring it ensures the thread is waiting, as the condition's
+            lock will be held until then.
+        """
+        semaphore = threading.Semaphore(0)
+
+        def _wait_for(
+            _self: threading.Condition,
+            *args,
+            **kwargs,
+        ) -> bool:
+            semaphore.release()
+
+            return threading.Condition.wait_for.call_original(
+                _self, *args, **kwargs)
+
+        self.spy_on(threading.Condition.wait_for,
+                    owner=threading.Condition,
+                    call_fake=_wait_for)
+
+        return semaphore
+
+    def test_read_lock_with_multiple_readers(self) -> None:
+        """Testing CacheReadLock.acquire with multiple readers"""
+        for i in range(3):
+            lock = CacheReadLock(key='D4A2B7E0', max_readers=3)
+            self.assertTrue(lock.acquire(blocking=False))
+            self.addCleanup(lock.release)
+
+        lock = CacheReadLock(key='D4A2B7E0', max_readers=3)
+        self.assertFalse(lock.acquire(blocking=False))
+
+    def test_read_lock_with_writer(self) -> None:
+        """Testing CacheReadLock.acquire with writer holding lock"""
+        write_lock = CacheWriteLock(key='8E61F03C')
+        self.assertTrue(write_lock.acquire(blocking=False))
+
+        read_lock = CacheReadLock(key='8E61F03C')
+        self.assertFalse(read_lock.acquire(blocking=False))
+
+        write_lock.release()
+
+        self.assertTrue(read_lock.acquire(blocking=False))
+        read_lock.release()
+
+    def test_write_lock_with_readers(self) -> None:
+        """Testing CacheWriteLock.acquire with readers holding lock"""
+        read_lock = CacheReadLock(key='27C9D5A1')
+        self.assertTrue(read_lock.acquire())
+
+        write_lock = CacheWriteLock(key='27C9D5A1')
+        self.assertFalse(write_lock.acquire(blocking=False))
+
+        read_lock.release()
+
+        self.assertTrue(write_lock.acquire(blocking=False))
+        write_lock.release()
+
+    def test_write_lock_blocks_new_readers_while_waiting(self) -> None:
+        """Testing CacheWriteLock.acquire blocks new readers while waiting
+        for existing readers
+        """
+        read_lock = CacheReadLock(key='F05B3E96')
+        read_lock.acquire()
+        self.addCleanup(read_lock.release)
+
+        write_lock = CacheWriteLock(key='F05B3E96',
+                                    retry_secs=0.01,
+                                    timeout_secs=0.1)
+
+        def _try_acquire(
+            _self: CacheWriteLock,
+            token: str,
+            lock_expiration_secs: int,
+        ) -> str | None:
+            result = write_lock._try_acquire.call_original(
+                token, lock_expiration_secs)
+
+            # While the writer waits, new readers must be turned away.
+            new_read_lock = CacheReadLock(key='F05B3E96')
+            self.assertFalse(new_read_lock.acquire(blocking=False))
+
+            return result
+
+        self.spy_on(write_lock._try_acquire, call_fake=_try_acquire)
+
+        with self.assertRaises(TimeoutError):
+            write_lock.acquire()
+
+        self.assertSpyCalled(write_lock._try_acquire)
+
+        # Once the writer gives up, readers can acquire again.
+        new_read_lock = CacheReadLock(key='F05B3E96')
+        self.assertTrue(new_read_lock.acquire(blocking=False))
+        new_read_lock.release()
+
+    def test_write_lock_with_writer(self) -> None:
+        """Testing CacheWriteLock.acquire with another writer holding lock"""
+        write_lock1 = CacheWriteLock(key='6A3C19F7')
+        write_lock2 = CacheWriteLock(key='6A3C19F7')
+
+        self.assertTrue(write_lock1.acquire())
+        self.assertFalse(write_lock2.acquire(blocking=False))
+
+        write_lock1.release()
+
+        self.assertTrue(write_lock2.acquire(blocking=False))
+        write_lock2.release()
+
+    def test_waiting_readers_and_writers_use_separate_pollers(self) -> None:
+        """Testing CacheReadLock and CacheWriteLock waiting in the same
+        process with separate pollers
+        """
+        read_lock = CacheReadLock(key='3B7E05C2')
+        read_lock.acquire()
+
+        full_cache_key = read_lock.full_cache_key
+        results: list[str] = []
+
+        def _write() -> None:
+            with CacheWriteLock(key='3B7E05C2',
+                                retry_secs=30,
+                                max_retry_secs=30):
+                results.append('write')
+
+        def _read() -> None:
+            with CacheReadLock(key='3B7E05C2',
+                               retry_secs=30,
+                               max_retry_secs=30):
+                results.append('read')
+
+        # Start the writer, and then a reader that must wait for the
+        # pending writer.
+        waits = self._spy_on_waits()
+
+        write_thread = threading.Thread(target=_write)
+        write_thread.start()
+        self.assertTrue(waits.acquire(timeout=5))
+
+        read_thread = threading.Thread(target=_read)
+        read_thread.start()
+        self.assertTrue(waits.acquire(timeout=5))
+
+        waiters_by_cls = _lock_waiters[full_cache_key]
+        self.assertEqual(set(waiters_by_cls),
+                         {CacheReadLock, CacheWriteLock})
+
+        for waiters in waiters_by_cls.values():
+            with waiters.condition:
+                self.assertTrue(waiters.has_poller)
+                self.assertEqual(waiters.refcount, 1)
+
+        # Releasing the reader should wake the writer, and releasing the
+        # writer should wake the new reader, well before the retry time.
+        read_lock.release()
+
+        write_thread.join(5)
+        read_thread.join(5)
+
+        self.assertFalse(write_thread.is_alive())
+        self.assertFalse(read_thread.is_alive())
+        self.assertEqual(results, ['write', 'read'])
+        self.assertNotIn(full_cache_key, _lock_waiters)
@@ -0,0 +1,111 @@
+"""Unit tests for djblets.protect.locks.CacheSemaphore.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import kgb
+from django.core.cache import cache
+
+from djblets.protect.locks import CacheSemaphore
+from djblets.testing.testcases import TestCase
+
+
+class CacheSemaphoreTests(kgb.SpyAgency, TestCase):
+    """Unit tests for CacheSemaphore.
+
+    Version Added:
+        7.0
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        cache.clear()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        cache.clear()
+
+    def test_acquire(self) -> None:
+        """Testing CacheSemaphore.acquire with free slots"""
+        semaphores = [
+            CacheSemaphore(key='B2F1E0C4', max_holders=2)
+            for i in range(2)
+        ]
+
+        for semaphore in semaphores:
+            self.assertTrue(semaphore.acquire(blocking=False))
+            self.addCleanup(semaphore.release)
+
+        slot_keys = semaphores[0].get_slot_cache_keys()
+        self.assertEqual(
+            cache.get_many(slot_keys),
+            {
+                semaphore._acquired_cache_key: semaphore.token
+                for semaphore in semaphores
+            })
+
+    def test_acquire_with_all_slots_taken(self) -> None:
+        """Testing CacheSemaphore.acquire with all slots taken"""
+        semaphores = [
+            CacheSemaphore(key='4C8A7D12', max_holders=2)
+            for i in range(2)
+        ]
+
+        for semaphore in semaphores:
+            semaphore.acquire()
+            self.addCleanup(semaphore.release)
+
+        new_semaphore = CacheSemaphore(key='4C8A7D12',
+                                       max_holders=2,
+                                       timeout_secs=0.05)
+
+        self.assertFalse(new_semaphore.acquire(blocking=False))
+
+        with self.assertRaises(TimeoutError):
+            new_semaphore.acquire()
+
+        self.assertFalse(new_semaphore.acquired)
+
+    def test_release(self) -> None:
+        """Testing CacheSemaphore.release frees a slot"""
+        semaphore1 = CacheSemaphore(key='E7D03B95', max_holders=1)
+        semaphore2 = CacheSemaphore(key='E7D03B95', max_holders=1)
+
+        self.assertTrue(semaphore1.acquire())
+        self.assertFalse(semaphore2.acquire(blocking=False))
+
+        semaphore1.release()
+
+        self.assertTrue(semaphore2.acquire(blocking=False))
+        semaphore2.release()
+
+        self.assertEqual(
+            cache.get_many(semaphore1.get_slot_cache_keys()),
+            {})
+
+    def test_update_expiration(self) -> None:
+        """Testing CacheSemaphore.update_expiration touches the claimed
+        slot
+        """
+        semaphore = CacheSemaphore(key='31F6C2A8', max_holders=3)
+        semaphore.acquire()
+        self.addCleanup(semaphore.release)
+
+        self.spy_on(cache.touch)
+        semaphore.update_expiration(60)
+
+        self.assertSpyCalledWith(cache.touch,
+                                 semaphore._acquired_cache_key,
+                                 timeout=60)
+
+    def test_init_with_invalid_max_holders(self) -> None:
+        """Testing CacheSemaphore.__init__ with max_holders < 1"""
+        message = 'max_holders must be a positive value.'
+
+        with self.assertRaisesMessage(ValueError, message):
+            CacheSemaphore(key='A1', max_holders=0)
@@ -11,9 +11,11 @@ from django.core.cache import cache
 
 from djblets.protect.ratelimit import (
     RateLimit,
+    RateLimitAlgorithm,
     RateLimitUsage,
     _get_time_int,
     check_rate_limit,
+    check_rate_limits,
 )
 from djblets.testing.testcases import TestCase
 
@@ -115,6 +117,24 @@ class RateLimitTests(TestCase):
         with self.assertRaisesMessage(ValueError, message):
             RateLimit.parse('100/f')
 
+    def test_parse_with_algorithm(self) -> None:
+        """Testing RateLimit.parse with algorithm="""
+        self.assertEqual(
+            RateLimit.parse('100/m',
+                            algorithm=RateLimitAlgorithm.TOKEN_BUCKET),
+            RateLimit(period_secs=60,
+                      total_limit=100,
+                      algorithm=RateLimitAlgorithm.TOKEN_BUCKET))
+
+    def test_eq_with_different_algorithm(self) -> None:
+        """Testing RateLimit.__eq__ with different algorithms"""
+        self.assertNotEqual(
+            RateLimit(period_secs=60,
+                      total_limit=100),
+            RateLimit(period_secs=60,
+                      total_limit=100,
+                      algorithm=RateLimitAlgorithm.SLIDING_WINDOW))
+
     def test_get_reset_timestamp(self) -> None:
         """Testing RateLimit.get_reset_timestamp"""
         rate_limit = RateLimit(period_secs=60,
@@ -309,3 +329,172 @@ class CheckRateLimitTests(kgb.SpyAgency, TestCase):
         self.assertEqual(
             cache.get('example.com:_ratelimit_:other:test:200/300:1759962300'),
             1)
+
+    def test_with_sliding_window(self) -> None:
+        """Testing check_rate_limit with sliding window algorithm"""
+        self.spy_on(_get_time_int, op=kgb.SpyOpReturn(1759962125))
+
+        rate_limit = RateLimit(period_secs=300,
+                               total_limit=200,
+                               algorithm=RateLimitAlgorithm.SLIDING_WINDOW)
+
+        # The previous window overlaps the sliding window by 175 of 300
+        # seconds, so 100 previous attempts count as 58.
+        cache.set('example.com:_ratelimit_:test:200/300:sliding:1759962000',
+                  100)
+
+        self.assertEqual(
+            check_rate_limit(rate_limit=rate_limit,
+                             key='test',
+                             increment_count=True),
+            RateLimitUsage(count=59,
+                           limit=200,
+                           time_left_secs=175))
+
+        self.assertEqual(
+            cache.get(
+                'example.com:_ratelimit_:test:200/300:sliding:1759962300'),
+            1)
+
+        self.assertEqual(
+            check_rate_limit(rate_limit=rate_limit,
+                             key='test'),
+            RateLimitUsage(count=60,
+                           limit=200,
+                           time_left_secs=175))
+
+    def test_with_token_bucket(self) -> None:
+        """Testing check_rate_limit with token bucket algorithm"""
+        self.spy_on(_get_time_int, op=kgb.SpyOpReturn(1759962125))
+
+        rate_limit = RateLimit(period_secs=60,
+                               total_limit=2,
+                               algorithm=RateLimitAlgorithm.TOKEN_BUCKET)
+
+        self.assertEqual(
+            check_rate_limit(rate_limit=rate_limit,
+                             key='test'),
+            RateLimitUsage(count=1,
+                           limit=2,
+                           time_left_secs=30))
+
+        for i in range(1, 3):
+            self.assertEqual(
+                check_rate_limit(rate_limit=rate_limit,
+                                 key='test',
+                                 increment_count=True),
+                RateLimitUsage(count=i,
+                               limit=2,
+                               time_left_secs=30 * i))
+
+        # The bucket is now empty. This attempt will be limited, and will
+        # not consume a token.
+        usage = check_rate_limit(rate_limit=rate_limit,
+                                 key='test',
+                                 increment_count=True)
+        self.assertEqual(usage,
+                         RateLimitUsage(count=3,
+                                        limit=2,
+                                        time_left_secs=30))
+        self.assertTrue(usage.is_limited)
+
+        # After a token refills, an attempt is allowed again.
+        _get_time_int.unspy()
+        self.spy_on(_get_time_int, op=kgb.SpyOpReturn(1759962155))
+
+        self.assertEqual(
+            check_rate_limit(rate_limit=rate_limit,
+                             key='test',
+                             increment_count=True),
+            RateLimitUsage(count=2,
+                           limit=2,
+                           time_left_secs=60))
+
+
+class CheckRateLimitsTests(kgb.SpyAgency, TestCase):
+    """Unit tests for check_rate_limits.
+
+    Version Added:
+        7.0
+    """
+
+    def setUp(self) -> None:
+        """Set up state for a unit test.
+
+        This will clear the cache.
+        """
+        super().setUp()
+
+        cache.clear()
+
+    def tearDown(self) -> None:
+        """Tear down state for a unit test.
+
+        This will clear the cache.
+        """
+        super().tearDown()
+
+        cache.clear()
+
+    def test_check_rate_limits(self) -> None:
+        """Testing check_rate_limits with multiple rate limits"""
+        self.spy_on(_get_time_int, op=kgb.SpyOpReturn(1759962125))
+
+        cache.set('example.com:_ratelimit_:user:1:200/300:1759962300', 10)
+        cache.set('example.com:_ratelimit_:ip:1.2.3.4:10/60:1759962180', 4)
+
+        self.spy_on(cache.get_many)
+
+        self.assertEqual(
+            check_rate_limits(rate_limits=[
+                ('200/5m', ['user', '1']),
+                ('10/m', ['ip', '1.2.3.4']),
+                (None, 'global'),
+                (RateLimit(period_secs=60,
+                           total_limit=100,
+                           algorithm=RateLimitAlgorithm.TOKEN_BUCKET),
+                 'global'),
+            ]),
+            [
+                RateLimitUsage(count=11,
+                               limit=200,
+                               time_left_secs=175),
+                RateLimitUsage(count=5,
+                               limit=10,
+                               time_left_secs=55),
+                RateLimitUsage(count=1),
+                RateLimitUsage(count=1,
+                               limit=100,
+                               time_left_secs=1),
+            ])
+
+        self.assertSpyCalledOnce(cache.get_many)
+
+    def test_check_rate_limits_with_increment_count(self) -> None:
+        """Testing check_rate_limits with increment_count=True"""
+        self.spy_on(_get_time_int, op=kgb.SpyOpReturn(1759962125))
+
+        cache.set('example.com:_ratelimit_:user:1:200/300:1759962300', 10)
+
+        self.assertEqual(
+            check_rate_limits(
+                rate_limits=[
+                    ('200/5m', ['user', '1']),
+                    ('10/m', ['ip', '1.2.3.4']),
+                ],
+                increment_count=True),
+            [
+                RateLimitUsage(count=11,
+                               limit=200,
+                               time_left_secs=175),
+                RateLimitUsage(count=1,
+                               limit=10,
+                               time_left_secs=55),
+            ])
+
+        self.assertEqual(
+            cache.get('example.com:_ratelimit_:user:1:200/300:1759962300'),
+            11)
+        self.assertEqual(
+            cache.get('example.com:_ratelimit_:ip:1.2.3.4:10/60:1759962180'),
+            1)
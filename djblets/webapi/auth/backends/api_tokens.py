@@ -13,9 +13,12 @@ list at ``settings.WEB_API_AUTH_BACKENDS``.
 from __future__ import annotations
 
 import logging
+import time
+from threading import RLock
 from typing import TYPE_CHECKING
 
 from django.contrib.auth import get_backends
+from django.core.cache import cache
 from django.utils import timezone
 from django.utils.formats import localize
 from django.utils.translation import gettext as _
@@ -29,6 +32,7 @@ from djblets.webapi.models import BaseWebAPIToken
 from djblets.webapi.signals import webapi_token_expired
 
 if TYPE_CHECKING:
+    from datetime import datetime
     from typing import Any, ClassVar
 
     from django.http import HttpRequest
@@ -106,6 +110,35 @@ class TokenAuthBackendMixin:
     #:     type
     api_token_model: ClassVar[type[BaseWebAPIToken] | None] = None
 
+    #: Whether to cache API tokens looked up for authentication.
+    #:
+    #: If enabled, tokens will be cached for :py:attr:`token_cache_expiration`
+    #: seconds, avoiding a token lookup in the database on each API request.
+    #: The token's owner is still fetched from the database on each request.
+    #:
+    #: Cached tokens are removed when the token is saved, deleted, or
+    #: invalidated through
+    #: :py:meth:`WebAPITokenManager.invalidate_tokens()
+    #: <djblets.webapi.managers.WebAPITokenManager.invalidate_tokens>`. Any
+    #: other bulk updates to tokens may not be seen until the cached tokens
+    #: expire.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     bool
+    token_cache_enabled: ClassVar[bool] = False
+
+    #: The expiration time for cached API tokens, in seconds.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     int
+    token_cache_expiration: ClassVar[int] = 60
+
     def authenticate(
         self,
         request: HttpRequest,
@@ -128,24 +161,15 @@ class TokenAuthBackendMixin:
             django.contrib.auth.models.User:
             The resulting user, if a token matched, or ``None`` otherwise.
         """
-        api_token_model = self.api_token_model
-        assert api_token_model is not None
-
         if not token:
             return None
 
         # Find the WebAPIToken matching the token parameter passed in.
         # Once we have it, we'll need to perform some additional checks on
         # the user.
-        queryset = (
-            api_token_model.objects
-            .filter(token=token)
-            .select_related('user')
-        )
-
-        try:
-            webapi_token = queryset.get()
-        except api_token_model.DoesNotExist:
+        webapi_token = self._get_api_token(request, token)
+
+        if webapi_token is None:
             return None
 
         user = webapi_token.user
@@ -201,18 +225,13 @@ class TokenAuthBackendMixin:
             If the token is valid to use for authentication this will return
             ``None``.
         """
-        api_token_model = self.api_token_model
-        assert api_token_model is not None
-
-        queryset = api_token_model.objects.filter(token=token)
-
         log_extra: dict[str, Any] = {
             'request': request,
         }
 
-        try:
-            webapi_token = queryset.get()
-        except api_token_model.DoesNotExist:
+        webapi_token = self._get_api_token(request, token)
+
+        if webapi_token is None:
             logger.debug('API Login failed. Token not found.',
                          extra=log_extra)
 
@@ -260,6 +279,170 @@ class TokenAuthBackendMixin:
 
         return None
 
+    def _get_api_token(
+        self,
+        request: HttpRequest | None,
+        token: str,
+    ) -> BaseWebAPIToken | None:
+        """Return the API token for a token value.
+
+        The token is looked up once per request, and shared between
+        :py:meth:`validate_token` and :py:meth:`authenticate`. If
+        :py:attr:`token_cache_enabled` is set, it will be fetched from the
+        cache if possible.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client, if any.
+
+            token (str):
+                The API token value to look up.
+
+        Returns:
+            djblets.webapi.models.BaseWebAPIToken:
+            The API token, or ``None`` if the token was not found.
+        """
+        api_token_model = self.api_token_model
+        assert api_token_model is not None
+
+        lookup_key = (api_token_model, token)
+        request_tokens: dict[tuple[type[BaseWebAPIToken], str],
+                             BaseWebAPIToken | None] | None = None
+
+        if request is not None:
+            try:
+                request_tokens = getattr(request, '_djblets_webapi_tokens')
+            except AttributeError:
+                request_tokens = {}
+                setattr(request, '_djblets_webapi_tokens', request_tokens)
+
+            assert request_tokens is not None
+
+            if lookup_key in request_tokens:
+                return request_tokens[lookup_key]
+
+        webapi_token: BaseWebAPIToken | None
+
+        if self.token_cache_enabled:
+            cache_key = api_token_model.get_token_cache_key(token)
+            webapi_token = cache.get(cache_key)
+
+            if webapi_token is None:
+                # The owner isn't fetched along with the token, so that the
+                # cached token won't contain stale user state.
+                try:
+                    webapi_token = api_token_model.objects.get(token=token)
+                except api_token_model.DoesNotExist:
+                    webapi_token = None
+                else:
+                    expiration = self.token_cache_expiration
+                    expires = webapi_token.expires
+
+                    if expires is not None:
+                        # Don't keep the token cached past its expiration.
+                        expiration = min(
+                            expiration,
+                            max(int((expires - timezone.now())
+                                    .total_seconds()),
+                                1))
+
+                    cache.set(cache_key, webapi_token, expiration)
+        else:
+            try:
+                webapi_token = (
+                    api_token_model.objects
+                    .filter(token=token)
+                    .select_related('user')
+                    .get()
+                )
+            except api_token_model.DoesNotExist:
+                webapi_token = None
+
+        if request_tokens is not None:
+            request_tokens[lookup_key] = webapi_token
+
+        return webapi_token
+
+
+class _TokenLastUsedBuffer:
+    """A buffer for writing API token last-used timestamps in bulk.
+
+    Timestamps are recorded for each token, coalescing multiple uses of a
+    token, and written to the database in bulk at most once per interval.
+
+    Since state is shared between threads, recording and writing timestamps
+    are done behind a thread lock.
+
+    Version Added:
+        7.0
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._pending: dict[type[BaseWebAPIToken], dict[Any, datetime]] = {}
+        self._last_flush: (float | None) = None
+        self._lock = RLock()
+
+    def add(
+        self,
+        webapi_token: BaseWebAPIToken,
+        last_used: datetime,
+        interval: int,
+    ) -> None:
+        """Record the last-used timestamp of a token.
+
+        If the interval has passed since timestamps were last written, all
+        pending timestamps will be written.
+
+        Args:
+            webapi_token (djblets.webapi.models.BaseWebAPIToken):
+                The token that was used.
+
+            last_used (datetime.datetime):
+                The timestamp when the token was used.
+
+            interval (int):
+                The minimum number of seconds between writes.
+        """
+        with self._lock:
+            self._pending.setdefault(type(webapi_token), {})[
+                webapi_token.pk] = last_used
+
+            now = time.monotonic()
+
+            if (self._last_flush is not None and
+                now - self._last_flush < interval):
+                return
+
+            self._last_flush = now
+
+        self.flush()
+
+    def flush(self) -> None:
+        """Write all pending timestamps to the database."""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+
+        for api_token_model, timestamps in pending.items():
+            try:
+                api_token_model.objects.bulk_update(
+                    [
+                        api_token_model(pk=pk, last_used=last_used)
+                        for pk, last_used in timestamps.items()
+                    ],
+                    fields=('last_used',))
+            except Exception as e:
+                logger.exception('Unable to update last-used timestamps for '
+                                 'API tokens: %s',
+                                 e)
+
+
+_last_used_buffer = _TokenLastUsedBuffer()
+
 
 class WebAPITokenAuthBackend(WebAPIAuthBackend):
     """Authenticates users using their generated API token.
@@ -269,6 +452,22 @@ class WebAPITokenAuthBackend(WebAPIAuthBackend):
     token, and authenticate that user.
     """
 
+    #: The minimum number of seconds between writes of last-used timestamps.
+    #:
+    #: If set, the last-used timestamps for tokens will be coalesced and
+    #: written to the database in bulk at most once per interval, rather than
+    #: on every API request. Timestamps recorded since the last write will be
+    #: written when a token is next used after the interval has passed.
+    #:
+    #: If 0, the timestamp will be written on every request.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     int
+    last_used_update_interval: ClassVar[int] = 0
+
     def get_credentials(
         self,
         request: HttpRequest,
@@ -335,7 +534,13 @@ class WebAPITokenAuthBackend(WebAPIAuthBackend):
             delattr(user, '_webapi_token')
 
             webapi_token.last_used = timezone.now()
-            webapi_token.save_base(update_fields=('last_used',))
+            interval = self.last_used_update_interval
+
+            if interval > 0:
+                _last_used_buffer.add(webapi_token, webapi_token.last_used,
+                                      interval)
+            else:
+                webapi_token.save_base(update_fields=('last_used',))
 
             request.session['webapi_token_id'] = webapi_token.pk
             setattr(request, '_webapi_token', webapi_token)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import io
 import json
-from xml.sax.saxutils import XMLGenerator
+from collections.abc import Iterator
+from xml.sax.saxutils import XMLGenerator, escape as xml_escape, quoteattr
 
 from django.conf import settings
 from django.contrib.auth.models import User, Group
@@ -130,11 +131,23 @@ class XMLEncoderAdapter(object):
     """Adapts a WebAPIEncoder to output XML.
 
     This takes an existing encoder and adapts it to output a simple XML format.
+
+    By default, the resulting XML is indented. If ``compact=True`` is passed,
+    elements will be written without any whitespace between them, using a
+    faster writer. The documents are otherwise the same.
+
+    Version Changed:
+        7.0:
+        Added the ``compact`` argument and :py:meth:`iterencode`.
     """
-    def __init__(self, encoder, *args, **kwargs):
+    def __init__(self, encoder, *args, compact=False, **kwargs):
         self.encoder = encoder
+        self.compact = compact
 
     def encode(self, o, *args, **kwargs):
+        if self.compact:
+            return ''.join(self.iterencode(o, *args, **kwargs))
+
         self.level = 0
         self.doIndent = False
 
@@ -191,6 +204,143 @@ class XMLEncoderAdapter(object):
 
             return self.__encode(result, *args, **kwargs)
 
+    def iterencode(self, o, *args, **kwargs):
+        """Encode an object as compact XML, in chunks.
+
+        Each top-level value in a dictionary is yielded as its own chunk,
+        with lists yielded one item at a time. Lists and iterators at the
+        top level will be consumed as they're encoded.
+
+        Version Added:
+            7.0
+
+        Args:
+            o (object):
+                The object to encode.
+
+            *args (tuple):
+                Positional arguments to pass to the encoder.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the encoder.
+
+        Yields:
+            str:
+            Each chunk of encoded XML.
+        """
+        buf = []
+        write = buf.append
+        write_compact = self._write_compact
+
+        write('<?xml version="1.0" encoding="%s"?>\n<rsp>'
+              % settings.DEFAULT_CHARSET)
+
+        if isinstance(o, dict):
+            for key, value in o.items():
+                start_tag, end_tag = self._get_compact_tags(key)
+                write(start_tag)
+
+                if isinstance(value, (tuple, list, Iterator)):
+                    write('<array>')
+
+                    for item in value:
+                        write('<item>')
+                        write_compact(item, write, args, kwargs)
+                        write('</item>')
+
+                        yield ''.join(buf)
+                        buf.clear()
+
+                    write('</array>')
+                else:
+                    write_compact(value, write, args, kwargs)
+
+                write(end_tag)
+
+                yield ''.join(buf)
+                buf.clear()
+        else:
+            write_compact(o, write, args, kwargs)
+
+        write('</rsp>')
+
+        yield ''.join(buf)
+
+    def _write_compact(self, o, write, args, kwargs):
+        """Write an object as compact XML.
+
+        This produces the same elements as :py:meth:`encode`, without any
+        indentation.
+
+        Version Added:
+            7.0
+
+        Args:
+            o (object):
+                The object to encode.
+
+            write (callable):
+                The function used to write each piece of XML.
+
+            args (tuple):
+                Positional arguments to pass to the encoder.
+
+            kwargs (dict):
+                Keyword arguments to pass to the encoder.
+
+        Raises:
+            TypeError:
+                The object could not be encoded.
+        """
+        if isinstance(o, dict):
+            for key, value in o.items():
+                start_tag, end_tag = self._get_compact_tags(key)
+                write(start_tag)
+                self._write_compact(value, write, args, kwargs)
+                write(end_tag)
+        elif isinstance(o, (tuple, list)):
+            write('<array>')
+
+            for i in o:
+                write('<item>')
+                self._write_compact(i, write, args, kwargs)
+                write('</item>')
+
+            write('</array>')
+        elif isinstance(o, str):
+            write(xml_escape(o))
+        elif isinstance(o, int):
+            # Note that this also covers bool values.
+            write('%d' % o)
+        elif isinstance(o, float):
+            write('%s' % o)
+        elif o is not None:
+            result = self.encoder.encode(o, *args, **kwargs)
+
+            if result is None:
+                raise TypeError("%r is not XML serializable" % (o,))
+
+            self._write_compact(result, write, args, kwargs)
+
+    def _get_compact_tags(self, key):
+        """Return the start and end tags for a dictionary key.
+
+        Version Added:
+            7.0
+
+        Args:
+            key (object):
+                The dictionary key.
+
+        Returns:
+            tuple:
+            A 2-tuple of the start and end tags.
+        """
+        if isinstance(key, int):
+            return ('<int value=%s>' % quoteattr(str(key)), '</int>')
+
+        return ('<%s>' % key, '</%s>' % key)
+
     def startElement(self, name, attrs={}):
         self.addIndent()
         self.xml.startElement(name, attrs)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 
+from django.core.cache import cache
 from django.db import IntegrityError
 from django.db.models import Manager, Q
 from django.utils import timezone
@@ -179,6 +180,9 @@ class WebAPITokenManager(Manager):
                           invalid_reason=''):
         """Invalidate a set of tokens.
 
+        Any of the tokens cached for authentication will be removed from the
+        cache.
+
         Version Added:
             3.0
 
@@ -205,9 +209,19 @@ class WebAPITokenManager(Manager):
         if extra_query:
             q &= extra_query
 
-        self.filter(q).update(valid=False,
-                              invalid_reason=invalid_reason,
-                              invalid_date=timezone.now())
+        queryset = self.filter(q)
+        tokens = list(queryset.values_list('token', flat=True))
+
+        queryset.update(valid=False,
+                        invalid_reason=invalid_reason,
+                        invalid_date=timezone.now())
+
+        # Make sure these tokens are no longer cached for authentication.
+        if tokens:
+            cache.delete_many([
+                self.model.get_token_cache_key(token)
+                for token in tokens
+            ])
 
     def invalidate_token(self, token, invalid_reason=''):
         """Invalidate the given token.
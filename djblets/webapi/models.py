@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import class_prepared, post_delete
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from djblets.cache.backend import make_cache_key
 from djblets.db.fields import JSONField, ModificationTimestampField
 from djblets.secrets.token_generators import token_generator_registry
 from djblets.webapi.managers import WebAPITokenManager
@@ -126,7 +131,12 @@ class BaseWebAPIToken(models.Model):
 
         If the token is being updated, the
         :py:data:`~djblets.webapi.signals.webapi_token_updated` signal will be
-        emitted.
+        emitted, and any copy of the token cached for authentication will be
+        removed.
+
+        Version Changed:
+            7.0:
+            Added removal of the token from the authentication cache.
 
         Args:
             *args (tuple):
@@ -140,8 +150,40 @@ class BaseWebAPIToken(models.Model):
         super().save(*args, **kwargs)
 
         if not is_new:
+            update_fields = kwargs.get('update_fields')
+
+            # Recording the last-used time doesn't affect authentication.
+            if update_fields is None or set(update_fields) != {'last_used'}:
+                cache.delete(self.get_token_cache_key(self.token))
+
             webapi_token_updated.send(instance=self, sender=type(self))
 
+    @classmethod
+    def get_token_cache_key(
+        cls,
+        token: str,
+    ) -> str:
+        """Return the cache key for a token cached for authentication.
+
+        The token itself is hashed, so that it doesn't appear in the key.
+
+        Version Added:
+            7.0
+
+        Args:
+            token (str):
+                The token value.
+
+        Returns:
+            str:
+            The cache key for the token.
+        """
+        return make_cache_key([
+            'webapi-token',
+            cls._meta.label,
+            hashlib.sha256(token.encode('utf-8')).hexdigest(),
+        ])
+
     @classmethod
     def get_root_resource(cls):
         raise NotImplementedError
@@ -254,3 +296,53 @@ class BaseWebAPIToken(models.Model):
         abstract = True
         verbose_name = _('Web API token')
         verbose_name_plural = _('Web API tokens')
+
+
+def _on_webapi_token_deleted(
+    instance: (models.Model | None) = None,
+    **kwargs,
+) -> None:
+    """Remove a deleted token from the authentication cache.
+
+    Version Added:
+        7.0
+
+    Args:
+        instance (django.db.models.Model, optional):
+            The instance that was deleted.
+
+        **kwargs (dict):
+            Additional keyword arguments passed to the signal.
+    """
+    if isinstance(instance, BaseWebAPIToken):
+        cache.delete(instance.get_token_cache_key(instance.token))
+
+
+def _on_class_prepared(
+    sender: type[models.Model],
+    **kwargs,
+) -> None:
+    """Listen for deletions of a newly-prepared API token model.
+
+    Only concrete subclasses of :py:class:`BaseWebAPIToken` are listened to,
+    so that deleting other models doesn't involve the token cache.
+
+    Version Added:
+        7.0
+
+    Args:
+        sender (type):
+            The model class that was prepared.
+
+        **kwargs (dict):
+            Additional keyword arguments passed to the signal.
+    """
+    if issubclass(sender, BaseWebAPIToken) and not sender._meta.abstract:
+        post_delete.connect(
+            _on_webapi_token_deleted,
+            sender=sender,
+            dispatch_uid=f'djblets-webapi-token-deleted:{sender._meta.label}')
+
+
+class_prepared.connect(_on_class_prepared,
+                       dispatch_uid='djblets-webapi-token-class-prepared')
@@ -4,25 +4,37 @@ from __future__ import annotations
 
 import inspect
 import logging
+import pickle
+import re
+import uuid
+from dataclasses import dataclass, field as dataclass_field
+from enum import Enum
 from typing import TYPE_CHECKING, TypedDict, cast
+from urllib.parse import quote
 
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
 from django.db import models
+from django.db.models import Count, Max
 from django.db.models.fields.related_descriptors import (
-    ManyToManyDescriptor,
-    ForwardManyToOneDescriptor)
-from django.db.models.query import QuerySet
+    ForwardManyToOneDescriptor,
+    ReverseManyToOneDescriptor)
+from django.db.models.query import Prefetch, QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.http.response import (HttpResponseNotAllowed,
                                   HttpResponse,
                                   HttpResponseBase,
                                   HttpResponseNotModified)
-from django.urls import include, path, re_path, reverse
+from django.urls import (get_resolver, get_script_prefix, get_urlconf,
+                         include, path, re_path, reverse)
 from django.utils.functional import cached_property
+from django.utils.http import RFC3986_SUBDELIMS, escape_leading_slashes
 from django.views.decorators.vary import vary_on_headers
 
 from djblets.auth.ratelimit import (RATE_LIMIT_API_ANONYMOUS,
                                     RATE_LIMIT_API_AUTHENTICATED,
                                     get_usage_count)
+from djblets.cache.backend import make_cache_key
 from djblets.util.http import (build_not_modified_from_response,
                                encode_etag,
                                etag_if_none_match,
@@ -33,6 +45,7 @@ from djblets.util.http import (build_not_modified_from_response,
 from djblets.webapi.auth.backends import check_login
 from djblets.webapi.resources.registry import (get_resource_for_object,
                                                _class_to_resources,
+                                               _model_to_resources,
                                                _name_to_resources)
 from djblets.webapi.responses import (WebAPIResponse,
                                       WebAPIResponseError,
@@ -47,7 +60,9 @@ from djblets.webapi.errors import (DOES_NOT_EXIST,
                                    PERMISSION_DENIED,
                                    RATE_LIMIT_EXCEEDED,
                                    WebAPIError)
-from djblets.webapi.fields import IntFieldType
+from djblets.webapi.fields import (IntFieldType,
+                                   ResourceFieldType,
+                                   ResourceListFieldType)
 from djblets.webapi.responses import (WebAPIEventStream,
                                       WebAPIResponseEventStream,
                                       WebAPIResponseHeaders,
@@ -256,6 +271,163 @@ class AllowedMimetypeEntry(TypedDict):
     list: NotRequired[str | None]
 
 
+@dataclass
+class WebAPIPrefetchPlan:
+    """A plan for fetching related objects when querying for a resource.
+
+    This is built by :py:meth:`WebAPIResource.get_prefetch_plan` based on
+    the resource's fields and the fields requested and expanded by the
+    client, and applied to querysets before they're evaluated.
+
+    Version Added:
+        7.0
+    """
+
+    #: Related fields to fetch using :py:meth:`QuerySet.select_related()
+    #: <django.db.models.query.QuerySet.select_related>`.
+    select_related: list[str] = dataclass_field(default_factory=list)
+
+    #: Related fields to fetch using :py:meth:`QuerySet.prefetch_related()
+    #: <django.db.models.query.QuerySet.prefetch_related>`.
+    prefetch_related: list[str | Prefetch] = \
+        dataclass_field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return whether the plan contains anything to fetch.
+
+        Returns:
+            bool:
+            ``True`` if there are related objects to fetch.
+        """
+        return bool(self.select_related or self.prefetch_related)
+
+    def apply(
+        self,
+        queryset: QuerySet,
+    ) -> QuerySet:
+        """Apply the plan to a queryset.
+
+        Args:
+            queryset (django.db.models.query.QuerySet):
+                The queryset to apply the plan to.
+
+        Returns:
+            django.db.models.query.QuerySet:
+            The resulting queryset.
+        """
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+
+        return queryset
+
+    def add_nested(
+        self,
+        field_name: str,
+        plan: WebAPIPrefetchPlan,
+    ) -> None:
+        """Add the contents of a plan for a field fetched with select_related.
+
+        Each entry in the nested plan will be prefixed by the field name.
+
+        Args:
+            field_name (str):
+                The name of the field the nested plan applies to.
+
+            plan (WebAPIPrefetchPlan):
+                The nested plan.
+        """
+        self.select_related += [
+            f'{field_name}__{lookup}'
+            for lookup in plan.select_related
+        ]
+
+        for lookup in plan.prefetch_related:
+            if isinstance(lookup, Prefetch):
+                lookup.add_prefix(field_name)
+            else:
+                lookup = f'{field_name}__{lookup}'
+
+            self.prefetch_related.append(lookup)
+
+    def remove_fields(
+        self,
+        field_names: set[str],
+    ) -> None:
+        """Remove any lookups that traverse the given fields.
+
+        Args:
+            field_names (set of str):
+                The names of the top-level fields to remove.
+        """
+        self.select_related = [
+            lookup
+            for lookup in self.select_related
+            if lookup.split('__', 1)[0] not in field_names
+        ]
+        self.prefetch_related = [
+            lookup
+            for lookup in self.prefetch_related
+            if (lookup.prefetch_through
+                if isinstance(lookup, Prefetch)
+                else lookup).split('__', 1)[0] not in field_names
+        ]
+
+
+class WebAPIListVersionStrategy(Enum):
+    """Strategies for computing the version of a list resource.
+
+    The version of a list is used to build ETags and Last-Modified headers
+    for list responses, allowing :py:meth:`WebAPIResource.get_list` to
+    return :http:`304` before any objects are fetched.
+
+    Version Added:
+        7.0
+    """
+
+    #: Compute the version from an aggregate query on the list.
+    #:
+    #: This queries for the latest timestamp in
+    #: :py:attr:`WebAPIResource.list_last_modified_field` and the number of
+    #: objects in the list, in a single query.
+    AGGREGATE = 'aggregate'
+
+    #: Compute the version from a generation stored in the cache.
+    #:
+    #: The generation is changed whenever an object of the resource's model
+    #: is saved or deleted, or its many-to-many relations change. This
+    #: avoids any database queries, but changes to any object will
+    #: invalidate all lists for the resource.
+    GENERATION = 'generation'
+
+
+@dataclass(frozen=True)
+class _CompiledURLCandidate:
+    """A precompiled candidate for building a resource URL.
+
+    This contains the state from Django's URL resolver needed to build
+    a URL for a URL name and set of keyword arguments, without having to
+    look it up for every call to :py:func:`~django.urls.reverse`.
+
+    Version Added:
+        7.0
+    """
+
+    #: The format string for the URL, including the script prefix.
+    url_format: str
+
+    #: The compiled regex used to validate a built URL.
+    regex: re.Pattern[str]
+
+    #: Default values for the URL pattern that are not captured in the URL.
+    defaults: Mapping[str, Any]
+
+    #: Path converters for the URL pattern.
+    converters: Mapping[str, Any]
+
+
 class WebAPIResource(object):
     """A resource handling HTTP operations for part of the API.
 
@@ -294,6 +466,79 @@ class WebAPIResource(object):
         WebAPIResourceFieldInfo | Mapping[str, Any]
     ]] = {}
 
+    #: A mapping of field names to the model columns needed to serialize them.
+    #:
+    #: If set, HTTP GET requests for this resource using ``?only-fields=``
+    #: will only load the model columns needed for the requested fields
+    #: (along with any linked fields and :py:attr:`required_model_columns`),
+    #: using :py:meth:`QuerySet.only()
+    #: <django.db.models.query.QuerySet.only>`.
+    #:
+    #: Fields that map directly to a model field don't need to be listed.
+    #: Fields with a :samp:`serialize_<fieldname>_field` method or that are
+    #: computed from other attributes must list the model fields they
+    #: depend on. If a needed field isn't listed, all columns will be loaded.
+    #:
+    #: If ``None`` (the default), all columns will always be loaded.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     dict
+    field_model_columns: ClassVar[Mapping[str, Sequence[str]] | None] = None
+
+    #: Model columns that must always be loaded for this resource.
+    #:
+    #: This is used along with :py:attr:`field_model_columns`, and should list
+    #: any model fields needed for access checks, ETags, or links. The
+    #: primary key and any fields named by :py:attr:`model_object_key`,
+    #: :py:attr:`model_parent_key`, :py:attr:`last_modified_field`, and
+    #: :py:attr:`etag_field` are always loaded.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     list of str
+    required_model_columns: ClassVar[Sequence[str]] = []
+
+    #: Whether to cache serialized object payloads across requests.
+    #:
+    #: If set, payloads generated by :py:meth:`serialize_object` for
+    #: instances of :py:attr:`model` will be stored in the cache, keyed off
+    #: the object, its :py:meth:`get_etag` and :py:meth:`get_last_modified`
+    #: values, the requesting user's visibility (see
+    #: :py:meth:`get_serialized_object_cache_visibility`), and the request
+    #: options affecting the payload. Cached payloads are invalidated when
+    #: the object is saved or deleted, or its many-to-many relations change.
+    #:
+    #: Objects without an ETag or last-modified timestamp, and payloads
+    #: containing expanded objects, won't be cached.
+    #:
+    #: When serializing lists, cached payloads for all objects are fetched
+    #: and stored in batches.
+    #:
+    #: This should only be enabled for resources whose payloads don't
+    #: depend on state beyond the object, its ETag or last-modified
+    #: timestamp, and the user's visibility.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     bool
+    serialized_object_cache_enabled: ClassVar[bool] = False
+
+    #: The expiration time for cached serialized payloads, in seconds.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     int
+    serialized_object_cache_expiration: ClassVar[int] = 60 * 60
+
     #: A regex for mapping keys for an object in an item resource.
     #:
     #: By default, this matches integers. Subclasses can override this to
@@ -341,6 +586,50 @@ class WebAPIResource(object):
     #:     str
     etag_field: ClassVar[str | None] = None
 
+    #: The strategy used to compute a version for list resources.
+    #:
+    #: If set, :py:meth:`get_list` will use the version to set ETag and
+    #: Last-Modified headers on list responses, and will return
+    #: :http:`304` if the client's copy is current, without fetching or
+    #: serializing any objects. See :py:meth:`get_list_version`.
+    #:
+    #: This should only be set for resources whose list payloads don't
+    #: depend on state beyond the objects in the list and the user's
+    #: visibility class (see :py:meth:`get_list_version_visibility`).
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     WebAPIListVersionStrategy
+    list_version_strategy: ClassVar[WebAPIListVersionStrategy | None] = None
+
+    #: The field to aggregate for the Last-Modified header of a list.
+    #:
+    #: This is used by :py:attr:`WebAPIListVersionStrategy.AGGREGATE`. If
+    #: not set, :py:attr:`last_modified_field` will be used. If neither is
+    #: set, no version will be computed.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     str
+    list_last_modified_field: ClassVar[str | None] = None
+
+    #: The expiration time for list generations, in seconds.
+    #:
+    #: This is used by :py:attr:`WebAPIListVersionStrategy.GENERATION`.
+    #: When a generation expires, a new one will be created, and clients
+    #: will receive a full response on their next request.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     int
+    list_version_generation_expiration: ClassVar[int] = 24 * 60 * 60
+
     #: Whether to auto-generate ETags for responses.
     #:
     #: If set, and an ETag is not otherwise provided, one will be generated
@@ -350,6 +639,24 @@ class WebAPIResource(object):
     #:     bool
     autogenerate_etags: ClassVar[bool] = False
 
+    #: Whether to stream list responses to the client.
+    #:
+    #: If set, list responses from :py:meth:`get_list` will serialize and
+    #: encode results as they're sent to the client, rather than building
+    #: the entire payload up-front. XML payloads will be sent without
+    #: indentation. See
+    #: :py:class:`~djblets.webapi.responses.WebAPIResponsePaginated`.
+    #:
+    #: This has no effect when :py:attr:`autogenerate_etags` is set, since
+    #: the ETag requires the full payload.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     bool
+    stream_list_responses: ClassVar[bool] = False
+
     #: Whether the resource is a singleton.
     #:
     #: Singleton resources behave like an item resource without a parent list
@@ -462,10 +769,53 @@ class WebAPIResource(object):
     #:     WebAPIResource
     _parent_resource: (WebAPIResource | None) = None
 
+    #: A cached set of fields that may be serialized as links.
+    #:
+    #: This is automatically computed in :py:meth:`_get_link_fields` once
+    #: for the lifetime of the resource instance.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     set of str
+    _link_fields: set[str]
+
+    #: Cached link information shared by all serialized objects.
+    #:
+    #: This maps a key for a list of child resources to a tuple of
+    #: ``(link_name, method, href_suffix)`` tuples. It's populated by
+    #: :py:meth:`_get_link_specs` for the lifetime of the resource instance.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     dict
+    _link_specs: dict[tuple[Any, ...],
+                      tuple[tuple[str, str, str], ...]]
+
+    #: Precompiled URL candidates for building resource URLs.
+    #:
+    #: This is a tuple of the URL resolver's reverse mapping that the
+    #: candidates were compiled from and a dictionary mapping keys for
+    #: each script prefix, URL name, and set of keyword arguments to
+    #: compiled candidates. It's reset whenever the URL patterns change.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     tuple
+    _compiled_urls: (tuple[Any,
+                           dict[tuple[str, str, frozenset[str]],
+                                tuple[_CompiledURLCandidate, ...]]] |
+                     None) = None
+
     #: A cached list of fields to pre-fetch when querying resources.
     #:
-    #: This is automatically computed in :py:meth:`_get_queryset` once for
-    #: the lifetime of the resource instance.
+    #: This is automatically computed in :py:meth:`_get_related_fields` once
+    #: for the lifetime of the resource instance.
     #:
     #: Type:
     #:     list of str
@@ -473,8 +823,8 @@ class WebAPIResource(object):
 
     #: A cached list of fields to select when querying resources.
     #:
-    #: This is automatically computed in :py:meth:`_get_queryset` once for
-    #: the lifetime of the resource instance.
+    #: This is automatically computed in :py:meth:`_get_related_fields` once
+    #: for the lifetime of the resource instance.
     #:
     #: Type:
     #:     list of str
@@ -520,6 +870,44 @@ class WebAPIResource(object):
                         vend_mimetype_pair,
                     ]
 
+        model = self.model
+
+        if self.serialized_object_cache_enabled and model is not None:
+            # Listen for changes to objects, so that cached payloads can be
+            # invalidated.
+            dispatch_uid = f'djblets-webapi-serialized:{id(self)}'
+
+            post_save.connect(self._on_serialized_object_changed,
+                              sender=model,
+                              dispatch_uid=dispatch_uid)
+            post_delete.connect(self._on_serialized_object_changed,
+                                sender=model,
+                                dispatch_uid=dispatch_uid)
+
+            for m2m_field in model._meta.many_to_many:
+                m2m_changed.connect(self._on_serialized_object_m2m_changed,
+                                    sender=m2m_field.remote_field.through,
+                                    dispatch_uid=dispatch_uid)
+
+        if (self.list_version_strategy is
+                WebAPIListVersionStrategy.GENERATION and
+            model is not None):
+            # Listen for changes to objects, so that the list generation
+            # can be changed.
+            dispatch_uid = f'djblets-webapi-list-gen:{id(self)}'
+
+            post_save.connect(self._on_list_changed,
+                              sender=model,
+                              dispatch_uid=dispatch_uid)
+            post_delete.connect(self._on_list_changed,
+                                sender=model,
+                                dispatch_uid=dispatch_uid)
+
+            for m2m_field in model._meta.many_to_many:
+                m2m_changed.connect(self._on_list_changed,
+                                    sender=m2m_field.remote_field.through,
+                                    dispatch_uid=dispatch_uid)
+
     @vary_on_headers('Accept', 'Cookie')
     def __call__(
         self,
@@ -625,6 +1013,7 @@ class WebAPIResource(object):
 
         setattr(request, '_djblets_webapi_method', method)
         setattr(request, '_djblets_webapi_kwargs', kwargs)
+        setattr(request, '_djblets_webapi_resource', self)
         setattr(request, 'PUT', request.POST)
 
         view: (Callable | None) = None
@@ -1281,6 +1670,12 @@ class WebAPIResource(object):
 
         This may need to be overridden if needing more complex logic.
 
+        Version Changed:
+            7.0:
+            If :py:attr:`list_version_strategy` is set, this will set ETag
+            and Last-Modified headers for the list, and return :http:`304`
+            before any objects are fetched if the client's copy is current.
+
         Args:
             request (django.http.HttpRequest):
                 The HTTP request from the client.
@@ -1331,13 +1726,35 @@ class WebAPIResource(object):
                                                         *args,
                                                         **kwargs)
 
-            return self.paginated_cls(
-                request,
-                queryset=queryset,
-                results_key=self.list_result_key,
-                serialize_object_list_func=_serialize_obj_list,
-                extra_data=data,
-                **self.build_response_args(request))
+            last_modified, etag = self.get_list_version(request, queryset,
+                                                        *args, **kwargs)
+            response: HttpResponse
+
+            if (etag is not None and
+                self.are_cache_headers_current(request, etag=etag)):
+                response = HttpResponseNotModified()
+            else:
+                response_args = self.build_response_args(request)
+
+                if (self.stream_list_responses and
+                    not self.autogenerate_etags):
+                    response_args['stream'] = True
+
+                response = self.paginated_cls(
+                    request,
+                    queryset=queryset,
+                    results_key=self.list_result_key,
+                    serialize_object_list_func=_serialize_obj_list,
+                    extra_data=data,
+                    **response_args)
+
+            if last_modified:
+                set_last_modified(response, last_modified)
+
+            if etag:
+                set_etag(response, etag)
+
+            return response
         else:
             return 200, data
 
@@ -1508,6 +1925,252 @@ class WebAPIResource(object):
 
         return model.objects.all()
 
+    def get_prefetch_plan(
+        self,
+        request: HttpRequest | None,
+        *,
+        is_list: bool = False,
+        expanded_resources: (set[str] | None) = None,
+    ) -> WebAPIPrefetchPlan:
+        """Return a plan for fetching related objects for this resource.
+
+        The plan is built from :py:attr:`fields`, along with any fields or
+        child resources the client has asked to expand through ``?expand=``
+        and any fields limited through ``?only-fields=``. This allows a page
+        of results to be serialized with a constant number of queries.
+
+        The plan covers:
+
+        * Foreign keys, which are fetched using
+          :py:meth:`~django.db.models.query.QuerySet.select_related`.
+
+        * Many-to-many relations and reverse foreign keys, which are
+          prefetched for lists and skipped if excluded by ``only-fields``.
+
+        * Related objects being expanded, which are fetched along with their
+          own related objects, based on the plan for the resource
+          registered for their model.
+
+        * Expanded child resources, if they provide a queryset through
+          :py:meth:`get_parent_prefetch_queryset`.
+
+        Fields with a custom :samp:`serialize_{field}_field` method are not
+        included.
+
+        Subclasses can override this to add to or change the plan.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            is_list (bool, optional):
+                Whether the plan is for a list resource.
+
+            expanded_resources (set of str, optional):
+                The resources being expanded at this level.
+
+                If not provided, this will be computed from the request.
+
+        Returns:
+            WebAPIPrefetchPlan:
+            The plan for fetching related objects.
+        """
+        plan = WebAPIPrefetchPlan()
+        model = self.model
+
+        if model is None:
+            return plan
+
+        if expanded_resources is None:
+            expanded_resources = self._get_requested_expanded_resources(
+                request)
+
+        only_fields = self.get_only_fields(request)
+        child_expanded_resources = \
+            self._get_child_expanded_resources(expanded_resources)
+        select_related_fields, prefetch_related_fields = \
+            self._get_related_fields()
+
+        for field in select_related_fields:
+            plan.select_related.append(field)
+
+            if (field in expanded_resources and
+                (only_fields is None or field in only_fields)):
+                nested_plan = self._get_related_prefetch_plan(
+                    request,
+                    field=field,
+                    expanded_resources=child_expanded_resources)
+
+                if nested_plan:
+                    plan.add_nested(field, nested_plan)
+
+        for field in prefetch_related_fields:
+            if only_fields is not None and field not in only_fields:
+                # The field won't be serialized at all.
+                continue
+
+            lookup: str | Prefetch = field
+
+            if field in expanded_resources:
+                nested_plan = self._get_related_prefetch_plan(
+                    request,
+                    field=field,
+                    expanded_resources=child_expanded_resources)
+
+                if nested_plan:
+                    related_model = model._meta.get_field(field).related_model
+                    assert related_model is not None
+
+                    lookup = Prefetch(
+                        field,
+                        queryset=nested_plan.apply(
+                            related_model._default_manager.all()))
+
+            if is_list or isinstance(lookup, Prefetch):
+                plan.prefetch_related.append(lookup)
+
+        if (expanded_resources and
+            self.uri_object_key and
+            self.model_object_key):
+            for child_resource in self.item_child_resources:
+                if (child_resource.model is None or
+                    not expanded_resources.intersection(
+                        (child_resource.name, child_resource.name_plural))):
+                    continue
+
+                if (only_fields is not None and
+                    child_resource.name not in only_fields and
+                    child_resource.name_plural not in only_fields):
+                    continue
+
+                prefetch = child_resource._get_parent_prefetch(
+                    request,
+                    parent_resource=self,
+                    expanded_resources=child_expanded_resources)
+
+                if prefetch is not None:
+                    plan.prefetch_related.append(prefetch)
+
+        return plan
+
+    def get_parent_prefetch_queryset(
+        self,
+        request: HttpRequest | None,
+        *,
+        parent_resource: WebAPIResource,
+    ) -> QuerySet | None:
+        """Return a queryset for prefetching objects for a list of parents.
+
+        When this resource is expanded in a list of parent objects (through
+        ``?expand=``), objects are normally queried once per parent using
+        :py:meth:`get_queryset`. If this returns a queryset, the objects
+        for all parents will instead be prefetched along with the parents,
+        using the foreign key named by :py:attr:`model_parent_key`.
+
+        The queryset must not filter on any particular parent, but must
+        apply any other filtering (such as access checks) performed by
+        :py:meth:`get_queryset`.
+
+        By default, this returns ``None``, disabling prefetching.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            parent_resource (WebAPIResource):
+                The parent resource being serialized.
+
+        Returns:
+            django.db.models.query.QuerySet:
+            The queryset for the objects, or ``None`` to disable
+            prefetching.
+        """
+        return None
+
+    def get_model_columns(
+        self,
+        request: HttpRequest | None,
+    ) -> set[str] | None:
+        """Return the model columns to load when serializing objects.
+
+        This is based on the fields requested through ``?only-fields=`` and
+        the links requested through ``?only-links=``. Only the columns needed
+        for the requested fields and any linked fields will be returned,
+        along with the columns that are always needed by the resource (see
+        :py:attr:`required_model_columns`).
+
+        This requires :py:attr:`field_model_columns` to be set.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+        Returns:
+            set of str:
+            The names of the model fields to load, or ``None`` if all
+            columns should be loaded.
+        """
+        field_model_columns = self.field_model_columns
+
+        if self.model is None or field_model_columns is None:
+            return None
+
+        only_fields = self.get_only_fields(request)
+
+        if only_fields is None:
+            return None
+
+        only_links = self.get_only_links(request)
+        link_fields = self._get_link_fields()
+        required_columns: list[str] = [
+            'pk',
+            *self.required_model_columns,
+        ]
+
+        for key in (self.model_object_key,
+                    self.model_parent_key,
+                    self.last_modified_field,
+                    self.etag_field):
+            if key:
+                required_columns.append(key.split('__', 1)[0])
+
+        for field in self.fields.keys():
+            if field not in only_fields:
+                if (field not in link_fields or
+                    (only_links is not None and field not in only_links)):
+                    # This field won't be serialized or linked.
+                    continue
+
+            if field in field_model_columns:
+                required_columns += field_model_columns[field]
+            elif hasattr(self, f'serialize_{field}_field'):
+                # We don't know what this field depends on, so we'll need
+                # to load everything.
+                return None
+            else:
+                required_columns.append(field)
+
+        columns: set[str] = set()
+
+        for column in required_columns:
+            model_column = self._get_model_column(column)
+
+            if model_column is None:
+                return None
+            elif model_column:
+                columns.add(model_column)
+
+        return columns
+
     def get_url_patterns(self) -> Sequence[URLPattern | URLResolver]:
         """Return the Django URL patterns for this object and its children.
 
@@ -1848,7 +2511,8 @@ class WebAPIResource(object):
         """
         requested_mimetype: (str | None) = None
         expanded_resources: set[str] = set()
-        serialize_cache: dict[str, WebAPIResponsePayload] = {}
+        serialize_cache: dict[Any, WebAPIResponsePayload | bytes] = {}
+        serialized_cache_entry: (tuple[str, str] | None) = None
 
         if request:
             try:
@@ -1860,22 +2524,31 @@ class WebAPIResource(object):
                         serialize_cache)
 
             if obj in serialize_cache:
-                return self._clone_serialized_object(serialize_cache[obj])
+                cached_data = serialize_cache[obj]
 
-            try:
-                # We're nested at least one level down. We'll be operating off
-                # of a possible subset of any specified expanded resources.
-                # Fields that were handled by a parent resource won't be
-                # handled here.
-                expanded_resources = \
-                    getattr(request, '_djblets_webapi_expanded_resources')
-            except AttributeError:
-                expanded_resources = set(
-                    request.GET.get('expand', request.POST.get('expand', ''))
-                    .split(',')
-                )
-                setattr(request, '_djblets_webapi_expanded_resources',
-                        expanded_resources)
+                if isinstance(cached_data, bytes):
+                    # This is a pickled payload from the serialized object
+                    # cache. Unpickling it is cheaper than cloning.
+                    return pickle.loads(cached_data)
+
+                return self._clone_serialized_object(cached_data)
+
+            # If we're nested at least one level down, we'll be operating off
+            # of a possible subset of any specified expanded resources.
+            # Fields that were handled by a parent resource won't be handled
+            # here.
+            expanded_resources = self._get_expanded_resources(request)
+
+            if self.serialized_object_cache_enabled:
+                # Check for a payload cached by a previous request.
+                serialized_cache_entry, pickled_data = \
+                    self._get_serialized_object_cache_entry(
+                        obj, request, expanded_resources, *args, **kwargs)
+
+                if pickled_data is not None:
+                    serialize_cache[obj] = pickled_data
+
+                    return pickle.loads(pickled_data)
 
             if expanded_resources:
                 # We'll set and work off a copy of the existing expanded
@@ -1945,7 +2618,10 @@ class WebAPIResource(object):
             # If we're limiting fields and this one isn't explicitly included,
             # then we're only going to want to process it if there's a chance
             # it'll be linked (as opposed to being expanded).
-            if not can_include_field and expand_field:
+            if (not can_include_field and
+                (expand_field or
+                 field not in self._get_link_fields() or
+                 (only_links is not None and field not in only_links))):
                 continue
 
             value: Any
@@ -2058,16 +2734,26 @@ class WebAPIResource(object):
                 if resource is None:
                     break
 
-                extra_kwargs = main_extra_kwargs.copy()
-                extra_kwargs.update(self.get_href_parent_ids(obj, **kwargs))
+                try:
+                    # Use the objects prefetched along with the list of
+                    # parents, if available.
+                    child_objs = getattr(
+                        obj, resource._get_parent_prefetch_attr())
+                except AttributeError:
+                    extra_kwargs = main_extra_kwargs.copy()
+                    extra_kwargs.update(self.get_href_parent_ids(obj,
+                                                                 **kwargs))
+
+                    child_objs = resource._get_queryset(request,
+                                                        is_list=True,
+                                                        *args,
+                                                        **extra_kwargs)
 
                 data[resource_name] = [
                     resource.serialize_object(o,
                                               request=request,
                                               *args, **kwargs)
-                    for o in resource._get_queryset(request,
-                                                    is_list=True,
-                                                    *args, **extra_kwargs)
+                    for o in child_objs
                 ]
 
                 assert requested_mimetype
@@ -2104,7 +2790,19 @@ class WebAPIResource(object):
 
             # Store the generated data in the object cache, in case we need
             # it again during this request/response cycle.
-            serialize_cache[obj] = self._clone_serialized_object(data)
+            if serialized_cache_entry is not None and not expand_info:
+                # Expanded objects may change independently of this object,
+                # so only payloads without them can be cached. The pickled
+                # payload is shared with the per-request cache.
+                pickled_data = self._store_serialized_object_cache_entry(
+                    request, serialized_cache_entry, data)
+            else:
+                pickled_data = None
+
+            if pickled_data is None:
+                serialize_cache[obj] = self._clone_serialized_object(data)
+            else:
+                serialize_cache[obj] = pickled_data
 
         return data
 
@@ -2144,10 +2842,50 @@ class WebAPIResource(object):
             dict:
             The serialized object payload.
         """
-        return [
-            self.serialize_object(obj, request=request, *args, **kwargs)
-            for obj in obj_list
-        ]
+        if request is None or not self.serialized_object_cache_enabled:
+            return [
+                self.serialize_object(obj, request=request, *args, **kwargs)
+                for obj in obj_list
+            ]
+
+        # Fetch any cached payloads for the whole list at once, and store
+        # new payloads at once when done.
+        obj_list = list(obj_list)
+        self._prefetch_serialized_object_cache_entries(obj_list, request,
+                                                       *args, **kwargs)
+
+        pending: (dict[str, tuple[str, bytes]] | None) = \
+            getattr(request, '_djblets_webapi_serialized_object_pending',
+                    None)
+
+        if pending is not None:
+            # We're nested in another list being serialized, which will store
+            # the payloads.
+            return [
+                self.serialize_object(obj, request=request, *args, **kwargs)
+                for obj in obj_list
+            ]
+
+        pending = {}
+        setattr(request, '_djblets_webapi_serialized_object_pending',
+                pending)
+
+        try:
+            return [
+                self.serialize_object(obj, request=request, *args, **kwargs)
+                for obj in obj_list
+            ]
+        finally:
+            delattr(request, '_djblets_webapi_serialized_object_pending')
+
+            if pending:
+                try:
+                    cache.set_many(pending,
+                                   self.serialized_object_cache_expiration)
+                except Exception as e:
+                    logger.exception('Unable to cache serialized payloads '
+                                     'for API resource %r: %s',
+                                     self.name, e)
 
     def get_only_fields(
         self,
@@ -2278,31 +3016,11 @@ class WebAPIResource(object):
         # base_href without any query arguments.
         clean_base_href = base_href.rsplit('?', 1)[0]
 
-        allowed_methods = self.allowed_methods
-
-        if obj is not None:
-            if 'PUT' in allowed_methods:
-                links['update'] = {
-                    'method': 'PUT',
-                    'href': clean_base_href,
-                }
-
-            if 'DELETE' in allowed_methods:
-                links['delete'] = {
-                    'method': 'DELETE',
-                    'href': clean_base_href,
-                }
-        else:
-            if 'POST' in allowed_methods:
-                links['create'] = {
-                    'method': 'POST',
-                    'href': clean_base_href,
-                }
-
-        for resource in resources:
-            links[resource.link_name] = {
-                'method': 'GET',
-                'href': f'{clean_base_href}{resource.uri_name}/',
+        for link_name, method, href_suffix in \
+                self._get_link_specs(resources, is_item=obj is not None):
+            links[link_name] = {
+                'method': method,
+                'href': f'{clean_base_href}{href_suffix}',
             }
 
         related_links = self.get_related_links(obj, request, *args, **kwargs)
@@ -2451,6 +3169,11 @@ class WebAPIResource(object):
         This can be overridden by subclasses that have special requirements
         for URL resolution.
 
+        Version Changed:
+            7.0:
+            URLs are now built from patterns compiled once per script prefix,
+            falling back to :py:func:`~django.urls.reverse` when needed.
+
         Args:
             name (str):
                 The name of the resource.
@@ -2467,10 +3190,14 @@ class WebAPIResource(object):
             str:
             The resulting absolute URL to the resource.
         """
-        url = reverse(self._build_named_url(name), kwargs=kwargs)
+        url_name = self._build_named_url(name)
+        url = self._build_compiled_url(url_name, kwargs, request)
+
+        if url is None:
+            url = reverse(url_name, kwargs=kwargs)
 
         if request:
-            url = request.build_absolute_uri(url)
+            url = self._build_absolute_url(request, url)
 
         return url
 
@@ -2617,6 +3344,143 @@ class WebAPIResource(object):
 
         return None
 
+    def get_list_version(
+        self,
+        request: HttpRequest,
+        queryset: Any,
+        *args,
+        **kwargs,
+    ) -> tuple[datetime | None, str | None]:
+        """Return the version of a list of objects.
+
+        The version is made of a Last-Modified timestamp and an ETag for the
+        list, and is computed using :py:attr:`list_version_strategy` without
+        fetching any objects. The ETag covers the objects in the list, the
+        user's visibility class (see :py:meth:`get_list_version_visibility`),
+        and the request options affecting the payload. Users in different
+        visibility classes will never share an ETag for a list.
+
+        Only the ETag is used to determine if the client's copy is current,
+        since the latest timestamp in a list doesn't change when objects are
+        removed from it.
+
+        Subclasses can override this for more complex behavior. Any overridden
+        functions should make sure to pass the ETag through
+        :py:meth:`encode_etag` before returning a value.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            queryset (django.db.models.query.QuerySet):
+                The queryset for the list.
+
+            *args (tuple):
+                Additional positional arguments passed to the view.
+
+            **kwargs (dict):
+                Keyword arguments representing values captured from the URL.
+
+        Returns:
+            tuple:
+            A 2-tuple containing:
+
+            Tuple:
+                0 (datetime.datetime):
+                    The Last-Modified timestamp for the list, or ``None``.
+
+                1 (str):
+                    The encoded ETag for the list, or ``None`` if one could
+                    not be generated.
+        """
+        strategy = self.list_version_strategy
+        last_modified: (datetime | None) = None
+
+        if strategy is WebAPIListVersionStrategy.AGGREGATE:
+            if not isinstance(queryset, QuerySet):
+                # Only database queries can be aggregated.
+                return None, None
+
+            last_modified_field = (self.list_last_modified_field or
+                                   self.last_modified_field)
+
+            if not last_modified_field:
+                return None, None
+
+            result = queryset.order_by().aggregate(
+                count=Count('pk'),
+                last_modified=Max(last_modified_field))
+            last_modified = result['last_modified']
+            version = '%s:%s' % (
+                last_modified.isoformat() if last_modified else '',
+                result['count'])
+        elif (strategy is WebAPIListVersionStrategy.GENERATION and
+              self.model is not None):
+            gen_key = self._get_list_gen_key()
+            version = cache.get(gen_key)
+
+            if version is None:
+                version = uuid.uuid4().hex
+
+                if not cache.add(gen_key, version,
+                                 self.list_version_generation_expiration):
+                    # Another process set the generation first.
+                    version = cache.get(gen_key, version)
+        else:
+            return None, None
+
+        return last_modified, self.encode_etag(
+            request,
+            '%s:%s:%s:%s:%s' % (
+                version,
+                self.get_list_version_visibility(request, *args, **kwargs),
+                request.get_full_path(),
+                kwargs.get('api_format') or '',
+                request.META.get('HTTP_ACCEPT', '')))
+
+    def get_list_version_visibility(
+        self,
+        request: HttpRequest,
+        *args,
+        **kwargs,
+    ) -> str:
+        """Return the visibility class of a user for list versions.
+
+        This is used when :py:attr:`list_version_strategy` is set. Users with
+        the same visibility class will share ETags for a list, and may
+        receive :http:`304` responses for each other's copies of it.
+
+        By default, each authenticated user has their own visibility class,
+        and anonymous users share one. Subclasses whose lists only vary by
+        broader roles can override this to share versions between users.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            *args (tuple):
+                Additional positional arguments passed to the view.
+
+            **kwargs (dict):
+                Keyword arguments representing values captured from the URL.
+
+        Returns:
+            str:
+            An identifier for the visibility class.
+        """
+        user = getattr(request, 'user', None)
+
+        if user is None or not user.is_authenticated:
+            return 'anonymous'
+
+        return f'user:{user.pk}'
+
     def encode_etag(
         self,
         request: HttpRequest,
@@ -2687,6 +3551,43 @@ class WebAPIResource(object):
              etag_if_none_match(request, etag))
         )
 
+    def get_serialized_object_cache_visibility(
+        self,
+        request: HttpRequest,
+        obj: Any,
+    ) -> str:
+        """Return the visibility class of a user for cached payloads.
+
+        This is used when :py:attr:`serialized_object_cache_enabled` is set.
+        Users with the same visibility class will share cached payloads for
+        an object.
+
+        By default, each authenticated user has their own visibility class,
+        and anonymous users share one. Subclasses whose payloads only vary
+        by broader roles (such as anonymous, regular, and administrative
+        users) can override this to share payloads between users.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            obj (object):
+                The object being serialized.
+
+        Returns:
+            str:
+            An identifier for the visibility class.
+        """
+        user = getattr(request, 'user', None)
+
+        if user is None or not user.is_authenticated:
+            return 'anonymous'
+
+        return f'user:{user.pk}'
+
     def get_no_access_error(
         self,
         request: HttpRequest,
@@ -2888,8 +3789,15 @@ class WebAPIResource(object):
     ) -> QuerySet:
         """Return an optimized queryset for looking up objects.
 
-        This wraps :py:meth:`get_queryset` and then optimizes the returned
-        queryset to help fetch related objects more efficiently.
+        This wraps :py:meth:`get_queryset` and then applies the plan from
+        :py:meth:`get_prefetch_plan` to help fetch related objects more
+        efficiently. For HTTP GET requests handled by this resource, only
+        the columns from :py:meth:`get_model_columns` will be loaded.
+
+        Version Changed:
+            7.0:
+            The queryset is now optimized based on the fields requested and
+            expanded by the client.
 
         Args:
             request (django.http.HttpRequest):
@@ -2909,43 +3817,1115 @@ class WebAPIResource(object):
             The resulting optimized queryset.
         """
         queryset = self.get_queryset(request, is_list=is_list, *args, **kwargs)
-        model = self.model
+        plan = self.get_prefetch_plan(request, is_list=is_list)
+        columns: (set[str] | None) = None
+
+        if (request is not None and
+            isinstance(queryset, QuerySet) and
+            getattr(request, '_djblets_webapi_method', None) == 'GET' and
+            getattr(request, '_djblets_webapi_resource', None) is self):
+            # Only load the columns needed for the requested fields. This is
+            # limited to the resource handling the request. Other resources
+            # may be querying for parent objects or access checks, and will
+            # need the full objects.
+            columns = self.get_model_columns(request)
+
+        if columns is not None:
+            # Related objects can't be selected through deferred columns.
+            plan.remove_fields({
+                field
+                for field in (
+                    lookup.split('__', 1)[0]
+                    for lookup in plan.select_related
+                )
+                if field not in columns
+            })
+            queryset = queryset.only(*columns)
 
-        select_related_fields: list[str]
+        return plan.apply(queryset)
+
+    def _get_related_fields(self) -> tuple[list[str], list[str]]:
+        """Return the fields that reference related objects.
+
+        This only includes fields serialized directly from the model. The
+        result is computed once for the lifetime of the resource instance.
+
+        Version Added:
+            7.0
+
+        Returns:
+            tuple:
+            A 2-tuple containing:
+
+            Tuple:
+                0 (list of str):
+                    Fields that can be fetched using
+                    :py:meth:`~django.db.models.query.QuerySet.select_related`.
+
+                1 (list of str):
+                    Fields that can be fetched using
+                    :py:meth:`~django.db.models.query.QuerySet.
+                    prefetch_related`.
+        """
+        try:
+            return (self._select_related_fields,
+                    self._prefetch_related_fields)
+        except AttributeError:
+            pass
+
+        # Build the cached related field information for future queries.
+        model = self.model
+        select_related_fields: list[str] = []
         prefetch_related_fields: list[str] = []
 
-        # Fetch the cached related field information. If it hasn't yet been
-        # generated for this resource, build it.
+        for field in self.fields.keys():
+            if hasattr(self, f'serialize_{field}_field'):
+                continue
+
+            field_type = getattr(model, field, None)
+
+            if field_type is not None:
+                if isinstance(field_type, ForwardManyToOneDescriptor):
+                    select_related_fields.append(field)
+                elif isinstance(field_type, ReverseManyToOneDescriptor):
+                    # This covers both many-to-many relations and reverse
+                    # foreign keys.
+                    prefetch_related_fields.append(field)
+
+        self._select_related_fields = select_related_fields
+        self._prefetch_related_fields = prefetch_related_fields
+
+        return select_related_fields, prefetch_related_fields
+
+    def _get_link_fields(self) -> set[str]:
+        """Return the fields that may be serialized as links.
+
+        These are fields that may reference a single related object. When
+        excluded by ``?only-fields=``, they'll still be included in the
+        links.
+
+        Only fields known not to reference a single object are left out.
+        These are model fields that aren't a foreign key or one-to-one
+        relation, managers for many related objects, and fields on
+        non-model attributes with a declared type other than a
+        :py:class:`~djblets.webapi.fields.ResourceFieldType`. Fields with a
+        :samp:`serialize_<fieldname>_field` method, properties, generic
+        foreign keys, and legacy fields that reference a type by a string
+        path are all included, since their values can't be determined
+        ahead of time. The result is computed once for the lifetime of the
+        resource instance.
+
+        Version Added:
+            7.0
+
+        Returns:
+            set of str:
+            The names of the fields that may be serialized as links.
+        """
         try:
-            select_related_fields = self._select_related_fields
-            prefetch_related_fields = self._prefetch_related_fields
+            return self._link_fields
         except AttributeError:
-            # Build the cached related field information for future queries.
-            select_related_fields = []
-            prefetch_related_fields = []
+            pass
 
-            for field in self.fields.keys():
-                if hasattr(self, f'serialize_{field}_field'):
-                    continue
+        model = self.model
+        link_fields: set[str] = set()
+
+        for field, field_info in self.fields.items():
+            is_link: bool
+
+            if hasattr(self, f'serialize_{field}_field'):
+                # The serializer may return any value.
+                is_link = True
+            elif model is not None and hasattr(model, field):
+                try:
+                    model_field = model._meta.get_field(field)
+                except FieldDoesNotExist:
+                    model_field = None
+
+                if model_field is None:
+                    # This is a property or other attribute, which may
+                    # return a model instance unless it's a manager.
+                    is_link = not isinstance(getattr(model, field),
+                                             ReverseManyToOneDescriptor)
+                else:
+                    # This covers forward and reverse relations, including
+                    # generic foreign keys.
+                    is_link = bool(model_field.many_to_one or
+                                   model_field.one_to_one)
+            else:
+                field_type = field_info.get('type')
+                is_link = (
+                    field_type is None or
+                    isinstance(field_type, str) or
+                    (inspect.isclass(field_type) and
+                     issubclass(field_type, ResourceFieldType) and
+                     not issubclass(field_type, ResourceListFieldType)))
 
-                field_type = getattr(model, field, None)
+            if is_link:
+                link_fields.add(field)
 
-                if field_type is not None:
-                    if isinstance(field_type, ForwardManyToOneDescriptor):
-                        select_related_fields.append(field)
-                    elif isinstance(field_type, ManyToManyDescriptor):
-                        prefetch_related_fields.append(field)
+        self._link_fields = link_fields
 
-            self._select_related_fields = select_related_fields
-            self._prefetch_related_fields = prefetch_related_fields
+        return link_fields
 
-        if select_related_fields:
-            queryset = queryset.select_related(*select_related_fields)
+    def _get_link_specs(
+        self,
+        resources: Sequence[WebAPIResource],
+        *,
+        is_item: bool,
+    ) -> tuple[tuple[str, str, str], ...]:
+        """Return the static links shared by all serialized objects.
 
-        if is_list and prefetch_related_fields:
-            queryset = queryset.prefetch_related(*prefetch_related_fields)
+        This covers the links for the HTTP methods allowed on the resource
+        and for each child resource. The hrefs are relative to the base href
+        of the object being serialized. The result is computed once for the
+        lifetime of the resource instance.
 
-        return queryset
+        Version Added:
+            7.0
+
+        Args:
+            resources (list of WebAPIResource):
+                The child resources to generate links for.
+
+            is_item (bool):
+                Whether the links are for an item resource.
+
+        Returns:
+            tuple:
+            A tuple of ``(link_name, method, href_suffix)`` tuples.
+        """
+        key = (is_item, *resources)
+
+        try:
+            return self._link_specs[key]
+        except AttributeError:
+            self._link_specs = {}
+        except KeyError:
+            pass
+
+        allowed_methods = self.allowed_methods
+        link_specs: list[tuple[str, str, str]] = []
+
+        if is_item:
+            if 'PUT' in allowed_methods:
+                link_specs.append(('update', 'PUT', ''))
+
+            if 'DELETE' in allowed_methods:
+                link_specs.append(('delete', 'DELETE', ''))
+        elif 'POST' in allowed_methods:
+            link_specs.append(('create', 'POST', ''))
+
+        for resource in resources:
+            link_specs.append((resource.link_name, 'GET',
+                               f'{resource.uri_name}/'))
+
+        result = tuple(link_specs)
+        self._link_specs[key] = result
+
+        return result
+
+    def _build_compiled_url(
+        self,
+        url_name: str,
+        kwargs: Mapping[str, Any],
+        request: (HttpRequest | None) = None,
+    ) -> str | None:
+        """Build a URL using precompiled URL patterns.
+
+        This produces the same result as :py:func:`~django.urls.reverse`,
+        but looks up and compiles the URL patterns for a URL name and set of
+        keyword arguments only once per script prefix. The compiled patterns
+        are discarded whenever Django's URL patterns change.
+
+        Version Added:
+            7.0
+
+        Args:
+            url_name (str):
+                The Django URL name to build.
+
+            kwargs (dict):
+                Keyword arguments representing values captured in the URL.
+
+            request (django.http.HttpRequest, optional):
+                The HTTP request from the client, if any. This is used to
+                store the URL resolver state for the request.
+
+        Returns:
+            str:
+            The resulting URL, or ``None`` if the URL could not be built
+            from compiled patterns. In that case, the caller should fall back
+            to :py:func:`~django.urls.reverse`.
+        """
+        if ':' in url_name:
+            # Namespaced URLs are left to reverse().
+            return None
+
+        # Looking up the URL resolver and script prefix involves several
+        # context-local lookups, so they're computed once per request.
+        url_state: (tuple[Any, str] | None) = None
+
+        if request is not None:
+            url_state = getattr(request, '_djblets_webapi_url_state', None)
+
+        if url_state is None:
+            url_state = (get_resolver(get_urlconf()).reverse_dict,
+                         get_script_prefix())
+
+            if request is not None:
+                setattr(request, '_djblets_webapi_url_state', url_state)
+
+        reverse_dict, prefix = url_state
+        compiled_urls = self._compiled_urls
+
+        if compiled_urls is None or compiled_urls[0] is not reverse_dict:
+            compiled = {}
+            self._compiled_urls = (reverse_dict, compiled)
+        else:
+            compiled = compiled_urls[1]
+
+        key = (prefix, url_name, frozenset(kwargs))
+
+        try:
+            candidates = compiled[key]
+        except KeyError:
+            candidates = []
+
+            # This mirrors URLResolver._reverse_with_prefix(), and depends
+            # on the layout of Django's internal reverse_dict entries. If
+            # that layout changes, no candidates will be compiled, and
+            # reverse() will be used instead.
+            try:
+                for possibility, pattern, defaults, converters in \
+                        reverse_dict.getlist(url_name):
+                    regex = re.compile(f'^{re.escape(prefix)}{pattern}')
+
+                    for result, params in possibility:
+                        if key[2].symmetric_difference(params).difference(
+                                defaults):
+                            continue
+
+                        candidates.append(_CompiledURLCandidate(
+                            url_format=prefix.replace('%', '%%') + result,
+                            regex=regex,
+                            defaults={
+                                default_key: default_value
+                                for default_key, default_value
+                                in defaults.items()
+                                if default_key not in params
+                            },
+                            converters=converters))
+            except (AttributeError, TypeError, ValueError, re.error) as e:
+                logger.warning('Unable to compile URL patterns for "%s". '
+                               'Falling back to reverse(): %s',
+                               url_name, e)
+                candidates = []
+
+            candidates = tuple(candidates)
+            compiled[key] = candidates
+
+        for candidate in candidates:
+            if any(
+                kwargs.get(default_key, default_value) != default_value
+                for default_key, default_value in candidate.defaults.items()
+            ):
+                continue
+
+            converters = candidate.converters
+            subs: dict[str, str] = {}
+
+            try:
+                for arg_name, value in kwargs.items():
+                    if arg_name in converters:
+                        subs[arg_name] = converters[arg_name].to_url(value)
+                    else:
+                        subs[arg_name] = str(value)
+            except ValueError:
+                continue
+
+            url = candidate.url_format % subs
+
+            if candidate.regex.search(url):
+                return escape_leading_slashes(
+                    quote(url, safe=f'{RFC3986_SUBDELIMS}/~:@'))
+
+        return None
+
+    def _build_absolute_url(
+        self,
+        request: HttpRequest,
+        url: str,
+    ) -> str:
+        """Return an absolute URL for a path built for a resource.
+
+        The scheme and host for the request are computed once and stored on
+        the request, so that building URLs for many objects in a response
+        only needs to join strings.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            url (str):
+                The URL path to make absolute. This must be an already-quoted
+                path starting with ``/``.
+
+        Returns:
+            str:
+            The resulting absolute URL.
+        """
+        if (not url.startswith('/') or
+            url.startswith('//') or
+            '/./' in url or
+            '/../' in url):
+            return request.build_absolute_uri(url)
+
+        try:
+            base_url = getattr(request, '_djblets_webapi_base_url')
+        except AttributeError:
+            base_url = request.build_absolute_uri('/')[:-1]
+            setattr(request, '_djblets_webapi_base_url', base_url)
+
+        return f'{base_url}{url}'
+
+    def _get_model_column(
+        self,
+        name: str,
+    ) -> str | None:
+        """Return the model column to load for a model field name.
+
+        Version Added:
+            7.0
+
+        Args:
+            name (str):
+                The name of the model field.
+
+        Returns:
+            str:
+            The name of the model field to pass to :py:meth:`QuerySet.only()
+            <django.db.models.query.QuerySet.only>`, an empty string if the
+            field doesn't have a column on the model (such as a many-to-many
+            relation), or ``None`` if this isn't a model field.
+        """
+        model = self.model
+        assert model is not None
+
+        meta = model._meta
+
+        if name == 'pk':
+            assert meta.pk is not None
+
+            return meta.pk.name
+
+        try:
+            model_field = meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+        if model_field.concrete and not model_field.many_to_many:
+            return model_field.name
+
+        return ''
+
+    def _get_child_expanded_resources(
+        self,
+        expanded_resources: set[str],
+    ) -> set[str]:
+        """Return the expanded resources remaining for nested objects.
+
+        This mirrors the handling in :py:meth:`serialize_object`, removing
+        any expanded fields and child resources handled by this resource.
+
+        Version Added:
+            7.0
+
+        Args:
+            expanded_resources (set of str):
+                The resources expanded at this level.
+
+        Returns:
+            set of str:
+            The resources to expand in nested objects.
+        """
+        child_expanded_resources = expanded_resources.difference(
+            self.fields.keys())
+
+        for child_resource in self.item_child_resources:
+            child_expanded_resources.discard(child_resource.name)
+            child_expanded_resources.discard(child_resource.name_plural)
+
+        return child_expanded_resources
+
+    def _get_requested_expanded_resources(
+        self,
+        request: HttpRequest | None,
+    ) -> set[str]:
+        """Return the resources to expand, as requested by the client.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+        Returns:
+            set of str:
+            The names of the fields and resources to expand.
+        """
+        if request is None:
+            return set()
+
+        try:
+            # We may already be serializing objects, in which case this
+            # will contain the expanded resources for the current level.
+            return set(getattr(request, '_djblets_webapi_expanded_resources'))
+        except AttributeError:
+            expand = request.GET.get('expand', request.POST.get('expand', ''))
+
+            return {
+                name
+                for name in expand.split(',')
+                if name
+            }
+
+    def _get_related_prefetch_plan(
+        self,
+        request: HttpRequest | None,
+        *,
+        field: str,
+        expanded_resources: set[str],
+    ) -> WebAPIPrefetchPlan | None:
+        """Return the plan for an expanded related field.
+
+        The plan comes from the resource registered for the related model.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            field (str):
+                The name of the related field.
+
+            expanded_resources (set of str):
+                The resources to expand in the related objects.
+
+        Returns:
+            WebAPIPrefetchPlan:
+            The plan for the related objects, or ``None`` if a resource
+            could not be found.
+        """
+        model = self.model
+        assert model is not None
+
+        related_model = model._meta.get_field(field).related_model
+        resource = _model_to_resources.get(related_model)
+
+        if not isinstance(resource, WebAPIResource):
+            # There's no resource, or it's determined per-object.
+            return None
+
+        return resource.get_prefetch_plan(
+            request,
+            is_list=True,
+            expanded_resources=expanded_resources)
+
+    def _get_parent_prefetch(
+        self,
+        request: HttpRequest | None,
+        *,
+        parent_resource: WebAPIResource,
+        expanded_resources: set[str],
+    ) -> Prefetch | None:
+        """Return a prefetch for this resource's objects in parent objects.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            parent_resource (WebAPIResource):
+                The parent resource being serialized.
+
+            expanded_resources (set of str):
+                The resources to expand in this resource's objects.
+
+        Returns:
+            django.db.models.query.Prefetch:
+            The prefetch for the parent queryset, or ``None`` if objects
+            can't be prefetched.
+        """
+        model = self.model
+        parent_model = parent_resource.model
+        model_parent_key = self.model_parent_key
+
+        if model is None or parent_model is None or not model_parent_key:
+            return None
+
+        try:
+            parent_field = model._meta.get_field(model_parent_key)
+        except FieldDoesNotExist:
+            return None
+
+        if (not isinstance(parent_field, models.ForeignKey) or
+            not issubclass(parent_model, parent_field.related_model)):
+            return None
+
+        queryset = self.get_parent_prefetch_queryset(
+            request,
+            parent_resource=parent_resource)
+
+        if queryset is None:
+            return None
+
+        plan = self.get_prefetch_plan(request,
+                                      is_list=True,
+                                      expanded_resources=expanded_resources)
+
+        return Prefetch(parent_field.remote_field.get_accessor_name(),
+                        queryset=plan.apply(queryset),
+                        to_attr=self._get_parent_prefetch_attr())
+
+    def _get_parent_prefetch_attr(self) -> str:
+        """Return the attribute storing objects prefetched for a parent.
+
+        Version Added:
+            7.0
+
+        Returns:
+            str:
+            The attribute name set on parent objects.
+        """
+        return '_djblets_webapi_prefetched_%s' % self.uri_name.replace('-',
+                                                                       '_')
+
+    def _get_list_gen_key(self) -> str:
+        """Return the cache key storing the generation of lists.
+
+        This is used by :py:attr:`WebAPIListVersionStrategy.GENERATION`.
+
+        Version Added:
+            7.0
+
+        Returns:
+            str:
+            The cache key for the generation.
+        """
+        return make_cache_key(['webapi-list-gen', self.name])
+
+    def _on_list_changed(
+        self,
+        action: (str | None) = None,
+        **kwargs,
+    ) -> None:
+        """Change the list generation when objects change.
+
+        This is called when an object is saved or deleted, or its
+        many-to-many relations change.
+
+        Version Added:
+            7.0
+
+        Args:
+            action (str, optional):
+                The type of change to a many-to-many relation, if any.
+
+            **kwargs (dict):
+                Additional keyword arguments passed to the signal.
+        """
+        if action is None or action in ('post_add', 'post_remove',
+                                        'post_clear'):
+            cache.set(self._get_list_gen_key(),
+                      uuid.uuid4().hex,
+                      self.list_version_generation_expiration)
+
+    def _get_serialized_object_gen_key(
+        self,
+        pk: Any,
+    ) -> str:
+        """Return the cache key storing the generation of an object.
+
+        The generation changes whenever the object changes, invalidating any
+        cached payloads for the object.
+
+        Version Added:
+            7.0
+
+        Args:
+            pk (object):
+                The primary key of the object.
+
+        Returns:
+            str:
+            The cache key for the generation.
+        """
+        return make_cache_key(['webapi-serialized-gen', self.name, str(pk)])
+
+    def _get_expanded_resources(
+        self,
+        request: HttpRequest,
+    ) -> set[str]:
+        """Return the resources being expanded for the request.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+        Returns:
+            set of str:
+            The resources being expanded at the current level.
+        """
+        try:
+            return getattr(request, '_djblets_webapi_expanded_resources')
+        except AttributeError:
+            expanded_resources = set(
+                request.GET.get('expand', request.POST.get('expand', ''))
+                .split(',')
+            )
+            setattr(request, '_djblets_webapi_expanded_resources',
+                    expanded_resources)
+
+            return expanded_resources
+
+    def _get_serialized_object_cache_key(
+        self,
+        obj: Any,
+        request: HttpRequest,
+        expanded_resources: set[str],
+        *args,
+        **kwargs,
+    ) -> str | None:
+        """Return the cache key for a serialized object payload.
+
+        Version Added:
+            7.0
+
+        Args:
+            obj (object):
+                The object being serialized.
+
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            expanded_resources (set of str):
+                The resources being expanded at this level.
+
+            *args (tuple):
+                Positional arguments passed to the view.
+
+            **kwargs (dict):
+                Keyword arguments representing values captured from the URL.
+
+        Returns:
+            str:
+            The cache key, or ``None`` if the payload can't be cached.
+        """
+        model = self.model
+
+        if (model is None or
+            not isinstance(obj, model) or
+            obj.pk is None):
+            return None
+
+        etag = self.get_etag(request, obj, *args, **kwargs)
+        last_modified = self.get_last_modified(request, obj)
+
+        if etag is None and last_modified is None:
+            # There's nothing to validate the cached payload against.
+            return None
+
+        return make_cache_key([
+            'webapi-serialized-object',
+            self.name,
+            str(obj.pk),
+            etag or '',
+            last_modified.isoformat() if last_modified else '',
+            self.get_serialized_object_cache_visibility(request, obj),
+            request.build_absolute_uri('/'),
+            ','.join(sorted(expanded_resources)),
+            repr(self.get_only_fields(request)),
+            repr(self.get_only_links(request)),
+            repr(args),
+            repr(sorted(
+                (name, str(value))
+                for name, value in kwargs.items()
+            )),
+        ])
+
+    def _prefetch_serialized_object_cache_entries(
+        self,
+        obj_list: Sequence[Any],
+        request: HttpRequest,
+        *args,
+        **kwargs,
+    ) -> None:
+        """Fetch cache entries for serialized object payloads in a list.
+
+        The entries for all objects are fetched in one request, and any
+        missing object generations are stored in one more. They'll be used
+        by :py:meth:`_get_serialized_object_cache_entry` when serializing
+        each object.
+
+        Version Added:
+            7.0
+
+        Args:
+            obj_list (list):
+                The objects that will be serialized.
+
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            *args (tuple):
+                Positional arguments passed to the view.
+
+            **kwargs (dict):
+                Keyword arguments representing values captured from the URL.
+        """
+        expanded_resources = self._get_expanded_resources(request)
+        keys: dict[Any, tuple[str, str] | None] = {}
+
+        for obj in obj_list:
+            key = self._get_serialized_object_cache_key(
+                obj, request, expanded_resources, *args, **kwargs)
+
+            if key is None:
+                keys[obj] = None
+            else:
+                keys[obj] = (key, self._get_serialized_object_gen_key(obj.pk))
+
+        cache_keys = {
+            cache_key
+            for obj_keys in keys.values()
+            if obj_keys is not None
+            for cache_key in obj_keys
+        }
+
+        if not cache_keys:
+            return
+
+        try:
+            cached = cache.get_many(list(cache_keys))
+        except Exception as e:
+            logger.exception('Unable to fetch cached serialized payloads for '
+                             'API resource %r: %s',
+                             self.name, e)
+            return
+
+        new_gens: dict[str, str] = {}
+        entries: dict[tuple[str, Any], tuple[frozenset[str], str | None,
+                                             str | None, bytes | None]] = {}
+        expanded_key = frozenset(expanded_resources)
+
+        for obj, obj_keys in keys.items():
+            if obj_keys is None:
+                entries[(self.name, obj)] = (expanded_key, None, None, None)
+                continue
+
+            key, gen_key = obj_keys
+            gen = cached.get(gen_key) or new_gens.get(gen_key)
+            pickled_data: (bytes | None) = None
+
+            if gen is None:
+                gen = uuid.uuid4().hex
+                new_gens[gen_key] = gen
+            else:
+                entry = cached.get(key)
+
+                if entry is not None and entry[0] == gen:
+                    pickled_data = entry[1]
+
+            entries[(self.name, obj)] = (expanded_key, key, gen,
+                                         pickled_data)
+
+        if new_gens:
+            # These would normally be added one at a time, to avoid
+            # replacing a generation set by another process. The ETag and
+            # last-modified timestamp in the payload keys keep stale
+            # payloads from being served if that happens.
+            try:
+                cache.set_many(new_gens,
+                               self.serialized_object_cache_expiration)
+            except Exception as e:
+                logger.exception('Unable to store serialized object '
+                                 'generations for API resource %r: %s',
+                                 self.name, e)
+                return
+
+        try:
+            prefetched = getattr(request,
+                                 '_djblets_webapi_serialized_object_entries')
+        except AttributeError:
+            prefetched = {}
+            setattr(request, '_djblets_webapi_serialized_object_entries',
+                    prefetched)
+
+        prefetched.update(entries)
+
+    def _get_serialized_object_cache_entry(
+        self,
+        obj: Any,
+        request: HttpRequest,
+        expanded_resources: set[str],
+        *args,
+        **kwargs,
+    ) -> tuple[tuple[str, str] | None, bytes | None]:
+        """Return the cache entry for a serialized object payload.
+
+        If the entry was fetched along with the rest of a list by
+        :py:meth:`_prefetch_serialized_object_cache_entries`, it will be used.
+        Otherwise, it will be fetched from cache.
+
+        Version Added:
+            7.0
+
+        Args:
+            obj (object):
+                The object being serialized.
+
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            expanded_resources (set of str):
+                The resources being expanded at this level.
+
+            *args (tuple):
+                Positional arguments passed to the view.
+
+            **kwargs (dict):
+                Keyword arguments representing values captured from the URL.
+
+        Returns:
+            tuple:
+            A 2-tuple containing:
+
+            Tuple:
+                0 (tuple):
+                    A 2-tuple of the cache key and object generation for
+                    storing the payload, or ``None`` if the payload can't be
+                    cached.
+
+                1 (bytes):
+                    The pickled cached payload, or ``None`` if not cached.
+        """
+        prefetched = getattr(request,
+                             '_djblets_webapi_serialized_object_entries',
+                             None)
+
+        if prefetched:
+            prefetched_entry = prefetched.pop((self.name, obj), None)
+
+            if (prefetched_entry is not None and
+                prefetched_entry[0] == expanded_resources):
+                key, gen, pickled_data = prefetched_entry[1:]
+
+                if key is None or gen is None:
+                    return None, None
+
+                return (key, gen), pickled_data
+
+        key = self._get_serialized_object_cache_key(
+            obj, request, expanded_resources, *args, **kwargs)
+
+        if key is None:
+            return None, None
+
+        gen_key = self._get_serialized_object_gen_key(obj.pk)
+        cached = cache.get_many([gen_key, key])
+        gen = cached.get(gen_key)
+
+        if gen is None:
+            gen = uuid.uuid4().hex
+
+            if not cache.add(gen_key, gen,
+                             self.serialized_object_cache_expiration):
+                # Another process set the generation first.
+                gen = cache.get(gen_key, gen)
+        else:
+            entry = cached.get(key)
+
+            if entry is not None and entry[0] == gen:
+                return (key, gen), entry[1]
+
+        return (key, gen), None
+
+    def _store_serialized_object_cache_entry(
+        self,
+        request: HttpRequest,
+        cache_entry: tuple[str, str],
+        data: WebAPIResponsePayload,
+    ) -> bytes | None:
+        """Store a serialized object payload in the cache.
+
+        If a list is being serialized, the payload will be stored along with
+        the rest of the list once done.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            cache_entry (tuple):
+                The cache key and object generation from
+                :py:meth:`_get_serialized_object_cache_entry`.
+
+            data (dict):
+                The serialized payload to store.
+
+        Returns:
+            bytes:
+            The pickled payload, or ``None`` if it couldn't be pickled.
+        """
+        key, gen = cache_entry
+
+        try:
+            pickled_data = pickle.dumps(data,
+                                        protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.exception('Unable to cache serialized payload for API '
+                             'resource %r: %s',
+                             self.name, e)
+            return None
+
+        pending = getattr(request,
+                          '_djblets_webapi_serialized_object_pending',
+                          None)
+
+        if pending is not None:
+            pending[key] = (gen, pickled_data)
+        else:
+            try:
+                cache.set(key, (gen, pickled_data),
+                          self.serialized_object_cache_expiration)
+            except Exception as e:
+                logger.exception('Unable to cache serialized payload for '
+                                 'API resource %r: %s',
+                                 self.name, e)
+
+        return pickled_data
+
+    def _on_serialized_object_changed(
+        self,
+        instance: Model,
+        **kwargs,
+    ) -> None:
+        """Invalidate cached payloads when an object is saved or deleted.
+
+        Version Added:
+            7.0
+
+        Args:
+            instance (django.db.models.Model):
+                The object that was saved or deleted.
+
+            **kwargs (dict):
+                Additional keyword arguments passed to the signal.
+        """
+        self._invalidate_serialized_object(instance.pk)
+
+    def _on_serialized_object_m2m_changed(
+        self,
+        sender: type[Model],
+        instance: Model,
+        action: str,
+        pk_set: set[Any] | None,
+        using: str,
+        **kwargs,
+    ) -> None:
+        """Invalidate cached payloads when many-to-many relations change.
+
+        When a relation is cleared from the other side, the objects that
+        were related are looked up before the clear, so they can be
+        invalidated afterward.
+
+        Version Added:
+            7.0
+
+        Args:
+            sender (type):
+                The intermediary model for the relation.
+
+            instance (django.db.models.Model):
+                The object whose relations changed.
+
+            action (str):
+                The type of change to the relation.
+
+            pk_set (set):
+                The primary keys added to or removed from the relation.
+
+            using (str):
+                The database alias being used.
+
+            **kwargs (dict):
+                Additional keyword arguments passed to the signal.
+        """
+        model = self.model
+        assert model is not None
+
+        if isinstance(instance, model):
+            if action in ('post_add', 'post_remove', 'post_clear'):
+                self._invalidate_serialized_object(instance.pk)
+
+            return
+
+        # The relation was changed from the other side.
+        cleared_pks_attr = f'_djblets_webapi_cleared_pks_{id(self)}'
+
+        if action == 'pre_clear':
+            for m2m_field in model._meta.many_to_many:
+                if m2m_field.remote_field.through is sender:
+                    setattr(instance, cleared_pks_attr, list(
+                        sender._default_manager
+                        .using(using)
+                        .filter(**{
+                            m2m_field.m2m_reverse_field_name(): instance.pk,
+                        })
+                        .values_list(m2m_field.m2m_field_name(), flat=True)
+                    ))
+                    break
+
+            return
+        elif action == 'post_clear':
+            pk_set = set(instance.__dict__.pop(cleared_pks_attr, []))
+        elif action not in ('post_add', 'post_remove'):
+            return
+
+        for pk in pk_set or []:
+            self._invalidate_serialized_object(pk)
+
+    def _invalidate_serialized_object(
+        self,
+        pk: Any,
+    ) -> None:
+        """Invalidate all cached payloads for an object.
+
+        Version Added:
+            7.0
+
+        Args:
+            pk (object):
+                The primary key of the object.
+        """
+        if pk is not None:
+            cache.set(self._get_serialized_object_gen_key(pk),
+                      uuid.uuid4().hex,
+                      self.serialized_object_cache_expiration)
 
     def _clone_serialized_object(
         self,
@@ -0,0 +1,478 @@
+"""A resource for performing multiple API requests in a single request.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+from io import BytesIO
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode, urlsplit
+
+from django.db import transaction
+from django.http import QueryDict
+from django.urls import Resolver404, get_script_prefix, resolve
+
+from djblets.webapi.decorators import (webapi_request_fields,
+                                       webapi_response_errors)
+from djblets.webapi.errors import DOES_NOT_EXIST, INVALID_FORM_DATA
+from djblets.webapi.fields import StringFieldType
+from djblets.webapi.resources.base import WebAPIResource
+from djblets.webapi.responses import WebAPIResponseError
+
+if TYPE_CHECKING:
+    from typing import Any, ClassVar
+
+    from django.http import HttpRequest, HttpResponseBase
+
+    from djblets.webapi.resources.base import WebAPIResourceHandlerResult
+
+
+logger = logging.getLogger(__name__)
+
+
+class BatchResource(WebAPIResource):
+    """A resource for performing multiple API requests in a single request.
+
+    Clients can POST a list of sub-requests to this resource, which will be
+    dispatched in order, in-process, through the resource tree. This saves
+    clients the overhead of authentication, middleware, and connections for
+    each request.
+
+    Each sub-request is a dictionary containing:
+
+    Keys:
+        method (str):
+            The HTTP method for the sub-request (``GET``, ``POST``, ``PUT``,
+            or ``DELETE``).
+
+        path (str):
+            The path or URL of an API resource. This may contain a query
+            string.
+
+        query (dict, optional):
+            Query arguments for the sub-request.
+
+        body (dict, optional):
+            Form fields for ``POST`` and ``PUT`` sub-requests.
+
+    The result is a list of responses, in the same order as the
+    sub-requests. Each contains the HTTP ``status``, the response
+    ``headers``, and the decoded response ``body``.
+
+    Sub-requests share the client's authentication and session, along with
+    the cache of objects fetched and serialized while handling the request.
+    Serialized payloads are only shared between ``GET`` sub-requests using
+    the same ``expand``, ``only-fields``, and ``only-links`` options. Both
+    caches are reset after any other sub-request, since it may make changes.
+
+    Each sub-request runs in its own transaction savepoint. A sub-request
+    that fails, either with an exception or an error response (an HTTP 4xx
+    or 5xx status), will have its changes rolled back without affecting
+    the others, even when the client's request is wrapped in a transaction
+    (such as with :django:setting:`ATOMIC_REQUESTS`).
+
+    Sub-requests aren't processed by middleware, and can't upload files.
+
+    This is opt-in. To enable it, add an instance to the list of child
+    resources passed to :py:class:`~djblets.webapi.resources.root.
+    RootResource`.
+
+    Version Added:
+        7.0
+    """
+
+    name = 'batch'
+    singleton = True
+    allowed_methods = ('POST',)
+
+    #: The maximum number of sub-requests allowed in a batch.
+    #:
+    #: Type:
+    #:     int
+    max_batch_size: ClassVar[int] = 25
+
+    #: The HTTP methods allowed for sub-requests.
+    #:
+    #: Type:
+    #:     tuple of str
+    allowed_batch_methods: ClassVar[tuple[str, ...]] = (
+        'GET',
+        'POST',
+        'PUT',
+        'DELETE',
+    )
+
+    @webapi_response_errors(INVALID_FORM_DATA)
+    @webapi_request_fields(
+        required={
+            'batch': {
+                'type': StringFieldType,
+                'description': 'A JSON-encoded list of sub-requests. Each '
+                               'contains a "method", a "path", and '
+                               'optionally a "query" dictionary of query '
+                               'arguments and a "body" dictionary of form '
+                               'fields.',
+            },
+        },
+    )
+    def create(
+        self,
+        request: HttpRequest,
+        *args,
+        batch: str,
+        **kwargs,
+    ) -> WebAPIResourceHandlerResult:
+        """Perform a batch of API requests.
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            *args (tuple):
+                Positional arguments passed to the view.
+
+            batch (str):
+                The JSON-encoded list of sub-requests.
+
+            **kwargs (dict):
+                Keyword arguments representing values captured from the URL.
+
+        Returns:
+            WebAPIResourceHandlerResult:
+            The HTTP response, API error, or tuple results from the API
+            handler.
+        """
+        try:
+            sub_requests = self._parse_batch(batch)
+        except ValueError as e:
+            return INVALID_FORM_DATA, {
+                'fields': {
+                    'batch': [str(e)],
+                },
+            }
+
+        # Objects fetched and serialized by sub-requests are shared with later
+        # sub-requests, until a sub-request makes a change.
+        object_cache: dict[str, Any] = {}
+        serialize_caches: dict[tuple[str, ...], dict[Any, Any]] = {}
+        responses: list[dict[str, Any]] = []
+
+        for sub_request_info in sub_requests:
+            method = sub_request_info['method']
+            sub_request = self.build_sub_request(request,
+                                                 object_cache=object_cache,
+                                                 **sub_request_info)
+
+            if method == 'GET':
+                # Serialized payloads depend on these options, so they're
+                # only shared between sub-requests using the same ones.
+                serialize_options = tuple(
+                    sub_request.GET.get(option_name, '')
+                    for option_name in ('expand', 'only-fields',
+                                        'only-links')
+                )
+                setattr(sub_request, '_djblets_webapi_serialize_cache',
+                        serialize_caches.setdefault(serialize_options, {}))
+
+            try:
+                # Use a savepoint, so that a failed sub-request won't break
+                # the transaction for the rest of the batch. Error responses
+                # don't raise exceptions, so they need to roll back any
+                # partial changes explicitly.
+                with transaction.atomic():
+                    sub_response = self.dispatch_sub_request(sub_request)
+
+                    if sub_response.status_code >= 400:
+                        transaction.set_rollback(True)
+
+                response = self.serialize_sub_response(sub_response)
+            except Exception as e:
+                logger.exception('Unexpected error handling batched API '
+                                 'request %s %s: %s',
+                                 method, sub_request.path, e,
+                                 extra={'request': request})
+                response = {
+                    'status': 500,
+                    'headers': {},
+                    'body': None,
+                }
+
+            responses.append(response)
+
+            if method != 'GET':
+                object_cache = {}
+                serialize_caches = {}
+
+        return 200, {
+            'responses': responses,
+        }
+
+    def build_sub_request(
+        self,
+        request: HttpRequest,
+        *,
+        method: str,
+        path: str,
+        query: str,
+        body: str,
+        object_cache: dict[str, Any],
+    ) -> HttpRequest:
+        """Return a request for a sub-request.
+
+        The sub-request is a copy of the client's request, sharing its
+        authenticated user and session.
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            method (str):
+                The HTTP method for the sub-request.
+
+            path (str):
+                The path for the sub-request, relative to the script prefix.
+
+            query (str):
+                The encoded query string for the sub-request.
+
+            body (str):
+                The encoded form data for the sub-request.
+
+            object_cache (dict):
+                The cache of fetched objects to share with the sub-request.
+
+        Returns:
+            django.http.HttpRequest:
+            The new request.
+        """
+        sub_request = copy.copy(request)
+
+        # Remove any state that was computed for the client's request.
+        for attr in ('_body', '_files', '_post', 'GET', 'PUT',
+                     'accepted_types', 'resolver_match',
+                     '_djblets_webapi_expanded_resources',
+                     '_djblets_webapi_kwargs', '_djblets_webapi_method',
+                     '_djblets_webapi_resource',
+                     '_djblets_webapi_serialize_cache',
+                     '_djblets_webapi_serialized_object_entries',
+                     '_djblets_webapi_serialized_object_pending'):
+            sub_request.__dict__.pop(attr, None)
+
+        body_bytes = body.encode('utf-8')
+
+        # The client has already been authenticated, so the sub-request
+        # doesn't need to authenticate again.
+        meta = {
+            key: value
+            for key, value in request.META.items()
+            if key not in ('CONTENT_LENGTH', 'CONTENT_TYPE',
+                           'HTTP_AUTHORIZATION', 'HTTP_IF_MODIFIED_SINCE',
+                           'HTTP_IF_NONE_MATCH')
+        }
+        meta.update({
+            'CONTENT_LENGTH': str(len(body_bytes)),
+            'CONTENT_TYPE': 'application/x-www-form-urlencoded',
+            'HTTP_ACCEPT': 'application/json',
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            'REQUEST_METHOD': method,
+        })
+
+        sub_request.META = meta
+        sub_request.method = method
+        sub_request.path = '%s%s' % (get_script_prefix().rstrip('/'), path)
+        sub_request.path_info = path
+        sub_request.GET = QueryDict(query)
+        sub_request.content_type = 'application/x-www-form-urlencoded'
+        sub_request.content_params = {}
+        sub_request._body = body_bytes
+        sub_request._stream = BytesIO(body_bytes)
+        sub_request._read_started = False
+
+        if hasattr(sub_request, 'environ'):
+            sub_request.environ = meta
+
+        setattr(sub_request, '_djblets_webapi_object_cache', object_cache)
+
+        return sub_request
+
+    def dispatch_sub_request(
+        self,
+        sub_request: HttpRequest,
+    ) -> HttpResponseBase:
+        """Dispatch a sub-request to the matching API resource.
+
+        Sub-requests for paths that don't map to an API resource, or that
+        map to another batch resource, will result in a
+        :py:data:`~djblets.webapi.errors.DOES_NOT_EXIST` error.
+
+        Args:
+            sub_request (django.http.HttpRequest):
+                The sub-request to dispatch.
+
+        Returns:
+            django.http.HttpResponseBase:
+            The response for the sub-request.
+        """
+        try:
+            match = resolve(sub_request.path_info)
+        except Resolver404:
+            match = None
+
+        # Resource URLs map to the resource's bound __call__ method.
+        resource = getattr(match.func, '__self__', None) if match else None
+
+        if (not isinstance(resource, WebAPIResource) or
+            isinstance(resource, BatchResource)):
+            return WebAPIResponseError(sub_request, err=DOES_NOT_EXIST)
+
+        sub_request.resolver_match = match
+
+        return match.func(sub_request, *match.args, **match.kwargs)
+
+    def serialize_sub_response(
+        self,
+        response: HttpResponseBase,
+    ) -> dict[str, Any]:
+        """Serialize a response for a sub-request.
+
+        Args:
+            response (django.http.HttpResponseBase):
+                The response for the sub-request.
+
+        Returns:
+            dict:
+            The serialized response, containing ``status``, ``headers``, and
+            ``body`` keys.
+        """
+        body: Any = None
+
+        if not getattr(response, 'streaming', False) or hasattr(response,
+                                                                 'api_data'):
+            content = getattr(response, 'content', b'')
+
+            if content:
+                content_type = response.get('Content-Type', '')
+
+                body = content.decode('utf-8', 'replace')
+
+                if 'json' in content_type:
+                    try:
+                        body = json.loads(body)
+                    except ValueError:
+                        pass
+
+        return {
+            'status': response.status_code,
+            'headers': dict(response.items()),
+            'body': body,
+        }
+
+    def _parse_batch(
+        self,
+        batch: str,
+    ) -> list[dict[str, str]]:
+        """Parse and validate a list of sub-requests.
+
+        Args:
+            batch (str):
+                The JSON-encoded list of sub-requests.
+
+        Returns:
+            list of dict:
+            A list of dictionaries containing the ``method``, ``path``,
+            ``query``, and ``body`` of each sub-request.
+
+        Raises:
+            ValueError:
+                The list of sub-requests was invalid. The error message will
+                describe the problem.
+        """
+        try:
+            items = json.loads(batch)
+        except ValueError:
+            raise ValueError('The batch must be a JSON-encoded list.')
+
+        if not isinstance(items, list):
+            raise ValueError('The batch must be a JSON-encoded list.')
+
+        if len(items) > self.max_batch_size:
+            raise ValueError(
+                'The batch cannot contain more than %d requests.'
+                % self.max_batch_size)
+
+        script_prefix = get_script_prefix()
+        sub_requests: list[dict[str, str]] = []
+
+        for i, item in enumerate(items):
+            if not isinstance(item, dict):
+                raise ValueError('Request %d must be a dictionary.' % i)
+
+            method = item.get('method')
+            path = item.get('path')
+            query = item.get('query') or {}
+            body = item.get('body') or {}
+
+            if (not isinstance(method, str) or
+                method.upper() not in self.allowed_batch_methods):
+                raise ValueError(
+                    'Request %d must have a method of %s.'
+                    % (i, ', '.join(self.allowed_batch_methods)))
+
+            if not isinstance(path, str) or not path:
+                raise ValueError('Request %d must have a path.' % i)
+
+            if not isinstance(query, dict) or not isinstance(body, dict):
+                raise ValueError(
+                    'The query and body for request %d must be dictionaries.'
+                    % i)
+
+            url_parts = urlsplit(path)
+            path = url_parts.path
+
+            if path.startswith(script_prefix):
+                path = '/%s' % path[len(script_prefix):]
+
+            query_string = '&'.join(
+                part
+                for part in (url_parts.query,
+                             self._encode_params(query))
+                if part
+            )
+
+            sub_requests.append({
+                'method': method.upper(),
+                'path': path,
+                'query': query_string,
+                'body': self._encode_params(body),
+            })
+
+        return sub_requests
+
+    def _encode_params(
+        self,
+        params: dict[str, Any],
+    ) -> str:
+        """Encode a dictionary of parameters for a sub-request.
+
+        Args:
+            params (dict):
+                The parameters to encode. Values may be lists. Any ``None``
+                values will be skipped.
+
+        Returns:
+            str:
+            The encoded parameters.
+        """
+        return urlencode(
+            {
+                key: value
+                for key, value in params.items()
+                if value is not None
+            },
+            doseq=True)
@@ -5,9 +5,15 @@ from __future__ import annotations
 from collections.abc import Callable, Iterator
 from typing import Any, TYPE_CHECKING, TypedDict
 
+from asgiref.sync import sync_to_async
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
 from django.http import HttpResponse
 from django.utils.encoding import force_str
 
+from djblets.cache.backend import cache_memoize
+from djblets.db.query import (build_keyset_q,
+                              decode_keyset_cursor,
+                              encode_keyset_cursor)
 from djblets.http.responses import (EventStreamMessage,
                                     EventStreamMessages,
                                     EventStreamHttpResponse)
@@ -21,7 +27,8 @@ from djblets.webapi.errors import INVALID_FORM_DATA
 
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Iterable, Mapping, Sequence
+    from collections.abc import (AsyncIterator, Collection, Iterable,
+                                 Mapping, Sequence)
     from typing import ClassVar, TypeAlias
 
     from django.db.models import QuerySet
@@ -150,6 +157,27 @@ class WebAPIResponse(HttpResponse):
         'application/xml',
     ]
 
+    #: The approximate size of each chunk of a streamed payload, in bytes.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     int
+    stream_chunk_size: ClassVar[int] = 64 * 1024
+
+    #: Whether the streamed content is generated asynchronously.
+    #:
+    #: This is always ``False``, and is provided for compatibility with
+    #: middleware handling streamed responses.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     bool
+    is_async: ClassVar[bool] = False
+
     ######################
     # Instance variables #
     ######################
@@ -204,6 +232,18 @@ class WebAPIResponse(HttpResponse):
     #:     django.http.HttpRequest
     request: HttpRequest
 
+    #: Whether the payload will be streamed to the client.
+    #:
+    #: This is set when passing ``stream=True`` for a JSON or XML response.
+    #: See :py:meth:`__init__` for details.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     bool
+    streaming: bool
+
     def __init__(
         self,
         request: HttpRequest,
@@ -217,6 +257,7 @@ class WebAPIResponse(HttpResponse):
         encoder_kwargs: Mapping[str, Any] = {},
         mimetype: (str | None) = None,
         supported_mimetypes: (Sequence[str] | None) = None,
+        stream: bool = False,
     ) -> None:
         """Initialize the response.
 
@@ -233,6 +274,18 @@ class WebAPIResponse(HttpResponse):
         Finally, if no mimetype can be determined, no content will be generated
         and this will automatically be set to a :http:`400`.
 
+        If ``stream`` is set, the payload will be encoded and sent
+        incrementally as the response is iterated, rather than built up-front
+        as a single string. Top-level lists in the payload are encoded one
+        item at a time, and may be provided as iterators to generate items on
+        demand. JSON content is the same as a non-streamed response. XML
+        content is written without indentation, but is otherwise the same.
+        Accessing :py:attr:`content` will still generate the entire payload.
+
+        Version Changed:
+            7.0:
+            Added the ``stream`` argument.
+
         Version Changed:
             3.2:
             All arguments (except for ``request``) must now be provided as
@@ -277,6 +330,12 @@ class WebAPIResponse(HttpResponse):
 
                 This is used when trying to guess a mimetype from the
                 :mailheader:`Accept` header.
+
+            stream (bool, optional):
+                Whether to stream the payload to the client.
+
+                Version Added:
+                    7.0
         """
         mimetype = _normalize_response_mimetype(
             request=request,
@@ -300,6 +359,8 @@ class WebAPIResponse(HttpResponse):
         self.mimetype = mimetype
         self.encoders = encoders or get_registered_encoders()
         self.encoder_kwargs = encoder_kwargs
+        self.streaming = stream
+        self._streaming_content: (Iterator[bytes] | None) = None
 
         for header, value in headers.items():
             self[header] = value
@@ -331,37 +392,17 @@ class WebAPIResponse(HttpResponse):
         Type:
             bytes
         """
-        class MultiEncoder(WebAPIEncoder):
-            def __init__(
-                self,
-                encoders: Sequence[WebAPIEncoder],
-            ) -> None:
-                self.encoders = encoders
-
-            def encode(self, *args, **kwargs) -> str:
-                for encoder in self.encoders:
-                    result = encoder.encode(*args, **kwargs)
-
-                    if result is not None:
-                        return result
-
-                return ''
-
         if not self.content_set:
-            adapter: (JSONEncoderAdapter | XMLEncoderAdapter | None) = None
-            encoder = MultiEncoder(self.encoders)
-
-            # See the note above about the check for text/plain.
-            if (self.mimetype == 'text/plain' or
-                is_mimetype_a(self.mimetype, 'application/json')):
-                adapter = JSONEncoderAdapter(encoder)
-            elif is_mimetype_a(self.mimetype, "application/xml"):
-                adapter = XMLEncoderAdapter(encoder)
+            # Any payload values generated on demand need to be converted
+            # to lists before they can be encoded in full.
+            for key, value in self.api_data.items():
+                if isinstance(value, Iterator):
+                    self.api_data[key] = list(value)
 
-            assert adapter is not None
-            content: str = adapter.encode(self.api_data,
-                                          request=self.request,
-                                          **self.encoder_kwargs)
+            content: str = self._build_encoder_adapter().encode(
+                self.api_data,
+                request=self.request,
+                **self.encoder_kwargs)
 
             if self.callback is not None:
                 content = f'{self.callback}({content});'
@@ -393,6 +434,230 @@ class WebAPIResponse(HttpResponse):
         # incorrectly interprets `HttpResponse.content` as being `bytes`.
         HttpResponse.content.fset(self, value)  # type: ignore
 
+    @property
+    def streaming_content(self) -> Iterator[bytes]:
+        """The encoded API response content, as an iterator of chunks.
+
+        This is only used when :py:attr:`streaming` is set.
+
+        Version Added:
+            7.0
+
+        Type:
+            collections.abc.Iterator
+        """
+        if self._streaming_content is None:
+            self._streaming_content = self._iter_content()
+
+        return self._streaming_content
+
+    @streaming_content.setter
+    def streaming_content(
+        self,
+        value: Iterable[bytes],
+    ) -> None:
+        """Set the streaming content on the response.
+
+        This allows middleware to wrap the streamed content.
+
+        Version Added:
+            7.0
+
+        Args:
+            value (collections.abc.Iterable):
+                The new iterable of content chunks.
+        """
+        self._streaming_content = iter(value)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate through the encoded content.
+
+        Version Added:
+            7.0
+
+        Yields:
+            bytes:
+            Each chunk of encoded content.
+        """
+        if self.streaming:
+            return self.streaming_content
+
+        return super().__iter__()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Asynchronously iterate through the encoded content.
+
+        This is used by ASGI handlers when streaming. Since the payload is
+        encoded synchronously, it will be fully encoded in a worker thread
+        before being sent.
+
+        Version Added:
+            7.0
+
+        Yields:
+            bytes:
+            Each chunk of encoded content.
+        """
+        for part in await sync_to_async(list)(self.streaming_content):
+            yield part
+
+    def _is_json_mimetype(self) -> bool:
+        """Return whether the response is encoded as JSON.
+
+        Version Added:
+            7.0
+
+        Returns:
+            bool:
+            ``True`` if the response mimetype is for JSON content.
+        """
+        # Note that text/plain is used for JSON content sent to older
+        # browsers.
+        return (self.mimetype == 'text/plain' or
+                is_mimetype_a(self.mimetype, 'application/json'))
+
+    def _build_encoder_adapter(
+        self,
+    ) -> JSONEncoderAdapter | XMLEncoderAdapter:
+        """Return an adapter for encoding the payload.
+
+        The adapter will try each of :py:attr:`encoders` in turn.
+
+        Version Added:
+            7.0
+
+        Returns:
+            djblets.webapi.encoders.JSONEncoderAdapter or
+            djblets.webapi.encoders.XMLEncoderAdapter:
+            The adapter for the response mimetype.
+        """
+        class MultiEncoder(WebAPIEncoder):
+            def __init__(
+                self,
+                encoders: Sequence[WebAPIEncoder],
+            ) -> None:
+                self.encoders = encoders
+
+            def encode(self, *args, **kwargs) -> str:
+                for encoder in self.encoders:
+                    result = encoder.encode(*args, **kwargs)
+
+                    if result is not None:
+                        return result
+
+                return ''
+
+        adapter: (JSONEncoderAdapter | XMLEncoderAdapter | None) = None
+        encoder = MultiEncoder(self.encoders)
+
+        if self._is_json_mimetype():
+            adapter = JSONEncoderAdapter(encoder)
+        elif is_mimetype_a(self.mimetype, "application/xml"):
+            # Streamed responses use the faster compact writer.
+            adapter = XMLEncoderAdapter(encoder, compact=self.streaming)
+
+        assert adapter is not None
+
+        return adapter
+
+    def _iter_content(self) -> Iterator[bytes]:
+        """Generate the encoded payload in chunks.
+
+        Each top-level value in the payload is encoded separately, with
+        lists (and iterators) encoded one item at a time. Encoded pieces are
+        combined into chunks of roughly :py:attr:`stream_chunk_size` bytes.
+
+        Version Changed:
+            7.0:
+            Added support for XML payloads.
+
+        Version Added:
+            7.0
+
+        Yields:
+            bytes:
+            Each chunk of encoded content.
+        """
+        if self.content_set:
+            # The full content was already generated.
+            yield super().content
+            return
+
+        adapter = self._build_encoder_adapter()
+        request = self.request
+        encoder_kwargs = self.encoder_kwargs
+        chunk_size = self.stream_chunk_size
+
+        def _encode(
+            value: Any,
+        ) -> str:
+            return adapter.encode(value, request=request, **encoder_kwargs)
+
+        def _iter_pieces() -> Iterator[str]:
+            if self.callback is not None:
+                yield f'{self.callback}('
+
+            if isinstance(adapter, XMLEncoderAdapter):
+                yield from adapter.iterencode(self.api_data,
+                                              request=request,
+                                              **encoder_kwargs)
+            else:
+                yield from _iter_json_pieces(adapter)
+
+            if self.callback is not None:
+                yield ');'
+
+        def _iter_json_pieces(
+            adapter: JSONEncoderAdapter,
+        ) -> Iterator[str]:
+            item_separator = adapter.item_separator
+            key_separator = adapter.key_separator
+
+            yield '{'
+
+            items: Iterable[tuple[str, Any]] = self.api_data.items()
+
+            if adapter.sort_keys:
+                items = sorted(items)
+
+            for i, (key, value) in enumerate(items):
+                if i > 0:
+                    yield item_separator
+
+                yield _encode(key)
+                yield key_separator
+
+                if isinstance(value, (list, tuple, Iterator)):
+                    yield '['
+
+                    for j, item in enumerate(value):
+                        if j > 0:
+                            yield item_separator
+
+                        yield _encode(item)
+
+                    yield ']'
+                else:
+                    yield _encode(value)
+
+            yield '}'
+
+        buf: list[bytes] = []
+        buf_size = 0
+
+        for piece in _iter_pieces():
+            data = self.make_bytes(piece)
+            buf.append(data)
+            buf_size += len(data)
+
+            if buf_size >= chunk_size:
+                yield b''.join(buf)
+                buf = []
+                buf_size = 0
+
+        if buf:
+            yield b''.join(buf)
+
 
 class WebAPIResponsePaginated(WebAPIResponse):
     """A response containing a list of results with pagination.
@@ -486,10 +751,19 @@ class WebAPIResponsePaginated(WebAPIResponse):
             None
         ) = None,
         extra_data: Mapping[Any, Any] = {},
+        stream: bool = False,
         **kwargs,
     ) -> None:
         """Initialize the response.
 
+        If ``stream`` is set, results will be serialized as the response is
+        sent to the client, rather than up-front. :py:attr:`results` will
+        then contain the unserialized results for the page.
+
+        Version Changed:
+            7.0:
+            Added the ``stream`` argument.
+
         Version Changed:
             6.0:
             Added the ``serialize_object_list_func`` argument.
@@ -559,6 +833,13 @@ class WebAPIResponsePaginated(WebAPIResponse):
             extra_data (dict, optional):
                 Extra payload data to merge into the resulting payload.
 
+            stream (bool, optional):
+                Whether to stream the payload to the client, serializing
+                results as they're sent.
+
+                Version Added:
+                    7.0
+
             **kwargs (dict):
                 Keyword arguments to pass to the parent class.
         """
@@ -586,20 +867,33 @@ class WebAPIResponsePaginated(WebAPIResponse):
         self.results = self.get_results()
         self.total_results = self.get_total_results()
 
+        serialized_results: Iterable[Any]
+
         if self.total_results == 0:
             self.results = []
-        elif serialize_object_list_func:
-            self.results = serialize_object_list_func(self.results)
-        elif serialize_object_func:
-            self.results = [
-                serialize_object_func(obj)
-                for obj in self.results
-            ]
-        else:
+            serialized_results = self.results
+        elif stream:
+            # Fetch the results now, but wait to serialize them until
+            # they're being sent.
             self.results = list(self.results)
+            serialized_results = self._iter_serialized_results(
+                serialize_object_func=serialize_object_func,
+                serialize_object_list_func=serialize_object_list_func)
+        else:
+            if serialize_object_list_func:
+                self.results = serialize_object_list_func(self.results)
+            elif serialize_object_func:
+                self.results = [
+                    serialize_object_func(obj)
+                    for obj in self.results
+                ]
+            else:
+                self.results = list(self.results)
+
+            serialized_results = self.results
 
         data: WebAPIResponsePayload = {
-            results_key: self.results,
+            results_key: serialized_results,
             'links': {},
         }
         data.update(extra_data)
@@ -613,6 +907,7 @@ class WebAPIResponsePaginated(WebAPIResponse):
 
         super().__init__(request,
                          obj=data,
+                         stream=stream,
                          *args,
                          **kwargs)
 
@@ -744,6 +1039,39 @@ class WebAPIResponsePaginated(WebAPIResponse):
 
         return links
 
+    def _iter_serialized_results(
+        self,
+        *,
+        serialize_object_func: Callable[[object], Any] | None,
+        serialize_object_list_func: (
+            Callable[[Iterable[Any]], Sequence[Any]] |
+            None
+        ),
+    ) -> Iterator[Any]:
+        """Generate serialized results for a streamed payload.
+
+        Version Added:
+            7.0
+
+        Args:
+            serialize_object_func (callable):
+                A function to call to serialize a single result.
+
+            serialize_object_list_func (callable):
+                A function to call to serialize a list of objects.
+
+        Yields:
+            object:
+            Each serialized result.
+        """
+        if serialize_object_list_func:
+            yield from serialize_object_list_func(self.results)
+        elif serialize_object_func:
+            for obj in self.results:
+                yield serialize_object_func(obj)
+        else:
+            yield from self.results
+
     def build_pagination_url(
         self,
         full_path: str,
@@ -776,6 +1104,396 @@ class WebAPIResponsePaginated(WebAPIResponse):
         )
 
 
+class WebAPIResponseCursorPaginated(WebAPIResponsePaginated):
+    """A response containing a list of results with cursor pagination.
+
+    Rather than paging by offset, this pages through results using the sort
+    key of the last (or first) result on the current page, encoded in an
+    opaque cursor in the next and previous links. Each page is then fetched
+    using ``WHERE`` clauses that can make use of an index, so later pages
+    are as fast to fetch as the first.
+
+    This accepts the following parameters to the URL:
+
+    * cursor - The opaque cursor from a next or previous link.
+    * max-results - The maximum number of results to return in the request.
+    * include-total - Whether to include the total number of results
+      (``1`` or ``true``).
+
+    Counting results can be expensive for large tables, so the total is
+    only included when requested. It can also be cached for a period of
+    time by passing ``total_results_cache_expiration``.
+
+    Results are sorted by the provided ``ordering``, or the ordering of the
+    queryset, with the primary key added to break ties. Each field must be
+    a non-nullable field on the model or an annotation on the queryset, and
+    should ideally be indexed.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The query argument key for the cursor.
+    #:
+    #: Type:
+    #:     str
+    cursor_param: str
+
+    #: The query argument key requesting the total number of results.
+    #:
+    #: Type:
+    #:     str
+    include_total_param: str
+
+    #: The fields used to sort results.
+    #:
+    #: Fields prefixed with ``-`` are sorted in descending order.
+    #:
+    #: Type:
+    #:     list of str
+    ordering: Sequence[str]
+
+    #: The expiration time for a cached total number of results, in seconds.
+    #:
+    #: If ``None``, the total will be computed on each request.
+    #:
+    #: Type:
+    #:     int
+    total_results_cache_expiration: int | None
+
+    def __init__(
+        self,
+        request: HttpRequest,
+        *args,
+        ordering: (Sequence[str] | None) = None,
+        cursor_param: str = 'cursor',
+        include_total_param: str = 'include-total',
+        total_results_cache_expiration: (int | None) = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            *args (tuple):
+                Positional arguments to pass to the parent class.
+
+            ordering (list of str, optional):
+                The fields used to sort results.
+
+                If not provided, the ordering of the queryset or model will
+                be used.
+
+            cursor_param (str, optional):
+                The query argument key for the cursor.
+
+            include_total_param (str, optional):
+                The query argument key requesting the total number of
+                results.
+
+            total_results_cache_expiration (int, optional):
+                The expiration time for a cached total number of results, in
+                seconds.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the parent class.
+
+        Raises:
+            ValueError:
+                The ordering contains expressions or random ordering, which
+                can't be used for cursors.
+        """
+        self.ordering = ordering or []
+        self.cursor_param = cursor_param
+        self.include_total_param = include_total_param
+        self.total_results_cache_expiration = total_results_cache_expiration
+        self._has_prev = False
+        self._has_next = False
+        self._prev_cursor: (str | None) = None
+        self._next_cursor: (str | None) = None
+
+        super().__init__(request, *args, **kwargs)
+
+    def has_prev(self) -> bool:
+        """Return whether there's a previous set of results.
+
+        Returns:
+            bool:
+            ``True`` if there's a previous set of results. ``False`` if
+            there is not.
+        """
+        return self._has_prev
+
+    def has_next(self) -> bool:
+        """Return whether there's a next set of results.
+
+        Returns:
+            bool:
+            ``True`` if there's a next set of results. ``False`` if there
+            is not.
+        """
+        return self._has_next
+
+    def get_ordering(self) -> Sequence[str]:
+        """Return the fields used to sort results.
+
+        The primary key will be added if not already present, ensuring a
+        stable order.
+
+        Returns:
+            list of str:
+            The fields used to sort results.
+
+        Raises:
+            ValueError:
+                The ordering contains expressions or random ordering, which
+                can't be used for cursors.
+        """
+        queryset = self.queryset
+        assert queryset is not None
+
+        meta = queryset.model._meta
+        assert meta.pk is not None
+
+        ordering = list(self.ordering or
+                        queryset.query.order_by or
+                        meta.ordering)
+
+        for field in ordering:
+            if not isinstance(field, str) or field == '?':
+                raise ValueError(
+                    f'{field!r} cannot be used to order results for '
+                    f'cursor pagination.')
+
+        if not any(field.lstrip('-') in ('pk', meta.pk.name)
+                   for field in ordering):
+            ordering.append('pk')
+
+        return ordering
+
+    def get_results(self) -> Collection[Any]:
+        """Return the results for this page.
+
+        This will fetch one more result than needed, in order to determine
+        if there's another page of results.
+
+        Returns:
+            collections.abc.Collection:
+            The collection of results from the queryset.
+        """
+        queryset = self.queryset
+
+        if queryset is None:
+            return []
+
+        ordering = self.get_ordering()
+        cursor = decode_keyset_cursor(self.request.GET.get(self.cursor_param),
+                                      queryset=queryset,
+                                      ordering=ordering)
+        is_prev = False
+
+        if cursor is not None:
+            is_prev = (cursor.direction == 'prev')
+            queryset = queryset.filter(build_keyset_q(
+                ordering=ordering,
+                values=cursor.values,
+                reverse=is_prev))
+
+        if is_prev:
+            # Walk backwards from the cursor, and then flip the page.
+            queryset = queryset.order_by(*(
+                field[1:] if field.startswith('-') else f'-{field}'
+                for field in ordering
+            ))
+        else:
+            queryset = queryset.order_by(*ordering)
+
+        max_results = self.max_results
+        results = list(queryset[:max_results + 1])
+        has_more = len(results) > max_results
+        results = results[:max_results]
+
+        if is_prev:
+            results.reverse()
+            self._has_prev = has_more
+            self._has_next = True
+        else:
+            self._has_prev = cursor is not None
+            self._has_next = has_more
+
+        if results:
+            if self._has_prev:
+                self._prev_cursor = encode_keyset_cursor(
+                    'prev',
+                    self._get_cursor_values(results[0], ordering))
+
+            if self._has_next:
+                self._next_cursor = encode_keyset_cursor(
+                    'next',
+                    self._get_cursor_values(results[-1], ordering))
+        else:
+            self._has_prev = False
+            self._has_next = False
+
+        return results
+
+    def get_total_results(self) -> int | None:
+        """Return the total number of results across all pages.
+
+        This is only computed if requested by the client. If
+        :py:attr:`total_results_cache_expiration` is set, it will be cached.
+
+        Returns:
+            int:
+            The number of resulting items, or ``None`` if not requested.
+        """
+        queryset = self.queryset
+
+        if queryset is None:
+            return super().get_total_results()
+
+        include_total = self.request.GET.get(self.include_total_param, '')
+
+        if include_total.lower() not in ('1', 'true'):
+            return None
+
+        expiration = self.total_results_cache_expiration
+
+        if expiration is None:
+            return queryset.count()
+
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+
+        return cache_memoize(
+            ['webapi-total-results', queryset.db, sql, repr(params)],
+            queryset.count,
+            expiration=expiration)
+
+    def get_links(self) -> WebAPIResponseLinks:
+        """Return all links used in the payload.
+
+        By default, this only includes pagination links. Subclasses can
+        provide additional links.
+
+        Returns:
+            dict:
+            The dictionary mapping link names to link information.
+
+            See :py:class:`WebAPIResponseLinkDict` for the format of the link
+            information dictionaries.
+        """
+        links: WebAPIResponseLinks = {}
+
+        full_path = self.request.build_absolute_uri(self.request.path)
+
+        query_parameters = get_url_params_except(
+            self.request.GET, self.cursor_param, self.start_param,
+            self.max_results_param)
+
+        if query_parameters:
+            query_parameters = f'&{query_parameters}'
+
+        if self.has_prev() and self._prev_cursor:
+            links[self.prev_key] = {
+                'method': 'GET',
+                'href': self.build_cursor_url(
+                    full_path, self._prev_cursor,
+                    self.max_results, query_parameters),
+            }
+
+        if self.has_next() and self._next_cursor:
+            links[self.next_key] = {
+                'method': 'GET',
+                'href': self.build_cursor_url(
+                    full_path, self._next_cursor,
+                    self.max_results, query_parameters),
+            }
+
+        return links
+
+    def build_cursor_url(
+        self,
+        full_path: str,
+        cursor: str,
+        max_results: int,
+        query_parameters: str,
+    ) -> str:
+        """Build a URL to go to the previous or next set of results.
+
+        Args:
+            full_path (str):
+                The full path to the API endpoint.
+
+            cursor (str):
+                The encoded cursor for the results.
+
+            max_results (int):
+                The maximum number of results to return.
+
+            query_parameters (str):
+                Additional query parameters to include in the query string.
+                This must start with ``&``.
+
+        Returns:
+            str:
+            The resulting URL.
+        """
+        return (
+            f'{full_path}'
+            f'?{self.cursor_param}={cursor}'
+            f'&{self.max_results_param}={max_results}'
+            f'{query_parameters}'
+        )
+
+    def _get_cursor_values(
+        self,
+        obj: Any,
+        ordering: Sequence[str],
+    ) -> list[Any]:
+        """Return the values of the sort fields for a result.
+
+        Args:
+            obj (django.db.models.Model):
+                The result.
+
+            ordering (list of str):
+                The fields used to sort results.
+
+        Returns:
+            list:
+            The value for each field.
+        """
+        meta = obj._meta
+        values: list[Any] = []
+
+        for field in ordering:
+            name = field.lstrip('-')
+
+            if name == 'pk':
+                value = obj.pk
+            else:
+                try:
+                    name = meta.get_field(name).attname
+                except (AttributeError, FieldDoesNotExist):
+                    # This may be an annotation.
+                    pass
+
+                value = getattr(obj, name)
+
+            values.append(value)
+
+        return values
+
+
 class WebAPIResponseError(WebAPIResponse):
     """A general API error response.
 
@@ -7,18 +7,21 @@ import logging
 import time
 
 import kgb
-from django.contrib.auth.models import User
+from django.contrib.auth.models import AnonymousUser, User
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.core.cache import cache
-from django.http import HttpResponse
+from django.db import connection
+from django.db.models.signals import post_delete
+from django.http import HttpRequest, HttpResponse
 from django.test.client import RequestFactory
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.utils import timezone
 
 from djblets.protect.ratelimit import _get_time_int
 from djblets.testing.testcases import TestCase, TestModelsLoaderMixin
 from djblets.webapi.auth.backends.api_tokens import (TokenAuthBackendMixin,
-                                                     WebAPITokenAuthBackend)
+                                                     WebAPITokenAuthBackend,
+                                                     _last_used_buffer)
 from djblets.webapi.models import BaseWebAPIToken
 
 
@@ -32,6 +35,13 @@ class MyTestTokenAuthBackend(TokenAuthBackendMixin):
     api_token_model = MyTestWebAPITokenModel
 
 
+class MyTestCachedTokenAuthBackend(TokenAuthBackendMixin):
+    """Mock Token Auth Backend with token caching for testing purposes."""
+
+    api_token_model = MyTestWebAPITokenModel
+    token_cache_enabled = True
+
+
 @override_settings(AUTHENTICATION_BACKENDS=(
     'djblets.webapi.tests.test_api_auth_backend.MyTestTokenAuthBackend',
 ))
@@ -348,3 +358,230 @@ class WebAPITokenAuthBackendTests(kgb.SpyAgency,
                     ),
                 }
             ))
+
+    @override_settings(AUTHENTICATION_BACKENDS=(
+        'djblets.webapi.tests.test_api_auth_backend.'
+        'MyTestCachedTokenAuthBackend',
+    ))
+    def test_authenticate_with_token_cache(self) -> None:
+        """Testing Token Auth authenticate with token_cache_enabled only
+        fetches the token once
+        """
+        token = 'token123'
+        self.user = User.objects.create_user(username='testuser')
+        MyTestWebAPITokenModel.objects.create(user=self.user, token=token)
+
+        table_name = MyTestWebAPITokenModel._meta.db_table
+
+        for i in range(3):
+            request = self._create_token_request(token)
+
+            with CaptureQueriesContext(connection) as ctx:
+                result = self.api_token_auth_backend.authenticate(request)
+
+            self.assertEqual(result, (True, None, None))
+            self.assertEqual(request.user, self.user)
+
+            token_queries = [
+                query['sql']
+                for query in ctx.captured_queries
+                if (table_name in query['sql'] and
+                    query['sql'].startswith('SELECT'))
+            ]
+
+            self.assertEqual(len(token_queries), 1 if i == 0 else 0)
+
+    @override_settings(AUTHENTICATION_BACKENDS=(
+        'djblets.webapi.tests.test_api_auth_backend.'
+        'MyTestCachedTokenAuthBackend',
+    ))
+    def test_authenticate_with_token_cache_and_save(self) -> None:
+        """Testing Token Auth authenticate with token_cache_enabled after
+        the token is saved
+        """
+        token = 'token123'
+        self.user = User.objects.create_user(username='testuser')
+        token_object = MyTestWebAPITokenModel.objects.create(user=self.user,
+                                                             token=token)
+
+        result = self.api_token_auth_backend.authenticate(
+            self._create_token_request(token))
+        self.assertEqual(result, (True, None, None))
+
+        token_object.valid = False
+        token_object.invalid_date = timezone.make_aware(
+            datetime.datetime(2022, 8, 2, 5, 45))
+        token_object.save()
+
+        result = self.api_token_auth_backend.authenticate(
+            self._create_token_request(token))
+        self.assertEqual(
+            result,
+            (
+                False,
+                'This API token became invalid on Aug. 2, 2022, 10:45 a.m..',
+                {
+                    'WWW-Authenticate': 'Basic realm="Web API"',
+                }
+            ))
+
+    @override_settings(AUTHENTICATION_BACKENDS=(
+        'djblets.webapi.tests.test_api_auth_backend.'
+        'MyTestCachedTokenAuthBackend',
+    ))
+    def test_authenticate_with_token_cache_and_invalidate_tokens(
+        self,
+    ) -> None:
+        """Testing Token Auth authenticate with token_cache_enabled after
+        WebAPITokenManager.invalidate_tokens
+        """
+        token = 'token123'
+        self.user = User.objects.create_user(username='testuser')
+        MyTestWebAPITokenModel.objects.create(user=self.user, token=token)
+
+        result = self.api_token_auth_backend.authenticate(
+            self._create_token_request(token))
+        self.assertEqual(result, (True, None, None))
+
+        MyTestWebAPITokenModel.objects.invalidate_tokens(
+            users=[self.user.pk],
+            invalid_reason='Revoked.')
+
+        result = self.api_token_auth_backend.authenticate(
+            self._create_token_request(token))
+        self.assertFalse(result[0])
+        self.assertTrue(result[1].endswith(': Revoked.'))
+
+    @override_settings(AUTHENTICATION_BACKENDS=(
+        'djblets.webapi.tests.test_api_auth_backend.'
+        'MyTestCachedTokenAuthBackend',
+    ))
+    def test_authenticate_with_token_cache_and_delete(self) -> None:
+        """Testing Token Auth authenticate with token_cache_enabled after
+        the token is deleted
+        """
+        token = 'token123'
+        self.user = User.objects.create_user(username='testuser')
+        token_object = MyTestWebAPITokenModel.objects.create(user=self.user,
+                                                             token=token)
+
+        result = self.api_token_auth_backend.authenticate(
+            self._create_token_request(token))
+        self.assertEqual(result, (True, None, None))
+
+        token_object.delete()
+
+        result = self.api_token_auth_backend.authenticate(
+            self._create_token_request(token))
+        self.assertEqual(result, (False, None, None))
+
+    def test_delete_unrelated_model(self) -> None:
+        """Testing deleting models other than API tokens doesn't involve the
+        token cache
+        """
+        self.spy_on(cache.delete)
+
+        User.objects.create_user(username='testuser').delete()
+
+        # Signals sent without an instance shouldn't fail.
+        post_delete.send(sender=User)
+
+        self.assertSpyNotCalled(cache.delete)
+
+    @override_settings(AUTHENTICATION_BACKENDS=(
+        'djblets.webapi.tests.test_api_auth_backend.'
+        'MyTestCachedTokenAuthBackend',
+    ))
+    def test_authenticate_with_token_cache_and_expired(self) -> None:
+        """Testing Token Auth authenticate with token_cache_enabled and a
+        cached token that has since expired
+        """
+        token = 'token123'
+        self.user = User.objects.create_user(username='testuser')
+        now = timezone.now()
+        MyTestWebAPITokenModel.objects.create(
+            user=self.user,
+            token=token,
+            expires=now + datetime.timedelta(seconds=30))
+
+        result = self.api_token_auth_backend.authenticate(
+            self._create_token_request(token))
+        self.assertEqual(result, (True, None, None))
+
+        self.spy_on(timezone.now,
+                    op=kgb.SpyOpReturn(now + datetime.timedelta(minutes=1)))
+
+        result = self.api_token_auth_backend.authenticate(
+            self._create_token_request(token))
+        self.assertFalse(result[0])
+        self.assertTrue(result[1].startswith('This API token expired on '))
+
+    def test_authenticate_with_last_used_update_interval(self) -> None:
+        """Testing Token Auth authenticate with last_used_update_interval
+        coalesces last-used timestamps
+        """
+        class TestBackend(WebAPITokenAuthBackend):
+            last_used_update_interval = 60
+
+        backend = TestBackend()
+        _last_used_buffer.flush()
+        _last_used_buffer._last_flush = None
+
+        token = 'token123'
+        self.user = User.objects.create_user(username='testuser')
+        token_object = MyTestWebAPITokenModel.objects.create(user=self.user,
+                                                             token=token)
+
+        now = timezone.now()
+        self.spy_on(timezone.now, op=kgb.SpyOpReturn(now))
+
+        # The first use is written immediately.
+        result = backend.authenticate(self._create_token_request(token))
+        self.assertEqual(result, (True, None, None))
+
+        token_object.refresh_from_db(fields=('last_used',))
+        self.assertEqual(token_object.last_used, now)
+
+        # Later uses are held until the interval has passed.
+        later = now + datetime.timedelta(seconds=10)
+        timezone.now.unspy()
+        self.spy_on(timezone.now, op=kgb.SpyOpReturn(later))
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = backend.authenticate(self._create_token_request(token))
+
+        self.assertEqual(result, (True, None, None))
+        self.assertFalse(any(
+            query['sql'].startswith('UPDATE') and
+            MyTestWebAPITokenModel._meta.db_table in query['sql']
+            for query in ctx.captured_queries
+        ))
+
+        token_object.refresh_from_db(fields=('last_used',))
+        self.assertEqual(token_object.last_used, now)
+
+        _last_used_buffer.flush()
+
+        token_object.refresh_from_db(fields=('last_used',))
+        self.assertEqual(token_object.last_used, later)
+
+    def _create_token_request(
+        self,
+        token: str,
+    ) -> HttpRequest:
+        """Return a new request authenticating with a token.
+
+        Args:
+            token (str):
+                The token to authenticate with.
+
+        Returns:
+            django.http.HttpRequest:
+            The new request.
+        """
+        request = RequestFactory().get('/')
+        SessionMiddleware(lambda request: HttpResponse(''))(request)
+        request.user = AnonymousUser()
+        request.META['HTTP_AUTHORIZATION'] = f'token {token}'
+
+        return request
@@ -0,0 +1,482 @@
+"""Unit tests for djblets.webapi.resources.batch.BatchResource."""
+
+from __future__ import annotations
+
+import json
+
+import kgb
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import include, path
+
+from djblets.testing.testcases import TestCase
+from djblets.webapi.errors import DOES_NOT_EXIST, INVALID_FORM_DATA
+from djblets.webapi.fields import StringFieldType
+from djblets.webapi.resources.base import WebAPIResource
+from djblets.webapi.resources.batch import BatchResource
+from djblets.webapi.resources.root import RootResource
+
+
+class MyTestUserResource(WebAPIResource):
+    """A user resource used for batch tests."""
+
+    name = 'batch-user'
+    model = User
+    uri_object_key = 'username'
+    uri_object_key_regex = r'[A-Za-z0-9_\-]+'
+    model_object_key = 'username'
+    allowed_methods = ('GET', 'PUT')
+    fields = {
+        'first_name': {
+            'type': StringFieldType,
+        },
+        'username': {
+            'type': StringFieldType,
+        },
+    }
+
+    def get_serializer_for_object(self, obj):
+        return self
+
+    def has_access_permissions(self, *args, **kwargs):
+        return True
+
+    def has_list_access_permissions(self, *args, **kwargs):
+        return True
+
+    def has_modify_permissions(self, *args, **kwargs):
+        return True
+
+    def update(self, request, *args, **kwargs):
+        try:
+            user = self.get_object(request, *args, **kwargs)
+        except User.DoesNotExist:
+            return DOES_NOT_EXIST
+
+        user.first_name = request.PUT.get('first_name', '')
+        user.save(update_fields=('first_name',))
+
+        return 200, {
+            self.item_result_key: user,
+        }
+
+
+batch_user_resource = MyTestUserResource()
+batch_resource = BatchResource()
+batch_root_resource = RootResource([
+    batch_user_resource,
+    batch_resource,
+])
+
+
+urlpatterns = [
+    path('api/', include(batch_root_resource.get_url_patterns())),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class BatchResourceTests(kgb.SpyAgency, TestCase):
+    """Unit tests for BatchResource.
+
+    Version Added:
+        7.0
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.user = User.objects.create(username='test-user',
+                                        first_name='Test')
+
+    def test_post_with_get_requests(self) -> None:
+        """Testing BatchResource.create with GET sub-requests"""
+        User.objects.create(username='other-user')
+
+        rsp = self._post_batch([
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/test-user/',
+            },
+            {
+                'method': 'get',
+                'path': '/api/batch-users/?max-results=1',
+            },
+        ])
+
+        self.assertEqual(rsp['stat'], 'ok')
+
+        responses = rsp['responses']
+        self.assertEqual(len(responses), 2)
+
+        self.assertEqual(responses[0]['status'], 200)
+        self.assertEqual(responses[0]['headers']['Content-Type'],
+                         'application/json')
+        self.assertEqual(responses[0]['body']['batch-user']['username'],
+                         'test-user')
+
+        self.assertEqual(responses[1]['status'], 200)
+        self.assertEqual(responses[1]['body']['total_results'], 2)
+        self.assertEqual(len(responses[1]['body']['batch-users']), 1)
+
+    def test_post_with_query(self) -> None:
+        """Testing BatchResource.create with sub-request query arguments"""
+        User.objects.create(username='other-user')
+
+        rsp = self._post_batch([
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/',
+                'query': {
+                    'max-results': 1,
+                    'start': 1,
+                },
+            },
+        ])
+
+        self.assertEqual(rsp['stat'], 'ok')
+
+        body = rsp['responses'][0]['body']
+        self.assertEqual(len(body['batch-users']), 1)
+        self.assertEqual(body['batch-users'][0]['username'], 'other-user')
+
+    def test_post_with_put_request(self) -> None:
+        """Testing BatchResource.create with PUT sub-request and body"""
+        rsp = self._post_batch([
+            {
+                'method': 'PUT',
+                'path': '/api/batch-users/test-user/',
+                'body': {
+                    'first_name': 'Updated',
+                },
+            },
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/test-user/',
+            },
+        ])
+
+        self.assertEqual(rsp['stat'], 'ok')
+
+        responses = rsp['responses']
+        self.assertEqual(responses[0]['status'], 200)
+        self.assertEqual(responses[1]['body']['batch-user']['first_name'],
+                         'Updated')
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Updated')
+
+    def test_post_shares_object_cache(self) -> None:
+        """Testing BatchResource.create shares fetched objects between GET
+        sub-requests
+        """
+        self.spy_on(MyTestUserResource.get_object,
+                    owner=MyTestUserResource)
+
+        # Prime the site cache, used when building absolute URLs.
+        Site.objects.get_current()
+
+        with CaptureQueriesContext(connection) as ctx:
+            rsp = self._post_batch([
+                {
+                    'method': 'GET',
+                    'path': '/api/batch-users/test-user/',
+                },
+                {
+                    'method': 'GET',
+                    'path': '/api/batch-users/test-user/',
+                },
+            ])
+
+        # Each sub-request runs in a savepoint, but only the first should
+        # have fetched the user.
+        self.assertEqual(
+            len([
+                query
+                for query in ctx.captured_queries
+                if 'SAVEPOINT' not in query['sql']
+            ]),
+            1)
+        self.assertEqual(rsp['stat'], 'ok')
+        self.assertEqual(
+            [response['status'] for response in rsp['responses']],
+            [200, 200])
+        self.assertSpyCallCount(MyTestUserResource.get_object, 2)
+
+    def test_post_shares_serialize_cache(self) -> None:
+        """Testing BatchResource.create shares serialized payloads between
+        GET sub-requests with the same options
+        """
+        self.spy_on(MyTestUserResource.get_links,
+                    owner=MyTestUserResource)
+
+        rsp = self._post_batch([
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/test-user/',
+            },
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/test-user/',
+            },
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/test-user/?only-fields=username',
+            },
+            {
+                'method': 'PUT',
+                'path': '/api/batch-users/test-user/',
+                'body': {
+                    'first_name': 'Updated',
+                },
+            },
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/test-user/',
+            },
+        ])
+
+        self.assertEqual(rsp['stat'], 'ok')
+
+        responses = rsp['responses']
+        self.assertEqual(
+            [response['status'] for response in responses],
+            [200, 200, 200, 200, 200])
+        self.assertEqual(responses[0]['body'], responses[1]['body'])
+        self.assertEqual(set(responses[2]['body']['batch-user']),
+                         {'links', 'username'})
+        self.assertEqual(responses[4]['body']['batch-user']['first_name'],
+                         'Updated')
+
+        # The second GET used the first one's payload. Changing options or
+        # making a change required serializing again.
+        self.assertSpyCallCount(MyTestUserResource.get_links, 3)
+
+    def test_post_with_sub_request_exception_rolls_back(self) -> None:
+        """Testing BatchResource.create rolls back changes from a
+        sub-request raising an exception
+        """
+        def _update(_self, request, *args, **kwargs):
+            User.objects.filter(username='test-user').update(
+                first_name='Broken')
+
+            raise Exception('Oh no')
+
+        self.spy_on(MyTestUserResource.update,
+                    owner=MyTestUserResource,
+                    call_fake=_update)
+
+        rsp = self._post_batch([
+            {
+                'method': 'PUT',
+                'path': '/api/batch-users/test-user/',
+                'body': {
+                    'first_name': 'Updated',
+                },
+            },
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/test-user/',
+            },
+        ])
+
+        self.assertEqual(rsp['stat'], 'ok')
+        self.assertEqual(rsp['responses'][0]['status'], 500)
+        self.assertEqual(rsp['responses'][1]['status'], 200)
+        self.assertEqual(
+            rsp['responses'][1]['body']['batch-user']['first_name'],
+            'Test')
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Test')
+
+    def test_post_with_sub_request_error_rolls_back(self) -> None:
+        """Testing BatchResource.create rolls back changes from a
+        sub-request returning an error response
+        """
+        def _update(_self, request, *args, **kwargs):
+            User.objects.filter(username='test-user').update(
+                first_name='Broken')
+
+            return INVALID_FORM_DATA
+
+        self.spy_on(MyTestUserResource.update,
+                    owner=MyTestUserResource,
+                    call_fake=_update)
+
+        rsp = self._post_batch([
+            {
+                'method': 'PUT',
+                'path': '/api/batch-users/test-user/',
+                'body': {
+                    'first_name': 'Updated',
+                },
+            },
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/test-user/',
+            },
+        ])
+
+        self.assertEqual(rsp['stat'], 'ok')
+        self.assertEqual(rsp['responses'][0]['status'], 400)
+        self.assertEqual(rsp['responses'][1]['status'], 200)
+        self.assertEqual(
+            rsp['responses'][1]['body']['batch-user']['first_name'],
+            'Test')
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Test')
+
+    def test_post_with_unknown_path(self) -> None:
+        """Testing BatchResource.create with sub-request for an unknown
+        path
+        """
+        rsp = self._post_batch([
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/missing-user/',
+            },
+            {
+                'method': 'GET',
+                'path': '/not-an-api/',
+            },
+        ])
+
+        self.assertEqual(rsp['stat'], 'ok')
+
+        for response in rsp['responses']:
+            self.assertEqual(response['status'], 404)
+            self.assertEqual(response['body']['err']['code'],
+                             DOES_NOT_EXIST.code)
+
+    def test_post_with_nested_batch(self) -> None:
+        """Testing BatchResource.create with nested batch sub-request"""
+        rsp = self._post_batch([
+            {
+                'method': 'POST',
+                'path': '/api/batch/',
+                'body': {
+                    'batch': '[]',
+                },
+            },
+        ])
+
+        self.assertEqual(rsp['stat'], 'ok')
+        self.assertEqual(rsp['responses'][0]['status'], 404)
+
+    def test_post_with_sub_request_exception(self) -> None:
+        """Testing BatchResource.create with sub-request raising an
+        exception
+        """
+        self.spy_on(MyTestUserResource.get_list,
+                    owner=MyTestUserResource,
+                    op=kgb.SpyOpRaise(Exception('Oh no')))
+
+        rsp = self._post_batch([
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/',
+            },
+            {
+                'method': 'GET',
+                'path': '/api/batch-users/test-user/',
+            },
+        ])
+
+        self.assertEqual(rsp['stat'], 'ok')
+        self.assertEqual(rsp['responses'][0], {
+            'status': 500,
+            'headers': {},
+            'body': None,
+        })
+        self.assertEqual(rsp['responses'][1]['status'], 200)
+
+    def test_post_with_too_many_requests(self) -> None:
+        """Testing BatchResource.create with more than max_batch_size
+        sub-requests
+        """
+        self.spy_on(MyTestUserResource.get,
+                    owner=MyTestUserResource)
+
+        rsp = self._post_batch(
+            [
+                {
+                    'method': 'GET',
+                    'path': '/api/batch-users/test-user/',
+                },
+            ] * (BatchResource.max_batch_size + 1),
+            expected_status=400)
+
+        self.assertEqual(rsp['stat'], 'fail')
+        self.assertEqual(rsp['err']['code'], INVALID_FORM_DATA.code)
+        self.assertEqual(rsp['fields'], {
+            'batch': ['The batch cannot contain more than 25 requests.'],
+        })
+        self.assertSpyNotCalled(MyTestUserResource.get)
+
+    def test_post_with_invalid_json(self) -> None:
+        """Testing BatchResource.create with invalid JSON"""
+        rsp = self._post_batch('{', expected_status=400)
+
+        self.assertEqual(rsp['stat'], 'fail')
+        self.assertEqual(rsp['err']['code'], INVALID_FORM_DATA.code)
+        self.assertEqual(rsp['fields'], {
+            'batch': ['The batch must be a JSON-encoded list.'],
+        })
+
+    def test_post_with_invalid_method(self) -> None:
+        """Testing BatchResource.create with invalid sub-request method"""
+        rsp = self._post_batch(
+            [
+                {
+                    'method': 'PATCH',
+                    'path': '/api/batch-users/test-user/',
+                },
+            ],
+            expected_status=400)
+
+        self.assertEqual(rsp['stat'], 'fail')
+        self.assertEqual(rsp['fields'], {
+            'batch': [
+                'Request 0 must have a method of GET, POST, PUT, DELETE.',
+            ],
+        })
+
+    def _post_batch(
+        self,
+        batch,
+        expected_status: int = 200,
+    ) -> dict:
+        """Post a batch of sub-requests and return the decoded payload.
+
+        Args:
+            batch (list or str):
+                The list of sub-requests, or an already-encoded string.
+
+            expected_status (int, optional):
+                The expected HTTP status code of the response.
+
+        Returns:
+            dict:
+            The decoded response payload.
+        """
+        if not isinstance(batch, str):
+            batch = json.dumps(batch)
+
+        request = RequestFactory().post(
+            '/api/batch/',
+            {
+                'batch': batch,
+            },
+            HTTP_ACCEPT='application/json')
+        request.user = AnonymousUser()
+        request.session = {}
+
+        response = batch_resource(request)
+
+        self.assertEqual(response.status_code, expected_status)
+
+        return json.loads(response.content)
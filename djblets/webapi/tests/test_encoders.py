@@ -64,3 +64,58 @@ class EncoderAdapterTests(TestCase):
 
         content = adapter.encode(self.data)
         self.assertEqual(content, expected)
+
+    def test_xml_encoder_adapter_with_compact(self):
+        """Testing XMLEncoderAdapter.encode with compact=True"""
+        encoder = WebAPIEncoder()
+        adapter = XMLEncoderAdapter(encoder, compact=True)
+
+        data = self.data.copy()
+        data['escaped_val'] = '<a & b>'
+        data[10] = 'int key'
+
+        expected = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<rsp>'
+            '<string_val>foobar</string_val>'
+            '<none_val></none_val>'
+            '<dict_val><foo>bar</foo></dict_val>'
+            '<bool_val>1</bool_val>'
+            '<scientific_val>2.75e-15</scientific_val>'
+            '<int_val>42</int_val>'
+            '<float_val>3.14159</float_val>'
+            '<list_val><array><item>10</item><item>baz</item></array>'
+            '</list_val>'
+            '<escaped_val>&lt;a &amp; b&gt;</escaped_val>'
+            '<int value="10">int key</int>'
+            '</rsp>'
+        )
+
+        content = adapter.encode(data)
+        self.assertEqual(content, expected)
+
+        # The indented output should only differ in whitespace.
+        indented = XMLEncoderAdapter(encoder).encode(data)
+        self.assertEqual(
+            ''.join(line.strip() for line in indented.splitlines()[1:]),
+            expected.split('\n', 1)[1])
+
+    def test_xml_encoder_adapter_iterencode(self):
+        """Testing XMLEncoderAdapter.iterencode"""
+        encoder = WebAPIEncoder()
+        adapter = XMLEncoderAdapter(encoder, compact=True)
+
+        chunks = list(adapter.iterencode({
+            'a': 1,
+            'items': iter([2, 3]),
+        }))
+
+        self.assertEqual(
+            chunks,
+            [
+                '<?xml version="1.0" encoding="utf-8"?>\n<rsp><a>1</a>',
+                '<items><array><item>2</item>',
+                '<item>3</item>',
+                '</array></items>',
+                '</rsp>',
+            ])
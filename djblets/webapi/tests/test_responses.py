@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import base64
 import json
 from typing import TYPE_CHECKING
 
 from django import forms
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test.client import RequestFactory
 from django.utils.encoding import force_str
 
@@ -20,6 +22,7 @@ from djblets.webapi.resources.user import UserResource
 from djblets.webapi.responses import (WebAPIEventStreamMessage,
                                       WebAPIEventStreamMessages,
                                       WebAPIResponse,
+                                      WebAPIResponseCursorPaginated,
                                       WebAPIResponseError,
                                       WebAPIResponseEventStream,
                                       WebAPIResponseFormError,
@@ -72,6 +75,90 @@ class WebAPIResponseTests(TestCase):
         self.assertEqual(response.encoder_kwargs, encoder_kwargs)
         self.assertEqual(response.mimetype, 'application/json+test')
 
+    def test_with_stream(self) -> None:
+        """Testing WebAPIResponse with stream=True"""
+        obj: WebAPIResponsePayload = {
+            'items': [
+                {
+                    'id': i,
+                    'name': f'item \u2022 {i}',
+                }
+                for i in range(100)
+            ],
+            'links': {
+                'self': {
+                    'href': 'http://testserver/',
+                    'method': 'GET',
+                },
+            },
+            'total': 100,
+        }
+
+        request = RequestFactory().get('/?callback=my_callback')
+
+        response = WebAPIResponse(request=request,
+                                  obj=obj,
+                                  api_format='json',
+                                  stream=True)
+        response.stream_chunk_size = 100
+
+        self.assertTrue(response.streaming)
+
+        chunks = list(response)
+        self.assertGreater(len(chunks), 1)
+
+        expected_response = WebAPIResponse(request=request,
+                                           obj=obj,
+                                           api_format='json')
+        self.assertFalse(expected_response.streaming)
+        self.assertEqual(b''.join(chunks), expected_response.content)
+
+    def test_with_stream_and_iterator(self) -> None:
+        """Testing WebAPIResponse with stream=True and an iterator in the
+        payload
+        """
+        request = RequestFactory().get('/')
+
+        response = WebAPIResponse(request=request,
+                                  obj={
+                                      'items': iter([1, 2, 3]),
+                                  },
+                                  api_format='json',
+                                  stream=True)
+
+        self.assertEqual(b''.join(response),
+                         b'{"items": [1, 2, 3], "stat": "ok"}')
+
+        # Accessing content directly should still build the full payload.
+        response = WebAPIResponse(request=request,
+                                  obj={
+                                      'items': iter([1, 2, 3]),
+                                  },
+                                  api_format='json',
+                                  stream=True)
+
+        self.assertEqual(response.content,
+                         b'{"items": [1, 2, 3], "stat": "ok"}')
+        self.assertEqual(b''.join(response),
+                         b'{"items": [1, 2, 3], "stat": "ok"}')
+
+    def test_with_stream_xml(self) -> None:
+        """Testing WebAPIResponse with stream=True and XML payloads"""
+        response = WebAPIResponse(request=RequestFactory().get('/'),
+                                  obj={
+                                      'a': 1,
+                                      'items': iter(['x & y', None]),
+                                  },
+                                  api_format='xml',
+                                  stream=True)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            b''.join(response),
+            b'<?xml version="1.0" encoding="utf-8"?>\n'
+            b'<rsp><stat>ok</stat><a>1</a><items><array>'
+            b'<item>x &amp; y</item><item></item></array></items></rsp>')
+
 
 class WebAPIResponsePaginatedTests(TestCase):
     """Unit tests for djblets.webapi.responses.WebAPIResponsePaginated."""
@@ -203,6 +290,194 @@ class WebAPIResponsePaginatedTests(TestCase):
         })
 
 
+    def test_with_stream(self) -> None:
+        """Testing WebAPIResponsePaginated with stream=True serializes
+        results when sent
+        """
+        serialized: list[str] = []
+
+        def _my_serialize(
+            user: User,
+        ) -> WebAPIResponsePayload:
+            serialized.append(user.username)
+
+            return {
+                'username': user.username,
+            }
+
+        User.objects.bulk_create([
+            User(username='user1'),
+            User(username='user2'),
+        ])
+
+        response = WebAPIResponsePaginated(
+            request=self.factory.get('/'),
+            queryset=User.objects.order_by('pk'),
+            serialize_object_func=_my_serialize,
+            stream=True)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(serialized, [])
+        self.assertEqual(
+            json.loads(b''.join(response)),
+            {
+                'links': {},
+                'results': [
+                    {
+                        'username': 'user1',
+                    },
+                    {
+                        'username': 'user2',
+                    },
+                ],
+                'stat': 'ok',
+                'total_results': 2,
+            })
+        self.assertEqual(serialized, ['user1', 'user2'])
+
+
+class WebAPIResponseCursorPaginatedTests(TestCase):
+    """Unit tests for djblets.webapi.responses.WebAPIResponseCursorPaginated.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.factory = RequestFactory()
+
+        User.objects.bulk_create([
+            User(username=f'user{i}',
+                 first_name=f'name{i % 3}')
+            for i in range(7)
+        ])
+
+        cache.clear()
+
+    def test_pagination(self) -> None:
+        """Testing WebAPIResponseCursorPaginated paging through results"""
+        url = '/api/users/?max-results=3&q=x'
+        pages: list[list[str]] = []
+
+        while url:
+            response = self._create_response(url, ordering=['-first_name'])
+            rsp = json.loads(response.content)
+            pages.append(rsp['results'])
+
+            self.assertNotIn('total_results', rsp)
+            self.assertEqual('prev' in rsp['links'], len(pages) > 1)
+
+            url = rsp['links'].get('next', {}).get('href')
+
+        self.assertEqual(pages, [
+            ['user2', 'user5', 'user1'],
+            ['user4', 'user0', 'user3'],
+            ['user6'],
+        ])
+
+        # Now page back.
+        url = rsp['links']['prev']['href']
+        self.assertIn('&max-results=3&q=x', url)
+
+        response = self._create_response(url, ordering=['-first_name'])
+        rsp = json.loads(response.content)
+
+        self.assertEqual(rsp['results'], ['user4', 'user0', 'user3'])
+        self.assertEqual(set(rsp['links']), {'next', 'prev'})
+
+        response = self._create_response(rsp['links']['prev']['href'],
+                                         ordering=['-first_name'])
+        rsp = json.loads(response.content)
+
+        self.assertEqual(rsp['results'], ['user2', 'user5', 'user1'])
+        self.assertEqual(set(rsp['links']), {'next'})
+
+    def test_with_invalid_cursor(self) -> None:
+        """Testing WebAPIResponseCursorPaginated with an invalid cursor"""
+        response = self._create_response('/?max-results=2&cursor=xxx')
+
+        self.assertEqual(response.api_data['results'], ['user0', 'user1'])
+
+    def test_with_invalid_cursor_values(self) -> None:
+        """Testing WebAPIResponseCursorPaginated with a cursor containing
+        invalid values for the sort fields
+        """
+        for data in (['next', ['zzz']],
+                     ['next', [None]],
+                     ['next', [[1]]],
+                     ['prev', ['name1', 'abc']]):
+            cursor = force_str(
+                base64.urlsafe_b64encode(json.dumps(data).encode('utf-8')))
+
+            with self.subTest(data=data):
+                response = self._create_response(
+                    f'/?max-results=2&cursor={cursor}')
+
+                self.assertEqual(response.api_data['results'],
+                                 ['user0', 'user1'])
+
+        # Mismatched types should also be caught for other fields.
+        cursor = force_str(base64.urlsafe_b64encode(
+            json.dumps(['next', ['not-a-date', 1]]).encode('utf-8')))
+        response = self._create_response(f'/?max-results=2&cursor={cursor}',
+                                         ordering=['date_joined'])
+
+        self.assertEqual(response.api_data['results'], ['user0', 'user1'])
+
+    def test_with_include_total(self) -> None:
+        """Testing WebAPIResponseCursorPaginated with ?include-total=1"""
+        response = self._create_response('/?include-total=1')
+
+        self.assertEqual(response.api_data['total_results'], 7)
+
+    def test_with_total_results_cache_expiration(self) -> None:
+        """Testing WebAPIResponseCursorPaginated with
+        total_results_cache_expiration
+        """
+        response = self._create_response('/?include-total=1',
+                                         total_results_cache_expiration=60)
+        self.assertEqual(response.api_data['total_results'], 7)
+
+        User.objects.create(username='user7')
+
+        with self.assertNumQueries(1):
+            response = self._create_response(
+                '/?include-total=1',
+                total_results_cache_expiration=60)
+
+        self.assertEqual(response.api_data['total_results'], 7)
+
+    def test_with_random_ordering(self) -> None:
+        """Testing WebAPIResponseCursorPaginated with random ordering"""
+        message = "'?' cannot be used to order results for cursor pagination."
+
+        with self.assertRaisesMessage(ValueError, message):
+            self._create_response('/', ordering=['?'])
+
+    def _create_response(
+        self,
+        url: str,
+        **kwargs,
+    ) -> WebAPIResponseCursorPaginated:
+        """Return a response for a URL.
+
+        Args:
+            url (str):
+                The URL being requested.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the response.
+
+        Returns:
+            djblets.webapi.responses.WebAPIResponseCursorPaginated:
+            The resulting response.
+        """
+        return WebAPIResponseCursorPaginated(
+            request=self.factory.get(url),
+            queryset=User.objects.all(),
+            serialize_object_func=lambda user: user.username,
+            **kwargs)
+
+
 class WebAPIResponseErrorTests(TestCase):
     """Unit tests for djblets.webapi.responses.WebAPIResponseError."""
 
@@ -8,10 +8,16 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import kgb
-from django.contrib.auth.models import User
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
 from django.db import models
+from django.db.models import Prefetch
 from django.http import HttpResponse, HttpResponseNotModified
 from django.test.client import RequestFactory
+from django.test.utils import override_settings
+from django.urls import (NoReverseMatch, clear_url_caches, include, path,
+                         re_path, reverse, set_script_prefix)
+from django.utils.datastructures import MultiValueDict
 
 from djblets.db.query import LocalDataQuerySet
 from djblets.testing.testcases import TestCase, TestModelsLoaderMixin
@@ -19,7 +25,8 @@ from djblets.webapi.auth.backends import check_login
 from djblets.webapi.fields import (ResourceFieldType,
                                    ResourceListFieldType,
                                    StringFieldType)
-from djblets.webapi.resources.base import WebAPIResource
+from djblets.webapi.resources.base import (WebAPIListVersionStrategy,
+                                           WebAPIResource)
 from djblets.webapi.resources.registry import (register_resource_for_model,
                                                unregister_resource_for_model,
                                                unregister_resource)
@@ -40,6 +47,18 @@ class MyTestGroup(models.Model):
     users = models.ManyToManyField(User)
 
 
+class MyTestGroupMember(models.Model):
+    group = models.ForeignKey(MyTestGroup,
+                              on_delete=models.CASCADE,
+                              related_name='members')
+    user = models.ForeignKey(User,
+                             on_delete=models.CASCADE)
+
+    @property
+    def owner(self):
+        return self.user
+
+
 class BaseTestWebAPIResource(WebAPIResource):
     mimetype_vendor = 'djblets-test'
 
@@ -89,6 +108,121 @@ class MyTestGroupResource(BaseTestWebAPIResource):
             return self
 
 
+class MyTestGroupMemberResource(BaseTestWebAPIResource):
+    name = 'member'
+    model = MyTestGroupMember
+    model_parent_key = 'group'
+    uri_object_key = 'member_pk'
+
+    fields = {
+        'user': {
+            'type': ResourceFieldType,
+            'resource': MyTestUserResource,
+        },
+    }
+
+    def get_queryset(self, request, is_list=False, *args, **kwargs):
+        return MyTestGroupMember.objects.filter(group=kwargs['pk'])
+
+    def get_parent_prefetch_queryset(self, request, *, parent_resource):
+        return MyTestGroupMember.objects.all()
+
+    def get_href(self, obj, *args, **kwargs):
+        return ('http://testserver/api/test/groups/%s/members/%s/'
+                % (obj.group_id, obj.pk))
+
+
+class MyTestColumnsGroupMemberResource(MyTestGroupMemberResource):
+    name = 'columns-member'
+
+    fields = {
+        'user': {
+            'type': ResourceFieldType,
+            'resource': MyTestUserResource,
+        },
+        'username': {
+            'type': StringFieldType,
+        },
+    }
+
+    field_model_columns = {
+        'username': ['user'],
+    }
+
+    def serialize_username_field(self, obj, **kwargs):
+        return obj.user.username
+
+
+class MyTestCachedGroupResource(MyTestGroupResource):
+    name = 'cached-group'
+    serialized_object_cache_enabled = True
+
+    def get_etag(self, request, obj, *args, **kwargs):
+        return self.encode_etag(request, 'etag')
+
+    def serialize_name_field(self, obj, **kwargs):
+        return obj.name
+
+
+class MyTestPrefetchGroupResource(MyTestGroupResource):
+    name = 'prefetch-group'
+    item_child_resources = [MyTestGroupMemberResource()]
+
+
+class MyTestVersionedUserResource(MyTestUserResource):
+    name = 'versioned-user'
+    list_version_strategy = WebAPIListVersionStrategy.AGGREGATE
+    list_last_modified_field = 'date_joined'
+
+    def get_serializer_for_object(self, o):
+        return self
+
+
+class MyTestVersionedGroupResource(MyTestGroupResource):
+    name = 'versioned-group'
+    list_version_strategy = WebAPIListVersionStrategy.GENERATION
+
+
+class MyTestURLGroupResource(BaseTestWebAPIResource):
+    name = 'url-group'
+    model = MyTestGroup
+    uri_object_key = 'pk'
+    allowed_methods = ('GET', 'PUT', 'DELETE')
+    item_child_resources = [MyTestGroupMemberResource()]
+
+    fields = {
+        'name': {
+            'type': StringFieldType,
+        },
+    }
+
+
+url_group_resource = MyTestURLGroupResource()
+
+
+def _url_test_view(request, **kwargs):
+    return HttpResponse()
+
+
+urlpatterns = [
+    path('api/url-groups/',
+         include(url_group_resource.get_url_patterns())),
+    path('api/converter-groups/<int:pk>/<slug:slug>/',
+         _url_test_view,
+         name='converter-group-resource'),
+    re_path(r'^api/regex-groups/(?P<pk>[0-9]+)-(?P<slug>[a-z]+)/$',
+            _url_test_view,
+            name='regex-group-resource'),
+    path('api/default-groups/',
+         _url_test_view,
+         {'format': 'json'},
+         name='default-group-resource'),
+    path('api/default-groups/<str:format>/',
+         _url_test_view,
+         name='default-group-resource'),
+]
+
+
 class BaseTestRefUserResource(BaseTestWebAPIResource):
     name = 'test'
     uri_object_key = 'pk'
@@ -116,6 +250,8 @@ class WebAPIResourceTests(kgb.SpyAgency, TestModelsLoaderMixin, TestCase):
         self.factory = RequestFactory()
         self.test_resource = None
 
+        cache.clear()
+
     def tearDown(self):
         super(WebAPIResourceTests, self).tearDown()
 
@@ -561,6 +697,131 @@ class WebAPIResourceTests(kgb.SpyAgency, TestModelsLoaderMixin, TestCase):
             }
         })
 
+    def test_serialize_object_with_only_fields_skips_non_links(self):
+        """Testing WebAPIResource.serialize_object with ?only-fields= doesn't
+        read excluded fields that can't be links
+        """
+        accessed_fields = []
+
+        class TestObject(object):
+            field1 = 'abc'
+
+            @property
+            def field2(self):
+                accessed_fields.append('field2')
+
+                return 'def'
+
+        class TestResource(WebAPIResource):
+            fields = {
+                'field1': {
+                    'type': StringFieldType,
+                },
+                'field2': {
+                    'type': StringFieldType,
+                },
+            }
+
+        request = RequestFactory().get('/api/test/?only-fields=field1')
+        resource = TestResource()
+
+        data = resource.serialize_object(TestObject(), request=request)
+
+        self.assertEqual(accessed_fields, [])
+        self.assertEqual(data, {
+            'field1': 'abc',
+            'links': {
+                'self': {
+                    'href': 'http://testserver/api/test/'
+                            '?only-fields=field1',
+                    'method': 'GET',
+                },
+            }
+        })
+
+    def test_serialize_object_with_only_fields_and_serializer_link(self):
+        """Testing WebAPIResource.serialize_object with ?only-fields= links
+        excluded fields with serializers returning objects
+        """
+        user = User.objects.create(username='user1')
+
+        class TestObject(object):
+            field1 = 'abc'
+
+        class TestResource(WebAPIResource):
+            fields = {
+                'field1': {
+                    'type': StringFieldType,
+                },
+                'field2': {
+                    'type': StringFieldType,
+                },
+            }
+
+            def serialize_field2_field(self, obj, **kwargs):
+                return user
+
+            def get_serializer_for_object(self, o):
+                return MyTestUserResource()
+
+        request = RequestFactory().get('/api/test/?only-fields=field1')
+        resource = TestResource()
+        self.spy_on(resource.serialize_field2_field)
+
+        data = resource.serialize_object(TestObject(), request=request)
+
+        self.assertSpyCalled(resource.serialize_field2_field)
+        self.assertEqual(data, {
+            'field1': 'abc',
+            'links': {
+                'field2': {
+                    'href': 'http://testserver/api/test/users/%s/'
+                            % user.pk,
+                    'method': 'GET',
+                    'title': 'user1',
+                },
+                'self': {
+                    'href': 'http://testserver/api/test/'
+                            '?only-fields=field1',
+                    'method': 'GET',
+                },
+            }
+        })
+
+    def test_serialize_object_with_only_fields_and_property_link(self):
+        """Testing WebAPIResource.serialize_object with ?only-fields= links
+        excluded model properties returning objects
+        """
+        class TestResource(MyTestGroupMemberResource):
+            name = 'owner-member'
+
+            fields = {
+                'owner': {
+                    'description': 'The owner of the membership.',
+                },
+            }
+
+            def get_serializer_for_object(self, o):
+                return MyTestUserResource()
+
+        self.test_resource = TestResource()
+
+        group = MyTestGroup.objects.create(name='group1')
+        user = User.objects.create(username='user1')
+        member = MyTestGroupMember.objects.create(group=group,
+                                                  user=user)
+
+        request = RequestFactory().get(
+            '/api/test/members/?only-fields=')
+        data = self.test_resource.serialize_object(member, request=request)
+
+        self.assertNotIn('owner', data)
+        self.assertEqual(data['links']['owner'], {
+            'href': 'http://testserver/api/test/users/%s/' % user.pk,
+            'method': 'GET',
+            'title': 'user1',
+        })
+
     def test_serialize_object_with_expand_model(self):
         """Testing WebAPIResource.serialize_object with
         ?expand=<model_field>
@@ -1094,6 +1355,750 @@ class WebAPIResourceTests(kgb.SpyAgency, TestModelsLoaderMixin, TestCase):
             'total_results': 2,
         })
 
+    def test_get_prefetch_plan(self) -> None:
+        """Testing WebAPIResource.get_prefetch_plan"""
+        resource = MyTestPrefetchGroupResource()
+        self.test_resource = resource
+
+        request = RequestFactory().get('/api/test/groups/')
+        plan = resource.get_prefetch_plan(request, is_list=True)
+
+        self.assertEqual(plan.select_related, [])
+        self.assertEqual(plan.prefetch_related, ['users'])
+
+        # Many-to-many relations are only prefetched for lists.
+        self.assertFalse(resource.get_prefetch_plan(request))
+
+    def test_get_prefetch_plan_with_only_fields(self) -> None:
+        """Testing WebAPIResource.get_prefetch_plan with ?only-fields="""
+        resource = MyTestPrefetchGroupResource()
+        self.test_resource = resource
+
+        request = RequestFactory().get('/api/test/groups/?only-fields=name')
+
+        self.assertFalse(resource.get_prefetch_plan(request, is_list=True))
+
+    def test_get_prefetch_plan_with_expand(self) -> None:
+        """Testing WebAPIResource.get_prefetch_plan with ?expand= for a
+        related field and child resource
+        """
+        resource = MyTestPrefetchGroupResource()
+        self.test_resource = resource
+
+        register_resource_for_model(User, MyTestUserResource())
+        self.addCleanup(unregister_resource_for_model, User)
+
+        request = RequestFactory().get(
+            '/api/test/groups/?expand=users,members')
+        plan = resource.get_prefetch_plan(request, is_list=True)
+
+        self.assertEqual(plan.select_related, [])
+        self.assertEqual(len(plan.prefetch_related), 2)
+
+        users_prefetch, members_prefetch = plan.prefetch_related
+
+        # The user resource has no related fields, so a plain prefetch is
+        # used.
+        self.assertEqual(users_prefetch, 'users')
+
+        assert isinstance(members_prefetch, Prefetch)
+        self.assertEqual(members_prefetch.prefetch_through, 'members')
+        self.assertEqual(members_prefetch.to_attr,
+                         '_djblets_webapi_prefetched_members')
+
+        assert members_prefetch.queryset is not None
+        self.assertEqual(members_prefetch.queryset.query.select_related,
+                         {'user': {}})
+
+    def test_get_list_with_expand_query_count(self) -> None:
+        """Testing WebAPIResource list serialization with ?expand= uses a
+        constant number of queries
+        """
+        resource = MyTestPrefetchGroupResource()
+        self.test_resource = resource
+
+        register_resource_for_model(User, MyTestUserResource())
+        self.addCleanup(unregister_resource_for_model, User)
+
+        for i in range(5):
+            group = MyTestGroup.objects.create(name='group%d' % i)
+
+            for j in range(3):
+                user = User.objects.create(username='user%d-%d' % (i, j))
+                group.users.add(user)
+                MyTestGroupMember.objects.create(group=group, user=user)
+
+        request = RequestFactory().get(
+            '/api/test/groups/?expand=users,members')
+
+        # This is one query for the groups, one for the users, and one for
+        # the members (along with their users).
+        with self.assertNumQueries(3):
+            data = resource.serialize_object_list(
+                resource._get_queryset(request, is_list=True),
+                request=request)
+
+        self.assertEqual(len(data), 5)
+
+        for item in data:
+            self.assertEqual(len(item['users']), 3)
+            self.assertEqual(len(item['members']), 3)
+            self.assertEqual(set(item['_expanded']),
+                             {'users', 'members'})
+
+    def test_get_model_columns(self) -> None:
+        """Testing WebAPIResource.get_model_columns"""
+        resource = MyTestColumnsGroupMemberResource()
+        self.test_resource = resource
+
+        request_factory = RequestFactory()
+
+        self.assertIsNone(resource.get_model_columns(
+            request_factory.get('/api/test/members/')))
+
+        # Linked foreign keys are still needed.
+        self.assertEqual(
+            resource.get_model_columns(
+                request_factory.get('/api/test/members/?only-fields=')),
+            {'id', 'group', 'user'})
+
+        self.assertEqual(
+            resource.get_model_columns(request_factory.get(
+                '/api/test/members/?only-fields=&only-links=')),
+            {'id', 'group'})
+
+        self.assertEqual(
+            resource.get_model_columns(request_factory.get(
+                '/api/test/members/?only-fields=username&only-links=')),
+            {'id', 'group', 'user'})
+
+    def test_get_model_columns_without_field_model_columns(self) -> None:
+        """Testing WebAPIResource.get_model_columns without
+        field_model_columns set
+        """
+        resource = MyTestGroupMemberResource()
+        self.test_resource = resource
+
+        request = RequestFactory().get('/api/test/members/?only-fields=')
+
+        self.assertIsNone(resource.get_model_columns(request))
+
+    def test_get_model_columns_with_unknown_serializer(self) -> None:
+        """Testing WebAPIResource.get_model_columns with a field serializer
+        not listed in field_model_columns
+        """
+        class TestResource(MyTestColumnsGroupMemberResource):
+            name = 'unknown-columns-member'
+            field_model_columns = {}
+
+        resource = TestResource()
+        self.test_resource = resource
+
+        request = RequestFactory().get(
+            '/api/test/members/?only-fields=username')
+
+        self.assertIsNone(resource.get_model_columns(request))
+
+    def test_get_object_with_only_fields(self) -> None:
+        """Testing WebAPIResource.get_object with ?only-fields= only loads
+        needed columns
+        """
+        resource = MyTestColumnsGroupMemberResource()
+        self.test_resource = resource
+
+        group = MyTestGroup.objects.create(name='group1')
+        member = MyTestGroupMember.objects.create(
+            group=group,
+            user=User.objects.create(username='user1'))
+
+        request = RequestFactory().get(
+            '/api/test/members/?only-fields=&only-links=')
+        setattr(request, '_djblets_webapi_method', 'GET')
+        setattr(request, '_djblets_webapi_resource', resource)
+
+        obj = resource.get_object(request, pk=group.pk, member_pk=member.pk)
+
+        self.assertEqual(obj, member)
+        self.assertEqual(obj.get_deferred_fields(), {'user_id'})
+
+        # The user isn't needed, so it shouldn't be selected.
+        with self.assertNumQueries(0):
+            data = resource.serialize_object(obj, request=request)
+
+        self.assertEqual(data, {})
+
+    def test_get_list_with_only_fields_and_other_resource(self) -> None:
+        """Testing WebAPIResource._get_queryset with ?only-fields= loads all
+        columns when not handling the request
+        """
+        resource = MyTestColumnsGroupMemberResource()
+        self.test_resource = resource
+
+        request = RequestFactory().get(
+            '/api/test/members/?only-fields=&only-links=')
+        setattr(request, '_djblets_webapi_method', 'GET')
+        setattr(request, '_djblets_webapi_resource', MyTestUserResource())
+
+        queryset = resource._get_queryset(request, is_list=True, pk=1)
+
+        self.assertEqual(queryset.query.deferred_loading,
+                         (frozenset(), True))
+        self.assertEqual(queryset.query.select_related, {'user': {}})
+
+    def test_get_list_with_list_version_aggregate(self) -> None:
+        """Testing WebAPIResource.get_list with
+        WebAPIListVersionStrategy.AGGREGATE
+        """
+        resource = MyTestVersionedUserResource()
+        self.test_resource = resource
+
+        user1 = User.objects.create(username='user1')
+        User.objects.create(username='user2')
+
+        request = self.factory.get('/api/users/',
+                                   HTTP_ACCEPT='application/json')
+        request.user = AnonymousUser()
+        response = resource(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)['versioned-users']),
+                         2)
+        self.assertIn('Last-Modified', response)
+
+        etag = response['ETag']
+
+        # This should only perform the aggregate query.
+        request = self.factory.get('/api/users/',
+                                   HTTP_ACCEPT='application/json',
+                                   HTTP_IF_NONE_MATCH=etag)
+        request.user = AnonymousUser()
+
+        with self.assertNumQueries(1):
+            response = resource(request)
+
+        self.assertIsInstance(response, HttpResponseNotModified)
+        self.assertEqual(response['ETag'], etag)
+
+        # Removing an object should change the ETag.
+        user1.delete()
+
+        request = self.factory.get('/api/users/',
+                                   HTTP_ACCEPT='application/json',
+                                   HTTP_IF_NONE_MATCH=etag)
+        request.user = AnonymousUser()
+        response = resource(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_get_list_with_list_version_generation(self) -> None:
+        """Testing WebAPIResource.get_list with
+        WebAPIListVersionStrategy.GENERATION
+        """
+        resource = MyTestVersionedGroupResource()
+        self.test_resource = resource
+
+        group = MyTestGroup.objects.create(name='group1')
+
+        request = self.factory.get('/api/groups/',
+                                   HTTP_ACCEPT='application/json')
+        request.user = AnonymousUser()
+        response = resource(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Last-Modified', response)
+
+        etag = response['ETag']
+
+        request = self.factory.get('/api/groups/',
+                                   HTTP_ACCEPT='application/json',
+                                   HTTP_IF_NONE_MATCH=etag)
+        request.user = AnonymousUser()
+
+        with self.assertNumQueries(0):
+            response = resource(request)
+
+        self.assertIsInstance(response, HttpResponseNotModified)
+        self.assertEqual(response['ETag'], etag)
+
+        # Changing a relation should change the ETag.
+        group.users.add(User.objects.create(username='user1'))
+
+        request = self.factory.get('/api/groups/',
+                                   HTTP_ACCEPT='application/json',
+                                   HTTP_IF_NONE_MATCH=etag)
+        request.user = AnonymousUser()
+        response = resource(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+
+        # Saving an object should change the ETag.
+        group.save()
+
+        request = self.factory.get('/api/groups/',
+                                   HTTP_ACCEPT='application/json',
+                                   HTTP_IF_NONE_MATCH=etag)
+        request.user = AnonymousUser()
+        response = resource(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_get_list_version_with_different_query(self) -> None:
+        """Testing WebAPIResource.get_list_version varies by query string"""
+        resource = MyTestVersionedGroupResource()
+        self.test_resource = resource
+
+        queryset = MyTestGroup.objects.all()
+
+        request1 = self.factory.get('/api/groups/?max-results=1')
+        request1.user = AnonymousUser()
+
+        request2 = self.factory.get('/api/groups/?max-results=2')
+        request2.user = AnonymousUser()
+
+        self.assertNotEqual(resource.get_list_version(request1, queryset),
+                            resource.get_list_version(request2, queryset))
+
+    def test_get_list_version_with_different_users(self) -> None:
+        """Testing WebAPIResource.get_list_version varies by user"""
+        class TestResource(MyTestVersionedGroupResource):
+            def encode_etag(self, request, etag, *args, **kwargs):
+                # Leave out the username added by default.
+                return etag
+
+        resource = TestResource()
+        self.test_resource = resource
+
+        queryset = MyTestGroup.objects.all()
+
+        def _get_etag(user) -> str | None:
+            request = self.factory.get('/api/groups/')
+            request.user = user
+
+            return resource.get_list_version(request, queryset)[1]
+
+        user1 = User.objects.create(username='user1')
+        user2 = User.objects.create(username='user2')
+
+        etag1 = _get_etag(user1)
+        etag2 = _get_etag(user2)
+        etag3 = _get_etag(AnonymousUser())
+
+        self.assertIsNotNone(etag1)
+        self.assertEqual(len({etag1, etag2, etag3}), 3)
+        self.assertEqual(_get_etag(user1), etag1)
+
+        # Users sharing a visibility class share ETags.
+        self.spy_on(resource.get_list_version_visibility,
+                    op=kgb.SpyOpReturn('everyone'))
+
+        self.assertEqual(_get_etag(user1), _get_etag(user2))
+
+    def test_get_list_version_without_strategy(self) -> None:
+        """Testing WebAPIResource.get_list_version without
+        list_version_strategy
+        """
+        resource = MyTestGroupResource()
+        self.test_resource = resource
+
+        request = self.factory.get('/api/groups/')
+        request.user = AnonymousUser()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                resource.get_list_version(request, MyTestGroup.objects.all()),
+                (None, None))
+
+    def test_serialize_object_with_serialized_object_cache(self) -> None:
+        """Testing WebAPIResource.serialize_object with
+        serialized_object_cache_enabled reuses payloads across requests
+        """
+        resource = MyTestCachedGroupResource()
+        self.test_resource = resource
+
+        group = MyTestGroup.objects.create(name='group1')
+        user = User.objects.create(username='user1')
+        group.users.add(user)
+
+        self.spy_on(resource.serialize_name_field)
+
+        request = self.factory.get('/api/test/groups/')
+        request.user = user
+
+        data = resource.serialize_object(group, request=request)
+        self.assertEqual(data['name'], 'group1')
+        self.assertEqual(len(data['users']), 1)
+
+        # A new request should use the cached payload.
+        request = self.factory.get('/api/test/groups/')
+        request.user = user
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resource.serialize_object(group, request=request),
+                             data)
+
+        self.assertSpyCallCount(resource.serialize_name_field, 1)
+
+        # Other users and request options get their own payloads.
+        request = self.factory.get('/api/test/groups/')
+        request.user = User.objects.create(username='user2')
+        resource.serialize_object(group, request=request)
+
+        self.assertSpyCallCount(resource.serialize_name_field, 2)
+
+        request = self.factory.get('/api/test/groups/?only-links=')
+        request.user = user
+        self.assertNotIn('links',
+                         resource.serialize_object(group, request=request))
+
+        self.assertSpyCallCount(resource.serialize_name_field, 3)
+
+    def test_serialize_object_with_serialized_object_cache_invalidation(
+        self,
+    ) -> None:
+        """Testing WebAPIResource.serialize_object with
+        serialized_object_cache_enabled invalidates payloads when objects
+        change
+        """
+        resource = MyTestCachedGroupResource()
+        self.test_resource = resource
+
+        group = MyTestGroup.objects.create(name='group1')
+        user = User.objects.create(username='user1')
+
+        def _serialize() -> WebAPIResponsePayload:
+            request = self.factory.get('/api/test/groups/')
+            request.user = user
+
+            return resource.serialize_object(group, request=request)
+
+        self.assertEqual(_serialize()['name'], 'group1')
+
+        group.name = 'group2'
+        group.save(update_fields=('name',))
+        self.assertEqual(_serialize()['name'], 'group2')
+
+        self.assertEqual(_serialize()['users'], [])
+        group.users.add(user)
+        self.assertEqual(len(_serialize()['users']), 1)
+
+        # Changes from the other side of the relation should also apply.
+        user.mytestgroup_set.remove(group)
+        self.assertEqual(_serialize()['users'], [])
+
+        group.users.add(user)
+        self.assertEqual(len(_serialize()['users']), 1)
+
+        user.mytestgroup_set.clear()
+        self.assertEqual(_serialize()['users'], [])
+
+    def test_serialize_object_with_serialized_object_cache_no_etag(
+        self,
+    ) -> None:
+        """Testing WebAPIResource.serialize_object with
+        serialized_object_cache_enabled and no ETag or last-modified
+        timestamp
+        """
+        class TestResource(MyTestCachedGroupResource):
+            name = 'uncached-group'
+
+            def get_etag(self, *args, **kwargs) -> None:
+                return None
+
+        resource = TestResource()
+        self.test_resource = resource
+
+        self.spy_on(resource.serialize_name_field)
+
+        group = MyTestGroup.objects.create(name='group1')
+
+        for i in range(2):
+            request = self.factory.get('/api/test/groups/')
+            request.user = User()
+            resource.serialize_object(group, request=request)
+
+        self.assertSpyCallCount(resource.serialize_name_field, 2)
+
+    def test_serialize_object_list_with_serialized_object_cache(
+        self,
+    ) -> None:
+        """Testing WebAPIResource.serialize_object_list with
+        serialized_object_cache_enabled batches cache lookups and stores
+        """
+        resource = MyTestCachedGroupResource()
+        self.test_resource = resource
+
+        user = User.objects.create(username='user1')
+        groups = [
+            MyTestGroup.objects.create(name=f'group{i}')
+            for i in range(5)
+        ]
+
+        def _serialize() -> list[WebAPIResponsePayload]:
+            request = self.factory.get('/api/test/groups/')
+            request.user = user
+
+            return resource.serialize_object_list(groups, request=request)
+
+        self.spy_on(resource.serialize_name_field)
+        self.spy_on(cache.get_many)
+        self.spy_on(cache.set_many)
+
+        data = _serialize()
+        self.assertEqual([item['name'] for item in data],
+                         [f'group{i}' for i in range(5)])
+
+        # Payloads for all objects are fetched and stored in one operation
+        # each.
+        self.assertSpyCallCount(cache.get_many, 1)
+        self.assertSpyCallCount(cache.set_many, 1)
+        self.assertSpyCallCount(resource.serialize_name_field, 5)
+
+        # A new request should fetch all payloads at once, without cloning
+        # them.
+        self.spy_on(resource._clone_serialized_object)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(_serialize(), data)
+
+        self.assertSpyCallCount(cache.get_many, 2)
+        self.assertSpyCallCount(cache.set_many, 1)
+        self.assertSpyCallCount(resource.serialize_name_field, 5)
+        self.assertSpyNotCalled(resource._clone_serialized_object)
+
+    def test_serialize_object_with_serialized_object_cache_same_request(
+        self,
+    ) -> None:
+        """Testing WebAPIResource.serialize_object with
+        serialized_object_cache_enabled returns independent copies within a
+        request
+        """
+        resource = MyTestCachedGroupResource()
+        self.test_resource = resource
+
+        group = MyTestGroup.objects.create(name='group1')
+
+        request = self.factory.get('/api/test/groups/')
+        request.user = User.objects.create(username='user1')
+
+        data1 = resource.serialize_object(group, request=request)
+        data1['name'] = 'changed'
+
+        data2 = resource.serialize_object(group, request=request)
+        self.assertEqual(data2['name'], 'group1')
+        self.assertIsNot(data1, data2)
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_build_resource_url(self) -> None:
+        """Testing WebAPIResource.build_resource_url matches reverse()"""
+        resource = url_group_resource
+        request = self.factory.get('/api/url-groups/')
+
+        self.assertEqual(resource.build_resource_url('url-groups'),
+                         reverse('url-groups-resource'))
+        self.assertEqual(resource.build_resource_url('url-group', pk=42),
+                         reverse('url-group-resource', kwargs={'pk': 42}))
+        self.assertEqual(
+            resource.build_resource_url('member', pk=42, member_pk=1),
+            reverse('member-resource', kwargs={
+                'pk': 42,
+                'member_pk': 1,
+            }))
+        self.assertEqual(
+            resource.build_resource_url('url-group', request=request, pk=42),
+            'http://testserver/api/url-groups/42/')
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_build_resource_url_with_pattern_types(self) -> None:
+        """Testing WebAPIResource.build_resource_url matches reverse() for
+        path converters, regex patterns, and default arguments
+        """
+        resource = MyTestURLGroupResource()
+        self.test_resource = resource
+
+        self.spy_on(reverse)
+
+        tests: list[tuple[str, dict[str, Any]]] = [
+            ('converter-group', {'pk': 42, 'slug': 'my-group'}),
+            ('regex-group', {'pk': 42, 'slug': 'abc'}),
+            ('default-group', {}),
+            ('default-group', {'format': 'json'}),
+            ('default-group', {'format': 'xml'}),
+        ]
+
+        for name, kwargs in tests:
+            with self.subTest(name=name, kwargs=kwargs):
+                self.assertEqual(
+                    resource.build_resource_url(name, **kwargs),
+                    reverse(f'{name}-resource', kwargs=kwargs))
+
+        # Only the calls above should have used reverse().
+        self.assertSpyCallCount(reverse, len(tests))
+
+        # Values not accepted by the patterns should fail the same way.
+        for name, kwargs in [('converter-group', {'pk': 'x', 'slug': 'a'}),
+                             ('regex-group', {'pk': 42, 'slug': 'ABC'})]:
+            with self.subTest(name=name, kwargs=kwargs):
+                with self.assertRaises(NoReverseMatch):
+                    resource.build_resource_url(name, **kwargs)
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_build_resource_url_with_unexpected_reverse_dict(self) -> None:
+        """Testing WebAPIResource.build_resource_url falls back to reverse()
+        if Django's URL resolver data isn't in the expected format
+        """
+        resource = MyTestURLGroupResource()
+        self.test_resource = resource
+
+        request = self.factory.get('/api/url-groups/')
+        request._djblets_webapi_url_state = (  # type: ignore
+            MultiValueDict({
+                'url-group-resource': [('unexpected',)],
+            }),
+            '/')
+
+        self.spy_on(reverse)
+
+        with self.assertLogs('djblets.webapi.resources.base',
+                             level='WARNING'):
+            self.assertEqual(
+                resource.build_resource_url('url-group', request=request,
+                                            pk=1),
+                'http://testserver/api/url-groups/1/')
+
+        self.assertSpyCalled(reverse)
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_build_resource_url_with_script_prefix(self) -> None:
+        """Testing WebAPIResource.build_resource_url with a script prefix"""
+        resource = url_group_resource
+
+        self.assertEqual(resource.build_resource_url('url-group', pk=1),
+                         '/api/url-groups/1/')
+
+        set_script_prefix('/sub%dir/')
+
+        try:
+            self.assertEqual(resource.build_resource_url('url-group', pk=1),
+                             '/sub%25dir/api/url-groups/1/')
+            self.assertEqual(resource.build_resource_url('url-group', pk=1),
+                             reverse('url-group-resource', kwargs={'pk': 1}))
+        finally:
+            set_script_prefix('/')
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_build_resource_url_compiles_once(self) -> None:
+        """Testing WebAPIResource.build_resource_url compiles URLs once per
+        set of arguments
+        """
+        resource = MyTestURLGroupResource()
+        self.test_resource = resource
+
+        self.spy_on(reverse)
+
+        for i in range(3):
+            self.assertEqual(resource.build_resource_url('url-group', pk=i),
+                             f'/api/url-groups/{i}/')
+
+        self.assertSpyNotCalled(reverse)
+
+        assert resource._compiled_urls is not None
+        self.assertEqual(len(resource._compiled_urls[1]), 1)
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_build_resource_url_with_no_match(self) -> None:
+        """Testing WebAPIResource.build_resource_url with arguments that
+        don't match the URL pattern
+        """
+        resource = url_group_resource
+
+        self.spy_on(reverse)
+
+        with self.assertRaises(NoReverseMatch):
+            resource.build_resource_url('url-group', pk='abc')
+
+        with self.assertRaises(NoReverseMatch):
+            resource.build_resource_url('url-group', id=1)
+
+        self.assertSpyCallCount(reverse, 2)
+
+    def test_build_resource_url_with_changed_urls(self) -> None:
+        """Testing WebAPIResource.build_resource_url after the URL patterns
+        change
+        """
+        resource = MyTestURLGroupResource()
+        self.test_resource = resource
+
+        with override_settings(ROOT_URLCONF=__name__):
+            self.assertEqual(resource.build_resource_url('url-group', pk=1),
+                             '/api/url-groups/1/')
+
+        old_urlpatterns = list(urlpatterns)
+
+        try:
+            urlpatterns[:] = [
+                path('api/v2/url-groups/',
+                     include(url_group_resource.get_url_patterns())),
+            ]
+            clear_url_caches()
+
+            with override_settings(ROOT_URLCONF=__name__):
+                self.assertEqual(
+                    resource.build_resource_url('url-group', pk=1),
+                    '/api/v2/url-groups/1/')
+        finally:
+            urlpatterns[:] = old_urlpatterns
+            clear_url_caches()
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_get_links(self) -> None:
+        """Testing WebAPIResource.get_links"""
+        resource = url_group_resource
+        group1 = MyTestGroup.objects.create(name='group1')
+        group2 = MyTestGroup.objects.create(name='group2')
+
+        request = self.factory.get('/api/url-groups/')
+        request.user = User()
+
+        links1 = resource.get_links(resource.item_child_resources, group1,
+                                    request=request)
+        links2 = resource.get_links(resource.item_child_resources, group2,
+                                    request=request)
+
+        self.assertEqual(
+            links1,
+            {
+                'self': {
+                    'method': 'GET',
+                    'href': f'http://testserver/api/url-groups/{group1.pk}/',
+                },
+                'update': {
+                    'method': 'PUT',
+                    'href': f'http://testserver/api/url-groups/{group1.pk}/',
+                },
+                'delete': {
+                    'method': 'DELETE',
+                    'href': f'http://testserver/api/url-groups/{group1.pk}/',
+                },
+                'members': {
+                    'method': 'GET',
+                    'href': f'http://testserver/api/url-groups/{group1.pk}/'
+                            f'members/',
+                },
+            })
+        self.assertEqual(
+            links2['members'],
+            {
+                'method': 'GET',
+                'href': f'http://testserver/api/url-groups/{group2.pk}/'
+                        f'members/',
+            })
+        self.assertIsNot(links1['members'], links2['members'])
+
     def test_uri_template_name_default(self):
         """Testing WebAPIResource.uri_template_name defaults to
         WebAPIResource.name